@@ -0,0 +1,234 @@
+"""
+Micro-benchmark of one AssistantAgent ToolCallingWorkflow iteration that ends in tool calls, comparing
+the previous activity layout (response, message, finish reason and tool call lookups as separate
+activities) with the compact response activity, with and without inline tool execution.
+
+The workflows below mirror the activity layout of `AssistantAgent.tool_calling_workflow`. They run on
+a local stub of the workflow runtime that persists activity inputs and results as JSON, waits
+`--round-trip-ms` for every batch of scheduled activities (the sidecar round trip) and replays the
+orchestrator from the start after each batch, like Dapr does. No Dapr runtime or LLM is required:
+
+    python benchmarks/assistant_workflow_activities.py --iterations 200 --tool-calls 3
+"""
+
+import argparse
+import json
+import time
+import uuid
+
+
+class ActivityCall:
+    def __init__(self, activity, input):
+        self.activity = activity
+        self.input = input
+
+
+class WhenAll:
+    def __init__(self, calls):
+        self.calls = calls
+
+
+class StubContext:
+    """Replays results recorded in the history, in scheduling order."""
+
+    def __init__(self, history):
+        self.history = history
+        self.position = 0
+
+    def call_activity(self, activity, input=None):
+        return ActivityCall(activity, input)
+
+
+class StubWorkflowRuntime:
+    """Runs an orchestrator to completion with Dapr-like persistence and replay."""
+
+    def __init__(self, round_trip: float):
+        self.round_trip = round_trip
+        self.activities = 0
+        self.history_bytes = 0
+
+    def run(self, orchestrator, input):
+        history = []
+        while True:
+            ctx = StubContext(history)
+            generator = orchestrator(ctx, input)
+            try:
+                pending = generator.send(None)
+                while True:
+                    calls = pending.calls if isinstance(pending, WhenAll) else [pending]
+                    if ctx.position + len(calls) > len(history):
+                        break
+                    results = [
+                        json.loads(history[ctx.position + i]) for i in range(len(calls))
+                    ]
+                    ctx.position += len(calls)
+                    value = results if isinstance(pending, WhenAll) else results[0]
+                    pending = generator.send(value)
+            except StopIteration as stop:
+                return stop.value
+
+            # New activities: one sidecar round trip, then persist and replay from the start
+            time.sleep(self.round_trip)
+            for call in calls:
+                encoded_input = json.dumps(call.input)
+                result = json.dumps(call.activity(**json.loads(encoded_input)))
+                history.append(result)
+                self.activities += 1
+                self.history_bytes += len(encoded_input) + len(result)
+
+
+def tool_call(index: int):
+    return {
+        "id": f"call_{index}",
+        "type": "function",
+        "function": {"name": "add", "arguments": json.dumps({"a": index, "b": 2})},
+    }
+
+
+def chat_completion(tool_calls: int):
+    """A response shaped like `ChatCompletion.model_dump()` that requests tool calls."""
+    return {
+        "choices": [
+            {
+                "finish_reason": "tool_calls",
+                "index": 0,
+                "message": {
+                    "content": None,
+                    "role": "assistant",
+                    "name": None,
+                    "tool_calls": [tool_call(i) for i in range(tool_calls)],
+                    "function_call": None,
+                },
+                "logprobs": None,
+            }
+        ],
+        "created": int(time.time()),
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "model": "stub-model",
+        "object": "chat.completion",
+        "usage": {"completion_tokens": 42, "prompt_tokens": 512, "total_tokens": 554},
+    }
+
+
+def run_tool(tool_call):
+    arguments = json.loads(tool_call["function"]["arguments"])
+    return {"tool_call_id": tool_call["id"], "content": str(sum(arguments.values()))}
+
+
+def legacy_workflow(tool_calls: int):
+    def generate_response(instance_id, task):
+        return chat_completion(tool_calls)
+
+    def get_response_message(response):
+        return response["choices"][0]["message"]
+
+    def get_finish_reason(response):
+        return response["choices"][0]["finish_reason"]
+
+    def get_tool_calls(response):
+        return response["choices"][0]["message"]["tool_calls"]
+
+    def execute_tool(instance_id, tool_call):
+        run_tool(tool_call)
+
+    def orchestrator(ctx, message):
+        response = yield ctx.call_activity(
+            generate_response, input={"instance_id": "bench", "task": message}
+        )
+        yield ctx.call_activity(get_response_message, input={"response": response})
+        finish_reason = yield ctx.call_activity(
+            get_finish_reason, input={"response": response}
+        )
+        if finish_reason == "tool_calls":
+            calls = yield ctx.call_activity(
+                get_tool_calls, input={"response": response}
+            )
+            yield WhenAll(
+                [
+                    ctx.call_activity(
+                        execute_tool, input={"instance_id": "bench", "tool_call": c}
+                    )
+                    for c in calls
+                ]
+            )
+
+    return orchestrator
+
+
+def compact_workflow(tool_calls: int, inline: bool):
+    def generate_response(instance_id, task):
+        response = chat_completion(tool_calls)
+        message = response["choices"][0]["message"]
+        calls = message["tool_calls"]
+        if inline:
+            for c in calls:
+                run_tool(c)
+            calls = []
+        return {
+            "message": {
+                k: v
+                for k, v in message.items()
+                if k not in ("tool_calls", "function_call")
+            },
+            "finish_reason": response["choices"][0]["finish_reason"],
+            "tool_calls": calls or None,
+        }
+
+    def execute_tool(instance_id, tool_call):
+        run_tool(tool_call)
+
+    def orchestrator(ctx, message):
+        result = yield ctx.call_activity(
+            generate_response, input={"instance_id": "bench", "task": message}
+        )
+        if result["finish_reason"] == "tool_calls" and result["tool_calls"]:
+            yield WhenAll(
+                [
+                    ctx.call_activity(
+                        execute_tool, input={"instance_id": "bench", "tool_call": c}
+                    )
+                    for c in result["tool_calls"]
+                ]
+            )
+
+    return orchestrator
+
+
+def bench(name: str, orchestrator, iterations: int, round_trip: float):
+    runtime = StubWorkflowRuntime(round_trip)
+    start = time.perf_counter()
+    for i in range(iterations):
+        runtime.run(orchestrator, f"task {i}")
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<16} {iterations / elapsed:9.1f} it/s  "
+        f"activities/it={runtime.activities / iterations:5.1f}  "
+        f"history/it={runtime.history_bytes / iterations:8.0f}B"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--tool-calls", type=int, default=2)
+    parser.add_argument("--round-trip-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    round_trip = args.round_trip_ms / 1000
+    bench("legacy", legacy_workflow(args.tool_calls), args.iterations, round_trip)
+    bench(
+        "compact",
+        compact_workflow(args.tool_calls, inline=False),
+        args.iterations,
+        round_trip,
+    )
+    bench(
+        "compact+inline",
+        compact_workflow(args.tool_calls, inline=True),
+        args.iterations,
+        round_trip,
+    )
+
+
+if __name__ == "__main__":
+    main()
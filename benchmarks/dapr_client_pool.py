@@ -0,0 +1,125 @@
+"""
+Micro-benchmark comparing per-call Dapr clients with the shared client pool.
+
+A stub sidecar (gRPC state API + HTTP health endpoint) is started in-process on free ports, so no
+Dapr runtime is required:
+
+    python benchmarks/dapr_client_pool.py --iterations 500
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import threading
+import time
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+GRPC_PORT = _free_port()
+HTTP_PORT = _free_port()
+
+# Dapr settings are read from the environment on import, so point them at the stub first.
+os.environ["DAPR_GRPC_PORT"] = str(GRPC_PORT)
+os.environ["DAPR_HTTP_PORT"] = str(HTTP_PORT)
+
+import grpc  # noqa: E402
+from dapr.clients import DaprClient  # noqa: E402
+from dapr.proto.runtime.v1 import dapr_pb2, dapr_pb2_grpc  # noqa: E402
+from google.protobuf import empty_pb2  # noqa: E402
+
+from dapr_agents.storage.daprstores.pool import DaprClientPool  # noqa: E402
+
+
+class StubStateServicer(dapr_pb2_grpc.DaprServicer):
+    """In-memory implementation of the Dapr state API."""
+
+    def __init__(self):
+        self.state = {}
+
+    def GetState(self, request, context):
+        return dapr_pb2.GetStateResponse(data=self.state.get(request.key, b""))
+
+    def SaveState(self, request, context):
+        for item in request.states:
+            self.state[item.key] = item.value
+        return empty_pb2.Empty()
+
+
+class HealthHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub_sidecar():
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
+    dapr_pb2_grpc.add_DaprServicer_to_server(StubStateServicer(), server)
+    server.add_insecure_port(f"127.0.0.1:{GRPC_PORT}")
+    server.start()
+
+    http_server = ThreadingHTTPServer(("127.0.0.1", HTTP_PORT), HealthHandler)
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    return server, http_server
+
+
+def per_call(iterations: int):
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        with DaprClient() as client:
+            client.save_state("statestore", f"key-{i % 10}", "value")
+            client.get_state("statestore", f"key-{i % 10}")
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def pooled(iterations: int, pool: DaprClientPool):
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        with pool.acquire() as client:
+            client.save_state("statestore", f"key-{i % 10}", "value")
+            client.get_state("statestore", f"key-{i % 10}")
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(name: str, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{name:<10} mean={statistics.mean(latencies) * 1e3:8.3f}ms "
+        f"p50={statistics.median(latencies) * 1e3:8.3f}ms p99={p99 * 1e3:8.3f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+
+    grpc_server, http_server = start_stub_sidecar()
+    pool = DaprClientPool(size=args.pool_size)
+    try:
+        report("per-call", per_call(args.iterations))
+        report("pooled", pooled(args.iterations, pool))
+    finally:
+        pool.close()
+        http_server.shutdown()
+        grpc_server.stop(None)
+
+
+if __name__ == "__main__":
+    main()
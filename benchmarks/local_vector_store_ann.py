@@ -0,0 +1,91 @@
+"""
+Recall and latency of the LocalVectorStore IVF index compared with exact (flat) search.
+
+Synthetic clustered embeddings are generated in-process, so no embedding model is required:
+
+    python benchmarks/local_vector_store_ann.py --rows 100000 --dimension 384 --probes 1 4 8 16
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from dapr_agents.storage.vectorstores.local import LocalVectorStore
+
+
+def make_embeddings(rows: int, dimension: int, clusters: int, seed: int):
+    """Gaussian blobs around random centers, roughly like sentence embeddings of mixed topics."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dimension)).astype(np.float32)
+    labels = rng.integers(clusters, size=rows)
+    noise = rng.normal(scale=0.6, size=(rows, dimension)).astype(np.float32)
+    return centers[labels] + noise
+
+
+def timed_search(store: LocalVectorStore, queries: np.ndarray, k: int, **kwargs):
+    latencies, results = [], []
+    for query in queries:
+        start = time.perf_counter()
+        matches = store.search_similar(query_embeddings=query.tolist(), k=k, **kwargs)
+        latencies.append(time.perf_counter() - start)
+        results.append({match["id"] for match in matches})
+    return latencies, results
+
+
+def report(name: str, latencies, recall: float):
+    latencies = sorted(latencies)
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+    print(
+        f"{name:<12} recall={recall:6.3f} mean={statistics.mean(latencies) * 1e3:8.3f}ms "
+        f"p50={statistics.median(latencies) * 1e3:8.3f}ms p99={p99 * 1e3:8.3f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--clusters", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--lists", type=int, default=None)
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    parser.add_argument(
+        "--dtype", choices=["float32", "float16", "int8"], default="float32"
+    )
+    args = parser.parse_args()
+
+    embeddings = make_embeddings(args.rows, args.dimension, args.clusters, seed=0)
+    queries = make_embeddings(args.queries, args.dimension, args.clusters, seed=0)
+    queries += np.random.default_rng(1).normal(scale=0.1, size=queries.shape)
+
+    store = LocalVectorStore(
+        embedding_function=None,
+        dtype=args.dtype,
+        index_type="ivf",
+        ivf_lists=args.lists,
+        ivf_min_rows=min(args.rows, 10000),
+    )
+    start = time.perf_counter()
+    store.add(
+        [f"doc {i}" for i in range(args.rows)],
+        embeddings=embeddings,
+        ids=[str(i) for i in range(args.rows)],
+    )
+    print(f"indexed {args.rows} rows in {time.perf_counter() - start:.2f}s")
+
+    exact_latencies, truth = timed_search(store, queries, args.k, exact=True)
+    report("exact", exact_latencies, 1.0)
+    for probes in args.probes:
+        latencies, results = timed_search(store, queries, args.k, probes=probes)
+        recall = statistics.mean(
+            len(found & expected) / len(expected)
+            for found, expected in zip(results, truth)
+        )
+        report(f"ivf/{probes}", latencies, recall)
+
+
+if __name__ == "__main__":
+    main()
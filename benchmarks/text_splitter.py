@@ -0,0 +1,140 @@
+"""
+Benchmark of TextSplitter.split_documents against the previous merge implementation.
+
+The previous implementation measured pieces repeatedly while building overlaps and located every
+chunk with `str.find`. A synthetic multi-page document is generated in-process; pass
+`--tokenizer` to measure sizes with a slower, tokenizer-like function instead of `len`:
+
+    python benchmarks/text_splitter.py --pages 1000 --chunk-size 1000 --tokenizer
+"""
+
+import argparse
+import random
+import re
+import time
+
+from dapr_agents.document.splitter import TextSplitter
+from dapr_agents.types.document import Document
+
+WORDS = (
+    "agent workflow state actor message tool memory vector store embedding document "
+    "chunk overlap sidecar component pubsub binding retry timeout latency throughput"
+).split()
+
+
+class LegacyTextSplitter(TextSplitter):
+    """TextSplitter with the merge and offset logic it had before the streaming engine."""
+
+    def split(self, text):
+        effective_chunk_size = self.chunk_size - self.reserved_metadata_size
+        if self._get_chunk_size(text) <= effective_chunk_size:
+            return [text]
+        return self._legacy_merge(self._split_adaptively(text), effective_chunk_size)
+
+    def _legacy_merge(self, splits, max_size):
+        chunks, current_chunk, current_size = [], [], 0
+        for split in splits:
+            split_size = self._get_chunk_size(split)
+            if current_size + split_size > max_size:
+                if current_chunk:
+                    chunks.append("".join(current_chunk))
+                    overlap, overlap_size = [], 0
+                    for sentence in reversed(current_chunk):
+                        sentence_size = self._get_chunk_size(sentence)
+                        if overlap_size + sentence_size > self.chunk_overlap:
+                            break
+                        overlap.insert(0, sentence)
+                        overlap_size += sentence_size
+                    current_chunk, current_size = overlap, overlap_size
+                else:
+                    chunks.append(split)
+                    current_chunk, current_size = [], 0
+            else:
+                current_chunk.append(split)
+                current_size += split_size
+        if current_chunk:
+            chunks.append("".join(current_chunk))
+        return chunks
+
+    def split_documents(self, documents):
+        chunked_documents = []
+        for doc in documents:
+            text_chunks = self.split(doc.text)
+            previous_end = 0
+            for chunk_num, chunk in enumerate(text_chunks):
+                start_index = doc.text.find(chunk, previous_end)
+                if start_index == -1:
+                    start_index = previous_end
+                end_index = start_index + self._get_chunk_size(chunk)
+                metadata = {
+                    "chunk_number": chunk_num + 1,
+                    "total_chunks": len(text_chunks),
+                    "start_index": start_index,
+                    "end_index": end_index,
+                    "chunk_length": self._get_chunk_size(chunk),
+                }
+                chunked_documents.append(Document(metadata=metadata, text=chunk))
+                previous_end = end_index
+        return chunked_documents
+
+
+def make_pages(pages: int, seed: int = 0):
+    rng = random.Random(seed)
+    result = []
+    for _ in range(pages):
+        lines = []
+        for _ in range(rng.randint(30, 50)):
+            words = rng.choices(WORDS, k=rng.randint(5, 15))
+            lines.append(" ".join(words).capitalize() + ".")
+        result.append("\n".join(lines) + "\n")
+    return result
+
+
+def tokenizer_like(text: str) -> int:
+    """Approximates the cost of a tokenizer by running a regex over the whole text."""
+    return len(re.findall(r"\w+|[^\w\s]", text))
+
+
+def timed(name: str, func):
+    start = time.perf_counter()
+    chunks = func()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} chunks={len(chunks):6d} time={elapsed * 1e3:10.1f}ms")
+    return chunks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--chunk-overlap", type=int, default=200)
+    parser.add_argument("--tokenizer", action="store_true")
+    args = parser.parse_args()
+
+    settings = {
+        "chunk_size": args.chunk_size,
+        "chunk_overlap": args.chunk_overlap,
+        "separator": "\n",
+    }
+    if args.tokenizer:
+        settings["chunk_size_function"] = tokenizer_like
+
+    pages = make_pages(args.pages)
+    document = Document(text="".join(pages))
+    print(f"{args.pages} pages, {len(document.text)} characters")
+
+    timed(
+        "legacy split_documents",
+        lambda: LegacyTextSplitter(**settings).split_documents([document]),
+    )
+    timed(
+        "split_documents", lambda: TextSplitter(**settings).split_documents([document])
+    )
+    timed(
+        "split_text_stream",
+        lambda: list(TextSplitter(**settings).split_text_stream(iter(pages))),
+    )
+
+
+if __name__ == "__main__":
+    main()
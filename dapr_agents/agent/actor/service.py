@@ -60,6 +60,15 @@ class AgentActorService(DaprPubSub, MessageRoutingMixin):
         default="agents_registry",
         description="Dapr state store key for agentic workflow state.",
     )
+    max_concurrent_messages: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of pub/sub messages handled concurrently per subscribed topic.",
+    )
+    message_ordering_key: Optional[str] = Field(
+        default="workflow_instance_id",
+        description="Message payload field used to keep related messages in order. Messages without it are handled concurrently.",
+    )
     service_port: Optional[int] = Field(
         default=None, description="The port number to run the API server on."
     )
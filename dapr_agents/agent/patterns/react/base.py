@@ -189,7 +189,7 @@ class ReActAgent(AgentBase):
                     ] += f"\n{react_loop}"  # Append react_loop to the last message
 
             try:
-                response: ChatCompletion = self.llm.generate(
+                response: ChatCompletion = await self.llm.agenerate(
                     messages=iteration_messages, stop=self.stop_at_token
                 )
 
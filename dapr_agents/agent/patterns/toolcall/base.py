@@ -67,7 +67,9 @@ class ToolCallAgent(AgentBase):
 
     async def process_response(self, tool_calls: List[dict]) -> None:
         """
-        Asynchronously executes tool calls and appends tool results to memory.
+        Asynchronously executes tool calls concurrently and appends tool results to memory.
+
+        Results are recorded in the order the LLM requested the calls.
 
         Args:
             tool_calls (List[dict]): Tool calls returned by the LLM.
@@ -76,22 +78,27 @@ class ToolCallAgent(AgentBase):
             AgentError: If a tool execution fails.
         """
         for tool in tool_calls:
+            logger.info(
+                f"Executing {tool.function.name} with arguments {tool.function.arguments}"
+            )
+
+        results = await self.tool_executor.run_tools(
+            [(tool.function.name, tool.function.arguments_dict) for tool in tool_calls],
+            return_exceptions=True,
+        )
+
+        for tool, result in zip(tool_calls, results):
             function_name = tool.function.name
-            try:
-                logger.info(
-                    f"Executing {function_name} with arguments {tool.function.arguments}"
-                )
-                result = await self.tool_executor.run_tool(
-                    function_name, **tool.function.arguments_dict
-                )
-                tool_message = ToolMessage(
-                    tool_call_id=tool.id, name=function_name, content=str(result)
-                )
-                self.text_formatter.print_message(tool_message)
-                self.tool_history.append(tool_message)
-            except Exception as e:
-                logger.error(f"Error executing tool {function_name}: {e}")
-                raise AgentError(f"Error executing tool '{function_name}': {e}") from e
+            if isinstance(result, Exception):
+                logger.error(f"Error executing tool {function_name}: {result}")
+                raise AgentError(
+                    f"Error executing tool '{function_name}': {result}"
+                ) from result
+            tool_message = ToolMessage(
+                tool_call_id=tool.id, name=function_name, content=str(result)
+            )
+            self.text_formatter.print_message(tool_message)
+            self.tool_history.append(tool_message)
 
     async def process_iterations(self, messages: List[Dict[str, Any]]) -> Any:
         """
@@ -112,9 +119,9 @@ class ToolCallAgent(AgentBase):
             messages += self.tool_history
 
             try:
-                response: ChatCompletion = self.llm.generate(
+                response: ChatCompletion = await self.llm.agenerate(
                     messages=messages,
-                    tools=self.tools,
+                    tools=self.tool_executor.get_formatted_tools(self.llm.provider),
                     tool_choice=self.tool_choice,
                 )
                 response_message = response.get_message()
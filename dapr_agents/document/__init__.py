@@ -1,4 +1,9 @@
 from .fetcher import ArxivFetcher
 from .reader import PyMuPDFReader, PyPDFReader
-from .splitter import TextSplitter
-from .embedder import OpenAIEmbedder, SentenceTransformerEmbedder, NVIDIAEmbedder
+from .splitter import TextSplitter, TokenTextSplitter
+from .embedder import (
+    OpenAIEmbedder,
+    SentenceTransformerEmbedder,
+    NVIDIAEmbedder,
+    CachedEmbedder,
+)
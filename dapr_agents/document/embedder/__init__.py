@@ -1,3 +1,4 @@
 from .openai import OpenAIEmbedder
 from .sentence import SentenceTransformerEmbedder
 from .nvidia import NVIDIAEmbedder
+from .cache import CachedEmbedder
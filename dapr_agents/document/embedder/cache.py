@@ -0,0 +1,264 @@
+from dapr_agents.document.embedder.base import EmbedderBase
+from dapr_agents.llm.cache.response import CacheStats
+from typing import List, Dict, Any, Optional, Union
+from pydantic import Field, ConfigDict, PrivateAttr
+from collections import OrderedDict
+from pathlib import Path
+import numpy as np
+import threading
+import hashlib
+import sqlite3
+import json
+import unicodedata
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Embedder fields that change the vectors returned by `embed` and are therefore part of the cache
+# key. Settings that only affect other methods, like the `precision` of `encode`, are left out.
+_MODEL_FIELDS = (
+    "model",
+    "dimensions",
+    "encoding_format",
+    "max_tokens",
+    "normalize",
+    "normalize_embeddings",
+)
+
+# SQLite limits the number of bound parameters per statement
+_SQLITE_BATCH = 500
+
+
+class CachedEmbedder(EmbedderBase):
+    """
+    Wraps any embedder with a content-addressed embedding cache.
+
+    Texts are keyed on a hash of the embedder's model settings, the input type ("passage" or
+    "query") and the normalized text. Vectors are kept in an in-memory LRU and, if `path` is set,
+    in a SQLite database of float32 blobs that survives restarts and is shared between processes.
+    Only cache misses are sent to the wrapped embedder, as a single batch, and results are returned
+    in input order.
+    """
+
+    embedder: EmbedderBase = Field(
+        ..., description="The embedder whose results are cached."
+    )
+    path: Optional[str] = Field(
+        default=None,
+        description="Path of the SQLite database holding cached vectors. If None, vectors are only cached in memory.",
+    )
+    table_name: str = Field(
+        default="embedding_cache",
+        pattern=r"^[A-Za-z_][A-Za-z0-9_]*$",
+        description="Name of the table holding cached vectors.",
+    )
+    max_memory_entries: int = Field(
+        default=10000,
+        ge=0,
+        description="Number of vectors kept in the in-memory LRU in front of the database.",
+    )
+    embedder_id: Optional[str] = Field(
+        default=None,
+        description="Identifies the embedding model in cache keys. Defaults to the embedder class and its model settings.",
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _memory: "OrderedDict[str, np.ndarray]" = PrivateAttr(default_factory=OrderedDict)
+    _conn: Optional[sqlite3.Connection] = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _stats: CacheStats = PrivateAttr(default_factory=CacheStats)
+
+    def model_post_init(self, __context: Any) -> None:
+        """
+        Derives the embedder ID and opens the SQLite database, if configured.
+        """
+        if self.embedder_id is None:
+            settings = {
+                name: getattr(self.embedder, name)
+                for name in _MODEL_FIELDS
+                if name in type(self.embedder).model_fields
+            }
+            embedder_type = type(self.embedder)
+            self.embedder_id = json.dumps(
+                [f"{embedder_type.__module__}.{embedder_type.__qualname__}", settings],
+                sort_keys=True,
+                default=str,
+            )
+        if self.path:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+                    "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+                )
+        super().model_post_init(__context)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit, miss and store counters of this cache."""
+        return self._stats
+
+    def embed(
+        self, input: Union[str, List[str]]
+    ) -> Union[List[float], List[List[float]]]:
+        """
+        Embeds input text(s) for indexing, serving repeated texts from the cache.
+
+        Args:
+            input (Union[str, List[str]]): Input text(s) to embed. Can be a single string or a list of strings.
+
+        Returns:
+            Union[List[float], List[List[float]]]: Embedding vector(s) for the input(s).
+        """
+        return self._embed(input, "passage")
+
+    def embed_query(
+        self, input: Union[str, List[str]]
+    ) -> Union[List[float], List[List[float]]]:
+        """
+        Embeds input text(s) for querying. Uses the wrapped embedder's `embed_query` if it has one,
+        and `embed` otherwise.
+
+        Args:
+            input (Union[str, List[str]]): Input text(s) to embed.
+
+        Returns:
+            Union[List[float], List[List[float]]]: Embedding vector(s) for the input(s).
+        """
+        return self._embed(input, "query")
+
+    def __call__(
+        self, input: Union[str, List[str]], query: bool = False
+    ) -> Union[List[float], List[List[float]]]:
+        """
+        Allows the instance to be called directly to embed text(s).
+
+        Args:
+            input (Union[str, List[str]]): The input text(s) to embed.
+            query (bool): If True, embeds for querying. Otherwise, embeds for indexing.
+
+        Returns:
+            Union[List[float], List[List[float]]]: Embedding vector(s) for the input(s).
+        """
+        if query:
+            return self.embed_query(input)
+        return self.embed(input)
+
+    def clear(self) -> None:
+        """Removes all cached vectors from memory and from the database."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(f"DELETE FROM {self.table_name}")
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _embed(
+        self, input: Union[str, List[str]], input_type: str
+    ) -> Union[List[float], List[List[float]]]:
+        if not input or (isinstance(input, list) and all(not q for q in input)):
+            raise ValueError("Input must contain valid text.")
+
+        single_input = isinstance(input, str)
+        input_strings = [input] if single_input else list(input)
+        keys = [self._make_key(text, input_type) for text in input_strings]
+
+        found = self._lookup(set(keys))
+        # Deduplicate misses so each distinct text is embedded once
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, input_strings):
+            if key not in found and key not in missing:
+                missing[key] = text
+
+        with self._lock:
+            self._stats.hits += len(keys) - len(missing)
+            self._stats.misses += len(missing)
+
+        if missing:
+            vectors = self._compute(list(missing.values()), input_type)
+            computed = {
+                key: np.asarray(vector, dtype=np.float32)
+                for key, vector in zip(missing, vectors)
+            }
+            self._save(computed)
+            found.update(computed)
+
+        results = [found[key].tolist() for key in keys]
+        return results[0] if single_input else results
+
+    def _compute(self, texts: List[str], input_type: str) -> List[List[float]]:
+        """Embeds all cache misses with one call to the wrapped embedder."""
+        if input_type == "query" and hasattr(self.embedder, "embed_query"):
+            vectors = self.embedder.embed_query(texts)
+        else:
+            vectors = self.embedder.embed(texts)
+        logger.debug(f"Embedded {len(texts)} uncached text(s).")
+        return vectors
+
+    def _make_key(self, text: str, input_type: str) -> str:
+        normalized = unicodedata.normalize("NFC", text).strip()
+        payload = json.dumps([self.embedder_id, input_type, normalized])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _lookup(self, keys: set) -> Dict[str, np.ndarray]:
+        """Returns the cached vectors of `keys`, checking memory first and then the database."""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+            remaining = [key for key in keys if key not in found]
+            if self._conn is None or not remaining:
+                return found
+            try:
+                for start in range(0, len(remaining), _SQLITE_BATCH):
+                    batch = remaining[start : start + _SQLITE_BATCH]
+                    rows = self._conn.execute(
+                        f"SELECT key, vector FROM {self.table_name} "
+                        f"WHERE key IN ({', '.join('?' * len(batch))})",
+                        batch,
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = np.frombuffer(blob, dtype=np.float32)
+                        found[key] = vector
+                        self._remember(key, vector)
+            except sqlite3.Error as e:
+                self._stats.errors += 1
+                logger.warning(f"Embedding cache lookup failed: {e}")
+        return found
+
+    def _save(self, vectors: Dict[str, np.ndarray]) -> None:
+        with self._lock:
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+            self._stats.stores += len(vectors)
+            if self._conn is None:
+                return
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        f"INSERT OR REPLACE INTO {self.table_name} (key, vector) VALUES (?, ?)",
+                        [(key, vector.tobytes()) for key, vector in vectors.items()],
+                    )
+            except sqlite3.Error as e:
+                self._stats.errors += 1
+                logger.warning(f"Embedding cache write failed: {e}")
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        """Adds a vector to the in-memory LRU. Callers hold the lock."""
+        if self.max_memory_entries == 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
@@ -1,6 +1,15 @@
 from dapr_agents.llm.nvidia.embeddings import NVIDIAEmbeddingClient
 from dapr_agents.document.embedder.base import EmbedderBase
-from typing import List, Union
+from dapr_agents.document.embedder.utils import (
+    pack_batches,
+    call_with_retry,
+    acall_with_retry,
+    run_batches,
+    arun_batches,
+    stream_embeddings,
+    astream_embeddings,
+)
+from typing import List, AsyncIterator, Iterable, Iterator, Optional, Union
 from pydantic import Field
 import numpy as np
 import logging
@@ -16,6 +25,10 @@ class NVIDIAEmbedder(NVIDIAEmbeddingClient, EmbedderBase):
     Attributes:
         chunk_size (int): Batch size for embedding requests. Defaults to 1000.
         normalize (bool): Whether to normalize embeddings. Defaults to True.
+        max_tokens_per_request (Optional[int]): Approximate token budget per request. Defaults to None (no limit).
+        max_concurrency (int): Maximum number of requests in flight. Defaults to 4.
+        max_retries (int): Retries after a rate limit, timeout or server error. Defaults to 5.
+        retry_base_delay (float): Delay in seconds before the first retry. Defaults to 1.0.
     """
 
     chunk_size: int = Field(
@@ -24,6 +37,23 @@ class NVIDIAEmbedder(NVIDIAEmbeddingClient, EmbedderBase):
     normalize: bool = Field(
         default=True, description="Whether to normalize embeddings."
     )
+    max_tokens_per_request: Optional[int] = Field(
+        default=None,
+        description="Approximate token budget per request, estimated at 4 characters per token. None disables it.",
+    )
+    max_concurrency: int = Field(
+        default=4, ge=1, description="Maximum number of embedding requests in flight."
+    )
+    max_retries: int = Field(
+        default=5,
+        ge=0,
+        description="Number of times a request is retried after a rate limit, timeout or server error.",
+    )
+    retry_base_delay: float = Field(
+        default=1.0,
+        ge=0,
+        description="Delay in seconds before the first retry. Doubles with every retry unless the server sends retry-after.",
+    )
 
     def embed(
         self, input: Union[str, List[str]]
@@ -63,44 +93,131 @@ class NVIDIAEmbedder(NVIDIAEmbeddingClient, EmbedderBase):
         """
         return self._generate_embeddings(input, input_type="query")
 
-    def _generate_embeddings(
-        self, input: Union[str, List[str]], input_type: str
+    async def aembed(
+        self, input: Union[str, List[str]]
+    ) -> Union[List[float], List[List[float]]]:
+        """Asynchronous `embed`, with batches sent concurrently on the asynchronous client."""
+        return await self._agenerate_embeddings(input, input_type="passage")
+
+    async def aembed_query(
+        self, input: Union[str, List[str]]
     ) -> Union[List[float], List[List[float]]]:
+        """Asynchronous `embed_query`."""
+        return await self._agenerate_embeddings(input, input_type="query")
+
+    def embed_stream(
+        self,
+        inputs: Iterable[str],
+        query: bool = False,
+        window_size: Optional[int] = None,
+    ) -> Iterator[List[float]]:
         """
-        Helper function to generate embeddings for given input text(s) with specified input_type.
+        Embeds a stream of texts, yielding one embedding per text in input order.
+
+        Texts are read lazily in windows of `window_size` (by default `chunk_size * max_concurrency`),
+        so arbitrarily large corpora can be embedded with bounded memory.
 
         Args:
-            input (Union[str, List[str]]): Input text(s) to embed.
-            input_type (str): The type of embedding operation ('query' or 'passage').
+            inputs (Iterable[str]): The texts to embed, e.g. a generator over document chunks.
+            query (bool): If True, embeds for querying. Otherwise, embeds for indexing.
+            window_size (Optional[int]): Number of texts embedded per window.
 
-        Returns:
-            Union[List[float], List[List[float]]]: Embedding vector(s) for the input(s).
+        Yields:
+            List[float]: The embedding of each text.
         """
+        return stream_embeddings(
+            self.embed_query if query else self.embed,
+            inputs,
+            window_size or self.chunk_size * self.max_concurrency,
+        )
+
+    def aembed_stream(
+        self,
+        inputs: Iterable[str],
+        query: bool = False,
+        window_size: Optional[int] = None,
+    ) -> AsyncIterator[List[float]]:
+        """Asynchronous `embed_stream`."""
+        return astream_embeddings(
+            self.aembed_query if query else self.aembed,
+            inputs,
+            window_size or self.chunk_size * self.max_concurrency,
+        )
+
+    def _plan(self, input: Union[str, List[str]]):
+        """Validates the input and packs it into request batches of input indices."""
         # Validate input
         if not input or (isinstance(input, list) and all(not q for q in input)):
             raise ValueError("Input must contain valid text.")
 
         single_input = isinstance(input, str)
         input_list = [input] if single_input else input
-
-        # Process input in chunks for efficiency
-        chunk_embeddings = []
-        for i in range(0, len(input_list), self.chunk_size):
-            batch = input_list[i : i + self.chunk_size]
-            response = self.create_embedding(input=batch, input_type=input_type)
-            chunk_embeddings.extend(r.embedding for r in response.data)
-
+        batches = pack_batches(
+            [len(text) // 4 + 1 for text in input_list],
+            self.chunk_size,
+            self.max_tokens_per_request,
+        )
+        return single_input, input_list, batches
+
+    def _finalize(
+        self, single_input: bool, embeddings: List[List[float]]
+    ) -> Union[List[float], List[List[float]]]:
         # Normalize embeddings if required
         if self.normalize:
-            normalized_embeddings = [
+            embeddings = [
                 (embedding / np.linalg.norm(embedding)).tolist()
-                for embedding in chunk_embeddings
+                for embedding in embeddings
             ]
-        else:
-            normalized_embeddings = chunk_embeddings
 
         # Return a single embedding if the input was a single string; otherwise, return a list
-        return normalized_embeddings[0] if single_input else normalized_embeddings
+        return embeddings[0] if single_input else embeddings
+
+    def _generate_embeddings(
+        self, input: Union[str, List[str]], input_type: str
+    ) -> Union[List[float], List[List[float]]]:
+        """
+        Helper function to generate embeddings for given input text(s) with specified input_type.
+
+        Args:
+            input (Union[str, List[str]]): Input text(s) to embed.
+            input_type (str): The type of embedding operation ('query' or 'passage').
+
+        Returns:
+            Union[List[float], List[List[float]]]: Embedding vector(s) for the input(s).
+        """
+        single_input, input_list, batches = self._plan(input)
+
+        def send(batch: List[int]) -> List[List[float]]:
+            response = call_with_retry(
+                lambda: self.create_embedding(
+                    input=[input_list[i] for i in batch], input_type=input_type
+                ),
+                self.max_retries,
+                self.retry_base_delay,
+            )
+            return [r.embedding for r in response.data]
+
+        embeddings = run_batches(send, batches, self.max_concurrency)
+        return self._finalize(single_input, embeddings)
+
+    async def _agenerate_embeddings(
+        self, input: Union[str, List[str]], input_type: str
+    ) -> Union[List[float], List[List[float]]]:
+        """Asynchronous `_generate_embeddings`."""
+        single_input, input_list, batches = self._plan(input)
+
+        async def send(batch: List[int]) -> List[List[float]]:
+            response = await acall_with_retry(
+                lambda: self.acreate_embedding(
+                    input=[input_list[i] for i in batch], input_type=input_type
+                ),
+                self.max_retries,
+                self.retry_base_delay,
+            )
+            return [r.embedding for r in response.data]
+
+        embeddings = await arun_batches(send, batches, self.max_concurrency)
+        return self._finalize(single_input, embeddings)
 
     def __call__(
         self, input: Union[str, List[str]], query: bool = False
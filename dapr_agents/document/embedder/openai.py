@@ -1,6 +1,15 @@
 from dapr_agents.document.embedder.base import EmbedderBase
+from dapr_agents.document.embedder.utils import (
+    pack_batches,
+    call_with_retry,
+    acall_with_retry,
+    run_batches,
+    arun_batches,
+    stream_embeddings,
+    astream_embeddings,
+)
 from dapr_agents.llm.openai.embeddings import OpenAIEmbeddingClient
-from typing import List, Any, Union, Optional
+from typing import List, Any, AsyncIterator, Iterable, Iterator, Tuple, Union, Optional
 from pydantic import Field, ConfigDict
 import numpy as np
 import logging
@@ -20,6 +29,23 @@ class OpenAIEmbedder(OpenAIEmbeddingClient, EmbedderBase):
     chunk_size: int = Field(
         default=1000, description="Batch size for embedding requests."
     )
+    max_tokens_per_request: Optional[int] = Field(
+        default=300000,
+        description="Maximum total tokens per embedding request. Batches are closed early to stay within it.",
+    )
+    max_concurrency: int = Field(
+        default=4, ge=1, description="Maximum number of embedding requests in flight."
+    )
+    max_retries: int = Field(
+        default=5,
+        ge=0,
+        description="Number of times a request is retried after a rate limit, timeout or server error.",
+    )
+    retry_base_delay: float = Field(
+        default=1.0,
+        ge=0,
+        description="Delay in seconds before the first retry. Doubles with every retry unless the server sends retry-after.",
+    )
     normalize: bool = Field(
         default=True, description="Whether to normalize embeddings."
     )
@@ -84,80 +110,156 @@ class OpenAIEmbedder(OpenAIEmbeddingClient, EmbedderBase):
             return (weighted_avg / norm).tolist()
         return weighted_avg.tolist()
 
-    def embed(
+    def _plan(
         self, input: Union[str, List[str]]
-    ) -> Union[List[float], List[List[float]]]:
+    ) -> Tuple[bool, List[List[int]], List[int], List[List[int]]]:
         """
-        Embeds input text(s) with support for both single and multiple inputs, handling long texts via chunking and batching.
-
-        Args:
-            input (Union[str, List[str]]): The input text(s) to embed. Can be a single string or a list of strings.
+        Tokenizes the inputs, splits long ones into `max_tokens` chunks and packs the chunks into
+        request batches.
 
         Returns:
-            Union[List[float], List[List[float]]]: Embedding vector(s) for the input(s).
-                - Returns a single list of floats for a single string input.
-                - Returns a list of lists of floats for a list of string inputs.
-
-        Notes:
-            - Handles long inputs by chunking them into smaller parts based on `max_tokens` and reassembling embeddings.
-            - Batches API calls for efficiency using `chunk_size`.
-            - Automatically combines chunk embeddings using weighted averaging for long inputs.
+            Tuple: Whether the input was a single string, the token chunks, the input index of each
+                chunk, and the chunk indices of each request batch.
         """
         # Validate input
         if not input or (isinstance(input, list) and all(not q for q in input)):
             raise ValueError("Input must contain valid text.")
 
-        # Check if the input is a single string or a list of strings
         single_input = isinstance(input, str)
         input_strings = [input] if single_input else input
 
-        # Tokenize the input strings to check for long texts requiring chunking
-        tokenized_inputs = [self._tokenize_text(q) for q in input_strings]
-        chunks = []  # Holds text chunks for API calls
-        chunk_indices = []  # Maps each chunk to its original input index
-
-        # Handle tokenized inputs: Chunk long inputs and map chunks to their respective inputs
-        for idx, tokens in enumerate(tokenized_inputs):
-            if len(tokens) <= self.max_tokens:
-                # Directly use the text if it's within max token limits
-                chunks.append(self.encoder.decode(tokens))
-                chunk_indices.append(idx)
-            else:
-                # Split long inputs into smaller chunks
-                token_chunks = self._chunk_tokens(tokens, self.max_tokens)
-                chunks.extend([self.encoder.decode(chunk) for chunk in token_chunks])
-                chunk_indices.extend([idx] * len(token_chunks))
-
-        # Process the chunks in batches for efficiency
-        batch_size = self.chunk_size
-        chunk_embeddings = []  # Holds embeddings for all chunks
-
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i : i + batch_size]
-            response = self.create_embedding(input=batch)  # Batch API call
-            chunk_embeddings.extend(r.embedding for r in response.data)
-
-        # Group chunk embeddings by their original query indices
-        grouped_embeddings = [[] for _ in range(len(input_strings))]
-        for idx, embedding in zip(chunk_indices, chunk_embeddings):
+        # Chunks are sent as token arrays, so the API does not tokenize the text a second time
+        chunks: List[List[int]] = []
+        chunk_indices: List[int] = []
+        for idx, tokens in enumerate(self.encoder.encode_batch(input_strings)):
+            token_chunks = self._chunk_tokens(tokens, self.max_tokens) or [tokens]
+            chunks.extend(token_chunks)
+            chunk_indices.extend([idx] * len(token_chunks))
+
+        batches = pack_batches(
+            [len(chunk) for chunk in chunks],
+            self.chunk_size,
+            self.max_tokens_per_request,
+        )
+        return single_input, chunks, chunk_indices, batches
+
+    def _combine(
+        self,
+        single_input: bool,
+        chunks: List[List[int]],
+        chunk_indices: List[int],
+        chunk_embeddings: List[List[float]],
+    ) -> Union[List[float], List[List[float]]]:
+        """Combines chunk embeddings into one embedding per input, in input order."""
+        grouped_embeddings: List[List[List[float]]] = []
+        grouped_weights: List[List[int]] = []
+        for idx, chunk, embedding in zip(chunk_indices, chunks, chunk_embeddings):
+            if idx == len(grouped_embeddings):
+                grouped_embeddings.append([])
+                grouped_weights.append([])
             grouped_embeddings[idx].append(embedding)
+            grouped_weights[idx].append(len(chunk))
 
-        # Combine chunk embeddings for each query
         results = []
-        for embeddings, tokens in zip(grouped_embeddings, tokenized_inputs):
+        for embeddings, weights in zip(grouped_embeddings, grouped_weights):
             if len(embeddings) == 1:
                 # If only one chunk, use its embedding directly
                 results.append(embeddings[0])
             else:
                 # Combine chunk embeddings using weighted averaging
-                weights = [
-                    len(chunk) for chunk in self._chunk_tokens(tokens, self.max_tokens)
-                ]
                 results.append(self._process_embeddings(embeddings, weights))
 
         # Return a single embedding if the input was a single string; otherwise, return a list
         return results[0] if single_input else results
 
+    def embed(
+        self, input: Union[str, List[str]]
+    ) -> Union[List[float], List[List[float]]]:
+        """
+        Embeds input text(s) with support for both single and multiple inputs, handling long texts via chunking and batching.
+
+        Args:
+            input (Union[str, List[str]]): The input text(s) to embed. Can be a single string or a list of strings.
+
+        Returns:
+            Union[List[float], List[List[float]]]: Embedding vector(s) for the input(s).
+                - Returns a single list of floats for a single string input.
+                - Returns a list of lists of floats for a list of string inputs.
+
+        Notes:
+            - Handles long inputs by chunking them into smaller parts based on `max_tokens` and reassembling embeddings.
+            - Packs chunks into batches of at most `chunk_size` items and `max_tokens_per_request` tokens,
+              and sends up to `max_concurrency` batches at once.
+            - Retries rate-limited and failed requests with backoff.
+            - Automatically combines chunk embeddings using weighted averaging for long inputs.
+        """
+        single_input, chunks, chunk_indices, batches = self._plan(input)
+
+        def send(batch: List[int]) -> List[List[float]]:
+            response = call_with_retry(
+                lambda: self.create_embedding(input=[chunks[i] for i in batch]),
+                self.max_retries,
+                self.retry_base_delay,
+            )
+            return [r.embedding for r in response.data]
+
+        chunk_embeddings = run_batches(send, batches, self.max_concurrency)
+        return self._combine(single_input, chunks, chunk_indices, chunk_embeddings)
+
+    async def aembed(
+        self, input: Union[str, List[str]]
+    ) -> Union[List[float], List[List[float]]]:
+        """
+        Asynchronously embeds input text(s). Batches are sent concurrently on the asynchronous client,
+        with at most `max_concurrency` requests in flight.
+
+        Args:
+            input (Union[str, List[str]]): The input text(s) to embed.
+
+        Returns:
+            Union[List[float], List[List[float]]]: Embedding vector(s) for the input(s).
+        """
+        single_input, chunks, chunk_indices, batches = self._plan(input)
+
+        async def send(batch: List[int]) -> List[List[float]]:
+            response = await acall_with_retry(
+                lambda: self.acreate_embedding(input=[chunks[i] for i in batch]),
+                self.max_retries,
+                self.retry_base_delay,
+            )
+            return [r.embedding for r in response.data]
+
+        chunk_embeddings = await arun_batches(send, batches, self.max_concurrency)
+        return self._combine(single_input, chunks, chunk_indices, chunk_embeddings)
+
+    def embed_stream(
+        self, inputs: Iterable[str], window_size: Optional[int] = None
+    ) -> Iterator[List[float]]:
+        """
+        Embeds a stream of texts, yielding one embedding per text in input order.
+
+        Texts are read lazily in windows of `window_size` (by default `chunk_size * max_concurrency`),
+        so arbitrarily large corpora can be embedded with bounded memory.
+
+        Args:
+            inputs (Iterable[str]): The texts to embed, e.g. a generator over document chunks.
+            window_size (Optional[int]): Number of texts embedded per window.
+
+        Yields:
+            List[float]: The embedding of each text.
+        """
+        return stream_embeddings(
+            self.embed, inputs, window_size or self.chunk_size * self.max_concurrency
+        )
+
+    def aembed_stream(
+        self, inputs: Iterable[str], window_size: Optional[int] = None
+    ) -> AsyncIterator[List[float]]:
+        """Asynchronous `embed_stream`."""
+        return astream_embeddings(
+            self.aembed, inputs, window_size or self.chunk_size * self.max_concurrency
+        )
+
     def __call__(
         self, input: Union[str, List[str]]
     ) -> Union[List[float], List[List[float]]]:
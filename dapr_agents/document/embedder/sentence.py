@@ -1,6 +1,8 @@
 from dapr_agents.document.embedder.base import EmbedderBase
 from typing import List, Any, Optional, Union, Literal
-from pydantic import Field
+from pydantic import Field, PrivateAttr
+import numpy as np
+import threading
 import logging
 import os
 
@@ -11,6 +13,10 @@ class SentenceTransformerEmbedder(EmbedderBase):
     """
     SentenceTransformer-based embedder for generating text embeddings.
     Supports multi-process encoding for large datasets.
+
+    With `multi_process=True`, a pool of worker processes is started on the first large input and
+    reused by later calls. Inputs smaller than `multi_process_threshold` are encoded in-process.
+    Call `close()` or use the embedder as a context manager to stop the workers.
     """
 
     model: str = Field(
@@ -26,6 +32,22 @@ class SentenceTransformerEmbedder(EmbedderBase):
     multi_process: bool = Field(
         default=False, description="Whether to use multi-process encoding."
     )
+    multi_process_threshold: int = Field(
+        default=1000,
+        ge=1,
+        description="Minimum number of inputs sent to the multi-process pool. Smaller inputs are encoded in-process.",
+    )
+    target_devices: Optional[List[str]] = Field(
+        default=None,
+        description="Devices of the multi-process workers, e.g. ['cuda:0', 'cuda:1']. Defaults to all GPUs, or 4 CPU workers.",
+    )
+    batch_size: int = Field(
+        default=32, ge=1, description="Number of inputs encoded per forward pass."
+    )
+    precision: Literal["float32", "float16", "int8"] = Field(
+        default="float32",
+        description="Output precision of `encode`. 'int8' scales each vector to [-127, 127], which preserves cosine similarity but not magnitude.",
+    )
     cache_dir: Optional[str] = Field(
         default=None, description="Directory to cache or load the model."
     )
@@ -34,6 +56,9 @@ class SentenceTransformerEmbedder(EmbedderBase):
         default=None, init=False, description="Loaded SentenceTransformer model."
     )
 
+    _pool: Optional[Any] = PrivateAttr(default=None)
+    _pool_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
     def model_post_init(self, __context: Any) -> None:
         """
         Initialize the SentenceTransformer model after validation.
@@ -80,11 +105,25 @@ class SentenceTransformerEmbedder(EmbedderBase):
             logger.info(f"Saving the downloaded model to: {self.cache_dir}")
             self.client.save(self.cache_dir)
 
+    def encode(self, input: Union[str, List[str]]) -> np.ndarray:
+        """
+        Generate embeddings for input text(s) as a NumPy array in the configured `precision`.
+
+        Args:
+            input (Union[str, List[str]]): Input text(s) to embed.
+
+        Returns:
+            np.ndarray: A (n_inputs x dimension) array, or a single vector for a string input.
+        """
+        embeddings = self._apply_precision(self._encode(input))
+        return embeddings[0] if isinstance(input, str) else embeddings
+
     def embed(
         self, input: Union[str, List[str]]
     ) -> Union[List[float], List[List[float]]]:
         """
-        Generate embeddings for input text(s).
+        Generate embeddings for input text(s). Vectors are always returned at full precision;
+        `precision` only applies to `encode`.
 
         Args:
             input (Union[str, List[str]]): Input text(s) to embed. Can be a single string or a list of strings.
@@ -94,37 +133,81 @@ class SentenceTransformerEmbedder(EmbedderBase):
                 - A single embedding vector (list of floats) for a single string input.
                 - A list of embedding vectors for a list of string inputs.
         """
+        embeddings = self._encode(input)
+        return embeddings[0].tolist() if isinstance(input, str) else embeddings.tolist()
+
+    def close(self) -> None:
+        """
+        Stops the multi-process pool, if one was started. A later large input starts a new pool.
+        """
+        with self._pool_lock:
+            if self._pool is not None:
+                logger.info("Stopping multi-process pool.")
+                self.client.stop_multi_process_pool(self._pool)
+                self._pool = None
+
+    def __enter__(self) -> "SentenceTransformerEmbedder":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _encode(self, input: Union[str, List[str]]) -> np.ndarray:
+        """Encodes text(s) as a float32 (n_inputs x dimension) array."""
         if not input or (isinstance(input, list) and all(not q for q in input)):
             raise ValueError("Input must contain valid text.")
 
-        single_input = isinstance(input, str)
-        input_strings = [input] if single_input else input
-
+        input_strings = [input] if isinstance(input, str) else input
         logger.info(f"Generating embeddings for {len(input_strings)} input(s).")
 
-        if self.multi_process:
-            logger.info("Starting multi-process pool for encoding.")
-            pool = self.client.start_multi_process_pool()
-
-            try:
-                embeddings = self.client.encode_multi_process(
-                    input_strings,
-                    pool=pool,
-                    normalize_embeddings=self.normalize_embeddings,
-                )
-            finally:
-                logger.info("Stopping multi-process pool.")
-                self.client.stop_multi_process_pool(pool)
+        if self.multi_process and len(input_strings) >= self.multi_process_threshold:
+            embeddings = self._encode_multi_process(input_strings)
         else:
+            # encode() sorts inputs by length internally, so batches need little padding
             embeddings = self.client.encode(
                 input_strings,
+                batch_size=self.batch_size,
                 convert_to_numpy=True,
                 normalize_embeddings=self.normalize_embeddings,
             )
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def _get_pool(self) -> Any:
+        """Returns the multi-process pool, starting it on first use. Requires `_pool_lock`."""
+        if self._pool is None:
+            logger.info("Starting multi-process pool for encoding.")
+            self._pool = self.client.start_multi_process_pool(
+                target_devices=self.target_devices
+            )
+        return self._pool
 
-        if single_input:
-            return embeddings[0].tolist()
-        return embeddings.tolist()
+    def _encode_multi_process(self, input_strings: List[str]) -> np.ndarray:
+        """
+        Encodes on the worker pool. Inputs are sorted by length first, so each chunk a worker receives
+        holds texts of similar length and its batches need little padding.
+        """
+        order = np.argsort([-len(text) for text in input_strings], kind="stable")
+        # The pool's input and output queues are shared, so concurrent calls would receive each
+        # other's chunks; one call uses the pool at a time
+        with self._pool_lock:
+            embeddings = self.client.encode_multi_process(
+                [input_strings[i] for i in order],
+                pool=self._get_pool(),
+                batch_size=self.batch_size,
+                normalize_embeddings=self.normalize_embeddings,
+            )
+        restored = np.empty_like(embeddings)
+        restored[order] = embeddings
+        return restored
+
+    def _apply_precision(self, embeddings: np.ndarray) -> np.ndarray:
+        if self.precision == "float16":
+            return embeddings.astype(np.float16)
+        if self.precision == "int8":
+            scales = np.abs(embeddings).max(axis=-1, keepdims=True) / 127.0
+            scales[scales == 0] = 1.0
+            return np.rint(embeddings / scales).astype(np.int8)
+        return embeddings
 
     def __call__(
         self, input: Union[str, List[str]]
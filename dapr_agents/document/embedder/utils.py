@@ -0,0 +1,209 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import asyncio
+import random
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def pack_batches(
+    sizes: Sequence[int], max_items: int, max_tokens: Optional[int] = None
+) -> List[List[int]]:
+    """
+    Groups consecutive items into request batches, preserving order.
+
+    A batch is closed once adding the next item would exceed `max_items` items or `max_tokens`
+    tokens. An item larger than `max_tokens` on its own still gets a batch of its own.
+
+    Args:
+        sizes (Sequence[int]): Token count of each item.
+        max_items (int): Maximum number of items per batch.
+        max_tokens (Optional[int]): Maximum total tokens per batch. None disables the token budget.
+
+    Returns:
+        List[List[int]]: Item indices of each batch.
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for index, size in enumerate(sizes):
+        if current and (
+            len(current) >= max_items
+            or (max_tokens is not None and current_tokens + size > max_tokens)
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Whether an embedding request failed transiently (rate limit, timeout, connection or server error).
+
+    Errors re-raised by the clients as ValueError are unwrapped through their cause.
+    """
+    try:
+        import openai
+    except ImportError:
+        return False
+
+    error = error.__cause__ or error
+    return isinstance(
+        error,
+        (
+            openai.RateLimitError,
+            openai.APITimeoutError,
+            openai.APIConnectionError,
+            openai.InternalServerError,
+        ),
+    )
+
+
+def retry_delay(error: Exception, attempt: int, base_delay: float) -> float:
+    """
+    Returns the wait before the next attempt: the server's `retry-after` if it sent one, otherwise
+    exponential backoff with jitter.
+    """
+    response = getattr(error.__cause__ or error, "response", None)
+    retry_after = getattr(response, "headers", {}).get("retry-after")
+    try:
+        if retry_after is not None:
+            return float(retry_after)
+    except ValueError:
+        pass
+    return base_delay * (2**attempt) * (0.5 + random.random())
+
+
+def call_with_retry(func: Callable[[], T], max_retries: int, base_delay: float) -> T:
+    """
+    Calls `func`, retrying transient failures with backoff.
+
+    Args:
+        func (Callable[[], T]): The request to send.
+        max_retries (int): Number of retries after the first attempt.
+        base_delay (float): Delay in seconds before the first retry. Doubles with every retry.
+
+    Returns:
+        T: The result of `func`.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return func()
+        except Exception as e:
+            if attempt == max_retries or not is_retryable(e):
+                raise
+            delay = retry_delay(e, attempt, base_delay)
+            logger.warning(
+                f"Embedding request failed (attempt {attempt + 1}), retrying in {delay:.1f}s: {e}"
+            )
+            time.sleep(delay)
+
+
+async def acall_with_retry(
+    func: Callable[[], Awaitable[T]], max_retries: int, base_delay: float
+) -> T:
+    """Asynchronous `call_with_retry`."""
+    for attempt in range(max_retries + 1):
+        try:
+            return await func()
+        except Exception as e:
+            if attempt == max_retries or not is_retryable(e):
+                raise
+            delay = retry_delay(e, attempt, base_delay)
+            logger.warning(
+                f"Embedding request failed (attempt {attempt + 1}), retrying in {delay:.1f}s: {e}"
+            )
+            await asyncio.sleep(delay)
+
+
+def run_batches(
+    send: Callable[[List[Any]], List[T]],
+    batches: List[List[Any]],
+    max_concurrency: int,
+) -> List[T]:
+    """
+    Sends batches on up to `max_concurrency` threads and concatenates the results in batch order.
+
+    Args:
+        send (Callable[[List[Any]], List[T]]): Sends one batch and returns one result per item.
+        batches (List[List[Any]]): The batches to send.
+        max_concurrency (int): Maximum number of requests in flight.
+
+    Returns:
+        List[T]: Results of all items, in input order.
+    """
+    if max_concurrency <= 1 or len(batches) <= 1:
+        results = [send(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(batches))
+        ) as executor:
+            results = list(executor.map(send, batches))
+    return [item for batch_results in results for item in batch_results]
+
+
+async def arun_batches(
+    send: Callable[[List[Any]], Awaitable[List[T]]],
+    batches: List[List[Any]],
+    max_concurrency: int,
+) -> List[T]:
+    """Asynchronous `run_batches`, bounded by a semaphore."""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def bounded(batch: List[Any]) -> List[T]:
+        async with semaphore:
+            return await send(batch)
+
+    results = await asyncio.gather(*(bounded(batch) for batch in batches))
+    return [item for batch_results in results for item in batch_results]
+
+
+def iter_windows(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yields consecutive lists of up to `size` items without materializing `items`."""
+    iterator = iter(items)
+    while window := list(islice(iterator, size)):
+        yield window
+
+
+def stream_embeddings(
+    embed: Callable[[List[str]], List[List[float]]],
+    inputs: Iterable[str],
+    window_size: int,
+) -> Iterator[List[float]]:
+    """
+    Embeds a (possibly unbounded) stream of texts window by window and yields one vector per text,
+    in input order. Only one window of texts and vectors is held in memory at a time.
+    """
+    for window in iter_windows(inputs, window_size):
+        yield from embed(window)
+
+
+async def astream_embeddings(
+    aembed: Callable[[List[str]], Awaitable[List[List[float]]]],
+    inputs: Iterable[str],
+    window_size: int,
+) -> AsyncIterator[List[float]]:
+    """Asynchronous `stream_embeddings`."""
+    for window in iter_windows(inputs, window_size):
+        for vector in await aembed(window):
+            yield vector
@@ -0,0 +1,2 @@
+from .pipeline import IngestionPipeline, IngestionReport, StageMetrics
+from .checkpoint import IngestionCheckpoint
@@ -0,0 +1,110 @@
+from typing import List, Optional, Tuple
+from pathlib import Path
+import threading
+import hashlib
+import sqlite3
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def file_digest(file_path: Path, chunk_size: int = 1 << 20) -> str:
+    """
+    Computes the SHA-256 of a file's content, reading it in chunks.
+
+    Args:
+        file_path (Path): Path to the file.
+        chunk_size (int): Number of bytes read at a time.
+
+    Returns:
+        str: The hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while block := f.read(chunk_size):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class IngestionCheckpoint:
+    """
+    Records which files an ingestion pipeline has written to a vector store, in a SQLite database.
+
+    Each file is stored with the content hash it was ingested with and the IDs of its chunks, so a
+    re-run can skip files whose content is unchanged and remove the chunks of files that changed or
+    whose previous run did not finish.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens (or creates) the checkpoint database.
+
+        Args:
+            path (str): Path of the SQLite database.
+        """
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files "
+                "(path TEXT PRIMARY KEY, sha256 TEXT NOT NULL, complete INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS chunks (path TEXT NOT NULL, id TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS chunks_path ON chunks (path)"
+            )
+
+    def get(self, path: str) -> Optional[Tuple[str, bool]]:
+        """
+        Returns the content hash a file was last ingested with and whether that run finished.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            Optional[Tuple[str, bool]]: The (sha256, complete) pair, or None if the file is unknown.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256, complete FROM files WHERE path = ?", (path,)
+            ).fetchone()
+        return (row[0], bool(row[1])) if row else None
+
+    def chunk_ids(self, path: str) -> List[str]:
+        """Returns the IDs of the chunks recorded for a file."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM chunks WHERE path = ?", (path,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def start(self, path: str, sha256: str) -> None:
+        """Marks a file as being ingested with the given content hash, forgetting its previous chunks."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM chunks WHERE path = ?", (path,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (path, sha256, complete) VALUES (?, ?, 0)",
+                (path, sha256),
+            )
+
+    def add_chunks(self, path: str, ids: List[str]) -> None:
+        """Records the IDs of chunks of a file that were written to the vector store."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO chunks (path, id) VALUES (?, ?)",
+                [(path, chunk_id) for chunk_id in ids],
+            )
+
+    def complete(self, path: str) -> None:
+        """Marks a file as fully ingested."""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE files SET complete = 1 WHERE path = ?", (path,))
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._conn.close()
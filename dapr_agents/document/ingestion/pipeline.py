@@ -0,0 +1,561 @@
+from dapr_agents.document.ingestion.checkpoint import IngestionCheckpoint, file_digest
+from dapr_agents.document.reader.base import ReaderBase
+from dapr_agents.document.splitter.base import SplitterBase
+from dapr_agents.document.splitter.text import TextSplitter
+from dapr_agents.storage.vectorstores.base import VectorStoreBase
+from dapr_agents.types.document import Document
+from typing import List, Dict, Any, Optional, Union, Iterable, Iterator, Tuple, Literal
+from pydantic import BaseModel, Field, ConfigDict
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    FIRST_COMPLETED,
+    wait,
+)
+from pathlib import Path
+import functools
+import os
+import threading
+import queue
+import time
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the stream on the queues between stages
+_DONE = object()
+
+# Reader and splitter of a parse worker process, set once by the pool initializer
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(reader: ReaderBase, splitter: SplitterBase) -> None:
+    _worker_state["reader"] = reader
+    _worker_state["splitter"] = splitter
+
+
+def _parse_task(
+    file_path: str,
+    page_range: Optional[Tuple[int, int]],
+    reader: Optional[ReaderBase] = None,
+    splitter: Optional[SplitterBase] = None,
+) -> Tuple[List[Document], float]:
+    """Reads a file, or a range of its pages, and splits it. Returns the chunks and the time spent."""
+    reader = reader or _worker_state["reader"]
+    splitter = splitter or _worker_state["splitter"]
+    start = time.perf_counter()
+    if page_range is None:
+        documents = reader.load(Path(file_path))
+    else:
+        documents = reader.load(Path(file_path), page_range=page_range)
+    chunks = list(splitter.iter_split_documents(documents))
+    return chunks, time.perf_counter() - start
+
+
+class StageMetrics(BaseModel):
+    """Counters describing the work done by one stage of an ingestion pipeline."""
+
+    items: int = Field(default=0, description="Chunks processed by the stage.")
+    batches: int = Field(default=0, description="Batches or tasks processed.")
+    busy_seconds: float = Field(
+        default=0.0,
+        description="Time spent working, summed over the stage's workers.",
+    )
+    wait_seconds: float = Field(
+        default=0.0,
+        description="Time spent waiting for input or for room in the next stage's queue, summed over workers.",
+    )
+
+    @property
+    def throughput(self) -> float:
+        """Chunks processed per second of work (0.0 if the stage did no work)."""
+        return self.items / self.busy_seconds if self.busy_seconds else 0.0
+
+
+class IngestionReport(BaseModel):
+    """Outcome of an ingestion run."""
+
+    files_total: int = Field(default=0, description="Files found in the sources.")
+    files_ingested: int = Field(
+        default=0, description="Files read, embedded and written to the store."
+    )
+    files_skipped: int = Field(
+        default=0,
+        description="Files skipped because the checkpoint holds their current content.",
+    )
+    failed: Dict[str, str] = Field(
+        default_factory=dict, description="Error message of each file that failed."
+    )
+    chunks: int = Field(default=0, description="Chunks written to the store.")
+    seconds: float = Field(default=0.0, description="Wall-clock duration of the run.")
+    stages: Dict[str, StageMetrics] = Field(
+        default_factory=lambda: {
+            name: StageMetrics() for name in ("parse", "embed", "write")
+        },
+        description="Metrics of the parse, embed and write stages.",
+    )
+
+
+class _FileState(BaseModel):
+    """Progress of one file through the pipeline. Guarded by the run lock."""
+
+    path: str
+    digest: str
+    tasks: int = 0
+    planned: bool = False
+    pending: int = 0
+    chunks: int = 0
+    error: Optional[str] = None
+    done: bool = False
+
+
+class IngestionPipeline(BaseModel):
+    """
+    Reads files, splits them into chunks, embeds the chunks and writes them to a vector store.
+
+    The stages run concurrently and are connected by bounded queues, so a slow stage holds back the
+    stages before it instead of letting chunks pile up in memory:
+
+    - **parse**: files are read and split in a process pool (or a thread pool). Readers with a
+      `count_pages` method, like the PDF readers, are parsed `pages_per_task` pages at a time, so the
+      pages of one large file are spread over several workers.
+    - **embed**: `embed_concurrency` threads embed batches of `embed_batch_size` chunks.
+    - **write**: one thread writes chunks to the vector store in batches of `write_batch_size`.
+
+    With `checkpoint_path` set, ingested files are recorded with the SHA-256 of their content.
+    Re-running skips unchanged files, and the chunks of files that changed, or whose previous run did
+    not finish, are deleted from the store before the file is ingested again. Chunk IDs are derived
+    from the file content, so they are stable across runs.
+    """
+
+    reader: ReaderBase = Field(..., description="Reader used to load each file.")
+    splitter: SplitterBase = Field(
+        default_factory=TextSplitter, description="Splitter used to chunk documents."
+    )
+    vector_store: VectorStoreBase = Field(
+        ..., description="Vector store the chunks are written to."
+    )
+    embedder: Optional[Any] = Field(
+        default=None,
+        description="Embedder of the chunks. Defaults to the vector store's embedding function.",
+    )
+    checkpoint_path: Optional[str] = Field(
+        default=None,
+        description="Path of the SQLite checkpoint used to skip unchanged files. If None, every file is ingested.",
+    )
+    pattern: str = Field(
+        default="**/*",
+        description="Glob pattern selecting the files of directory sources, e.g. '**/*.pdf'.",
+    )
+    executor: Literal["process", "thread"] = Field(
+        default="process",
+        description="Pool used to parse and split files. 'thread' avoids pickling the reader and splitter.",
+    )
+    max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of parse workers. None uses the CPU count.",
+    )
+    pages_per_task: int = Field(
+        default=16,
+        gt=0,
+        description="Pages parsed per task for readers that support page ranges.",
+    )
+    embed_batch_size: int = Field(
+        default=128, gt=0, description="Chunks sent to the embedder per call."
+    )
+    embed_concurrency: int = Field(
+        default=2, ge=1, description="Number of threads embedding batches."
+    )
+    write_batch_size: int = Field(
+        default=1000, gt=0, description="Chunks written to the vector store per call."
+    )
+    queue_size: int = Field(
+        default=8,
+        ge=1,
+        description="Batches buffered between two stages before the earlier stage waits.",
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def run(
+        self, sources: Union[str, Path, Iterable[Union[str, Path]]]
+    ) -> IngestionReport:
+        """
+        Ingests files into the vector store.
+
+        Args:
+            sources (Union[str, Path, Iterable[Union[str, Path]]]): Files and directories to
+                ingest. Directories are searched with `pattern`.
+
+        Returns:
+            IngestionReport: Counts of ingested, skipped and failed files and per-stage metrics.
+        """
+        started = time.perf_counter()
+        files = self._discover(sources)
+        report = IngestionReport(files_total=len(files))
+        checkpoint = (
+            IngestionCheckpoint(self.checkpoint_path) if self.checkpoint_path else None
+        )
+        try:
+            states = self._prepare(files, checkpoint, report)
+            if states:
+                _IngestionRun(self, checkpoint, report).execute(states)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+        report.seconds = time.perf_counter() - started
+        logger.info(
+            f"Ingested {report.files_ingested} file(s) ({report.chunks} chunks) in {report.seconds:.1f}s; "
+            f"{report.files_skipped} skipped, {len(report.failed)} failed."
+        )
+        return report
+
+    def _discover(
+        self, sources: Union[str, Path, Iterable[Union[str, Path]]]
+    ) -> List[str]:
+        """Expands directory sources into their files, keeping order and dropping duplicates."""
+        if isinstance(sources, (str, Path)):
+            sources = [sources]
+        files: Dict[str, None] = {}
+        for source in sources:
+            source = Path(source)
+            if source.is_dir():
+                for path in sorted(source.glob(self.pattern)):
+                    if path.is_file():
+                        files[str(path.resolve())] = None
+            elif source.is_file():
+                files[str(source.resolve())] = None
+            else:
+                raise FileNotFoundError(f"Source not found: {source}")
+        return list(files)
+
+    def _prepare(
+        self,
+        files: List[str],
+        checkpoint: Optional[IngestionCheckpoint],
+        report: IngestionReport,
+    ) -> List[_FileState]:
+        """Hashes the files, skips unchanged ones and removes stale chunks of changed ones."""
+        states = []
+        for path in files:
+            digest = file_digest(Path(path))
+            if checkpoint is not None:
+                previous = checkpoint.get(path)
+                if previous == (digest, True):
+                    report.files_skipped += 1
+                    continue
+                stale = checkpoint.chunk_ids(path) if previous else []
+                if stale:
+                    logger.info(f"Removing {len(stale)} stale chunk(s) of {path}.")
+                    self.vector_store.delete(ids=stale)
+                checkpoint.start(path, digest)
+            states.append(_FileState(path=path, digest=digest))
+        return states
+
+    def _create_executor(self) -> Executor:
+        if self.executor == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.reader, self.splitter),
+            )
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ingest-parse"
+        )
+
+    def _parse_function(self):
+        if self.executor == "process":
+            return _parse_task
+        return functools.partial(
+            _parse_task, reader=self.reader, splitter=self.splitter
+        )
+
+    def _page_ranges(self, path: str) -> Iterator[Optional[Tuple[int, int]]]:
+        """Yields the page ranges a file is parsed in, or a single None if the reader loads whole files."""
+        count_pages = getattr(self.reader, "count_pages", None)
+        if count_pages is None:
+            yield None
+            return
+        total = count_pages(Path(path))
+        for start in range(0, max(total, 1), self.pages_per_task):
+            yield start, start + self.pages_per_task
+
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        embedder = self.embedder or self.vector_store.embedding_function
+        if embedder is None:
+            raise ValueError(
+                "IngestionPipeline requires an embedder or a vector store with an embedding function."
+            )
+        return getattr(embedder, "embed", embedder)(texts)
+
+
+class _IngestionRun:
+    """State of one `IngestionPipeline.run`: the queues, worker threads and per-file progress."""
+
+    def __init__(
+        self,
+        pipeline: IngestionPipeline,
+        checkpoint: Optional[IngestionCheckpoint],
+        report: IngestionReport,
+    ):
+        self.pipeline = pipeline
+        self.checkpoint = checkpoint
+        self.report = report
+        self.lock = threading.Lock()
+        self.embed_queue: "queue.Queue" = queue.Queue(maxsize=pipeline.queue_size)
+        self.write_queue: "queue.Queue" = queue.Queue(maxsize=pipeline.queue_size)
+        # First unexpected error of a worker thread, re-raised once the stages have stopped
+        self.error: Optional[BaseException] = None
+
+    def execute(self, states: List[_FileState]) -> None:
+        """
+        Runs the three stages until every file is ingested or has failed.
+
+        Raises:
+            Exception: The error that stopped a worker thread, e.g. a failing checkpoint. The
+                stages are shut down first, so the run fails instead of waiting forever.
+        """
+        embedders = [
+            threading.Thread(
+                target=self._run_worker,
+                args=(self._embed_worker, self.embed_queue),
+                name=f"ingest-embed-{i}",
+                daemon=True,
+            )
+            for i in range(self.pipeline.embed_concurrency)
+        ]
+        writer = threading.Thread(
+            target=self._run_worker,
+            args=(self._write_worker, self.write_queue),
+            name="ingest-write",
+            daemon=True,
+        )
+        for thread in [*embedders, writer]:
+            thread.start()
+        try:
+            self._parse(states)
+        finally:
+            for _ in embedders:
+                self._put(self.embed_queue, _DONE, "parse")
+            for thread in embedders:
+                thread.join()
+            self._put(self.write_queue, _DONE, "embed")
+            writer.join()
+        if self.error is not None:
+            raise self.error
+
+    def _run_worker(self, worker: Any, source: "queue.Queue") -> None:
+        """
+        Runs a stage worker. If it dies, the error is kept for `execute` and the worker's input
+        queue is drained until its end marker, so the stages feeding it never block on a full queue.
+        """
+        try:
+            worker()
+        except BaseException as e:
+            logger.error(
+                f"Ingestion worker {threading.current_thread().name} failed: {e}"
+            )
+            with self.lock:
+                if self.error is None:
+                    self.error = e
+            while source.get() is not _DONE:
+                pass
+
+    def _parse(self, states: List[_FileState]) -> None:
+        """Submits parse tasks, keeping at most two per worker in flight, and queues their chunks."""
+        executor = self.pipeline._create_executor()
+        parse = self.pipeline._parse_function()
+        max_in_flight = 2 * (self.pipeline.max_workers or os.cpu_count() or 1)
+        in_flight: Dict[Future, Tuple[_FileState, Optional[Tuple[int, int]]]] = {}
+        try:
+            for state in states:
+                if self.error is not None:
+                    # A worker died; stop submitting work, `execute` raises its error
+                    break
+                try:
+                    page_ranges = list(self.pipeline._page_ranges(state.path))
+                except Exception as e:
+                    self._fail(state, e)
+                    page_ranges = []
+                for page_range in page_ranges:
+                    while len(in_flight) >= max_in_flight:
+                        self._collect(in_flight)
+                    with self.lock:
+                        state.tasks += 1
+                    future = executor.submit(parse, state.path, page_range)
+                    in_flight[future] = (state, page_range)
+                with self.lock:
+                    state.planned = True
+                    self._maybe_finish(state)
+            while in_flight:
+                self._collect(in_flight)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _collect(self, in_flight: Dict[Future, Any]) -> None:
+        """Waits for at least one parse task and hands its chunks to the embed stage."""
+        done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+        metrics = self.report.stages["parse"]
+        for future in done:
+            state, page_range = in_flight.pop(future)
+            try:
+                chunks, seconds = future.result()
+            except Exception as e:
+                self._fail(state, e)
+                chunks, seconds = [], 0.0
+            metrics.items += len(chunks)
+            metrics.batches += 1
+            metrics.busy_seconds += seconds
+
+            # Ids are stable across runs; the path keeps identical files at different paths apart
+            task_start = page_range[0] if page_range else 0
+            ids = [
+                str(
+                    uuid.uuid5(
+                        uuid.NAMESPACE_URL,
+                        f"{state.path}:{state.digest}:{task_start}:{i}",
+                    )
+                )
+                for i in range(len(chunks))
+            ]
+            with self.lock:
+                state.tasks -= 1
+                if state.error is None:
+                    state.pending += len(chunks)
+                    state.chunks += len(chunks)
+                else:
+                    chunks = []
+                self._maybe_finish(state)
+            size = self.pipeline.embed_batch_size
+            for start in range(0, len(chunks), size):
+                batch = (state, chunks[start : start + size], ids[start : start + size])
+                self._put(self.embed_queue, batch, "parse")
+
+    def _embed_worker(self) -> None:
+        metrics = self.report.stages["embed"]
+        while True:
+            item = self._get(self.embed_queue, "embed")
+            if item is _DONE:
+                return
+            state, chunks, ids = item
+            if state.error is not None:
+                self._settle(state, len(chunks))
+                continue
+            start = time.perf_counter()
+            try:
+                vectors = self.pipeline._embed([chunk.text for chunk in chunks])
+            except Exception as e:
+                self._fail(state, e)
+                self._settle(state, len(chunks))
+                continue
+            with self.lock:
+                metrics.items += len(chunks)
+                metrics.batches += 1
+                metrics.busy_seconds += time.perf_counter() - start
+            self._put(self.write_queue, (state, chunks, ids, vectors), "embed")
+
+    def _write_worker(self) -> None:
+        """Accumulates embedded chunks and writes them `write_batch_size` at a time, or sooner when idle."""
+        buffer: List[Tuple[_FileState, Document, str, List[float]]] = []
+        while True:
+            try:
+                item = self.write_queue.get_nowait()
+            except queue.Empty:
+                if buffer:
+                    self._write(buffer)
+                    buffer = []
+                item = self._get(self.write_queue, "write")
+            if item is _DONE:
+                break
+            state, chunks, ids, vectors = item
+            buffer.extend(
+                (state, chunk, chunk_id, vector)
+                for chunk, chunk_id, vector in zip(chunks, ids, vectors)
+            )
+            if len(buffer) >= self.pipeline.write_batch_size:
+                self._write(buffer)
+                buffer = []
+        if buffer:
+            self._write(buffer)
+
+    def _write(
+        self, buffer: List[Tuple[_FileState, Document, str, List[float]]]
+    ) -> None:
+        metrics = self.report.stages["write"]
+        live = [entry for entry in buffer if entry[0].error is None]
+        written: Dict[int, Tuple[_FileState, List[str]]] = {}
+        for state, _, chunk_id, _ in live:
+            written.setdefault(id(state), (state, []))[1].append(chunk_id)
+        start = time.perf_counter()
+        try:
+            if live:
+                self.pipeline.vector_store.add(
+                    documents=[chunk.text for _, chunk, _, _ in live],
+                    embeddings=[vector for _, _, _, vector in live],
+                    metadatas=[chunk.metadata for _, chunk, _, _ in live],
+                    ids=[chunk_id for _, _, chunk_id, _ in live],
+                )
+            # Files whose chunks cannot be recorded fail too; a re-run replaces their chunks
+            if self.checkpoint is not None:
+                for state, ids in written.values():
+                    self.checkpoint.add_chunks(state.path, ids)
+        except Exception as e:
+            for state, _ in written.values():
+                self._fail(state, e)
+            live = []
+        metrics.busy_seconds += time.perf_counter() - start
+        metrics.items += len(live)
+        metrics.batches += 1
+        self.report.chunks += len(live)
+
+        settled: Dict[int, Tuple[_FileState, int]] = {}
+        for state, _, _, _ in buffer:
+            count = settled.get(id(state), (state, 0))[1]
+            settled[id(state)] = (state, count + 1)
+        for state, count in settled.values():
+            self._settle(state, count)
+
+    def _settle(self, state: _FileState, count: int) -> None:
+        """Marks `count` chunks of a file as written or dropped."""
+        with self.lock:
+            state.pending -= count
+            self._maybe_finish(state)
+
+    def _fail(self, state: _FileState, error: Exception) -> None:
+        logger.error(f"Failed to ingest {state.path}: {error}")
+        with self.lock:
+            if state.error is None:
+                state.error = str(error) or type(error).__name__
+            self._maybe_finish(state)
+
+    def _maybe_finish(self, state: _FileState) -> None:
+        """Records a file as ingested or failed once all its tasks and chunks are done. Callers hold the lock."""
+        if state.done or not state.planned or state.tasks or state.pending:
+            return
+        state.done = True
+        if state.error is not None:
+            self.report.failed[state.path] = state.error
+            return
+        if self.checkpoint is not None:
+            self.checkpoint.complete(state.path)
+        self.report.files_ingested += 1
+        logger.debug(f"Ingested {state.path} ({state.chunks} chunks).")
+
+    def _put(self, target: "queue.Queue", item: Any, stage: str) -> None:
+        start = time.perf_counter()
+        target.put(item)
+        self._waited(stage, time.perf_counter() - start)
+
+    def _get(self, source: "queue.Queue", stage: str) -> Any:
+        start = time.perf_counter()
+        item = source.get()
+        self._waited(stage, time.perf_counter() - start)
+        return item
+
+    def _waited(self, stage: str, seconds: float) -> None:
+        with self.lock:
+            self.report.stages[stage].wait_seconds += seconds
@@ -1,6 +1,6 @@
 from dapr_agents.document.reader.base import ReaderBase
 from dapr_agents.types.document import Document
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
 
@@ -10,7 +10,10 @@ class PyMuPDFReader(ReaderBase):
     """
 
     def load(
-        self, file_path: Path, additional_metadata: Optional[Dict] = None
+        self,
+        file_path: Path,
+        additional_metadata: Optional[Dict] = None,
+        page_range: Optional[Tuple[int, int]] = None,
     ) -> List[Document]:
         """
         Load content from a PDF file using PyMuPDF.
@@ -18,24 +21,19 @@ class PyMuPDFReader(ReaderBase):
         Args:
             file_path (Path): Path to the PDF file.
             additional_metadata (Optional[Dict]): Additional metadata to include.
+            page_range (Optional[Tuple[int, int]]): Zero-based (start, end) range of pages to load, end excluded. Loads all pages if None.
 
         Returns:
             List[Document]: A list of Document objects.
         """
-        try:
-            import pymupdf
-        except ImportError:
-            raise ImportError(
-                "PyMuPDF library is not installed. Install it using `pip install pymupdf`."
-            )
-
         file_path = str(file_path)
-        doc = pymupdf.open(file_path)
+        doc = self._open(file_path)
         total_pages = len(doc)
+        start, end = page_range or (0, total_pages)
         documents = []
 
-        for page_num, page in enumerate(doc.pages):
-            text = page.get_text()
+        for page_num in range(start, min(end, total_pages)):
+            text = doc[page_num].get_text()
             metadata = {
                 "file_path": file_path,
                 "page_number": page_num + 1,
@@ -48,3 +46,29 @@ class PyMuPDFReader(ReaderBase):
 
         doc.close()
         return documents
+
+    def count_pages(self, file_path: Path) -> int:
+        """
+        Counts the pages of a PDF file without extracting their text.
+
+        Args:
+            file_path (Path): Path to the PDF file.
+
+        Returns:
+            int: The number of pages.
+        """
+        doc = self._open(str(file_path))
+        try:
+            return len(doc)
+        finally:
+            doc.close()
+
+    @staticmethod
+    def _open(file_path: str):
+        try:
+            import pymupdf
+        except ImportError:
+            raise ImportError(
+                "PyMuPDF library is not installed. Install it using `pip install pymupdf`."
+            )
+        return pymupdf.open(file_path)
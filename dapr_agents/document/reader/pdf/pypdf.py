@@ -1,6 +1,6 @@
 from dapr_agents.types.document import Document
 from dapr_agents.document.reader.base import ReaderBase
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
 
@@ -10,7 +10,10 @@ class PyPDFReader(ReaderBase):
     """
 
     def load(
-        self, file_path: Path, additional_metadata: Optional[Dict] = None
+        self,
+        file_path: Path,
+        additional_metadata: Optional[Dict] = None,
+        page_range: Optional[Tuple[int, int]] = None,
     ) -> List[Document]:
         """
         Load content from a PDF file using PyPDF.
@@ -18,23 +21,18 @@ class PyPDFReader(ReaderBase):
         Args:
             file_path (Path): Path to the PDF file.
             additional_metadata (Optional[Dict]): Additional metadata to include.
+            page_range (Optional[Tuple[int, int]]): Zero-based (start, end) range of pages to load, end excluded. Loads all pages if None.
 
         Returns:
             List[Document]: A list of Document objects.
         """
-        try:
-            from pypdf import PdfReader
-        except ImportError:
-            raise ImportError(
-                "PyPDF library is not installed. Install it using `pip install pypdf`."
-            )
-
-        reader = PdfReader(file_path)
+        reader = self._open(file_path)
         total_pages = len(reader.pages)
+        start, end = page_range or (0, total_pages)
         documents = []
 
-        for page_num, page in enumerate(reader.pages):
-            text = page.extract_text()
+        for page_num in range(start, min(end, total_pages)):
+            text = reader.pages[page_num].extract_text()
             metadata = {
                 "file_path": str(file_path),
                 "page_number": page_num + 1,
@@ -46,3 +44,25 @@ class PyPDFReader(ReaderBase):
             documents.append(Document(text=text.strip(), metadata=metadata))
 
         return documents
+
+    def count_pages(self, file_path: Path) -> int:
+        """
+        Counts the pages of a PDF file without extracting their text.
+
+        Args:
+            file_path (Path): Path to the PDF file.
+
+        Returns:
+            int: The number of pages.
+        """
+        return len(self._open(file_path).pages)
+
+    @staticmethod
+    def _open(file_path: Path):
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            raise ImportError(
+                "PyPDF library is not installed. Install it using `pip install pypdf`."
+            )
+        return PdfReader(file_path)
@@ -1,2 +1,3 @@
-from .base import SplitterBase
+from .base import SplitterBase, TextChunk
 from .text import TextSplitter
+from .token import TokenTextSplitter
@@ -1,7 +1,18 @@
 from pydantic import BaseModel, ConfigDict, Field
 from abc import ABC, abstractmethod
-from typing import List, Optional, Callable
+from typing import (
+    List,
+    Optional,
+    Callable,
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Tuple,
+)
 from dapr_agents.types.document import Document
+from collections import deque
 import re
 import logging
 
@@ -16,6 +27,21 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+class TextChunk(NamedTuple):
+    """A chunk of text with its character offsets in the source text."""
+
+    text: str
+    start_index: int
+    end_index: int
+    size: int
+
+
+class _Piece(NamedTuple):
+    start: int
+    text: str
+    size: int
+
+
 class SplitterBase(BaseModel, ABC):
     """
     Base class for defining text splitting strategies.
@@ -83,9 +109,6 @@ class SplitterBase(BaseModel, ABC):
         """
         Merge splits into chunks while ensuring size constraints and meaningful overlaps.
 
-        Unlike other implementations, this method prioritizes sentence boundaries
-        when creating overlaps, ensuring that each chunk remains contextually meaningful.
-
         Args:
             splits (List[str]): The text segments to be merged.
             max_size (int): Maximum allowed size for each chunk.
@@ -93,65 +116,115 @@ class SplitterBase(BaseModel, ABC):
         Returns:
             List[str]: The resulting merged chunks.
         """
-        if not splits:
-            return []
+        pieces = []
+        offset = 0
+        for split in splits:
+            pieces.append((offset, split))
+            offset += len(split)
+        return [chunk.text for chunk in self._merge_pieces(pieces, max_size)]
+
+    def _merge_pieces(
+        self,
+        pieces: Iterable[Tuple[int, str]],
+        max_size: int,
+        size_of: Optional[Callable[[int, str], int]] = None,
+    ) -> Iterator[TextChunk]:
+        """
+        Merge (offset, text) pieces into chunks while ensuring size constraints and meaningful overlaps.
 
-        chunks = []  # Store finalized chunks
-        current_chunk = []  # Collect splits for the current chunk
+        Unlike other implementations, this method prioritizes sentence boundaries
+        when creating overlaps, ensuring that each chunk remains contextually meaningful.
+        The size of every piece is computed once, and pieces are consumed lazily, so chunks are
+        yielded as soon as they are complete.
+
+        Args:
+            pieces (Iterable[Tuple[int, str]]): Text segments and their offsets in the source text.
+            max_size (int): Maximum allowed size for each chunk.
+            size_of (Optional[Callable[[int, str], int]]): Returns the size of a piece from its offset
+                and text. Defaults to `chunk_size_function` applied to the text.
+
+        Yields:
+            TextChunk: The merged chunks with their character offsets.
+        """
+        current: deque = deque()  # Pieces of the current chunk
         current_size = 0  # Track the size of the current chunk
+        chunk_count = 0
+
+        for start, text in pieces:
+            size = size_of(start, text) if size_of else self._get_chunk_size(text)
+            piece = _Piece(start, text, size)
+
+            # If adding the current piece exceeds max_size, finalize the current chunk
+            if current and current_size + piece.size > max_size:
+                chunk_count += 1
+                yield self._make_chunk(current, current_size)
+                logger.debug(
+                    f"Chunk {chunk_count} finalized. Size: {current_size}. Overlap size: {self.chunk_overlap}"
+                )
 
-        for split in splits:
-            split_size = self._get_chunk_size(split)
-
-            # If adding the current split exceeds max_size, finalize the current chunk
-            if current_size + split_size > max_size:
-                if current_chunk:
-                    # Finalize the current chunk
-                    full_chunk = "".join(current_chunk)
-                    chunks.append(full_chunk)
-
-                    # Logging information for overlap and chunk size
-                    logger.debug(
-                        f"Chunk {len(chunks)} finalized. Size: {current_size}. Overlap size: {self.chunk_overlap}"
-                    )
-
-                    # Create an overlap using sentences from the current chunk
-                    overlap = []
-                    overlap_size = 0
-                    for sentence in reversed(current_chunk):
-                        sentence_size = self._get_chunk_size(sentence)
-                        if overlap_size + sentence_size > self.chunk_overlap:
-                            break
-                        overlap.insert(0, sentence)
-                        overlap_size += sentence_size
-
-                    # Logging information for overlap content
-                    logger.debug(f"Chunk {len(chunks)} overlap: {''.join(overlap)}")
-
-                    # Start the new chunk with the overlap
-                    current_chunk = overlap
-                    current_size = overlap_size
-                else:
-                    # If a single split exceeds max_size, treat it as a standalone chunk
-                    chunks.append(split)
-                    current_chunk = []
-                    current_size = 0
-            else:
-                # Add the current split to the ongoing chunk
-                current_chunk.append(split)
-                current_size += split_size
+                # Keep the trailing pieces that fit into the overlap
+                overlap_size = 0
+                keep = 0
+                for previous in reversed(current):
+                    if overlap_size + previous.size > self.chunk_overlap:
+                        break
+                    overlap_size += previous.size
+                    keep += 1
+                while len(current) > keep:
+                    current.popleft()
+                current_size = overlap_size
+
+                # Drop overlap from the front until the new piece fits
+                while current and current_size + piece.size > max_size:
+                    current_size -= current.popleft().size
+
+            if not current and piece.size > max_size:
+                # If a single piece exceeds max_size, treat it as a standalone chunk
+                chunk_count += 1
+                yield TextChunk(
+                    piece.text, piece.start, piece.start + len(piece.text), piece.size
+                )
+                continue
 
-        # Finalize the last chunk
-        if current_chunk:
-            chunks.append("".join(current_chunk))
-            logger.debug(f"Chunk {len(chunks)} finalized. Size: {current_size}.")
+            # Add the current piece to the ongoing chunk
+            current.append(piece)
+            current_size += piece.size
 
-        return chunks
+        # Finalize the last chunk
+        if current:
+            chunk_count += 1
+            yield self._make_chunk(current, current_size)
+            logger.debug(f"Chunk {chunk_count} finalized. Size: {current_size}.")
+
+    @staticmethod
+    def _make_chunk(pieces: deque, size: int) -> TextChunk:
+        last = pieces[-1]
+        return TextChunk(
+            "".join(piece.text for piece in pieces),
+            pieces[0].start,
+            last.start + len(last.text),
+            size,
+        )
 
     def _split_by_separators(self, text: str, separators: List[str]) -> List[str]:
         """
         Split text using a prioritized list of separators while keeping separators in chunks.
 
+        Args:
+            text (str): The input text to split.
+            separators (List[str]): List of separators in order of priority.
+
+        Returns:
+            List[str]: A list of non-empty splits with separators retained.
+        """
+        return [piece for _, piece in self._separator_spans(text, separators)]
+
+    def _separator_spans(
+        self, text: str, separators: List[str]
+    ) -> List[Tuple[int, str]]:
+        """
+        Split text using a prioritized list of separators, returning each split with its offset.
+
         For each separator in the provided list, attempt to split the text. The separator
         is appended to each split except the last one to preserve structure.
 
@@ -160,21 +233,23 @@ class SplitterBase(BaseModel, ABC):
             separators (List[str]): List of separators in order of priority.
 
         Returns:
-            List[str]: A list of non-empty splits with separators retained.
+            List[Tuple[int, str]]: Non-empty splits and their offsets in `text`.
         """
         for separator in separators:
-            if separator in text:
+            if separator and separator in text:
+                spans = []
+                offset = 0
                 parts = text.split(separator)
-                result = []
                 for i, part in enumerate(parts):
                     # Add separator to all splits except the last one
-                    if i < len(parts) - 1:
-                        result.append(part + separator)
-                    else:
-                        result.append(part)
-                # Return non-empty chunks only
-                return [chunk for chunk in result if chunk.strip()]
-        return [text.strip()]
+                    piece = part + separator if i < len(parts) - 1 else part
+                    # Keep non-empty chunks only
+                    if piece.strip():
+                        spans.append((offset, piece))
+                    offset += len(piece)
+                return spans
+        stripped = text.strip()
+        return [(text.find(stripped), stripped)]
 
     def _split_by_sentences(self, text: str) -> List[str]:
         """
@@ -186,9 +261,30 @@ class SplitterBase(BaseModel, ABC):
         Returns:
             List[str]: List of sentences split from the text.
         """
+        return [sentence for _, sentence in self._sentence_spans(text)]
+
+    def _sentence_spans(self, text: str) -> List[Tuple[int, str]]:
+        """
+        Split text into sentences with their offsets, using NLTK if available or the fallback regex.
+
+        Args:
+            text (str): The input text to split.
+
+        Returns:
+            List[Tuple[int, str]]: Sentences and their offsets in `text`.
+        """
         if NLTK_AVAILABLE:
-            return sent_tokenize(text)
-        return self._regex_split(text)
+            spans = []
+            cursor = 0
+            for sentence in sent_tokenize(text):
+                # Sentences are returned in order, so each search starts where the last one ended
+                start = text.find(sentence, cursor)
+                if start == -1:
+                    start = cursor
+                spans.append((start, sentence))
+                cursor = start + len(sentence)
+            return spans
+        return self._regex_spans(text)
 
     def _regex_split(self, text: str) -> List[str]:
         """
@@ -200,8 +296,15 @@ class SplitterBase(BaseModel, ABC):
         Returns:
             List[str]: List of text segments split using regex.
         """
-        matches = re.findall(self.fallback_regex, text)
-        return [match for match in matches if match.strip()]
+        return [match for _, match in self._regex_spans(text)]
+
+    def _regex_spans(self, text: str) -> List[Tuple[int, str]]:
+        """Split text using the fallback regex, returning each segment with its offset."""
+        return [
+            (match.start(), match.group())
+            for match in re.finditer(self.fallback_regex, text)
+            if match.group().strip()
+        ]
 
     def _split_adaptively(self, text: str) -> List[str]:
         """
@@ -213,19 +316,88 @@ class SplitterBase(BaseModel, ABC):
         Returns:
             List[str]: List of adaptively split text segments.
         """
+        return [piece for _, piece in self._adaptive_spans(text)]
+
+    def _adaptive_spans(self, text: str) -> List[Tuple[int, str]]:
+        """
+        Adaptively split text using separators, fallback methods, and regex, keeping offsets.
+
+        Args:
+            text (str): The input text to split.
+
+        Returns:
+            List[Tuple[int, str]]: Text segments and their offsets in `text`.
+        """
         # Try primary separator first
-        chunks = self._split_by_separators(text, [self.separator])
+        spans = self._separator_spans(text, [self.separator])
 
         # Use fallback separators if the primary separator fails
-        if len(chunks) <= 1:
-            chunks = self._split_by_separators(text, self.fallback_separators)
+        if len(spans) <= 1:
+            spans = self._separator_spans(text, self.fallback_separators)
 
         # Finally, fallback to sentence-based or regex splitting
-        if len(chunks) <= 1:
-            chunks = self._split_by_sentences(text)
+        if len(spans) <= 1:
+            spans = self._sentence_spans(text) or spans
 
+        return self._close_gaps(text, spans)
+
+    @staticmethod
+    def _close_gaps(text: str, spans: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+        """
+        Extends the spans so they cover `text` from start to end: the first span starts at 0 and
+        every span runs up to the start of the next one. Text between or around the spans (e.g.
+        dropped whitespace-only splits or a tail without punctuation) stays in a chunk, and each
+        chunk is an exact slice of `text`.
+        """
+        if not spans:
+            return [(0, text)] if text else []
+        bounds = [0] + [start for start, _ in spans[1:]] + [len(text)]
+        return [
+            (bounds[i], text[bounds[i] : bounds[i + 1]])
+            for i in range(len(spans))
+            if bounds[i] < bounds[i + 1]
+        ]
+
+    def split_with_offsets(self, text: str) -> List[TextChunk]:
+        """
+        Split text into chunks together with their character offsets in `text`.
+
+        Splitters that only implement `split` get offsets by searching for each chunk after the
+        previous one. Subclasses that track offsets while splitting should override this.
+
+        Args:
+            text (str): The text to be split.
+
+        Returns:
+            List[TextChunk]: The chunks with their offsets and sizes.
+        """
+        chunks = []
+        cursor = 0
+        for chunk in self.split(text):
+            start = text.find(chunk, cursor)
+            if start == -1:
+                start = cursor
+            end = start + len(chunk)
+            chunks.append(TextChunk(chunk, start, end, self._get_chunk_size(chunk)))
+            cursor = start + 1
         return chunks
 
+    def split_stream(self, texts: Iterable[str]) -> Iterator[TextChunk]:
+        """
+        Split a stream of text, e.g. the pages of a large PDF, into chunks.
+
+        The stream is treated as one continuous text: chunks may span page boundaries and offsets
+        refer to the concatenated text. This default joins the stream and splits it at once;
+        subclasses can override it to yield chunks as the text arrives.
+
+        Args:
+            texts (Iterable[str]): Consecutive pieces of the text.
+
+        Yields:
+            TextChunk: The chunks with their offsets in the concatenated text.
+        """
+        yield from self.split_with_offsets("".join(texts))
+
     def split_documents(self, documents: List[Document]) -> List[Document]:
         """
         Split documents into smaller chunks while retaining metadata.
@@ -236,28 +408,59 @@ class SplitterBase(BaseModel, ABC):
         Returns:
             List[Document]: List of chunked documents with updated metadata.
         """
-        chunked_documents = []
+        return list(self.iter_split_documents(documents))
+
+    def iter_split_documents(self, documents: Iterable[Document]) -> Iterator[Document]:
+        """
+        Split documents into smaller chunks, yielding the chunks of one document at a time.
+
+        Args:
+            documents (Iterable[Document]): Documents to be split, e.g. a generator over pages.
+
+        Yields:
+            Document: Chunked documents with updated metadata.
+        """
         for doc in documents:
-            text_chunks = self.split(doc.text)
-
-            previous_end = 0
-            for chunk_num, chunk in enumerate(text_chunks):
-                start_index = doc.text.find(chunk, previous_end)
-                if start_index == -1:
-                    start_index = previous_end
-                end_index = start_index + self._get_chunk_size(chunk)
-
-                metadata = doc.metadata.copy() if doc.metadata else {}
-                metadata.update(
-                    {
-                        "chunk_number": chunk_num + 1,
-                        "total_chunks": len(text_chunks),
-                        "start_index": start_index,
-                        "end_index": end_index,
-                        "chunk_length": self._get_chunk_size(chunk),
-                    }
+            chunks = self.split_with_offsets(doc.text)
+            for chunk_num, chunk in enumerate(chunks):
+                yield self._chunk_document(
+                    chunk, chunk_num, doc.metadata, total_chunks=len(chunks)
                 )
-                chunked_documents.append(Document(metadata=metadata, text=chunk))
-                previous_end = end_index
 
-        return chunked_documents
+    def split_text_stream(
+        self, texts: Iterable[str], metadata: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Document]:
+        """
+        Split a stream of text into `Document` chunks as the text arrives. See `split_stream`.
+
+        The total number of chunks is not known in advance, so the metadata has no "total_chunks".
+
+        Args:
+            texts (Iterable[str]): Consecutive pieces of the text, e.g. the pages of a large PDF.
+            metadata (Optional[Dict[str, Any]]): Metadata copied into every chunk.
+
+        Yields:
+            Document: Chunked documents with updated metadata.
+        """
+        for chunk_num, chunk in enumerate(self.split_stream(texts)):
+            yield self._chunk_document(chunk, chunk_num, metadata)
+
+    @staticmethod
+    def _chunk_document(
+        chunk: TextChunk,
+        chunk_num: int,
+        metadata: Optional[Dict[str, Any]],
+        total_chunks: Optional[int] = None,
+    ) -> Document:
+        metadata = metadata.copy() if metadata else {}
+        metadata["chunk_number"] = chunk_num + 1
+        if total_chunks is not None:
+            metadata["total_chunks"] = total_chunks
+        metadata.update(
+            {
+                "start_index": chunk.start_index,
+                "end_index": chunk.end_index,
+                "chunk_length": chunk.size,
+            }
+        )
+        return Document(metadata=metadata, text=chunk.text)
@@ -1,5 +1,6 @@
-from dapr_agents.document.splitter.base import SplitterBase
-from typing import List
+from dapr_agents.document.splitter.base import SplitterBase, TextChunk
+from typing import Iterable, Iterator, List, Tuple
+from itertools import chain
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,23 +29,101 @@ class TextSplitter(SplitterBase):
         Returns:
             List[str]: List of merged text chunks.
         """
+        return [chunk.text for chunk in self.split_with_offsets(text)]
+
+    def split_with_offsets(self, text: str) -> List[TextChunk]:
+        """
+        Splits input text into chunks like `split`, tracking each chunk's character offsets.
+
+        Args:
+            text (str): The text to be split.
+
+        Returns:
+            List[TextChunk]: The chunks with their offsets and sizes.
+        """
         # Step 1: Adjust effective chunk size
         effective_chunk_size = self.chunk_size - self.reserved_metadata_size
         logger.debug(f"Effective chunk size: {effective_chunk_size}")
 
         # Step 2: Short-circuit for small texts
-        if self._get_chunk_size(text) <= effective_chunk_size:
+        text_size = self._get_chunk_size(text)
+        if text_size <= effective_chunk_size:
             logger.debug(
                 "Text size is smaller than effective chunk size. Returning as a single chunk."
             )
-            return [text]
+            return [TextChunk(text, 0, len(text), text_size)]
 
         # Step 3: Use adaptive splitting strategy
-        chunks = self._split_adaptively(text)
-        logger.debug(f"Initial split into {len(chunks)} chunks.")
+        spans = self._adaptive_spans(text)
+        logger.debug(f"Initial split into {len(spans)} chunks.")
 
         # Step 4: Merge smaller chunks into valid sizes with overlap
-        merged_chunks = self._merge_splits(chunks, effective_chunk_size)
+        merged_chunks = list(self._merge_pieces(spans, effective_chunk_size))
         logger.debug(f"Merged into {len(merged_chunks)} chunks with overlap.")
 
         return merged_chunks
+
+    def split_stream(self, texts: Iterable[str]) -> Iterator[TextChunk]:
+        """
+        Splits a stream of text, e.g. the pages of a large PDF, yielding chunks as the text arrives.
+
+        The stream is treated as one continuous text: chunks may span page boundaries and offsets
+        refer to the concatenated text. Only the chunk being built and the unsplit tail of the
+        stream are kept in memory.
+
+        Args:
+            texts (Iterable[str]): Consecutive pieces of the text.
+
+        Yields:
+            TextChunk: The chunks with their offsets in the concatenated text.
+        """
+        texts = iter(texts)
+        head, complete = self._stream_head(texts)
+        if complete:
+            return iter(self.split_with_offsets("".join(head)))
+        return self._merge_pieces(
+            self._stream_pieces(chain(head, texts)),
+            self.chunk_size - self.reserved_metadata_size,
+        )
+
+    def _stream_head(self, texts: Iterator[str]) -> Tuple[List[str], bool]:
+        """
+        Reads the stream until it no longer fits in one chunk. Returns the texts read and whether
+        the stream ended first, in which case it is split like a single text.
+        """
+        max_size = self.chunk_size - self.reserved_metadata_size
+        head = []
+        for text in texts:
+            head.append(text)
+            if self._get_chunk_size("".join(head)) > max_size:
+                return head, False
+        return head, True
+
+    def _stream_pieces(self, texts: Iterable[str]) -> Iterator[Tuple[int, str]]:
+        """
+        Yields the pieces of a text stream, which together cover the whole stream. The last piece
+        of the buffer may continue in the next text, so it is carried over and split again together
+        with it.
+        """
+        buffer = ""
+        buffer_start = 0
+        carried = False  # Whether the buffer holds only the piece carried over
+        for text in texts:
+            if not text:
+                continue
+            buffer += text
+            carried = False
+            spans = self._adaptive_spans(buffer)
+            if len(spans) <= 1:
+                continue
+            for start, piece in spans[:-1]:
+                yield buffer_start + start, piece
+            carry = spans[-1][0]
+            buffer = buffer[carry:]
+            buffer_start += carry
+            carried = True
+        if carried:
+            yield buffer_start, buffer
+        else:
+            for start, piece in self._adaptive_spans(buffer):
+                yield buffer_start + start, piece
@@ -0,0 +1,236 @@
+from dapr_agents.document.splitter.base import TextChunk
+from dapr_agents.document.splitter.text import TextSplitter
+from dapr_agents.types.document import Document
+from typing import List, Any, Optional, Iterable, Iterator, Tuple
+from pydantic import Field, PrivateAttr
+from functools import lru_cache
+from itertools import chain, islice
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _load_tiktoken(encoding_name: Optional[str], model: Optional[str]) -> Any:
+    try:
+        import tiktoken
+    except ImportError:
+        raise ImportError(
+            "The `tiktoken` library is required for token-based splitting. "
+            "Install it using `pip install tiktoken`."
+        )
+    if model:
+        return tiktoken.encoding_for_model(model)
+    return tiktoken.get_encoding(encoding_name)
+
+
+@lru_cache(maxsize=None)
+def _load_hf_tokenizer(name: str) -> Any:
+    try:
+        from transformers import AutoTokenizer
+    except ImportError:
+        raise ImportError(
+            "The `transformers` library is required for Hugging Face tokenizers. "
+            "Install it using `pip install transformers`."
+        )
+    return AutoTokenizer.from_pretrained(name, use_fast=True)
+
+
+class TokenTextSplitter(TextSplitter):
+    """
+    Splits text into chunks measured in tokens.
+
+    Each document is tokenized once, and the character offset of every token is kept. Pieces are
+    still cut along the separator hierarchy of `TextSplitter`, but their sizes are read from the
+    token offsets instead of tokenizing every piece again. Pieces longer than a chunk are cut on
+    token boundaries. `split_documents` tokenizes documents in batches.
+
+    Sizes follow the tokenization of the whole document, with each token counted in the piece where
+    it starts. Tokenizing a chunk on its own can differ by a token at its edges.
+
+    Uses tiktoken by default; pass `tokenizer` to use a Hugging Face (fast) tokenizer instead.
+    """
+
+    chunk_size: int = Field(
+        default=512, description="Maximum size of chunks in tokens.", gt=0
+    )
+    chunk_overlap: int = Field(
+        default=50,
+        description="Overlap size in tokens between chunks for context continuity.",
+        ge=0,
+    )
+    encoding_name: str = Field(
+        default="cl100k_base", description="tiktoken encoding used to count tokens."
+    )
+    model: Optional[str] = Field(
+        default=None,
+        description="Model whose tiktoken encoding is used. Takes precedence over `encoding_name`.",
+    )
+    tokenizer: Optional[Any] = Field(
+        default=None,
+        description="Hugging Face tokenizer, or the name of one, used instead of tiktoken.",
+    )
+    batch_size: int = Field(
+        default=64, gt=0, description="Number of documents tokenized per batch."
+    )
+
+    _encoder: Any = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """
+        Loads the tokenizer (cached across splitters) and measures streamed pieces in tokens.
+        """
+        if isinstance(self.tokenizer, str):
+            self.tokenizer = _load_hf_tokenizer(self.tokenizer)
+        elif self.tokenizer is None:
+            self._encoder = _load_tiktoken(self.encoding_name, self.model)
+        if self.chunk_size_function is len:
+            self.chunk_size_function = self._count_one
+        super().model_post_init(__context)
+
+    def count_tokens(self, texts: List[str]) -> List[int]:
+        """
+        Counts the tokens of many texts in one batched call.
+
+        Args:
+            texts (List[str]): The texts to measure.
+
+        Returns:
+            List[int]: The number of tokens of each text.
+        """
+        if self._encoder is not None:
+            return [
+                len(tokens) for tokens in self._encoder.encode_ordinary_batch(texts)
+            ]
+        encoded = self.tokenizer(texts, add_special_tokens=False)
+        return [len(ids) for ids in encoded["input_ids"]]
+
+    def split_with_offsets(self, text: str) -> List[TextChunk]:
+        """
+        Splits input text into token-sized chunks with their character offsets.
+
+        Args:
+            text (str): The text to be split.
+
+        Returns:
+            List[TextChunk]: The chunks with their character offsets and token counts.
+        """
+        return self._split_tokenized(text, self._token_starts([text])[0])
+
+    def iter_split_documents(self, documents: Iterable[Document]) -> Iterator[Document]:
+        """
+        Splits documents into token-sized chunks, tokenizing `batch_size` documents at a time.
+
+        Args:
+            documents (Iterable[Document]): Documents to be split.
+
+        Yields:
+            Document: Chunked documents with updated metadata. `start_index` and `end_index` are
+                character offsets; `chunk_length` is the number of tokens.
+        """
+        iterator = iter(documents)
+        while batch := list(islice(iterator, self.batch_size)):
+            starts = self._token_starts([doc.text for doc in batch])
+            for doc, doc_starts in zip(batch, starts):
+                chunks = self._split_tokenized(doc.text, doc_starts)
+                for chunk_num, chunk in enumerate(chunks):
+                    yield self._chunk_document(
+                        chunk, chunk_num, doc.metadata, total_chunks=len(chunks)
+                    )
+
+    def split_stream(self, texts: Iterable[str]) -> Iterator[TextChunk]:
+        """
+        Splits a stream of text into token-sized chunks as the text arrives. Each piece of the
+        stream is tokenized once, when it is complete.
+
+        Args:
+            texts (Iterable[str]): Consecutive pieces of the text.
+
+        Yields:
+            TextChunk: The chunks with their offsets in the concatenated text.
+        """
+        texts = iter(texts)
+        head, complete = self._stream_head(texts)
+        if complete:
+            return iter(self.split_with_offsets("".join(head)))
+        max_size = self.chunk_size - self.reserved_metadata_size
+        sizes = {}
+
+        def pieces() -> Iterator[Tuple[int, str]]:
+            for start, piece in self._stream_pieces(chain(head, texts)):
+                starts = self._token_starts([piece])[0]
+                if len(starts) <= max_size:
+                    sizes[start] = len(starts)
+                    yield start, piece
+                    continue
+                for window_start, window_end, size in self._token_windows(
+                    starts, 0, len(piece), max_size
+                ):
+                    sizes[start + window_start] = size
+                    yield start + window_start, piece[window_start:window_end]
+
+        return self._merge_pieces(
+            pieces(), max_size, lambda start, piece: sizes.pop(start)
+        )
+
+    def _count_one(self, text: str) -> int:
+        return self.count_tokens([text])[0]
+
+    def _token_starts(self, texts: List[str]) -> List[np.ndarray]:
+        """Tokenizes texts in one batch and returns the character offset at which each token starts."""
+        if self._encoder is not None:
+            return [
+                np.asarray(self._encoder.decode_with_offsets(tokens)[1], dtype=np.int64)
+                for tokens in self._encoder.encode_ordinary_batch(texts)
+            ]
+        if not getattr(self.tokenizer, "is_fast", False):
+            raise ValueError(
+                "TokenTextSplitter requires a fast Hugging Face tokenizer to map tokens to offsets."
+            )
+        encoded = self.tokenizer(
+            texts, add_special_tokens=False, return_offsets_mapping=True
+        )
+        return [
+            np.asarray([start for start, _ in offsets], dtype=np.int64)
+            for offsets in encoded["offset_mapping"]
+        ]
+
+    def _split_tokenized(self, text: str, starts: np.ndarray) -> List[TextChunk]:
+        """Splits a text whose token start offsets are known."""
+        max_size = self.chunk_size - self.reserved_metadata_size
+        if len(starts) <= max_size:
+            return [TextChunk(text, 0, len(text), len(starts))]
+
+        def size_of(start: int, piece: str) -> int:
+            # Tokens are attributed to the piece in which they start
+            first, last = np.searchsorted(starts, [start, start + len(piece)])
+            return int(last - first)
+
+        pieces = self._token_pieces(text, starts, max_size, size_of)
+        return list(self._merge_pieces(pieces, max_size, size_of))
+
+    def _token_pieces(
+        self, text: str, starts: np.ndarray, max_size: int, size_of: Any
+    ) -> Iterator[Tuple[int, str]]:
+        """Yields the separator-based pieces of `text`, cutting pieces longer than `max_size` tokens on token boundaries."""
+        for start, piece in self._adaptive_spans(text):
+            if size_of(start, piece) <= max_size:
+                yield start, piece
+                continue
+            for window_start, window_end, _ in self._token_windows(
+                starts, start, start + len(piece), max_size
+            ):
+                yield window_start, text[window_start:window_end]
+
+    @staticmethod
+    def _token_windows(
+        starts: np.ndarray, start: int, end: int, max_size: int
+    ) -> Iterator[Tuple[int, int, int]]:
+        """Yields (start, end, tokens) windows of at most `max_size` tokens covering characters [start, end)."""
+        first, last = (int(i) for i in np.searchsorted(starts, [start, end]))
+        for window in range(first, last, max_size):
+            window_start = start if window == first else int(starts[window])
+            window_stop = min(window + max_size, last)
+            window_end = int(starts[window_stop]) if window_stop < last else end
+            yield window_start, window_end, window_stop - window
@@ -1,6 +1,12 @@
 from pydantic import BaseModel, PrivateAttr
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Dict
+import asyncio
+import inspect
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
 
 
 class LLMClientBase(BaseModel, ABC):
@@ -16,6 +22,12 @@ class LLMClientBase(BaseModel, ABC):
     _config: Any = PrivateAttr()
     _client: Any = PrivateAttr()
 
+    # Asynchronous clients, created lazily per event loop
+    _async_clients: Dict[asyncio.AbstractEventLoop, Any] = PrivateAttr(
+        default_factory=dict
+    )
+    _async_clients_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
     @property
     def provider(self) -> str:
         return self._provider
@@ -32,11 +44,69 @@ class LLMClientBase(BaseModel, ABC):
     def client(self) -> Any:
         return self._client
 
+    @property
+    def async_client(self) -> Any:
+        """
+        Asynchronous client bound to the running event loop.
+
+        Async HTTP and gRPC clients keep connections tied to the loop that opened them, so one client
+        is created per event loop on first use.
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            # Evict clients of loops closed in the meantime; they are closed below
+            stale = {
+                lp: self._async_clients.pop(lp)
+                for lp in list(self._async_clients)
+                if lp.is_closed()
+            }
+            if loop not in self._async_clients:
+                self._async_clients[loop] = self.get_async_client()
+            client = self._async_clients[loop]
+        for stale_loop, stale_client in stale.items():
+            self._close_async_client(stale_loop, stale_client)
+        return client
+
+    @staticmethod
+    def _close_async_client(owner: asyncio.AbstractEventLoop, client: Any) -> None:
+        """
+        Closes an evicted asynchronous client, best effort.
+
+        The client is closed on its own loop while that loop is still running. Otherwise it is closed
+        on the current thread's running loop, or on a temporary loop when there is none.
+        """
+        close = getattr(client, "close", None)
+        if not callable(close):
+            return
+
+        async def _close() -> None:
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.debug(f"Ignoring error while closing async LLM client: {e}")
+
+        if not owner.is_closed() and owner.is_running():
+            asyncio.run_coroutine_threadsafe(_close(), owner)
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(_close())
+        else:
+            running.create_task(_close())
+
     @abstractmethod
     def get_client(self) -> Any:
         """Abstract method to get the client for the LLM model."""
         pass
 
+    @abstractmethod
+    def get_async_client(self) -> Any:
+        """Abstract method to get the asynchronous client for the LLM model."""
+        pass
+
     @abstractmethod
     def get_config(self) -> Any:
         """Abstract method to get the configuration for the LLM model."""
@@ -49,3 +119,7 @@ class LLMClientBase(BaseModel, ABC):
         # Refresh config and client using the current state
         self._config = self.get_config()
         self._client = self.get_client()
+        with self._async_clients_lock:
+            evicted, self._async_clients = self._async_clients, {}
+        for loop, client in evicted.items():
+            self._close_async_client(loop, client)
@@ -0,0 +1,6 @@
+from .base import CacheBackendBase
+from .memory import InMemoryCacheBackend
+from .sqlite import SQLiteCacheBackend
+from .daprstate import DaprStateCacheBackend
+from .response import LLMResponseCache, CacheStats
+from .semantic import SemanticResponseCache, SemanticCacheKey
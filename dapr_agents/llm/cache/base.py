@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+from pydantic import BaseModel, ConfigDict
+import asyncio
+
+
+class CacheBackendBase(BaseModel, ABC):
+    """
+    Abstract key-value backend for caches. Values must be JSON-serializable.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the value stored under `key`, or None if it is missing or expired.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The cached value.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value under `key`.
+
+        Args:
+            key (str): The cache key.
+            value (Any): A JSON-serializable value.
+            ttl (Optional[float]): Seconds until the entry expires. None keeps it until evicted.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes the value stored under `key`, if any.
+
+        Args:
+            key (str): The cache key.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        pass
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronous `get`. Runs in a worker thread unless overridden."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Asynchronous `set`. Runs in a worker thread unless overridden."""
+        await asyncio.to_thread(self.set, key, value, ttl)
@@ -0,0 +1,105 @@
+from typing import Any, Optional
+from pydantic import Field, PrivateAttr
+from dapr_agents.llm.cache.base import CacheBackendBase
+from dapr_agents.storage.daprstores.statestore import DaprStateStore
+import json
+import logging
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Key, under `key_prefix`, of the generation that is part of every cache key
+GENERATION_KEY = "__generation__"
+
+# Generation used until `clear()` is called for the first time
+INITIAL_GENERATION = "0"
+
+
+class DaprStateCacheBackend(CacheBackendBase):
+    """
+    Cache backed by a Dapr state store, shared by every replica that uses the same component.
+
+    Expiry relies on the state store's `ttlInSeconds` support. Dapr has no key listing, so instead of
+    tracking the keys it wrote, the backend puts a generation in every key. `clear()` stores a new
+    generation; entries of older generations are no longer read and expire through their TTL.
+    Replicas re-read the generation every `generation_refresh` seconds.
+    """
+
+    store_name: str = Field(..., description="Name of the Dapr state store component.")
+    key_prefix: str = Field(
+        default="llm_cache", description="Prefix added to every cache key."
+    )
+    generation_refresh: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds a replica keeps using the generation it read before reading it again, which bounds how long a clear() by another replica goes unnoticed.",
+    )
+    state_store: Optional[DaprStateStore] = Field(
+        default=None,
+        init=False,
+        description="Dapr state store used to persist entries.",
+    )
+
+    _generation: Optional[str] = PrivateAttr(default=None)
+    _generation_read_at: float = PrivateAttr(default=0.0)
+    _generation_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def model_post_init(self, __context: Any) -> None:
+        self.state_store = DaprStateStore(store_name=self.store_name)
+        super().model_post_init(__context)
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}:{self._current_generation()}:{key}"
+
+    def _current_generation(self) -> str:
+        """Returns the current generation, reading it from the store when the local copy is stale."""
+        with self._generation_lock:
+            if (
+                self._generation is not None
+                and time.monotonic() - self._generation_read_at
+                < self.generation_refresh
+            ):
+                return self._generation
+        found, value = self.state_store.try_get_state(
+            f"{self.key_prefix}:{GENERATION_KEY}"
+        )
+        generation = value if found and value else INITIAL_GENERATION
+        with self._generation_lock:
+            self._generation = generation
+            self._generation_read_at = time.monotonic()
+        return generation
+
+    def get(self, key: str) -> Optional[Any]:
+        found, value = self.state_store.try_get_state(self._key(key))
+        return value if found else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        metadata = {"contentType": "application/json"}
+        if ttl is not None:
+            metadata["ttlInSeconds"] = str(max(1, int(ttl)))
+        self.state_store.save_state(
+            self._key(key), json.dumps(value), state_metadata=metadata
+        )
+
+    def delete(self, key: str) -> None:
+        self.state_store.delete_state(self._key(key))
+
+    def clear(self) -> None:
+        """
+        Moves the cache to a new generation, so no entry written so far is read again.
+
+        The old entries are not deleted; they expire through their TTL. Entries stored without a
+        TTL stay in the state store until it removes them.
+        """
+        generation = uuid.uuid4().hex
+        self.state_store.save_state(
+            f"{self.key_prefix}:{GENERATION_KEY}",
+            json.dumps(generation),
+            state_metadata={"contentType": "application/json"},
+        )
+        with self._generation_lock:
+            self._generation = generation
+            self._generation_read_at = time.monotonic()
+        logger.debug(f"Cache '{self.key_prefix}' moved to generation {generation}.")
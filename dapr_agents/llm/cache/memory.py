@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+from pydantic import Field, PrivateAttr
+from dapr_agents.llm.cache.base import CacheBackendBase
+import threading
+import time
+
+
+class InMemoryCacheBackend(CacheBackendBase):
+    """
+    Thread-safe in-process LRU cache with optional per-entry expiry.
+    """
+
+    max_size: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum number of entries. The least recently used entry is evicted first.",
+    )
+
+    _entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.set(key, value, ttl)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,243 @@
+from typing import Any, Dict, Optional, Type
+from pydantic import BaseModel, Field, PrivateAttr
+from dapr_agents.llm.cache.base import CacheBackendBase
+from dapr_agents.llm.cache.memory import InMemoryCacheBackend
+from dapr_agents.llm.utils import StructureHandler
+from dapr_agents.types import ChatCompletion
+import hashlib
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStats(BaseModel):
+    """Counters describing how a response cache has been used."""
+
+    hits: int = Field(default=0, description="Requests answered from the cache.")
+    misses: int = Field(
+        default=0, description="Cacheable requests that were not found in the cache."
+    )
+    bypassed: int = Field(
+        default=0, description="Requests that were not eligible for caching."
+    )
+    stores: int = Field(default=0, description="Responses written to the cache.")
+    errors: int = Field(
+        default=0, description="Backend errors, which are logged and treated as misses."
+    )
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of cacheable requests answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LLMResponseCache(BaseModel):
+    """
+    Opt-in cache for chat completion responses.
+
+    Requests are keyed on a hash of the provider and the fully prepared request parameters
+    (normalized messages, formatted tools, model, structured output settings and sampling
+    parameters). By default only deterministic requests are cached, i.e. those sent with
+    `temperature` <= `max_temperature`. Streaming requests are never cached.
+
+    Per call, `use_cache=True` forces caching, `use_cache=False` bypasses the cache and `None`
+    applies the rules above.
+    """
+
+    backend: CacheBackendBase = Field(
+        default_factory=InMemoryCacheBackend,
+        description="Storage backend for cached responses. Defaults to an in-memory LRU.",
+    )
+    ttl: Optional[float] = Field(
+        default=3600.0,
+        gt=0,
+        description="Seconds a cached response stays valid. None keeps responses until the backend evicts them.",
+    )
+    max_temperature: Optional[float] = Field(
+        default=0.0,
+        description="Requests are cached only if they set a temperature at or below this value. None caches regardless of temperature.",
+    )
+    namespace: str = Field(
+        default="v1",
+        description="Included in every key. Change it to invalidate all previously cached responses.",
+    )
+
+    _stats: CacheStats = PrivateAttr(default_factory=CacheStats)
+    _stats_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache hit, miss and bypass counters."""
+        with self._stats_lock:
+            return self._stats.model_copy()
+
+    def reset_stats(self) -> None:
+        """Resets the cache counters."""
+        with self._stats_lock:
+            self._stats = CacheStats()
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + 1)
+
+    def is_cacheable(self, params: Dict[str, Any], use_cache: Optional[bool]) -> bool:
+        """
+        Decides whether a request may be served from and stored in the cache.
+
+        Args:
+            params (Dict[str, Any]): The prepared request parameters.
+            use_cache (Optional[bool]): Per-call override. None applies the default rules.
+
+        Returns:
+            bool: True if the request is eligible for caching.
+        """
+        if use_cache is False or params.get("stream"):
+            return False
+        if use_cache is True or self.max_temperature is None:
+            return True
+        temperature = params.get("temperature")
+        return temperature is not None and temperature <= self.max_temperature
+
+    def make_key(self, provider: str, params: Dict[str, Any]) -> str:
+        """
+        Builds a stable cache key from the provider and request parameters.
+
+        Args:
+            provider (str): The LLM provider name.
+            params (Dict[str, Any]): The prepared request parameters.
+
+        Returns:
+            str: A SHA-256 hex digest.
+
+        Raises:
+            TypeError: If a parameter cannot be serialized into a stable key.
+        """
+        payload = json.dumps(
+            {"namespace": self.namespace, "provider": provider, "params": params},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=_canonical_default,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def serialize(result: Any) -> Any:
+        """Converts a processed chat response into a JSON-serializable value."""
+        if isinstance(result, list):
+            return [item.model_dump(mode="json") for item in result]
+        if isinstance(result, BaseModel):
+            return result.model_dump(mode="json")
+        raise TypeError(f"Unsupported response type for caching: {type(result)}")
+
+    @staticmethod
+    def deserialize(
+        value: Any, response_format: Optional[Type[BaseModel]] = None
+    ) -> Any:
+        """Rebuilds a processed chat response from its cached form."""
+        if response_format is None:
+            return ChatCompletion(**value)
+        model_cls = StructureHandler.resolve_response_model(response_format)
+        if isinstance(value, list):
+            return [model_cls.model_validate(item) for item in value]
+        return model_cls.model_validate(value)
+
+    def lookup(
+        self, key: str, response_format: Optional[Type[BaseModel]] = None
+    ) -> Optional[Any]:
+        """
+        Returns the cached response for `key`, or None on a miss.
+
+        Args:
+            key (str): The cache key.
+            response_format (Optional[Type[BaseModel]]): Structured output model used to rebuild the response.
+
+        Returns:
+            Optional[Any]: The cached response.
+        """
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed: {e}")
+            self._count("errors")
+            value = None
+        return self._finish_lookup(key, value, response_format)
+
+    async def alookup(
+        self, key: str, response_format: Optional[Type[BaseModel]] = None
+    ) -> Optional[Any]:
+        """Asynchronous `lookup`."""
+        try:
+            value = await self.backend.aget(key)
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed: {e}")
+            self._count("errors")
+            value = None
+        return self._finish_lookup(key, value, response_format)
+
+    def _finish_lookup(
+        self, key: str, value: Any, response_format: Optional[Type[BaseModel]]
+    ) -> Optional[Any]:
+        if value is not None:
+            try:
+                result = self.deserialize(value, response_format)
+                self._count("hits")
+                logger.info("Chat completion served from cache.")
+                return result
+            except Exception as e:
+                logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+        self._count("misses")
+        return None
+
+    def store(self, key: str, result: Any) -> None:
+        """
+        Stores a processed chat response under `key`. Backend errors are logged, not raised.
+
+        Args:
+            key (str): The cache key.
+            result (Any): The processed chat response.
+        """
+        try:
+            self.backend.set(key, self.serialize(result), self.ttl)
+            self._count("stores")
+        except Exception as e:
+            logger.warning(f"LLM cache store failed: {e}")
+            self._count("errors")
+
+    async def astore(self, key: str, result: Any) -> None:
+        """Asynchronous `store`."""
+        try:
+            await self.backend.aset(key, self.serialize(result), self.ttl)
+            self._count("stores")
+        except Exception as e:
+            logger.warning(f"LLM cache store failed: {e}")
+            self._count("errors")
+
+    def record_bypass(self) -> None:
+        """Counts a request that was not eligible for caching."""
+        self._count("bypassed")
+
+    def clear(self) -> None:
+        """Removes all cached responses."""
+        self.backend.clear()
+
+
+def _canonical_default(value: Any) -> Any:
+    """
+    JSON fallback for request parameters that are not natively serializable.
+
+    Raises:
+        TypeError: For values without a canonical form. Their `repr` can differ between processes
+            (e.g. it includes memory addresses), which would give the same request different keys.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return value.model_json_schema()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    raise TypeError(
+        f"Request parameter of type {type(value).__name__} cannot be part of a cache key."
+    )
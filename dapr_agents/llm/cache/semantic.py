@@ -0,0 +1,256 @@
+from typing import Any, Dict, List, Optional, Tuple, Type
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from dapr_agents.llm.cache.response import LLMResponseCache
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCacheKey(BaseModel):
+    """Identifies a request in the semantic cache."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    scope: str = Field(
+        ...,
+        description="Hash of everything but the user query: cache scope, provider, model, tools, system messages and parameters.",
+    )
+    text: str = Field(..., description="The user query that is embedded.")
+    digest: str = Field(
+        ..., description="Exact key used to store the response in the backend."
+    )
+    embedding: Optional[Any] = Field(
+        default=None,
+        description="Normalized query embedding, computed on first lookup and reused when storing.",
+    )
+
+
+class _ScopeIndex:
+    """Query embeddings of one scope, kept as a single matrix for vectorized search."""
+
+    def __init__(self) -> None:
+        self.vectors: Optional[np.ndarray] = None
+        self.keys: List[str] = []
+        self.created: List[float] = []
+
+    def search(self, query: np.ndarray) -> Tuple[Optional[str], float]:
+        if self.vectors is None or not self.keys:
+            return None, 0.0
+        scores = self.vectors @ query
+        best = int(np.argmax(scores))
+        return self.keys[best], float(scores[best])
+
+    def add(self, key: str, vector: np.ndarray, now: float) -> None:
+        if key in self.keys:
+            self.remove([self.keys.index(key)])
+        row = vector[np.newaxis, :]
+        self.vectors = row if self.vectors is None else np.vstack([self.vectors, row])
+        self.keys.append(key)
+        self.created.append(now)
+
+    def remove(self, positions: List[int]) -> List[str]:
+        if not positions:
+            return []
+        drop = set(positions)
+        removed = [self.keys[i] for i in positions]
+        keep = [i for i in range(len(self.keys)) if i not in drop]
+        self.vectors = self.vectors[keep] if keep else None
+        self.keys = [self.keys[i] for i in keep]
+        self.created = [self.created[i] for i in keep]
+        return removed
+
+
+class SemanticResponseCache(LLMResponseCache):
+    """
+    Response cache that also matches paraphrased requests.
+
+    The last user message is embedded and compared (cosine similarity) with previously answered
+    queries of the same scope. A scope groups requests that share the cache `scope` name (e.g. the
+    agent name), provider, model, tools, structured output settings, system messages and sampling
+    parameters. Earlier user and assistant turns are not part of the match, so the cache suits
+    single-turn, FAQ-style agents.
+
+    Responses are stored in `backend`; the vector index lives in process memory and is bounded by
+    `max_entries` and `ttl`.
+    """
+
+    embedder: Any = Field(
+        ...,
+        description="EmbedderBase used to embed user queries, e.g. a SentenceTransformerEmbedder.",
+    )
+    similarity_threshold: float = Field(
+        default=0.92,
+        ge=-1.0,
+        le=1.0,
+        description="Minimum cosine similarity for a cached answer to be returned.",
+    )
+    scope: Optional[str] = Field(
+        default=None,
+        description="Name that separates cached answers, e.g. the agent name. Clients sharing a cache only share answers within a scope.",
+    )
+    max_entries: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum number of indexed queries across all scopes. The oldest entries are evicted first.",
+    )
+
+    _indexes: Dict[str, _ScopeIndex] = PrivateAttr(default_factory=dict)
+    _index_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def is_cacheable(self, params: Dict[str, Any], use_cache: Optional[bool]) -> bool:
+        """
+        Decides whether a request may be served from and stored in the cache.
+
+        In addition to the rules of `LLMResponseCache`, the request must end with a user message.
+
+        Args:
+            params (Dict[str, Any]): The prepared request parameters.
+            use_cache (Optional[bool]): Per-call override. None applies the default rules.
+
+        Returns:
+            bool: True if the request is eligible for caching.
+        """
+        if not super().is_cacheable(params, use_cache):
+            return False
+        return self._query_text(params) is not None
+
+    def make_key(self, provider: str, params: Dict[str, Any]) -> SemanticCacheKey:
+        """
+        Builds the semantic cache key for a request. The query is embedded lazily on lookup.
+
+        Args:
+            provider (str): The LLM provider name.
+            params (Dict[str, Any]): The prepared request parameters.
+
+        Returns:
+            SemanticCacheKey: The scope, query text and exact digest of the request.
+        """
+        messages = params.get("messages", params.get("inputs")) or []
+        scope_params = {
+            k: v for k, v in params.items() if k not in ("messages", "inputs")
+        }
+        scope_params["system"] = [m for m in messages if m.get("role") == "system"]
+        scope_params["cache_scope"] = self.scope
+        text = self._query_text(params) or ""
+        scope = super().make_key(provider, scope_params)
+        digest = hashlib.sha256(json.dumps([scope, text]).encode("utf-8")).hexdigest()
+        return SemanticCacheKey(scope=scope, text=text, digest=digest)
+
+    def lookup(
+        self, key: SemanticCacheKey, response_format: Optional[Type[BaseModel]] = None
+    ) -> Optional[Any]:
+        """
+        Returns the cached answer of the most similar query in scope, or None on a miss.
+
+        Args:
+            key (SemanticCacheKey): The semantic cache key.
+            response_format (Optional[Type[BaseModel]]): Structured output model used to rebuild the response.
+
+        Returns:
+            Optional[Any]: The cached response.
+        """
+        if key.embedding is None:
+            key.embedding = self._embed(key.text)
+        return super().lookup(self._match(key), response_format)
+
+    async def alookup(
+        self, key: SemanticCacheKey, response_format: Optional[Type[BaseModel]] = None
+    ) -> Optional[Any]:
+        """Asynchronous `lookup`. The query is embedded in a worker thread."""
+        if key.embedding is None:
+            key.embedding = await asyncio.to_thread(self._embed, key.text)
+        return await super().alookup(self._match(key), response_format)
+
+    def store(self, key: SemanticCacheKey, result: Any) -> None:
+        """
+        Stores a response and indexes its query.
+
+        Args:
+            key (SemanticCacheKey): The semantic cache key.
+            result (Any): The processed chat response.
+        """
+        super().store(key.digest, result)
+        self._index(key)
+
+    async def astore(self, key: SemanticCacheKey, result: Any) -> None:
+        """Asynchronous `store`."""
+        await super().astore(key.digest, result)
+        self._index(key)
+
+    def clear(self) -> None:
+        """Removes all cached responses and indexed queries."""
+        super().clear()
+        with self._index_lock:
+            self._indexes.clear()
+
+    def __len__(self) -> int:
+        with self._index_lock:
+            return sum(len(index.keys) for index in self._indexes.values())
+
+    @staticmethod
+    def _query_text(params: Dict[str, Any]) -> Optional[str]:
+        """Returns the content of the final user message, or None if the request does not end with one."""
+        messages = params.get("messages", params.get("inputs")) or []
+        if not messages or messages[-1].get("role") != "user":
+            return None
+        content = messages[-1].get("content")
+        if isinstance(content, str):
+            return content.strip() or None
+        return None
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.asarray(self.embedder.embed(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _match(self, key: SemanticCacheKey) -> str:
+        """Returns the backend key of the closest query in scope, or the request's own digest."""
+        with self._index_lock:
+            self._evict_expired()
+            index = self._indexes.get(key.scope)
+            if index is None:
+                return key.digest
+            match, score = index.search(key.embedding)
+        if match is None or score < self.similarity_threshold:
+            return key.digest
+        logger.debug(f"Semantic cache match with similarity {score:.3f}.")
+        return match
+
+    def _index(self, key: SemanticCacheKey) -> None:
+        if key.embedding is None:
+            key.embedding = self._embed(key.text)
+        with self._index_lock:
+            index = self._indexes.setdefault(key.scope, _ScopeIndex())
+            index.add(key.digest, key.embedding, time.monotonic())
+            self._evict_oldest()
+
+    def _evict_expired(self) -> None:
+        if self.ttl is None:
+            return
+        cutoff = time.monotonic() - self.ttl
+        for scope, index in list(self._indexes.items()):
+            index.remove([i for i, t in enumerate(index.created) if t <= cutoff])
+            if not index.keys:
+                del self._indexes[scope]
+
+    def _evict_oldest(self) -> None:
+        overflow = sum(len(index.keys) for index in self._indexes.values())
+        overflow -= self.max_entries
+        while overflow > 0:
+            scope, index = min(
+                self._indexes.items(), key=lambda item: item[1].created[0]
+            )
+            for digest in index.remove([0]):
+                try:
+                    self.backend.delete(digest)
+                except Exception as e:
+                    logger.debug(f"Could not delete evicted cache entry {digest}: {e}")
+            if not index.keys:
+                del self._indexes[scope]
+            overflow -= 1
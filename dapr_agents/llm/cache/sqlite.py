@@ -0,0 +1,97 @@
+from typing import Any, Optional
+from pathlib import Path
+from pydantic import Field, PrivateAttr
+from dapr_agents.llm.cache.base import CacheBackendBase
+import json
+import sqlite3
+import threading
+import time
+
+
+class SQLiteCacheBackend(CacheBackendBase):
+    """
+    On-disk cache backed by a SQLite database, shared across processes on the same host.
+    """
+
+    path: str = Field(
+        default=".dapr_agents_cache.sqlite",
+        description="Path of the SQLite database file. Parent directories are created if needed.",
+    )
+    table_name: str = Field(
+        default="llm_cache",
+        pattern=r"^[A-Za-z_][A-Za-z0-9_]*$",
+        description="Name of the table holding cache entries.",
+    )
+    max_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of entries. The least recently used entries are evicted first. None means unbounded.",
+    )
+
+    _conn: Optional[sqlite3.Connection] = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def model_post_init(self, __context: Any) -> None:
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL, last_access REAL NOT NULL)"
+            )
+        super().model_post_init(__context)
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table_name} WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE key = ?", (key,)
+                )
+                return None
+            if self.max_size is not None:
+                self._conn.execute(
+                    f"UPDATE {self.table_name} SET last_access = ? WHERE key = ?",
+                    (now, key),
+                )
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} "
+                "(key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, now),
+            )
+            if self.max_size is not None:
+                self._conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE key IN ("
+                    f"SELECT key FROM {self.table_name} "
+                    "ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                    (self.max_size,),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table_name}")
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,9 +1,24 @@
-from typing import Union, Dict, Any, Optional, Iterable, List, Iterator, Type
+from typing import (
+    Union,
+    Dict,
+    Any,
+    Optional,
+    Iterable,
+    List,
+    Iterator,
+    AsyncIterator,
+    Type,
+)
 from dapr_agents.prompt.base import PromptTemplateBase
 from dapr_agents.prompt.prompty import Prompty
+from dapr_agents.llm.cache import LLMResponseCache
 from pydantic import BaseModel, Field
 from abc import ABC, abstractmethod
 from pathlib import Path
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class ChatClientBase(BaseModel, ABC):
@@ -18,6 +33,10 @@ class ChatClientBase(BaseModel, ABC):
     prompt_template: Optional[PromptTemplateBase] = Field(
         default=None, description="Prompt template for rendering (optional)."
     )
+    cache: Optional[LLMResponseCache] = Field(
+        default=None,
+        description="Optional response cache. Pass 'use_cache' to 'generate' to force or bypass it per call.",
+    )
 
     @classmethod
     @abstractmethod
@@ -61,9 +80,79 @@ class ChatClientBase(BaseModel, ABC):
             tools (Optional[List[Union[Dict[str, Any]]]]): List of tools for the request.
             response_format (Optional[Type[BaseModel]]): Optional Pydantic model for structured response parsing.
             structured_mode (Optional[str]): Mode for structured output.
-            **kwargs: Additional parameters for the chat completion API.
+            **kwargs: Additional parameters for the chat completion API. `use_cache` (Optional[bool]) forces
+                (True) or bypasses (False) the response cache for this call.
 
         Returns:
             Union[Iterator[Dict[str, Any]], Dict[str, Any]]: The chat completion response(s).
         """
         pass
+
+    async def agenerate(
+        self,
+        messages: Union[
+            str, Dict[str, Any], BaseModel, Iterable[Union[Dict[str, Any], BaseModel]]
+        ] = None,
+        input_data: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+        tools: Optional[List[Union[Dict[str, Any]]]] = None,
+        response_format: Optional[Type[BaseModel]] = None,
+        structured_mode: Optional[str] = None,
+        **kwargs,
+    ) -> Union[AsyncIterator[Dict[str, Any]], Iterator[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Asynchronously generate chat completions.
+
+        Clients with a native asynchronous SDK override this method. The default implementation runs
+        `generate` in a worker thread so the event loop is never blocked.
+
+        Args:
+            messages (Optional): Either pre-set messages or None if using input_data.
+            input_data (Optional[Dict[str, Any]]): Input variables for prompt templates.
+            model (Optional[str]): Specific model to use for the request, overriding the default.
+            tools (Optional[List[Union[Dict[str, Any]]]]): List of tools for the request.
+            response_format (Optional[Type[BaseModel]]): Optional Pydantic model for structured response parsing.
+            structured_mode (Optional[str]): Mode for structured output.
+            **kwargs: Additional parameters for the chat completion API.
+
+        Returns:
+            Union[AsyncIterator[Dict[str, Any]], Iterator[Dict[str, Any]], Dict[str, Any]]: The chat completion response(s).
+        """
+        params = {
+            "messages": messages,
+            "input_data": input_data,
+            "tools": tools,
+            "response_format": response_format,
+            **kwargs,
+        }
+        # Only forward optional arguments that were set, so each client keeps its own defaults
+        if model is not None:
+            params["model"] = model
+        if structured_mode is not None:
+            params["structured_mode"] = structured_mode
+        return await asyncio.to_thread(self.generate, **params)
+
+    def _get_cache_key(
+        self, params: Dict[str, Any], use_cache: Optional[bool] = None
+    ) -> Optional[Any]:
+        """
+        Returns the response cache key for a prepared request, or None if the request is not cached.
+
+        Args:
+            params (Dict[str, Any]): The prepared request parameters.
+            use_cache (Optional[bool]): Per-call cache override.
+
+        Returns:
+            Optional[Any]: The cache key, or None when no cache is set or the request is bypassed.
+        """
+        if self.cache is None:
+            return None
+        if not self.cache.is_cacheable(params, use_cache):
+            self.cache.record_bypass()
+            return None
+        try:
+            return self.cache.make_key(self.provider, params)
+        except TypeError as e:
+            logger.warning(f"Not caching request: {e}")
+            self.cache.record_bypass()
+            return None
@@ -13,6 +13,7 @@ from typing import (
     Any,
     List,
     Iterator,
+    AsyncIterator,
     Type,
     Literal,
     ClassVar,
@@ -141,6 +142,161 @@ class DaprChatClient(DaprInferenceClientBase, ChatClientBase):
         Returns:
             Union[Iterator[Dict[str, Any]], Dict[str, Any]]: The chat completion response(s).
         """
+        use_cache = kwargs.pop("use_cache", None)
+        params = self._build_params(
+            messages=messages,
+            input_data=input_data,
+            tools=tools,
+            response_format=response_format,
+            structured_mode=structured_mode,
+            **kwargs,
+        )
+        inputs = self.convert_to_conversation_inputs(params["inputs"])
+        cache_key = self._get_cache_key(
+            {
+                **params,
+                "llm_component": llm_component or self._llm_component,
+                "temperature": temperature,
+                "scrubPII": scrubPII,
+            },
+            use_cache,
+        )
+        if cache_key:
+            cached = self.cache.lookup(cache_key, response_format)
+            if cached is not None:
+                return cached
+
+        try:
+            logger.info("Invoking the Dapr Conversation API.")
+            response = self.client.chat_completion(
+                llm=llm_component or self._llm_component,
+                conversation_inputs=inputs,
+                scrub_pii=scrubPII,
+                temperature=temperature,
+            )
+            transposed_response = self.translate_response(response, self._llm_component)
+            logger.info("Chat completion retrieved successfully.")
+
+            result = ResponseHandler.process_response(
+                transposed_response,
+                llm_provider=self.provider,
+                response_format=response_format,
+                structured_mode=structured_mode,
+                stream=params.get("stream", False),
+            )
+            if cache_key:
+                self.cache.store(cache_key, result)
+            return result
+        except Exception as e:
+            logger.error(
+                f"An error occurred during the Dapr Conversation API call: {e}"
+            )
+            raise
+
+    async def agenerate(
+        self,
+        messages: Union[
+            str,
+            Dict[str, Any],
+            BaseMessage,
+            Iterable[Union[Dict[str, Any], BaseMessage]],
+        ] = None,
+        input_data: Optional[Dict[str, Any]] = None,
+        llm_component: Optional[str] = None,
+        tools: Optional[List[Union[AgentTool, Dict[str, Any]]]] = None,
+        response_format: Optional[Type[BaseModel]] = None,
+        structured_mode: Literal["function_call"] = "function_call",
+        scrubPII: Optional[bool] = False,
+        temperature: Optional[float] = None,
+        **kwargs,
+    ) -> Union[AsyncIterator[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Asynchronously generate chat completions through the Dapr Conversation API.
+
+        Args:
+            messages (Optional): Either pre-set messages or None if using input_data.
+            input_data (Optional[Dict[str, Any]]): Input variables for prompt templates.
+            llm_component (str): Name of the LLM component to use for the request.
+            tools (List[Union[AgentTool, Dict[str, Any]]]): List of tools for the request.
+            response_format (Type[BaseModel]): Optional Pydantic model for structured response parsing.
+            structured_mode (Literal["function_call"]): Mode for structured output: "function_call" (Limited Support).
+            scrubPII (Type[bool]): Optional flag to obfuscate any sensitive information coming back from the LLM.
+            **kwargs: Additional parameters for the language model.
+
+        Returns:
+            Union[AsyncIterator[Dict[str, Any]], Dict[str, Any]]: The chat completion response(s).
+        """
+        use_cache = kwargs.pop("use_cache", None)
+        params = self._build_params(
+            messages=messages,
+            input_data=input_data,
+            tools=tools,
+            response_format=response_format,
+            structured_mode=structured_mode,
+            **kwargs,
+        )
+        inputs = self.convert_to_conversation_inputs(params["inputs"])
+        cache_key = self._get_cache_key(
+            {
+                **params,
+                "llm_component": llm_component or self._llm_component,
+                "temperature": temperature,
+                "scrubPII": scrubPII,
+            },
+            use_cache,
+        )
+        if cache_key:
+            cached = await self.cache.alookup(cache_key, response_format)
+            if cached is not None:
+                return cached
+
+        try:
+            logger.info("Invoking the Dapr Conversation API asynchronously.")
+            response = await self.async_client.chat_completion(
+                llm=llm_component or self._llm_component,
+                conversation_inputs=inputs,
+                scrub_pii=scrubPII,
+                temperature=temperature,
+            )
+            transposed_response = self.translate_response(response, self._llm_component)
+            logger.info("Chat completion retrieved successfully.")
+
+            result = ResponseHandler.process_async_response(
+                transposed_response,
+                llm_provider=self.provider,
+                response_format=response_format,
+                structured_mode=structured_mode,
+                stream=params.get("stream", False),
+            )
+            if cache_key:
+                await self.cache.astore(cache_key, result)
+            return result
+        except Exception as e:
+            logger.error(
+                f"An error occurred during the Dapr Conversation API call: {e}"
+            )
+            raise
+
+    def _build_params(
+        self,
+        messages: Union[
+            str,
+            Dict[str, Any],
+            BaseMessage,
+            Iterable[Union[Dict[str, Any], BaseMessage]],
+        ] = None,
+        input_data: Optional[Dict[str, Any]] = None,
+        tools: Optional[List[Union[AgentTool, Dict[str, Any]]]] = None,
+        response_format: Optional[Type[BaseModel]] = None,
+        structured_mode: Literal["function_call"] = "function_call",
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Build the Conversation API request parameters shared by `generate` and `agenerate`.
+
+        Returns:
+            Dict[str, Any]: Prepared request parameters.
+        """
         if structured_mode not in self.SUPPORTED_STRUCTURED_MODES:
             raise ValueError(
                 f"Invalid structured_mode '{structured_mode}'. Must be one of {self.SUPPORTED_STRUCTURED_MODES}."
@@ -176,28 +332,5 @@ class DaprChatClient(DaprInferenceClientBase, ChatClientBase):
             response_format=response_format,
             structured_mode=structured_mode,
         )
-        inputs = self.convert_to_conversation_inputs(params["inputs"])
-
-        try:
-            logger.info("Invoking the Dapr Conversation API.")
-            response = self.client.chat_completion(
-                llm=llm_component or self._llm_component,
-                conversation_inputs=inputs,
-                scrub_pii=scrubPII,
-                temperature=temperature,
-            )
-            transposed_response = self.translate_response(response, self._llm_component)
-            logger.info("Chat completion retrieved successfully.")
 
-            return ResponseHandler.process_response(
-                transposed_response,
-                llm_provider=self.provider,
-                response_format=response_format,
-                structured_mode=structured_mode,
-                stream=params.get("stream", False),
-            )
-        except Exception as e:
-            logger.error(
-                f"An error occurred during the Dapr Conversation API call: {e}"
-            )
-            raise
+        return params
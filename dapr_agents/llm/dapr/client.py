@@ -1,9 +1,14 @@
 from dapr_agents.types.llm import DaprInferenceClientConfig
 from dapr_agents.llm.base import LLMClientBase
-from dapr.clients import DaprClient
+from dapr_agents.storage.daprstores.pool import (
+    AsyncDaprClientPool,
+    DaprClientPool,
+    get_async_dapr_client_pool,
+    get_dapr_client_pool,
+)
 from dapr.clients.grpc._request import ConversationInput
 from dapr.clients.grpc._response import ConversationResponse
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pydantic import model_validator
 
 import logging
@@ -12,8 +17,8 @@ logger = logging.getLogger(__name__)
 
 
 class DaprInferenceClient:
-    def __init__(self):
-        self.dapr_client = DaprClient()
+    def __init__(self, client_pool: Optional[DaprClientPool] = None):
+        self.client_pool = client_pool or get_dapr_client_pool()
 
     def translate_to_json(self, response: ConversationResponse) -> dict:
         response_dict = {
@@ -34,12 +39,36 @@ class DaprInferenceClient:
         scrub_pii: bool | None = None,
         temperature: float | None = None,
     ) -> Any:
-        response = self.dapr_client.converse_alpha1(
-            name=llm,
-            inputs=conversation_inputs,
-            scrub_pii=scrub_pii,
-            temperature=temperature,
-        )
+        with self.client_pool.acquire() as client:
+            response = client.converse_alpha1(
+                name=llm,
+                inputs=conversation_inputs,
+                scrub_pii=scrub_pii,
+                temperature=temperature,
+            )
+        output = self.translate_to_json(response)
+
+        return output
+
+
+class AsyncDaprInferenceClient(DaprInferenceClient):
+    def __init__(self, client_pool: Optional[AsyncDaprClientPool] = None):
+        self.client_pool = client_pool or get_async_dapr_client_pool()
+
+    async def chat_completion(
+        self,
+        llm: str,
+        conversation_inputs: List[ConversationInput],
+        scrub_pii: bool | None = None,
+        temperature: float | None = None,
+    ) -> Any:
+        async with self.client_pool.acquire() as client:
+            response = await client.converse_alpha1(
+                name=llm,
+                inputs=conversation_inputs,
+                scrub_pii=scrub_pii,
+                temperature=temperature,
+            )
         output = self.translate_to_json(response)
 
         return output
@@ -78,6 +107,12 @@ class DaprInferenceClientBase(LLMClientBase):
         """
         return DaprInferenceClient()
 
+    def get_async_client(self) -> AsyncDaprInferenceClient:
+        """
+        Initializes and returns the asynchronous Dapr Inference client.
+        """
+        return AsyncDaprInferenceClient()
+
     @classmethod
     def from_config(
         cls, client_options: DaprInferenceClientConfig, timeout: float = 1500
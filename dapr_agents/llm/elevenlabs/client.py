@@ -73,6 +73,20 @@ class ElevenLabsClientBase(LLMClientBase):
         logger.info("Initializing ElevenLabs API client...")
         return ElevenLabs(api_key=config.api_key, base_url=config.base_url)
 
+    def get_async_client(self) -> Any:
+        """
+        Initializes and returns the asynchronous ElevenLabs API client.
+        """
+        try:
+            from elevenlabs import AsyncElevenLabs
+        except ImportError as e:
+            raise ImportError(
+                "The 'elevenlabs' package is required but not installed. Install it with 'pip install elevenlabs'."
+            ) from e
+
+        config = self.config
+        return AsyncElevenLabs(api_key=config.api_key, base_url=config.base_url)
+
     @property
     def config(self) -> ElevenLabsClientConfig:
         """
@@ -1,7 +1,7 @@
 from dapr_agents.types.llm import HFInferenceClientConfig
 from dapr_agents.llm.base import LLMClientBase
 from typing import Optional, Dict, Any, Union
-from huggingface_hub import InferenceClient
+from huggingface_hub import AsyncInferenceClient, InferenceClient
 from pydantic import Field, model_validator
 import os
 import logging
@@ -138,6 +138,21 @@ class HFHubInferenceClientBase(LLMClientBase):
             timeout=self.timeout,
         )
 
+    def get_async_client(self) -> AsyncInferenceClient:
+        """
+        Initializes and returns the asynchronous Hugging Face Inference client.
+        """
+        config: HFInferenceClientConfig = self.config
+        return AsyncInferenceClient(
+            model=config.model,
+            api_key=config.api_key,
+            base_url=config.base_url,
+            headers=config.headers,
+            cookies=config.cookies,
+            proxies=config.proxies,
+            timeout=self.timeout,
+        )
+
     @classmethod
     def from_config(
         cls, client_options: HFInferenceClientConfig, timeout: float = 1500
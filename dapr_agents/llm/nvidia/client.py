@@ -2,7 +2,7 @@ from dapr_agents.types.llm import NVIDIAClientConfig
 from dapr_agents.llm.base import LLMClientBase
 from typing import Any, Optional
 from pydantic import Field
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 import os
 import logging
 
@@ -74,6 +74,18 @@ class NVIDIAClientBase(LLMClientBase):
         logger.info("Initializing NVIDIA API client...")
         return OpenAI(api_key=config.api_key, base_url=config.base_url)
 
+    def get_async_client(self) -> AsyncOpenAI:
+        """
+        Initializes and returns the asynchronous NVIDIA LLM API client.
+
+        Returns:
+            AsyncOpenAI: The initialized asynchronous NVIDIA API client instance.
+        """
+        config = self.config
+
+        logger.info("Initializing asynchronous NVIDIA API client...")
+        return AsyncOpenAI(api_key=config.api_key, base_url=config.base_url)
+
     @property
     def config(self) -> NVIDIAClientConfig:
         """
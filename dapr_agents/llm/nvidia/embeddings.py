@@ -83,6 +83,59 @@ class NVIDIAEmbeddingClient(NVIDIAClientBase):
         """
         logger.info(f"Using model '{self.model}' for embedding generation.")
 
+        body = self._build_body(
+            input, model, input_type, truncate, encoding_format, dimensions, extra_body
+        )
+        logger.debug(f"Embedding request payload: {body}")
+
+        # Send the request to the NVIDIA embeddings endpoint
+        try:
+            response = self.client.embeddings.create(**body)
+            logger.info("Embedding generation successful.")
+            return response
+        except Exception as e:
+            logger.error(f"An error occurred while generating embeddings: {e}")
+            raise ValueError(f"Failed to generate embeddings: {e}") from e
+
+    async def acreate_embedding(
+        self,
+        input: Union[str, List[str]],
+        model: Optional[str] = None,
+        input_type: Optional[Literal["query", "passage"]] = None,
+        truncate: Optional[Literal["NONE", "START", "END"]] = None,
+        encoding_format: Optional[Literal["float", "base64"]] = None,
+        dimensions: Optional[int] = None,
+        extra_body: Optional[Dict[str, Any]] = None,
+    ) -> CreateEmbeddingResponse:
+        """
+        Asynchronously generate embeddings for the given input text(s). Takes the same arguments as `create_embedding`.
+
+        Returns:
+            CreateEmbeddingResponse: A response object containing the generated embeddings and associated metadata.
+
+        Raises:
+            ValueError: If the client fails to generate embeddings.
+        """
+        body = self._build_body(
+            input, model, input_type, truncate, encoding_format, dimensions, extra_body
+        )
+        try:
+            return await self.async_client.embeddings.create(**body)
+        except Exception as e:
+            logger.error(f"An error occurred while generating embeddings: {e}")
+            raise ValueError(f"Failed to generate embeddings: {e}") from e
+
+    def _build_body(
+        self,
+        input: Union[str, List[str]],
+        model: Optional[str],
+        input_type: Optional[str],
+        truncate: Optional[str],
+        encoding_format: Optional[str],
+        dimensions: Optional[int],
+        extra_body: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Builds the embeddings request body."""
         # If a model is provided, override the default model
         model = model or self.model
 
@@ -101,14 +154,4 @@ class NVIDIAEmbeddingClient(NVIDIAClientBase):
             body["extra_body"]["truncate"] = truncate
         if dimensions:
             body["dimensions"] = dimensions
-
-        logger.debug(f"Embedding request payload: {body}")
-
-        # Send the request to the NVIDIA embeddings endpoint
-        try:
-            response = self.client.embeddings.create(**body)
-            logger.info("Embedding generation successful.")
-            return response
-        except Exception as e:
-            logger.error(f"An error occurred while generating embeddings: {e}")
-            raise ValueError(f"Failed to generate embeddings: {e}")
+        return body
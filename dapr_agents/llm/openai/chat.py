@@ -13,6 +13,7 @@ from typing import (
     Any,
     List,
     Iterator,
+    AsyncIterator,
     Type,
     Literal,
     ClassVar,
@@ -145,6 +146,133 @@ class OpenAIChatClient(OpenAIClientBase, ChatClientBase):
             Union[Iterator[Dict[str, Any]], Dict[str, Any]]: The chat completion response(s).
         """
 
+        use_cache = kwargs.pop("use_cache", None)
+        params = self._build_params(
+            messages=messages,
+            input_data=input_data,
+            model=model,
+            tools=tools,
+            response_format=response_format,
+            structured_mode=structured_mode,
+            **kwargs,
+        )
+        cache_key = self._get_cache_key(params, use_cache)
+        if cache_key:
+            cached = self.cache.lookup(cache_key, response_format)
+            if cached is not None:
+                return cached
+
+        try:
+            logger.info("Invoking ChatCompletion API.")
+            logger.debug(f"ChatCompletion API Parameters: {params}")
+            response: ChatCompletionMessage = self.client.chat.completions.create(
+                **params, timeout=self.timeout
+            )
+            logger.info("Chat completion retrieved successfully.")
+
+            result = ResponseHandler.process_response(
+                response,
+                llm_provider=self.provider,
+                response_format=response_format,
+                structured_mode=structured_mode,
+                stream=params.get("stream", False),
+            )
+            if cache_key:
+                self.cache.store(cache_key, result)
+            return result
+        except Exception as e:
+            logger.error(f"An error occurred during the ChatCompletion API call: {e}")
+            raise
+
+    async def agenerate(
+        self,
+        messages: Union[
+            str,
+            Dict[str, Any],
+            BaseMessage,
+            Iterable[Union[Dict[str, Any], BaseMessage]],
+        ] = None,
+        input_data: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+        tools: Optional[List[Union[AgentTool, Dict[str, Any]]]] = None,
+        response_format: Optional[Type[BaseModel]] = None,
+        structured_mode: Literal["json", "function_call"] = "json",
+        **kwargs,
+    ) -> Union[AsyncIterator[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Asynchronously generate chat completions using the native async OpenAI client.
+
+        Args:
+            messages (Optional): Either pre-set messages or None if using input_data.
+            input_data (Optional[Dict[str, Any]]): Input variables for prompt templates.
+            model (str): Specific model to use for the request, overriding the default.
+            tools (List[Union[AgentTool, Dict[str, Any]]]): List of tools for the request.
+            response_format (Type[BaseModel]): Optional Pydantic model for structured response parsing.
+            structured_mode (Literal["json", "function_call"]): Mode for structured output: "json" or "function_call".
+            **kwargs: Additional parameters for the language model.
+
+        Returns:
+            Union[AsyncIterator[Dict[str, Any]], Dict[str, Any]]: The chat completion response or an async stream of chunks.
+        """
+        use_cache = kwargs.pop("use_cache", None)
+        params = self._build_params(
+            messages=messages,
+            input_data=input_data,
+            model=model,
+            tools=tools,
+            response_format=response_format,
+            structured_mode=structured_mode,
+            **kwargs,
+        )
+        cache_key = self._get_cache_key(params, use_cache)
+        if cache_key:
+            cached = await self.cache.alookup(cache_key, response_format)
+            if cached is not None:
+                return cached
+
+        try:
+            logger.info("Invoking ChatCompletion API asynchronously.")
+            logger.debug(f"ChatCompletion API Parameters: {params}")
+            response = await self.async_client.chat.completions.create(
+                **params, timeout=self.timeout
+            )
+            logger.info("Chat completion retrieved successfully.")
+
+            result = ResponseHandler.process_async_response(
+                response,
+                llm_provider=self.provider,
+                response_format=response_format,
+                structured_mode=structured_mode,
+                stream=params.get("stream", False),
+            )
+            if cache_key:
+                await self.cache.astore(cache_key, result)
+            return result
+        except Exception as e:
+            logger.error(f"An error occurred during the ChatCompletion API call: {e}")
+            raise
+
+    def _build_params(
+        self,
+        messages: Union[
+            str,
+            Dict[str, Any],
+            BaseMessage,
+            Iterable[Union[Dict[str, Any], BaseMessage]],
+        ] = None,
+        input_data: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+        tools: Optional[List[Union[AgentTool, Dict[str, Any]]]] = None,
+        response_format: Optional[Type[BaseModel]] = None,
+        structured_mode: Literal["json", "function_call"] = "json",
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Build the ChatCompletion request parameters shared by `generate` and `agenerate`.
+
+        Returns:
+            Dict[str, Any]: Prepared request parameters.
+        """
         if structured_mode not in self.SUPPORTED_STRUCTURED_MODES:
             raise ValueError(
                 f"Invalid structured_mode '{structured_mode}'. Must be one of {self.SUPPORTED_STRUCTURED_MODES}."
@@ -185,21 +313,4 @@ class OpenAIChatClient(OpenAIClientBase, ChatClientBase):
             structured_mode=structured_mode,
         )
 
-        try:
-            logger.info("Invoking ChatCompletion API.")
-            logger.debug(f"ChatCompletion API Parameters: {params}")
-            response: ChatCompletionMessage = self.client.chat.completions.create(
-                **params, timeout=self.timeout
-            )
-            logger.info("Chat completion retrieved successfully.")
-
-            return ResponseHandler.process_response(
-                response,
-                llm_provider=self.provider,
-                response_format=response_format,
-                structured_mode=structured_mode,
-                stream=params.get("stream", False),
-            )
-        except Exception as e:
-            logger.error(f"An error occurred during the ChatCompletion API call: {e}")
-            raise
+        return params
@@ -5,8 +5,8 @@ from azure.identity import (
 )
 from dapr_agents.types.llm import AzureOpenAIClientConfig
 from dapr_agents.llm.utils import HTTPHelper
-from openai import AzureOpenAI
-from typing import Union, Optional
+from openai import AzureOpenAI, AsyncAzureOpenAI
+from typing import Any, Dict, Type, Union, Optional
 import logging
 import os
 
@@ -68,17 +68,32 @@ class AzureOpenAIClient:
         Returns:
             AzureOpenAI: The initialized Azure OpenAI client.
         """
+        return self._create_client(AzureOpenAI, **self._get_auth_kwargs())
+
+    def get_async_client(self) -> AsyncAzureOpenAI:
+        """
+        Returns the asynchronous Azure OpenAI client.
+
+        Returns:
+            AsyncAzureOpenAI: The initialized asynchronous Azure OpenAI client.
+        """
+        return self._create_client(AsyncAzureOpenAI, **self._get_auth_kwargs())
+
+    def _get_auth_kwargs(self) -> Dict[str, Any]:
+        """
+        Resolves the authentication arguments for the Azure OpenAI client.
+        """
         # Authentication: API Key, Azure AD Token, or Azure Identity
         # The api_key, azure_ad_token, and azure_ad_token_provider arguments are mutually exclusive.
         # Case 1: Use API Key
         if self.api_key:
             logger.info("Using API key for authentication.")
-            return self._create_client(api_key=self.api_key)
+            return {"api_key": self.api_key}
 
         # Case 2: Use Azure AD Token
         if self.azure_ad_token:
             logger.info("Using Azure AD token for authentication.")
-            return self._create_client(azure_ad_token=self.azure_ad_token)
+            return {"azure_ad_token": self.azure_ad_token}
 
         # Case 3: Use Azure Identity Credentials
         logger.info(
@@ -93,18 +108,20 @@ class AzureOpenAIClient:
             azure_ad_token_provider = get_bearer_token_provider(
                 credential, "https://cognitiveservices.azure.com/.default"
             )
-            return self._create_client(azure_ad_token_provider=azure_ad_token_provider)
+            return {"azure_ad_token_provider": azure_ad_token_provider}
         except Exception as e:
             logger.error(f"Failed to initialize Azure Identity credentials: {e}")
             raise ValueError(
                 "Unable to authenticate using Azure Identity credentials. Check your setup."
             ) from e
 
-    def _create_client(self, **kwargs) -> AzureOpenAI:
+    def _create_client(
+        self, client_cls: Type[Union[AzureOpenAI, AsyncAzureOpenAI]], **kwargs
+    ) -> Union[AzureOpenAI, AsyncAzureOpenAI]:
         """
-        Helper method to create and return an Azure OpenAI client.
+        Helper method to create and return a synchronous or asynchronous Azure OpenAI client.
         """
-        return AzureOpenAI(
+        return client_cls(
             azure_endpoint=self.azure_endpoint,
             azure_deployment=self.azure_deployment,
             api_version=self.api_version,
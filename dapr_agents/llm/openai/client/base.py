@@ -1,7 +1,7 @@
 from dapr_agents.types.llm import OpenAIClientConfig, AzureOpenAIClientConfig
 from dapr_agents.llm.openai.client import AzureOpenAIClient, OpenAIClient
 from dapr_agents.llm.base import LLMClientBase
-from openai import OpenAI, AzureOpenAI
+from openai import OpenAI, AzureOpenAI, AsyncOpenAI, AsyncAzureOpenAI
 from typing import Any, Optional, Union, Dict
 from pydantic import Field
 import logging
@@ -87,11 +87,24 @@ class OpenAIClientBase(LLMClientBase):
         """
         Initialize and return the appropriate client (OpenAI or Azure OpenAI).
         """
+        logger.info("Initializing OpenAI client...")
+        return self._get_client_factory().get_client()
+
+    def get_async_client(self) -> Union[AsyncAzureOpenAI, AsyncOpenAI]:
+        """
+        Initialize and return the appropriate asynchronous client (OpenAI or Azure OpenAI).
+        """
+        logger.info("Initializing asynchronous OpenAI client...")
+        return self._get_client_factory().get_async_client()
+
+    def _get_client_factory(self) -> Union[AzureOpenAIClient, OpenAIClient]:
+        """
+        Build the OpenAI or Azure OpenAI client factory from the current configuration.
+        """
         config = self.config
         timeout = self.timeout
 
         if isinstance(config, AzureOpenAIClientConfig):
-            logger.info("Initializing Azure OpenAI client...")
             return AzureOpenAIClient(
                 api_key=config.api_key,
                 azure_ad_token=config.azure_ad_token,
@@ -102,16 +115,15 @@ class OpenAIClientBase(LLMClientBase):
                 project=config.project,
                 azure_client_id=self.azure_client_id,
                 timeout=timeout,
-            ).get_client()
+            )
 
-        logger.info("Initializing OpenAI client...")
         return OpenAIClient(
             api_key=config.api_key,
             base_url=config.base_url,
             organization=config.organization,
             project=config.project,
             timeout=timeout,
-        ).get_client()
+        )
 
     @property
     def config(self) -> Union[AzureOpenAIClientConfig, OpenAIClientConfig]:
@@ -1,7 +1,7 @@
 from dapr_agents.types.llm import OpenAIClientConfig
 from dapr_agents.llm.utils import HTTPHelper
 from typing import Union, Optional
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 import logging
 
 logger = logging.getLogger(__name__)
@@ -52,6 +52,21 @@ class OpenAIClient:
             timeout=self.timeout,
         )
 
+    def get_async_client(self) -> AsyncOpenAI:
+        """
+        Returns the asynchronous OpenAI client.
+
+        Returns:
+            AsyncOpenAI: The initialized asynchronous OpenAI client.
+        """
+        return AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            organization=self.organization,
+            project=self.project,
+            timeout=self.timeout,
+        )
+
     @classmethod
     def from_config(
         cls, client_options: OpenAIClientConfig, timeout: Union[int, float, dict] = 1500
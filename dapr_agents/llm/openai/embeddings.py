@@ -93,3 +93,26 @@ class OpenAIEmbeddingClient(OpenAIClientBase):
             user=self.user,
         )
         return response
+
+    async def acreate_embedding(
+        self,
+        input: Union[str, List[Union[str, List[int]]]],
+        model: Optional[str] = None,
+    ) -> CreateEmbeddingResponse:
+        """
+        Asynchronously generate embeddings for the given input text(s).
+
+        Args:
+            input (Union[str, List[Union[str, List[int]]]]): Input text(s) or tokenized input(s) to generate embeddings for.
+            model (Optional[str]): Model to use for embedding. Overrides the default model if provided.
+
+        Returns:
+            CreateEmbeddingResponse: A response object containing the generated embeddings and associated metadata.
+        """
+        return await self.async_client.embeddings.create(
+            model=model or self.model,
+            input=input,
+            encoding_format=self.encoding_format,
+            dimensions=self.dimensions,
+            user=self.user,
+        )
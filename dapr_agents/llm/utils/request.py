@@ -101,7 +101,8 @@ class RequestHandler:
         Args:
             params: Parameters for the request.
             llm_provider: The LLM provider to use (e.g., 'openai').
-            tools: List of tools to include in the request.
+            tools: List of tools to include in the request. A `FormattedTools` payload built for
+                   `llm_provider` is used as is.
             response_format: Either a Pydantic model (for function calling)
                             or a JSON Schema definition/dict (for raw JSON structured output).
             structured_mode: The mode of structured output: 'json' or 'function_call'.
@@ -112,9 +113,7 @@ class RequestHandler:
         """
         if tools:
             logger.info("Tools are available in the request.")
-            params["tools"] = [
-                ToolHelper.format_tool(tool, tool_format=llm_provider) for tool in tools
-            ]
+            params["tools"] = ToolHelper.format_tools(tools, tool_format=llm_provider)
 
         if response_format:
             logger.info(f"Structured Mode Activated! Mode={structured_mode}.")
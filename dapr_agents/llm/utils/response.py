@@ -1,6 +1,6 @@
 import logging
 from dataclasses import asdict, is_dataclass
-from typing import Any, Dict, Iterator, Literal, Optional, Type, Union
+from typing import Any, AsyncIterator, Dict, Iterator, Literal, Optional, Type, Union
 
 from pydantic import BaseModel
 
@@ -86,3 +86,40 @@ class ResponseHandler:
             completion = ChatCompletion(**response_dict)
             logger.debug(f"Chat completion response: {completion}")
             return completion
+
+    @staticmethod
+    def process_async_response(
+        response: Any,
+        llm_provider: str,
+        response_format: Optional[Type[BaseModel]] = None,
+        structured_mode: Literal["json", "function_call"] = "json",
+        stream: bool = False,
+    ) -> Union[AsyncIterator[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Process the response from an asynchronous language model call.
+
+        Completed responses are processed exactly like `process_response`; streams are consumed
+        asynchronously.
+
+        Args:
+            response: The response object or asynchronous stream from the language model.
+            llm_provider: The LLM provider (e.g., 'openai').
+            response_format: A pydantic model to parse and validate the structured response.
+            structured_mode: The mode of the structured response: 'json' or 'function_call'.
+            stream: Whether the response is a stream.
+
+        Returns:
+            Union[AsyncIterator[Dict[str, Any]], Dict[str, Any]]: The processed response.
+        """
+        if stream:
+            return StreamHandler.aprocess_stream(
+                stream=response,
+                llm_provider=llm_provider,
+                response_format=response_format,
+            )
+        return ResponseHandler.process_response(
+            response,
+            llm_provider=llm_provider,
+            response_format=response_format,
+            structured_mode=structured_mode,
+        )
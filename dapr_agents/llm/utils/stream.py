@@ -1,6 +1,7 @@
 from typing import (
     Dict,
     Any,
+    AsyncIterator,
     Iterator,
     Type,
     TypeVar,
@@ -53,6 +54,40 @@ class StreamHandler:
             logger.error(f"An error occurred during streaming: {e}")
             raise
 
+    @staticmethod
+    async def aprocess_stream(
+        stream: AsyncIterator[Any],
+        llm_provider: str,
+        response_format: Optional[Union[Type[T], Type[Iterable[T]]]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream chat completion responses from an asynchronous stream.
+
+        Args:
+            stream: The asynchronous response stream from the API.
+            llm_provider: The LLM provider to use (e.g., 'openai').
+            response_format: The optional Pydantic model or iterable model for validating the response.
+
+        Yields:
+            dict: Each processed and validated chunk from the chat completion response.
+        """
+        logger.info("Streaming response enabled.")
+
+        try:
+            if llm_provider == "openai":
+                state = _OpenAIStreamState(response_format)
+                async for chunk in stream:
+                    for processed_chunk in state.process_chunk(chunk):
+                        yield processed_chunk
+                for processed_chunk in state.finalize():
+                    yield processed_chunk
+            else:
+                async for chunk in stream:
+                    yield chunk
+        except Exception as e:
+            logger.error(f"An error occurred during streaming: {e}")
+            raise
+
     @staticmethod
     def _process_openai_stream(
         stream: Iterator[Dict[str, Any]],
@@ -68,80 +103,10 @@ class StreamHandler:
         Yields:
             dict: Each processed and validated chunk from the chat completion response.
         """
-        content_accumulator = ""
-        json_extraction_active = False
-        json_brace_level = 0
-        json_string_buffer = ""
-        tool_calls = {}
-
+        state = _OpenAIStreamState(response_format)
         for chunk in stream:
-            processed_chunk = StreamHandler._process_openai_chunk(chunk)
-            chunk_type = processed_chunk["type"]
-            chunk_data = processed_chunk["data"]
-
-            if chunk_type == "content":
-                content_accumulator += chunk_data
-                yield processed_chunk
-            elif chunk_type in ["tool_calls", "function_call"]:
-                for tool_chunk in chunk_data:
-                    tool_call_index = tool_chunk["index"]
-                    tool_call_id = tool_chunk["id"]
-                    tool_call_function = tool_chunk["function"]
-                    tool_call_arguments = tool_call_function["arguments"]
-
-                    if tool_call_id is not None:
-                        tool_calls.setdefault(
-                            tool_call_index,
-                            {
-                                "id": tool_call_id,
-                                "type": tool_chunk["type"],
-                                "function": {
-                                    "name": tool_call_function["name"],
-                                    "arguments": tool_call_arguments,
-                                },
-                            },
-                        )
-
-                    # Add tool call arguments to current tool calls
-                    tool_calls[tool_call_index]["function"][
-                        "arguments"
-                    ] += tool_call_arguments
-
-                    # Process Iterable model if provided
-                    if (
-                        response_format
-                        and isinstance(response_format, Iterable) is True
-                    ):
-                        trimmed_character = tool_call_arguments.strip()
-                        # Check beginning of List
-                        if trimmed_character == "[" and json_extraction_active is False:
-                            json_extraction_active = True
-                        # Check beginning of a JSON object
-                        elif (
-                            trimmed_character == "{" and json_extraction_active is True
-                        ):
-                            json_brace_level += 1
-                            json_string_buffer += trimmed_character
-                        # Check the end of a JSON object
-                        elif (
-                            "}" in trimmed_character and json_extraction_active is True
-                        ):
-                            json_brace_level -= 1
-                            json_string_buffer += trimmed_character.rstrip(",")
-                            if json_brace_level == 0:
-                                yield from StreamHandler._validate_json_object(
-                                    response_format, json_string_buffer
-                                )
-                                # Reset buffers and counts
-                                json_string_buffer = ""
-                        elif json_extraction_active is True:
-                            json_string_buffer += tool_call_arguments
-
-        if content_accumulator:
-            yield {"type": "final_content", "data": content_accumulator}
-
-        if tool_calls:
-            yield from StreamHandler._get_final_tool_calls(tool_calls, response_format)
+            yield from state.process_chunk(chunk)
+        yield from state.finalize()
 
     @staticmethod
     def _process_openai_chunk(chunk: ChatCompletionChunk) -> Dict[str, Any]:
@@ -239,3 +204,103 @@ class StreamHandler:
             else:
                 tool_call = ToolCall(**tool)
                 yield {"type": "final_tool_call", "data": tool_call}
+
+
+class _OpenAIStreamState:
+    """
+    Accumulates content and tool calls across OpenAI stream chunks.
+    Shared by the synchronous and asynchronous stream processors.
+    """
+
+    def __init__(self, response_format: Optional[Union[Type[T], Type[Iterable[T]]]]):
+        self.response_format = response_format
+        self.content_accumulator = ""
+        self.json_extraction_active = False
+        self.json_brace_level = 0
+        self.json_string_buffer = ""
+        self.tool_calls: Dict[int, Any] = {}
+
+    def process_chunk(self, chunk: ChatCompletionChunk) -> Iterator[Dict[str, Any]]:
+        """
+        Process a single stream chunk.
+
+        Args:
+            chunk: The chunk from the OpenAI API.
+
+        Yields:
+            dict: Processed content chunks and validated structured outputs.
+        """
+        response_format = self.response_format
+        processed_chunk = StreamHandler._process_openai_chunk(chunk)
+        chunk_type = processed_chunk.get("type")
+        chunk_data = processed_chunk.get("data")
+
+        if chunk_type == "content":
+            self.content_accumulator += chunk_data
+            yield processed_chunk
+        elif chunk_type in ["tool_calls", "function_call"]:
+            for tool_chunk in chunk_data:
+                tool_call_index = tool_chunk["index"]
+                tool_call_id = tool_chunk["id"]
+                tool_call_function = tool_chunk["function"]
+                tool_call_arguments = tool_call_function["arguments"]
+
+                if tool_call_id is not None:
+                    self.tool_calls.setdefault(
+                        tool_call_index,
+                        {
+                            "id": tool_call_id,
+                            "type": tool_chunk["type"],
+                            "function": {
+                                "name": tool_call_function["name"],
+                                "arguments": tool_call_arguments,
+                            },
+                        },
+                    )
+
+                # Add tool call arguments to current tool calls
+                self.tool_calls[tool_call_index]["function"][
+                    "arguments"
+                ] += tool_call_arguments
+
+                # Process Iterable model if provided
+                if response_format and isinstance(response_format, Iterable) is True:
+                    trimmed_character = tool_call_arguments.strip()
+                    # Check beginning of List
+                    if (
+                        trimmed_character == "["
+                        and self.json_extraction_active is False
+                    ):
+                        self.json_extraction_active = True
+                    # Check beginning of a JSON object
+                    elif (
+                        trimmed_character == "{" and self.json_extraction_active is True
+                    ):
+                        self.json_brace_level += 1
+                        self.json_string_buffer += trimmed_character
+                    # Check the end of a JSON object
+                    elif (
+                        "}" in trimmed_character and self.json_extraction_active is True
+                    ):
+                        self.json_brace_level -= 1
+                        self.json_string_buffer += trimmed_character.rstrip(",")
+                        if self.json_brace_level == 0:
+                            yield from StreamHandler._validate_json_object(
+                                response_format, self.json_string_buffer
+                            )
+                            # Reset buffers and counts
+                            self.json_string_buffer = ""
+                    elif self.json_extraction_active is True:
+                        self.json_string_buffer += tool_call_arguments
+
+    def finalize(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the accumulated content and final tool calls once the stream is exhausted.
+        """
+        if self.content_accumulator:
+            yield {"type": "final_content", "data": self.content_accumulator}
+
+        if self.tool_calls:
+            yield from StreamHandler._get_final_tool_calls(
+                self.tool_calls, self.response_format
+            )
@@ -1,7 +1,15 @@
 from dapr_agents.storage.daprstores.statestore import DaprStateStore
 from dapr_agents.types import BaseMessage
 from dapr_agents.memory import MemoryBase
-from typing import List, Union, Optional, Dict, Any
+from dapr.clients.exceptions import DaprGrpcError
+from dapr.clients.grpc._request import (
+    TransactionalStateOperation,
+    TransactionOperationType,
+)
+from dapr.clients.grpc._response import StateResponse
+from dapr.clients.grpc._state import Concurrency, StateOptions
+from grpc import StatusCode
+from typing import List, Union, Optional, Dict, Any, Tuple
 from pydantic import Field, model_validator
 from datetime import datetime
 import json
@@ -10,6 +18,8 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+STATE_METADATA = {"contentType": "application/json"}
+
 
 def generate_numeric_session_id() -> int:
     """
@@ -23,8 +33,12 @@ def generate_numeric_session_id() -> int:
 
 class ConversationDaprStateMemory(MemoryBase):
     """
-    Manages conversation memory stored in a Dapr state store. Each message in the conversation is saved
-    individually with a unique key and includes a session ID and timestamp for querying and retrieval.
+    Manages conversation memory stored in a Dapr state store using an append-only, segmented layout.
+
+    Messages are written to fixed-size segments keyed as ``{session_id}:segment:{index}``, while a small
+    head key (``session_id``) tracks the message count and number of segments. Appends only touch the
+    tail segment and the head, and are applied as etag-guarded transactions so concurrent writers
+    cannot silently overwrite each other.
     """
 
     store_name: str = Field(
@@ -33,6 +47,16 @@ class ConversationDaprStateMemory(MemoryBase):
     session_id: Optional[Union[str, int]] = Field(
         default=None, description="Unique identifier for the conversation session."
     )
+    segment_size: int = Field(
+        default=50,
+        gt=0,
+        description="Maximum number of messages stored per segment for new sessions.",
+    )
+    max_retries: int = Field(
+        default=3,
+        ge=0,
+        description="Number of times an append is retried when the head etag no longer matches.",
+    )
 
     # Private attribute to hold the initialized DaprStateStore
     dapr_store: Optional[DaprStateStore] = Field(
@@ -66,60 +90,217 @@ class ConversationDaprStateMemory(MemoryBase):
         # Complete post-initialization
         super().model_post_init(__context)
 
-    def _get_message_key(self, message_id: str) -> str:
+    @property
+    def _head_key(self) -> str:
         """
-        Generates a unique key for each message using session_id and message_id.
+        Key of the head record holding the session's message count and segment count.
+        """
+        return str(self.session_id)
+
+    def _get_segment_key(self, index: int) -> str:
+        """
+        Generates the key for a message segment using session_id and the segment index.
 
         Args:
-            message_id (str): A unique identifier for the message.
+            index (int): The zero-based index of the segment.
 
         Returns:
-            str: A composite key for storing individual messages.
+            str: A composite key for storing a segment of messages.
         """
-        return f"{self.session_id}:{message_id}"
+        return f"{self.session_id}:segment:{index}"
 
-    def add_message(self, message: Union[Dict, BaseMessage]):
+    def _prepare_message(self, message: Union[Dict, BaseMessage]) -> Dict[str, Any]:
         """
-        Adds a single message to the memory and saves it to the Dapr state store.
+        Converts a message to a dictionary and stamps it with the session ID and creation time.
 
         Args:
-            message (Union[Dict, BaseMessage]): The message to add to the memory.
-        """
+            message (Union[Dict, BaseMessage]): The message to prepare.
 
+        Returns:
+            Dict[str, Any]: The message ready to be persisted.
+        """
         if isinstance(message, BaseMessage):
             message = message.model_dump()
+        else:
+            message = dict(message)
 
-        message_id = str(uuid.uuid4())
-        message_key = self._get_message_key(message_id)
         message.update(
             {
                 "sessionId": self.session_id,
                 "createdAt": datetime.now().isoformat() + "Z",
             }
         )
+        return message
+
+    def _read_head(self) -> Tuple[Dict[str, int], Optional[str], List[Dict[str, Any]]]:
+        """
+        Reads the head record for the current session.
+
+        Sessions written with the previous single-key layout store the whole history as a JSON list
+        under the session key. Those messages are returned separately so the next append can migrate
+        them into segments.
 
-        existing = self.get_messages()
-        existing.append(message)
+        Returns:
+            Tuple[Dict[str, int], Optional[str], List[Dict[str, Any]]]: The head record, its etag,
+            and any messages found in the legacy layout.
+        """
+        response = self.query_messages(session_id=self._head_key)
+        etag = (response.etag or None) if response else None
+        head = {"count": 0, "segments": 0, "segment_size": self.segment_size}
+
+        if not response or not response.data:
+            return head, etag, []
+
+        data = self._decode_message(response.data)
+        if isinstance(data, list):
+            return head, etag, data
 
-        logger.debug(
-            f"Adding message with key {message_key} to session {self.session_id}"
+        head.update(data)
+        return head, etag, []
+
+    def _read_segments(self, indices: List[int]) -> List[Dict[str, Any]]:
+        """
+        Reads the given segments in a single bulk request and concatenates them in index order.
+
+        Args:
+            indices (List[int]): The segment indices to read.
+
+        Returns:
+            List[Dict[str, Any]]: The messages stored in the segments, in order.
+        """
+        if not indices:
+            return []
+
+        keys = [self._get_segment_key(index) for index in indices]
+        items = self.dapr_store.get_bulk_state(
+            keys, parallelism=min(len(keys), 10), states_metadata=STATE_METADATA
         )
-        self.dapr_store.save_state(
-            self.session_id, json.dumps(existing), {"contentType": "application/json"}
+        segments = {item.key: item.data for item in items if item.data}
+
+        messages: List[Dict[str, Any]] = []
+        for key in keys:
+            if key in segments:
+                messages.extend(self._decode_message(segments[key]))
+        return messages
+
+    def _append(self, messages: List[Dict[str, Any]]) -> None:
+        """
+        Appends prepared messages to the session, touching only the tail segment and the head.
+
+        The segment writes and the head update are executed as one transaction guarded by the head's
+        etag. A missing head is first created with first-write concurrency, so concurrent first
+        appends cannot both succeed. If another writer updated the head in the meantime, the append
+        is retried.
+
+        Args:
+            messages (List[Dict[str, Any]]): The prepared messages to append.
+
+        Raises:
+            DaprGrpcError: If the transaction fails for another reason than an etag mismatch, or
+                still conflicts after ``max_retries`` retries.
+        """
+        for attempt in range(self.max_retries + 1):
+            head, etag, legacy = self._read_head()
+            if etag is None:
+                # Create the head only if no other writer did, then append against its etag
+                try:
+                    self.dapr_store.save_state(
+                        self._head_key,
+                        json.dumps(head),
+                        state_metadata=STATE_METADATA,
+                        options=StateOptions(concurrency=Concurrency.first_write),
+                    )
+                except DaprGrpcError as e:
+                    if not self._is_etag_mismatch(e):
+                        raise
+                head, etag, legacy = self._read_head()
+            size = head["segment_size"]
+            pending = legacy + messages
+
+            # Continue filling the tail segment if it still has room
+            buffer: List[Dict[str, Any]] = []
+            index = head["segments"]
+            if head["count"] % size:
+                index -= 1
+                buffer = self._read_segments([index])
+
+            operations: List[TransactionalStateOperation] = []
+            for message in pending:
+                buffer.append(message)
+                if len(buffer) == size:
+                    operations.append(self._segment_operation(index, buffer))
+                    index += 1
+                    buffer = []
+            if buffer:
+                operations.append(self._segment_operation(index, buffer))
+                index += 1
+
+            head = {
+                "count": head["count"] + len(pending),
+                "segments": index,
+                "segment_size": size,
+            }
+            operations.append(
+                TransactionalStateOperation(
+                    key=self._head_key, data=json.dumps(head), etag=etag
+                )
+            )
+
+            try:
+                self.dapr_store.execute_state_transaction(operations)
+                return
+            except DaprGrpcError as e:
+                if not self._is_etag_mismatch(e) or attempt == self.max_retries:
+                    raise
+                logger.warning(
+                    f"Append to session {self.session_id} conflicted (attempt {attempt + 1}), retrying: {e}"
+                )
+
+    @staticmethod
+    def _is_etag_mismatch(error: DaprGrpcError) -> bool:
+        """Whether a state request was rejected because another writer changed or created the key."""
+        if error.code() in (StatusCode.ABORTED, StatusCode.FAILED_PRECONDITION):
+            return True
+        return "etag" in (error.details() or "").lower()
+
+    def _segment_operation(
+        self, index: int, messages: List[Dict[str, Any]]
+    ) -> TransactionalStateOperation:
+        """
+        Builds the upsert operation for a single segment.
+
+        Args:
+            index (int): The segment index.
+            messages (List[Dict[str, Any]]): The messages the segment should hold.
+
+        Returns:
+            TransactionalStateOperation: The upsert operation.
+        """
+        return TransactionalStateOperation(
+            key=self._get_segment_key(index), data=json.dumps(messages)
         )
 
+    def add_message(self, message: Union[Dict, BaseMessage]):
+        """
+        Adds a single message to the memory and appends it to the tail segment in the Dapr state store.
+
+        Args:
+            message (Union[Dict, BaseMessage]): The message to add to the memory.
+        """
+        logger.debug(f"Adding message to session {self.session_id}")
+        self._append([self._prepare_message(message)])
+
     def add_messages(self, messages: List[Union[Dict, BaseMessage]]):
         """
-        Adds multiple messages to the memory and saves each one individually to the Dapr state store.
+        Adds multiple messages to the memory and appends them to the Dapr state store in a single transaction.
 
         Args:
             messages (List[Union[Dict, BaseMessage]]): A list of messages to add to the memory.
         """
+        if not messages:
+            return
         logger.info(f"Adding {len(messages)} messages to session {self.session_id}")
-        for message in messages:
-            if isinstance(message, BaseMessage):
-                message = message.model_dump()
-            self.add_message(message)
+        self._append([self._prepare_message(message) for message in messages])
 
     def add_interaction(
         self, user_message: BaseMessage, assistant_message: BaseMessage
@@ -133,7 +314,7 @@ class ConversationDaprStateMemory(MemoryBase):
         """
         self.add_messages([user_message, assistant_message])
 
-    def _decode_message(self, message_data: Union[bytes, str]) -> dict:
+    def _decode_message(self, message_data: Union[bytes, str]) -> Any:
         """
         Decodes the message data if it's in bytes, otherwise parses it as a JSON string.
 
@@ -141,56 +322,80 @@ class ConversationDaprStateMemory(MemoryBase):
             message_data (Union[bytes, str]): The message data to decode.
 
         Returns:
-            dict: The decoded message as a dictionary.
+            Any: The decoded JSON value.
         """
         if isinstance(message_data, bytes):
             message_data = message_data.decode("utf-8")
         return json.loads(message_data)
 
-    def get_messages(self, limit: int = 100) -> List[Dict[str, str]]:
+    def get_messages(self, limit: Optional[int] = 100) -> List[Dict[str, str]]:
         """
-        Retrieves messages stored in the state store for the current session_id, with an optional limit.
+        Retrieves the most recent messages for the current session_id, reading only the segments
+        needed to cover the requested limit.
 
         Args:
-            limit (int): The maximum number of messages to retrieve. Defaults to 100.
+            limit (Optional[int]): The maximum number of messages to retrieve. Defaults to 100.
+                Pass None to retrieve the full history.
 
         Returns:
             List[Dict[str, str]]: A list containing the 'content' and 'role' fields of the messages.
         """
-        response = self.query_messages(session_id=self.session_id)
-        if response and response.data:
-            raw_messages = json.loads(response.data)
-            if raw_messages:
-                messages = [
-                    {"content": msg.get("content"), "role": msg.get("role")}
-                    for msg in raw_messages
-                ]
-
-                logger.info(
-                    f"Retrieved {len(messages)} messages for session {self.session_id}"
-                )
-                return messages
-
-        return []
-
-    def query_messages(self, session_id: str) -> List[Dict[str, str]]:
+        head, _, legacy = self._read_head()
+
+        if legacy:
+            raw_messages = legacy if limit is None else legacy[-limit:]
+        else:
+            total = head["count"]
+            start = 0 if limit is None else max(0, total - limit)
+            if start >= total:
+                return []
+            size = head["segment_size"]
+            first = start // size
+            raw_messages = self._read_segments(list(range(first, head["segments"])))
+            raw_messages = raw_messages[start - first * size :]
+
+        messages = [
+            {"content": msg.get("content"), "role": msg.get("role")}
+            for msg in raw_messages
+        ]
+        if messages:
+            logger.info(
+                f"Retrieved {len(messages)} messages for session {self.session_id}"
+            )
+        return messages
+
+    def query_messages(self, session_id: str) -> StateResponse:
         """
-        Queries messages from the state store based on a pre-constructed query string.
+        Reads the head record stored under the given session ID.
 
         Args:
-            query (Optional[str]): A JSON-formatted query string to be executed.
+            session_id (str): The session ID whose head record should be read.
 
         Returns:
-            List[Dict[str, str]]: A list containing the 'content' and 'role' fields of the messages.
+            StateResponse: The raw state response, including its etag.
         """
-        logger.debug(f"Executing query for session {self.session_id}")
-        states_metadata = {"contentType": "application/json"}
-        response = self.dapr_store.get_state(session_id, state_metadata=states_metadata)
+        logger.debug(f"Executing query for session {session_id}")
+        response = self.dapr_store.get_state(
+            str(session_id), state_metadata=STATE_METADATA
+        )
         return response
 
     def reset_memory(self):
         """
-        Clears all messages stored in the memory and resets the state store for the current session.
+        Clears all messages stored in the memory by deleting the head and every segment for the current session.
         """
-        self.dapr_store.delete_state(self.session_id)
+        head, _, _ = self._read_head()
+        operations = [
+            TransactionalStateOperation(
+                key=self._get_segment_key(index),
+                operation_type=TransactionOperationType.delete,
+            )
+            for index in range(head["segments"])
+        ]
+        operations.append(
+            TransactionalStateOperation(
+                key=self._head_key, operation_type=TransactionOperationType.delete
+            )
+        )
+        self.dapr_store.execute_state_transaction(operations)
         logger.info(f"Memory reset for session {self.session_id} completed.")
@@ -1,2 +1,7 @@
 from .graphstores import GraphStoreBase, Neo4jGraphStore
-from .vectorstores import VectorStoreBase, ChromaVectorStore, PostgresVectorStore
+from .vectorstores import (
+    VectorStoreBase,
+    ChromaVectorStore,
+    PostgresVectorStore,
+    LocalVectorStore,
+)
@@ -1,2 +1,10 @@
 from .base import DaprStoreBase
 from .statestore import DaprStateStore
+from .pool import (
+    DaprClientPool,
+    AsyncDaprClientPool,
+    get_dapr_client_pool,
+    get_async_dapr_client_pool,
+    configure_dapr_client_pools,
+    close_dapr_client_pools,
+)
@@ -1,4 +1,4 @@
-from dapr.clients import DaprClient
+from dapr_agents.storage.daprstores.pool import DaprClientPool, get_dapr_client_pool
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, Any
 
@@ -9,8 +9,9 @@ class DaprStoreBase(BaseModel):
     """
 
     store_name: str = Field(..., description="The name of the Dapr store.")
-    client: Optional[DaprClient] = Field(
-        default=None, init=False, description="Dapr client for store operations."
+    client_pool: Optional[DaprClientPool] = Field(
+        default=None,
+        description="Pool of long-lived Dapr clients used for store operations. Defaults to the shared pool.",
     )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -19,6 +20,8 @@ class DaprStoreBase(BaseModel):
         """
         Post-initialization to set Dapr settings based on provided or environment values for host and port.
         """
+        if self.client_pool is None:
+            self.client_pool = get_dapr_client_pool()
 
         # Complete post-initialization
         super().model_post_init(__context)
@@ -0,0 +1,324 @@
+from dapr.clients import DaprClient
+from dapr.aio.clients import DaprClient as AsyncDaprClient
+from contextlib import contextmanager, asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+import asyncio
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = int(os.getenv("DAPR_AGENTS_CLIENT_POOL_SIZE", "4"))
+DEFAULT_IDLE_TIMEOUT = float(os.getenv("DAPR_AGENTS_CLIENT_POOL_IDLE_TIMEOUT", "300"))
+
+
+class DaprClientPool:
+    """
+    Thread-safe pool of long-lived synchronous Dapr clients.
+
+    Clients are created lazily up to `size`, handed out with `acquire()` and returned to the pool
+    afterwards, so the gRPC channel and sidecar health check are paid once per client instead of
+    once per operation. Clients that stay idle longer than `idle_timeout` seconds are closed.
+    `close()` drains the pool; it keeps serving requests with new clients afterwards.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+        client_factory: Callable[[], DaprClient] = DaprClient,
+    ):
+        """
+        Args:
+            size (int): Maximum number of clients kept open at the same time.
+            idle_timeout (Optional[float]): Seconds after which an idle client is closed. None disables eviction.
+            client_factory (Callable[[], DaprClient]): Factory used to create new clients.
+        """
+        if size < 1:
+            raise ValueError("Client pool size must be at least 1.")
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._client_factory = client_factory
+        self._idle: List[Tuple[DaprClient, float]] = []
+        self._created = 0
+        # Clients in use, by id, with the generation they were checked out in
+        self._leased: Dict[int, int] = {}
+        self._generation = 0
+        self._condition = threading.Condition()
+
+    def _evict_idle(self) -> None:
+        """Closes clients that have been idle longer than `idle_timeout`. Caller must hold the lock."""
+        if self.idle_timeout is None:
+            return
+        deadline = time.monotonic() - self.idle_timeout
+        keep = []
+        for client, last_used in self._idle:
+            if last_used < deadline:
+                self._close_client(client)
+                self._created -= 1
+            else:
+                keep.append((client, last_used))
+        self._idle = keep
+
+    @staticmethod
+    def _close_client(client: DaprClient) -> None:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close Dapr client: {e}")
+
+    def _checkout(self) -> DaprClient:
+        with self._condition:
+            while True:
+                self._evict_idle()
+                if self._idle:
+                    client, _ = self._idle.pop()
+                    self._leased[id(client)] = self._generation
+                    return client
+                if self._created < self.size:
+                    self._created += 1
+                    generation = self._generation
+                    break
+                self._condition.wait()
+
+        # Create outside the lock; the constructor waits on the sidecar health check
+        try:
+            client = self._client_factory()
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._leased[id(client)] = generation
+        return client
+
+    def _checkin(self, client: DaprClient) -> None:
+        with self._condition:
+            # Clients checked out before the last close() are closed instead of reused
+            if self._leased.pop(id(client), self._generation) != self._generation:
+                self._created -= 1
+                self._close_client(client)
+            else:
+                self._idle.append((client, time.monotonic()))
+            self._condition.notify()
+
+    @contextmanager
+    def acquire(self) -> Iterator[DaprClient]:
+        """
+        Borrows a client from the pool, blocking while all `size` clients are in use.
+
+        Yields:
+            DaprClient: A ready-to-use Dapr client.
+        """
+        client = self._checkout()
+        try:
+            yield client
+        finally:
+            self._checkin(client)
+
+    def close(self) -> None:
+        """
+        Closes all idle clients. Clients still in use are closed when they are returned. The pool
+        stays usable: later checkouts open new clients.
+        """
+        with self._condition:
+            self._generation += 1
+            for client, _ in self._idle:
+                self._close_client(client)
+            self._created -= len(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+
+
+class _LoopClients:
+    """Clients and bookkeeping of an `AsyncDaprClientPool` for a single event loop."""
+
+    def __init__(self):
+        self.idle: List[Tuple[AsyncDaprClient, float]] = []
+        self.created = 0
+        self.condition = asyncio.Condition()
+
+
+class AsyncDaprClientPool:
+    """
+    Pool of long-lived asynchronous Dapr clients.
+
+    gRPC asyncio channels are bound to the event loop that created them, so clients are pooled per
+    event loop. Within a loop, at most `size` clients exist and idle ones are closed after
+    `idle_timeout` seconds. `close()` drains the pool; it keeps serving requests with new clients
+    afterwards.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+        client_factory: Callable[[], AsyncDaprClient] = AsyncDaprClient,
+    ):
+        """
+        Args:
+            size (int): Maximum number of clients kept open per event loop.
+            idle_timeout (Optional[float]): Seconds after which an idle client is closed. None disables eviction.
+            client_factory (Callable[[], AsyncDaprClient]): Factory used to create new clients.
+        """
+        if size < 1:
+            raise ValueError("Client pool size must be at least 1.")
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._client_factory = client_factory
+        self._loops: Dict[asyncio.AbstractEventLoop, _LoopClients] = {}
+        self._lock = threading.Lock()
+
+    def _loop_clients(self) -> _LoopClients:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            # Forget pools of loops that have been closed in the meantime
+            for stale in [lp for lp in self._loops if lp.is_closed()]:
+                del self._loops[stale]
+            if loop not in self._loops:
+                self._loops[loop] = _LoopClients()
+            return self._loops[loop]
+
+    @staticmethod
+    async def _close_client(client: AsyncDaprClient) -> None:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close async Dapr client: {e}")
+
+    async def _evict_idle(self, clients: _LoopClients) -> None:
+        if self.idle_timeout is None:
+            return
+        deadline = time.monotonic() - self.idle_timeout
+        expired = [client for client, last in clients.idle if last < deadline]
+        clients.idle = [(c, last) for c, last in clients.idle if last >= deadline]
+        clients.created -= len(expired)
+        for client in expired:
+            await self._close_client(client)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AsyncDaprClient]:
+        """
+        Borrows a client bound to the running event loop, waiting while all `size` clients are in use.
+
+        Yields:
+            AsyncDaprClient: A ready-to-use asynchronous Dapr client.
+        """
+        clients = self._loop_clients()
+        async with clients.condition:
+            while True:
+                await self._evict_idle(clients)
+                if clients.idle:
+                    client, _ = clients.idle.pop()
+                    break
+                if clients.created < self.size:
+                    clients.created += 1
+                    client = None
+                    break
+                await clients.condition.wait()
+
+        if client is None:
+            try:
+                client = self._client_factory()
+            except Exception:
+                async with clients.condition:
+                    clients.created -= 1
+                    clients.condition.notify()
+                raise
+
+        try:
+            yield client
+        finally:
+            async with clients.condition:
+                # Clients checked out before the last close() are closed instead of reused
+                with self._lock:
+                    drained = self._loops.get(asyncio.get_running_loop()) is not clients
+                if drained:
+                    clients.created -= 1
+                    await self._close_client(client)
+                else:
+                    clients.idle.append((client, time.monotonic()))
+                clients.condition.notify()
+
+    async def close(self) -> None:
+        """
+        Closes idle clients of the running event loop and drops clients bound to other loops.
+        Clients still in use are closed when they are returned. The pool stays usable: later
+        checkouts open new clients.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loops = dict(self._loops)
+            self._loops.clear()
+        for client_loop, clients in loops.items():
+            idle = [client for client, _ in clients.idle]
+            clients.idle.clear()
+            if client_loop is loop:
+                for client in idle:
+                    await self._close_client(client)
+            elif client_loop.is_running():
+                for client in idle:
+                    asyncio.run_coroutine_threadsafe(
+                        self._close_client(client), client_loop
+                    )
+
+
+_pool_lock = threading.Lock()
+_sync_pool: Optional[DaprClientPool] = None
+_async_pool: Optional[AsyncDaprClientPool] = None
+_pool_settings: Dict[str, Optional[float]] = {
+    "size": DEFAULT_POOL_SIZE,
+    "idle_timeout": DEFAULT_IDLE_TIMEOUT,
+}
+
+
+def configure_dapr_client_pools(
+    size: Optional[int] = None, idle_timeout: Optional[float] = None
+) -> None:
+    """
+    Sets the size and idle timeout used by the shared pools the next time they are created.
+
+    Args:
+        size (Optional[int]): Maximum number of clients per pool.
+        idle_timeout (Optional[float]): Seconds after which an idle client is closed.
+    """
+    with _pool_lock:
+        if size is not None:
+            _pool_settings["size"] = size
+        if idle_timeout is not None:
+            _pool_settings["idle_timeout"] = idle_timeout
+
+
+def get_dapr_client_pool() -> DaprClientPool:
+    """Returns the process-wide synchronous Dapr client pool, creating it on first use."""
+    global _sync_pool
+    with _pool_lock:
+        if _sync_pool is None:
+            _sync_pool = DaprClientPool(**_pool_settings)
+        return _sync_pool
+
+
+def get_async_dapr_client_pool() -> AsyncDaprClientPool:
+    """Returns the process-wide asynchronous Dapr client pool, creating it on first use."""
+    global _async_pool
+    with _pool_lock:
+        if _async_pool is None:
+            _async_pool = AsyncDaprClientPool(**_pool_settings)
+        return _async_pool
+
+
+async def close_dapr_client_pools() -> None:
+    """
+    Closes the clients of the shared pools. Stores and clients that hold a pool keep working; the
+    pools open new clients when they are used again.
+    """
+    with _pool_lock:
+        sync_pool, async_pool = _sync_pool, _async_pool
+    if sync_pool:
+        sync_pool.close()
+    if async_pool:
+        await async_pool.close()
+    logger.debug("Shared Dapr client pools closed.")
@@ -16,10 +16,11 @@ class DaprSecretStore(DaprStoreBase):
         Returns:
             Optional[Dict[str, str]]: The secret stored in the secret store, or None if not found.
         """
-        response = self.client.get_secret(
-            store_name=self.store_name, key=key, secret_metadata=secret_metadata
-        )
-        return response.secret
+        with self.client_pool.acquire() as client:
+            response = client.get_secret(
+                store_name=self.store_name, key=key, secret_metadata=secret_metadata
+            )
+            return response.secret
 
     def get_bulk_secret(
         self, secret_metadata: Optional[Dict[str, str]] = {}
@@ -33,7 +34,8 @@ class DaprSecretStore(DaprStoreBase):
         Returns:
             Dict[str, Dict[str, str]]: A dictionary of secrets.
         """
-        response = self.client.get_bulk_secret(
-            store_name=self.store_name, secret_metadata=secret_metadata
-        )
-        return response.secrets
+        with self.client_pool.acquire() as client:
+            response = client.get_bulk_secret(
+                store_name=self.store_name, secret_metadata=secret_metadata
+            )
+            return response.secrets
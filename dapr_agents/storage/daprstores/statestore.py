@@ -4,8 +4,8 @@ from dapr.clients.grpc._response import (
     StateResponse,
     QueryResponse,
 )
-from dapr.clients import DaprClient
-from dapr.clients.grpc._state import StateItem
+from dapr.clients.grpc._state import StateItem, StateOptions
+from dapr.clients.grpc._request import TransactionalStateOperation
 from dapr_agents.storage.daprstores.base import DaprStoreBase
 from typing import Optional, Union, Dict, List, Tuple
 
@@ -26,7 +26,7 @@ class DaprStateStore(DaprStoreBase):
         Returns:
             StateResponse: gRPC metadata returned from callee and value obtained from the state store
         """
-        with DaprClient() as client:
+        with self.client_pool.acquire() as client:
             response: StateResponse = client.get_state(
                 store_name=self.store_name, key=key, state_metadata=state_metadata
             )
@@ -46,7 +46,7 @@ class DaprStateStore(DaprStoreBase):
             Tuple[bool, Optional[dict]]: A tuple where the first element is a boolean indicating whether the state exists,
                                         and the second element is the retrieved state data or None if not found.
         """
-        with DaprClient() as client:
+        with self.client_pool.acquire() as client:
             response: StateResponse = client.get_state(
                 store_name=self.store_name, key=key, state_metadata=state_metadata
             )
@@ -73,7 +73,7 @@ class DaprStateStore(DaprStoreBase):
         """
         states_metadata = states_metadata or {}
 
-        with DaprClient() as client:
+        with self.client_pool.acquire() as client:
             response: BulkStatesResponse = client.get_bulk_state(
                 store_name=self.store_name,
                 keys=keys,
@@ -90,6 +90,8 @@ class DaprStateStore(DaprStoreBase):
         key: str,
         value: Union[str, bytes],
         state_metadata: Optional[Dict[str, str]] = dict(),
+        etag: Optional[str] = None,
+        options: Optional[StateOptions] = None,
     ):
         """
         Saves a key-value pair in the state store.
@@ -98,12 +100,16 @@ class DaprStateStore(DaprStoreBase):
             key (str): The key to save.
             value (Union[str, bytes]): The value to save.
             state_metadata (Dict[str, str], optional): Dapr metadata for state request
+            etag (str, optional): Etag the stored value must match for the write to succeed.
+            options (StateOptions, optional): Concurrency and consistency options of the write.
         """
-        with DaprClient() as client:
+        with self.client_pool.acquire() as client:
             client.save_state(
                 store_name=self.store_name,
                 key=key,
                 value=value,
+                etag=etag,
+                options=options,
                 state_metadata=state_metadata,
             )
 
@@ -117,20 +123,48 @@ class DaprStateStore(DaprStoreBase):
             states (List[StateItem]): The list of key-value pairs to save.
             metadata (Dict[str, str], optional): Metadata for the save request.
         """
-        with DaprClient() as client:
+        with self.client_pool.acquire() as client:
             client.save_bulk_state(
                 store_name=self.store_name, states=states, metadata=metadata
             )
 
-    def delete_state(self, key: str):
+    def execute_state_transaction(
+        self,
+        operations: List[TransactionalStateOperation],
+        transactional_metadata: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Executes a list of upsert/delete operations against the state store as a single transaction.
+
+        Args:
+            operations (List[TransactionalStateOperation]): The operations to apply atomically.
+            transactional_metadata (Dict[str, str], optional): Dapr metadata for the transaction.
+        """
+        with self.client_pool.acquire() as client:
+            client.execute_state_transaction(
+                store_name=self.store_name,
+                operations=operations,
+                transactional_metadata=transactional_metadata or {},
+            )
+
+    def delete_state(
+        self,
+        key: str,
+        etag: Optional[str] = None,
+        options: Optional[StateOptions] = None,
+    ):
         """
         Deletes a key-value pair from the state store.
 
         Args:
             key (str): The key to delete.
+            etag (str, optional): Etag the stored value must match for the delete to succeed.
+            options (StateOptions, optional): Concurrency and consistency options of the delete.
         """
-        with DaprClient() as client:
-            client.delete_state(store_name=self.store_name, key=key)
+        with self.client_pool.acquire() as client:
+            client.delete_state(
+                store_name=self.store_name, key=key, etag=etag, options=options
+            )
 
     def query_state(
         self, query: str, states_metadata: Optional[Dict[str, str]] = None
@@ -145,7 +179,7 @@ class DaprStateStore(DaprStoreBase):
         Returns:
             QueryResponse: Contains query results and metadata.
         """
-        with DaprClient() as client:
+        with self.client_pool.acquire() as client:
             client.query_state(
                 store_name=self.store_name, query=query, states_metadata=states_metadata
             )
@@ -1,3 +1,4 @@
 from .base import VectorStoreBase
 from .chroma import ChromaVectorStore
 from .postgres import PostgresVectorStore
+from .local import LocalVectorStore
@@ -0,0 +1,161 @@
+from typing import List, Optional
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rows assigned per block, bounding the temporary (rows x lists) distance matrix
+_ASSIGN_BLOCK_ROWS = 16384
+
+
+class IVFIndex:
+    """
+    Inverted-file index with k-means coarse quantization.
+
+    Vectors are clustered into `n_lists` cells. A query only scores the rows of the `n_probes`
+    cells whose centroids are closest to it, trading a little recall for a large cut in work.
+    For "cosine" and "inner_product" the clustering is spherical (on normalized vectors); for
+    "l2" it uses Euclidean distance.
+
+    The index only stores centroids and one cell assignment per store row; the vectors themselves
+    stay in the owning store.
+    """
+
+    def __init__(self, metric: str = "cosine"):
+        self.metric = metric
+        self.centroids: Optional[np.ndarray] = None
+        self.assignments: np.ndarray = np.zeros(0, dtype=np.int32)
+        self.trained_rows: int = 0
+        self._order: Optional[np.ndarray] = None
+        self._offsets: Optional[np.ndarray] = None
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether centroids have been computed."""
+        return self.centroids is not None
+
+    @property
+    def n_lists(self) -> int:
+        """Number of cells, or 0 before training."""
+        return 0 if self.centroids is None else len(self.centroids)
+
+    def train(
+        self,
+        vectors: np.ndarray,
+        n_lists: int,
+        n_iter: int = 15,
+        sample_size: int = 64,
+        seed: int = 0,
+    ) -> None:
+        """
+        Computes centroids with k-means on a sample of `vectors` and assigns every row to a cell.
+
+        Args:
+            vectors (np.ndarray): All store vectors as a float32 matrix.
+            n_lists (int): Number of cells.
+            n_iter (int): Number of k-means iterations.
+            sample_size (int): Training rows per cell; the sample is capped at `n_lists * sample_size`.
+            seed (int): Random seed for sampling and initialization.
+        """
+        rng = np.random.default_rng(seed)
+        n_lists = max(1, min(n_lists, len(vectors)))
+        points = self._prepare(vectors)
+        if len(points) > n_lists * sample_size:
+            points = points[
+                rng.choice(len(points), n_lists * sample_size, replace=False)
+            ]
+
+        centroids = points[rng.choice(len(points), n_lists, replace=False)].copy()
+        for _ in range(n_iter):
+            labels = self._nearest(points, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, points)
+            counts = np.bincount(labels, minlength=n_lists)
+            empty = counts == 0
+            # Re-seed empty cells with random points so every cell stays useful
+            if empty.any():
+                sums[empty] = points[rng.choice(len(points), int(empty.sum()))]
+                counts[empty] = 1
+            centroids = sums / counts[:, np.newaxis]
+            if self.metric != "l2":
+                centroids = self._normalize(centroids)
+
+        self.centroids = centroids.astype(np.float32)
+        self.assignments = self._nearest(self._prepare(vectors), self.centroids)
+        self.trained_rows = len(vectors)
+        self._invalidate()
+        logger.info(f"IVF index trained with {n_lists} lists on {len(vectors)} rows.")
+
+    def add(self, vectors: np.ndarray) -> None:
+        """Assigns newly appended store rows to their nearest cells."""
+        new = self._nearest(self._prepare(vectors), self.centroids)
+        self.assignments = np.concatenate([self.assignments, new])
+        self._invalidate()
+
+    def reassign(self, rows: List[int], vectors: np.ndarray) -> None:
+        """Moves updated store rows to the cells of their new vectors."""
+        assignments = np.array(self.assignments)
+        assignments[rows] = self._nearest(self._prepare(vectors), self.centroids)
+        self.assignments = assignments
+        self._invalidate()
+
+    def keep(self, mask: np.ndarray) -> None:
+        """Drops the assignments of rows removed from the store during compaction."""
+        self.assignments = self.assignments[mask]
+        self._invalidate()
+
+    def probe(self, queries: np.ndarray, n_probes: int) -> List[np.ndarray]:
+        """
+        Returns, for each query, the store rows in its `n_probes` nearest cells.
+
+        Args:
+            queries (np.ndarray): Query vectors as a float32 matrix.
+            n_probes (int): Number of cells searched per query.
+
+        Returns:
+            List[np.ndarray]: Candidate row indices per query.
+        """
+        if self._order is None:
+            self._order = np.argsort(self.assignments, kind="stable")
+            counts = np.bincount(self.assignments, minlength=self.n_lists)
+            self._offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        n_probes = max(1, min(n_probes, self.n_lists))
+        scores = self._similarity(self._prepare(queries), self.centroids)
+        cells = np.argpartition(-scores, n_probes - 1, axis=1)[:, :n_probes]
+        return [
+            np.concatenate(
+                [self._order[self._offsets[c] : self._offsets[c + 1]] for c in row]
+            )
+            for row in cells
+        ]
+
+    def _invalidate(self) -> None:
+        self._order = None
+        self._offsets = None
+
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        return vectors if self.metric == "l2" else self._normalize(vectors)
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _similarity(self, points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Higher is closer: dot product, or negative squared L2 distance for "l2"."""
+        dots = points @ centroids.T
+        if self.metric != "l2":
+            return dots
+        return 2 * dots - (centroids**2).sum(axis=1)[np.newaxis, :]
+
+    def _nearest(self, points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        labels = np.empty(len(points), dtype=np.int32)
+        for start in range(0, len(points), _ASSIGN_BLOCK_ROWS):
+            block = points[start : start + _ASSIGN_BLOCK_ROWS]
+            labels[start : start + len(block)] = np.argmax(
+                self._similarity(block, centroids), axis=1
+            )
+        return labels
@@ -0,0 +1,847 @@
+from dapr_agents.storage.vectorstores import VectorStoreBase
+from dapr_agents.document.embedder import SentenceTransformerEmbedder
+from dapr_agents.document.embedder.base import EmbedderBase
+from dapr_agents.storage.vectorstores.ivf import IVFIndex
+from typing import List, Dict, Optional, Iterable, Any, Literal, Union
+from pydantic import Field, ConfigDict, PrivateAttr
+from pathlib import Path
+import numpy as np
+import threading
+import json
+import uuid
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rows scored per block during search, bounding temporary memory for large or quantized matrices
+_SEARCH_BLOCK_ROWS = 65536
+
+
+class _TextColumn:
+    """
+    Column of strings, held either as a Python list or as a UTF-8 blob with row offsets.
+
+    Persisted columns are opened from memory-mapped files, so only the rows that are actually
+    read are decoded. Any mutation materializes the column as a list.
+    """
+
+    def __init__(
+        self,
+        values: Optional[List[str]] = None,
+        blob: Optional[np.ndarray] = None,
+        offsets: Optional[np.ndarray] = None,
+    ):
+        if blob is None and values is None:
+            values = []
+        self._values = values
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        if self._values is not None:
+            return len(self._values)
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if self._values is not None:
+            return self._values[index]
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+        return self._blob[start:end].tobytes().decode("utf-8")
+
+    def to_list(self) -> List[str]:
+        """Materializes the column as a mutable list."""
+        if self._values is None:
+            self._values = [self[i] for i in range(len(self))]
+            self._blob = None
+            self._offsets = None
+        return self._values
+
+    def save(self, prefix: Path) -> None:
+        """Writes the column as `<prefix>.bin` and `<prefix>_offsets.npy`."""
+        encoded = [self[i].encode("utf-8") for i in range(len(self))]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        if encoded:
+            np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        _atomic_write(prefix.with_suffix(".bin"), lambda f: f.write(b"".join(encoded)))
+        _atomic_save(prefix.parent / f"{prefix.name}_offsets.npy", offsets)
+
+    @classmethod
+    def load(cls, prefix: Path, mmap: bool) -> "_TextColumn":
+        """Opens a column written by `save`."""
+        offsets = np.load(
+            prefix.parent / f"{prefix.name}_offsets.npy",
+            mmap_mode="r" if mmap else None,
+        )
+        blob_path = prefix.with_suffix(".bin")
+        if offsets[-1] == 0:
+            blob = np.zeros(0, dtype=np.uint8)
+        elif mmap:
+            blob = np.memmap(blob_path, dtype=np.uint8, mode="r")
+        else:
+            blob = np.fromfile(blob_path, dtype=np.uint8)
+        return cls(blob=blob, offsets=offsets)
+
+
+def _atomic_write(path: Path, write: Any) -> None:
+    """Writes a file through a temporary file so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def _atomic_save(path: Path, array: np.ndarray) -> None:
+    """Saves an array as `.npy` through a temporary file."""
+    _atomic_write(path, lambda f: np.save(f, array))
+
+
+class LocalVectorStore(VectorStoreBase):
+    """
+    In-process vector store built on NumPy, for small to medium collections that do not need a server.
+
+    Embeddings are kept in one contiguous matrix (float32, float16, or int8 with per-row scales) and
+    searched with vectorized top-k. IDs, documents and metadata are stored as columns. When `path`
+    is set, `persist()` writes the store as `.npy` and binary files that are memory-mapped on load,
+    so startup is near-instant and worker processes share the same pages.
+
+    With `index_type="ivf"`, searches use an approximate inverted-file index once the store holds
+    `ivf_min_rows` documents. Deletes only mark rows as removed; the matrix is compacted once the
+    share of removed rows exceeds `compaction_threshold`.
+    """
+
+    path: Optional[str] = Field(
+        None,
+        description="Directory used to persist the store. If None, the store lives in memory only.",
+    )
+    embedding_function: Optional[EmbedderBase] = Field(
+        default_factory=SentenceTransformerEmbedder,
+        description="Embedding function for embedding generation.",
+    )
+    dtype: Literal["float32", "float16", "int8"] = Field(
+        "float32",
+        description="Storage type of the embedding matrix. 'float16' halves and 'int8' quarters memory at a small cost in precision.",
+    )
+    distance_metric: Literal["cosine", "l2", "inner_product"] = Field(
+        "cosine", description="Default distance metric for similarity search."
+    )
+    mmap: bool = Field(
+        True,
+        description="Whether persisted files are memory-mapped instead of read into memory.",
+    )
+    auto_persist: bool = Field(
+        False,
+        description="Whether the whole store is rewritten to `path` after every add, update or delete. Off by default because each write then costs O(N); call `persist()` after a batch of changes instead.",
+    )
+    index_type: Literal["flat", "ivf"] = Field(
+        "flat",
+        description="'flat' searches every vector exactly. 'ivf' searches an approximate k-means inverted-file index.",
+    )
+    ivf_lists: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Number of IVF cells. Defaults to the square root of the number of rows at training time.",
+    )
+    ivf_probes: int = Field(
+        8,
+        ge=1,
+        description="IVF cells searched per query. Higher values improve recall at the cost of latency.",
+    )
+    ivf_min_rows: int = Field(
+        10000,
+        ge=1,
+        description="Number of rows at which the IVF index is trained. Smaller stores are searched exactly.",
+    )
+    compaction_threshold: float = Field(
+        0.2,
+        ge=0.0,
+        le=1.0,
+        description="Share of deleted rows at which the matrix is compacted.",
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _vectors: Optional[np.ndarray] = PrivateAttr(default=None)
+    _scales: Optional[np.ndarray] = PrivateAttr(default=None)
+    _norms: Optional[np.ndarray] = PrivateAttr(default=None)
+    _ids: Optional[np.ndarray] = PrivateAttr(default=None)
+    _deleted: Optional[np.ndarray] = PrivateAttr(default=None)
+    _n_deleted: int = PrivateAttr(default=0)
+    _ivf: Optional[IVFIndex] = PrivateAttr(default=None)
+    _documents: _TextColumn = PrivateAttr(default_factory=_TextColumn)
+    _metadatas: _TextColumn = PrivateAttr(default_factory=_TextColumn)
+    _positions: Optional[Dict[str, int]] = PrivateAttr(default=None)
+    _metadata_columns: Dict[str, np.ndarray] = PrivateAttr(default_factory=dict)
+    _lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
+
+    def model_post_init(self, __context: Any) -> None:
+        """
+        Loads the persisted store from `path`, if present.
+        """
+        if self.path and (Path(self.path) / "store.json").exists():
+            self._load()
+            logger.info(
+                f"LocalVectorStore loaded {self.count()} documents from {self.path}"
+            )
+        super().model_post_init(__context)
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """Dimensionality of the stored embeddings, or None while the store is empty."""
+        return None if self._vectors is None else int(self._vectors.shape[1])
+
+    def add(
+        self,
+        documents: Iterable[str],
+        embeddings: Optional[List[List[float]]] = None,
+        metadatas: Optional[List[Dict]] = None,
+        ids: Optional[List[str]] = None,
+        upsert: bool = False,
+    ) -> List[str]:
+        """
+        Adds or upserts documents into the vector store.
+
+        Args:
+            documents (Iterable[str]): The documents to add or upsert.
+            embeddings (Optional[List[List[float]]]): Precomputed embeddings.
+                If None, the configured embedding function generates them.
+            metadatas (Optional[List[Dict]]): Metadata for each document.
+            ids (Optional[List[str]]): Unique IDs for the documents. Random UUIDs are generated if omitted.
+            upsert (bool): Whether to replace documents whose ID already exists. Defaults to False,
+                which skips them.
+
+        Returns:
+            List[str]: List of IDs for the added or upserted documents.
+        """
+        documents = list(documents)
+        if not documents:
+            return []
+        if embeddings is None:
+            embeddings = self.embedding_function(documents)
+        matrix = self._to_matrix(embeddings)
+        if len(matrix) != len(documents):
+            raise ValueError(
+                "The number of embeddings must match the number of documents."
+            )
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in documents]
+        ids = [str(i) for i in ids]
+        metadatas = metadatas or [{} for _ in documents]
+
+        with self._lock:
+            positions = self._get_positions()
+            existing = [i for i, doc_id in enumerate(ids) if doc_id in positions]
+            if existing and upsert:
+                rows = [positions[ids[i]] for i in existing]
+                self._write_rows(
+                    rows,
+                    matrix[existing],
+                    [documents[i] for i in existing],
+                    [metadatas[i] for i in existing],
+                )
+                if self._ivf is not None:
+                    self._ivf.reassign(rows, matrix[existing])
+            existing_set = set(existing)
+            new = [i for i in range(len(documents)) if i not in existing_set]
+            if new:
+                self._append_rows(
+                    [ids[i] for i in new],
+                    matrix[new],
+                    [documents[i] for i in new],
+                    [metadatas[i] for i in new],
+                )
+                if self._ivf is not None:
+                    self._ivf.add(matrix[new])
+            self._maybe_train_index()
+            self._changed()
+
+        logger.info(
+            f"{'Upserted' if upsert else 'Added'} {len(new) + (len(existing) if upsert else 0)} documents."
+        )
+        return ids
+
+    def update(
+        self,
+        ids: List[str],
+        embeddings: Optional[List[List[float]]] = None,
+        metadatas: Optional[List[Dict]] = None,
+        documents: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Updates existing documents in the vector store. IDs that do not exist are ignored.
+
+        Args:
+            ids (List[str]): A list of document IDs to update.
+            embeddings (Optional[List[List[float]]]): The new embedding vectors for the documents.
+            metadatas (Optional[List[Dict]]): The new metadata for the documents.
+            documents (Optional[List[str]]): The new text for the documents.
+        """
+        if embeddings is None and metadatas is None and documents is None:
+            raise ValueError(
+                "At least one of embeddings, metadatas, or documents must be provided for update."
+            )
+
+        with self._lock:
+            positions = self._get_positions()
+            found = [
+                (i, positions[str(doc_id)])
+                for i, doc_id in enumerate(ids)
+                if str(doc_id) in positions
+            ]
+            if not found:
+                return
+            self._make_writable()
+            if embeddings is not None:
+                rows = [(i, row) for i, row in found if embeddings[i] is not None]
+                if rows:
+                    matrix = self._to_matrix([embeddings[i] for i, _ in rows])
+                    self._store_vectors([row for _, row in rows], matrix)
+                    if self._ivf is not None:
+                        self._ivf.reassign([row for _, row in rows], matrix)
+            if documents:
+                column = self._documents.to_list()
+                for i, row in found:
+                    if documents[i]:
+                        column[row] = documents[i]
+            if metadatas:
+                column = self._metadatas.to_list()
+                for i, row in found:
+                    if metadatas[i]:
+                        column[row] = json.dumps(metadatas[i])
+            self._changed()
+
+        logger.info(f"Updated {len(found)} documents.")
+
+    def delete(self, ids: List[str]) -> bool:
+        """
+        Deletes documents from the vector store by their IDs.
+
+        Rows are marked as deleted and skipped by reads and searches. The matrix is compacted once
+        the share of deleted rows exceeds `compaction_threshold`.
+
+        Args:
+            ids (List[str]): List of document IDs to delete.
+
+        Returns:
+            bool: True if any document was deleted, False otherwise.
+        """
+        with self._lock:
+            positions = self._get_positions()
+            rows = [positions[str(i)] for i in set(ids) if str(i) in positions]
+            if not rows:
+                return False
+            deleted = np.array(self._deleted)
+            deleted[rows] = True
+            self._deleted = deleted
+            self._n_deleted += len(rows)
+            if self._n_deleted > self.compaction_threshold * len(self._ids):
+                self._compact()
+            self._changed()
+
+        logger.info(f"Deleted {len(rows)} documents.")
+        return True
+
+    def compact(self) -> None:
+        """
+        Removes deleted rows from the matrix and columns.
+        """
+        with self._lock:
+            if self._n_deleted:
+                self._compact()
+                self._changed()
+
+    def rebuild_index(self) -> None:
+        """
+        Retrains the IVF index on the current rows, e.g. after the data distribution has changed.
+        """
+        with self._lock:
+            if self.index_type == "ivf" and self.count():
+                self._compact()
+                self._train_index()
+                self._changed()
+
+    def get(
+        self, ids: Optional[List[str]] = None, with_embedding: bool = False
+    ) -> List[Dict]:
+        """
+        Retrieves items from the vector store by IDs. If no IDs are provided, retrieves all items.
+
+        Args:
+            ids (Optional[List[str]]): The IDs of the items to retrieve. If None, retrieves all items.
+            with_embedding (bool): Whether to include embeddings in the retrieved data.
+
+        Returns:
+            List[Dict]: A list of dictionaries containing the id, document, metadata and optionally embedding of each item.
+        """
+        with self._lock:
+            if self._ids is None:
+                return []
+            if ids is None:
+                rows = np.flatnonzero(~self._deleted)
+            else:
+                positions = self._get_positions()
+                rows = [positions[str(i)] for i in ids if str(i) in positions]
+            return [self._row_to_dict(row, with_embedding) for row in rows]
+
+    def search_similar(
+        self,
+        query_texts: Optional[Union[str, List[str]]] = None,
+        query_embeddings: Optional[Union[List[float], List[List[float]]]] = None,
+        k: int = 4,
+        distance_metric: Optional[str] = None,
+        metadata_filter: Optional[Dict] = None,
+        probes: Optional[int] = None,
+        exact: bool = False,
+    ) -> List[Dict]:
+        """
+        Perform a similarity search in the vector store with optional metadata filtering.
+
+        Args:
+            query_texts (Optional[Union[str, List[str]]]): Text queries to embed and search.
+            query_embeddings (Optional[Union[List[float], List[List[float]]]]): Precomputed embeddings
+                for similarity search. Provide either `query_texts` or `query_embeddings`, not both.
+            k (int): Number of top results to return per query. Defaults to 4.
+            distance_metric (Optional[str]): "cosine", "l2" or "inner_product". Defaults to the store's metric.
+            metadata_filter (Optional[Dict]): Metadata key/value pairs that results must match.
+            probes (Optional[int]): IVF cells searched per query. Defaults to `ivf_probes`.
+            exact (bool): Search every vector even if an IVF index is available. Defaults to False.
+
+        Returns:
+            List[Dict]: Results of all queries, concatenated in query order. Each result contains "id",
+                "document", "metadata", "similarity" and "distance". For cosine and L2, similarity is
+                `1 - distance`; for inner product it is the inner product itself.
+
+        Raises:
+            ValueError: If neither `query_texts` nor `query_embeddings` is provided, or if both are provided.
+        """
+        grouped = self.search_similar_batch(
+            query_texts=query_texts,
+            query_embeddings=query_embeddings,
+            k=k,
+            distance_metric=distance_metric,
+            metadata_filter=metadata_filter,
+            probes=probes,
+            exact=exact,
+        )
+        return [result for results in grouped for result in results]
+
+    def search_similar_batch(
+        self,
+        query_texts: Optional[Union[str, List[str]]] = None,
+        query_embeddings: Optional[Union[List[float], List[List[float]]]] = None,
+        k: int = 4,
+        distance_metric: Optional[str] = None,
+        metadata_filter: Optional[Dict] = None,
+        probes: Optional[int] = None,
+        exact: bool = False,
+    ) -> List[List[Dict]]:
+        """
+        Runs several similarity searches at once and returns the top-k results of each query.
+
+        Args:
+            query_texts (Optional[Union[str, List[str]]]): Text queries to embed and search.
+            query_embeddings (Optional[Union[List[float], List[List[float]]]]): Precomputed query embeddings.
+            k (int): Number of top results to return per query. Defaults to 4.
+            distance_metric (Optional[str]): "cosine", "l2" or "inner_product". Defaults to the store's metric.
+            metadata_filter (Optional[Dict]): Metadata key/value pairs that results must match.
+            probes (Optional[int]): IVF cells searched per query. Defaults to `ivf_probes`.
+            exact (bool): Search every vector even if an IVF index is available. Defaults to False.
+
+        Returns:
+            List[List[Dict]]: One list of results per query, in query order, best match first.
+        """
+        # Embeddings may be NumPy arrays, whose truth value is ambiguous
+        if not query_texts and query_embeddings is None:
+            raise ValueError(
+                "Either `query_texts` or `query_embeddings` must be provided."
+            )
+        if query_texts and query_embeddings is not None:
+            raise ValueError(
+                "Provide either `query_texts` or `query_embeddings`, not both."
+            )
+        if query_texts:
+            if isinstance(query_texts, str):
+                query_texts = [query_texts]
+            query_embeddings = self.embedding_function(query_texts)
+        metric = distance_metric or self.distance_metric
+        if metric not in ("cosine", "l2", "inner_product"):
+            raise ValueError(f"Unsupported distance metric: {metric}")
+
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[np.newaxis, :]
+        with self._lock:
+            if self._vectors is None or k <= 0:
+                return [[] for _ in queries]
+            if queries.shape[1] != self.dimension:
+                raise ValueError(
+                    f"Query dimension {queries.shape[1]} does not match store dimension {self.dimension}."
+                )
+            mask = self._filter_mask(metadata_filter) if metadata_filter else None
+            if self._n_deleted:
+                mask = ~self._deleted if mask is None else mask & ~self._deleted
+
+            if not exact and self._ivf is not None and metric == self.distance_metric:
+                candidates = self._ivf.probe(queries, probes or self.ivf_probes)
+                if mask is not None:
+                    candidates = [rows[mask[rows]] for rows in candidates]
+                matches = [
+                    self._top_k(
+                        self._scores(queries[q : q + 1], metric, rows)[0], k, rows
+                    )
+                    for q, rows in enumerate(candidates)
+                ]
+            else:
+                scores = self._scores(queries, metric)
+                if mask is not None:
+                    scores[:, ~mask] = -np.inf
+                matches = [self._top_k(row_scores, k) for row_scores in scores]
+
+            results = []
+            for query_matches in matches:
+                query_results = []
+                for row, score in query_matches:
+                    distance = self._score_to_distance(score, metric)
+                    result = self._row_to_dict(row)
+                    result["similarity"] = (
+                        score if metric == "inner_product" else 1 - distance
+                    )
+                    result["distance"] = distance
+                    query_results.append(result)
+                results.append(query_results)
+            return results
+
+    @staticmethod
+    def _top_k(
+        scores: np.ndarray, k: int, rows: Optional[np.ndarray] = None
+    ) -> List[tuple]:
+        """Returns up to k (row, score) pairs with the highest finite scores, best first."""
+        top_k = min(k, len(scores))
+        if top_k == 0:
+            return []
+        # argpartition selects the top k in linear time; only those are sorted
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best])]
+        return [
+            (int(best_row if rows is None else rows[best_row]), float(scores[best_row]))
+            for best_row in best
+            if scores[best_row] != -np.inf
+        ]
+
+    def reset(self):
+        """
+        Resets the vector store, deleting all stored data.
+        """
+        with self._lock:
+            self._clear_arrays()
+            self._changed()
+        logger.info("LocalVectorStore reset.")
+
+    def count(self) -> int:
+        """
+        Counts the number of documents in the vector store.
+
+        Returns:
+            int: The total number of documents in the store.
+        """
+        return 0 if self._ids is None else len(self._ids) - self._n_deleted
+
+    def persist(self) -> None:
+        """
+        Writes the store to `path` and reopens it memory-mapped.
+
+        Raises:
+            ValueError: If no `path` is configured.
+        """
+        if not self.path:
+            raise ValueError("Cannot persist a LocalVectorStore without a 'path'.")
+        directory = Path(self.path)
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            if self._ids is not None:
+                _atomic_save(directory / "vectors.npy", self._vectors)
+                _atomic_save(directory / "norms.npy", self._norms)
+                _atomic_save(directory / "ids.npy", self._ids)
+                _atomic_save(directory / "deleted.npy", self._deleted)
+                if self._scales is not None:
+                    _atomic_save(directory / "scales.npy", self._scales)
+                if self._ivf is not None:
+                    _atomic_save(directory / "ivf_centroids.npy", self._ivf.centroids)
+                    _atomic_save(
+                        directory / "ivf_assignments.npy", self._ivf.assignments
+                    )
+                self._documents.save(directory / "documents")
+                self._metadatas.save(directory / "metadatas")
+            manifest = {
+                "dtype": self.dtype,
+                "dimension": self.dimension,
+                "rows": 0 if self._ids is None else len(self._ids),
+                "ivf_trained_rows": self._ivf.trained_rows if self._ivf else None,
+            }
+            _atomic_write(
+                directory / "store.json",
+                lambda f: f.write(json.dumps(manifest).encode("utf-8")),
+            )
+            if self._ids is not None and self.mmap:
+                self._load()
+
+    def _load(self) -> None:
+        """Opens the persisted store files."""
+        directory = Path(self.path)
+        manifest = json.loads((directory / "store.json").read_text())
+        if manifest["dtype"] != self.dtype:
+            raise ValueError(
+                f"Store at {self.path} uses dtype '{manifest['dtype']}', not '{self.dtype}'."
+            )
+        # Stores written before deletes became tombstones record "count" and have no deleted.npy
+        if not manifest.get("rows", manifest.get("count")):
+            self._clear_arrays()
+            return
+        mode = "r" if self.mmap else None
+        self._vectors = np.load(directory / "vectors.npy", mmap_mode=mode)
+        self._norms = np.load(directory / "norms.npy", mmap_mode=mode)
+        self._ids = np.load(directory / "ids.npy", mmap_mode=mode)
+        deleted_path = directory / "deleted.npy"
+        if deleted_path.exists():
+            self._deleted = np.load(deleted_path, mmap_mode=mode)
+        else:
+            self._deleted = np.zeros(len(self._ids), dtype=bool)
+        self._n_deleted = int(self._deleted.sum())
+        self._scales = (
+            np.load(directory / "scales.npy", mmap_mode=mode)
+            if self.dtype == "int8"
+            else None
+        )
+        self._documents = _TextColumn.load(directory / "documents", self.mmap)
+        self._metadatas = _TextColumn.load(directory / "metadatas", self.mmap)
+        self._ivf = None
+        if manifest.get("ivf_trained_rows") and self.index_type == "ivf":
+            self._ivf = IVFIndex(self.distance_metric)
+            self._ivf.centroids = np.load(
+                directory / "ivf_centroids.npy", mmap_mode=mode
+            )
+            self._ivf.assignments = np.load(
+                directory / "ivf_assignments.npy", mmap_mode=mode
+            )
+            self._ivf.trained_rows = manifest["ivf_trained_rows"]
+        self._positions = None
+        self._metadata_columns.clear()
+
+    def _clear_arrays(self) -> None:
+        self._vectors = None
+        self._norms = None
+        self._scales = None
+        self._ids = None
+        self._deleted = None
+        self._n_deleted = 0
+        self._ivf = None
+        self._documents = _TextColumn()
+        self._metadatas = _TextColumn()
+
+    def _changed(self) -> None:
+        """Drops derived lookups and persists the store if configured."""
+        self._positions = None
+        self._metadata_columns.clear()
+        if self.path and self.auto_persist:
+            self.persist()
+
+    def _get_positions(self) -> Dict[str, int]:
+        """Returns the ID-to-row lookup, building it on first use."""
+        if self._positions is None:
+            ids = [] if self._ids is None else self._ids.tolist()
+            self._positions = {
+                doc_id: row for row, doc_id in enumerate(ids) if not self._deleted[row]
+            }
+        return self._positions
+
+    def _to_matrix(self, embeddings: Any) -> np.ndarray:
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix[np.newaxis, :]
+        if self.dimension is not None and matrix.shape[1] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {matrix.shape[1]} does not match store dimension {self.dimension}."
+            )
+        return matrix
+
+    def _compact(self) -> None:
+        """Drops deleted rows from all arrays, columns and the IVF assignments."""
+        if not self._n_deleted:
+            return
+        keep = ~self._deleted
+        if not keep.any():
+            self._clear_arrays()
+            return
+        self._vectors = self._vectors[keep]
+        self._norms = self._norms[keep]
+        if self._scales is not None:
+            self._scales = self._scales[keep]
+        self._ids = self._ids[keep]
+        kept = np.flatnonzero(keep)
+        self._documents = _TextColumn([self._documents[i] for i in kept])
+        self._metadatas = _TextColumn([self._metadatas[i] for i in kept])
+        if self._ivf is not None:
+            self._ivf.keep(keep)
+        self._deleted = np.zeros(len(self._ids), dtype=bool)
+        self._n_deleted = 0
+        logger.info(f"Compacted LocalVectorStore to {len(self._ids)} rows.")
+
+    def _maybe_train_index(self) -> None:
+        """Trains the IVF index once the store is large enough, and retrains it after 4x growth."""
+        if self.index_type != "ivf" or self.count() < self.ivf_min_rows:
+            return
+        if self._ivf is None or len(self._ids) > 4 * self._ivf.trained_rows:
+            self._train_index()
+
+    def _train_index(self) -> None:
+        n_lists = self.ivf_lists or max(1, int(np.sqrt(len(self._ids))))
+        index = IVFIndex(self.distance_metric)
+        index.train(self._float_vectors(), n_lists)
+        self._ivf = index
+
+    def _float_vectors(self) -> np.ndarray:
+        """Returns all stored vectors as float32, dequantizing int8 rows."""
+        vectors = np.asarray(self._vectors, dtype=np.float32)
+        if self._scales is not None:
+            vectors = vectors * self._scales[:, np.newaxis]
+        return vectors
+
+    def _quantize(self, matrix: np.ndarray):
+        """Converts float32 rows to the storage dtype. Returns the rows and, for int8, their scales."""
+        if self.dtype == "float32":
+            return matrix, None
+        if self.dtype == "float16":
+            return matrix.astype(np.float16), None
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.clip(np.rint(matrix / scales[:, np.newaxis]), -127, 127)
+        return quantized.astype(np.int8), scales.astype(np.float32)
+
+    def _append_rows(
+        self,
+        ids: List[str],
+        matrix: np.ndarray,
+        documents: List[str],
+        metadatas: List[Dict],
+    ) -> None:
+        rows, scales = self._quantize(matrix)
+        norms = np.linalg.norm(matrix, axis=1).astype(np.float32)
+        new_ids = np.asarray(ids, dtype=str)
+        new_deleted = np.zeros(len(ids), dtype=bool)
+        if self._vectors is None:
+            self._vectors = np.ascontiguousarray(rows)
+            self._norms = norms
+            self._scales = scales
+            self._ids = new_ids
+            self._deleted = new_deleted
+        else:
+            self._vectors = np.concatenate([self._vectors, rows])
+            self._norms = np.concatenate([self._norms, norms])
+            if scales is not None:
+                self._scales = np.concatenate([self._scales, scales])
+            # Widen the fixed-width unicode dtype if needed
+            self._ids = np.concatenate([self._ids, new_ids])
+            self._deleted = np.concatenate([self._deleted, new_deleted])
+        self._documents.to_list().extend(documents)
+        self._metadatas.to_list().extend(json.dumps(m or {}) for m in metadatas)
+
+    def _write_rows(
+        self,
+        rows: List[int],
+        matrix: np.ndarray,
+        documents: List[str],
+        metadatas: List[Dict],
+    ) -> None:
+        self._make_writable()
+        self._store_vectors(rows, matrix)
+        document_column = self._documents.to_list()
+        metadata_column = self._metadatas.to_list()
+        for row, document, metadata in zip(rows, documents, metadatas):
+            document_column[row] = document
+            metadata_column[row] = json.dumps(metadata or {})
+
+    def _store_vectors(self, rows: List[int], matrix: np.ndarray) -> None:
+        quantized, scales = self._quantize(matrix)
+        self._vectors[rows] = quantized
+        self._norms[rows] = np.linalg.norm(matrix, axis=1)
+        if scales is not None:
+            self._scales[rows] = scales
+
+    def _make_writable(self) -> None:
+        """Copies memory-mapped arrays into memory before they are modified in place."""
+        if isinstance(self._vectors, np.memmap):
+            self._vectors = np.array(self._vectors)
+            self._norms = np.array(self._norms)
+            if self._scales is not None:
+                self._scales = np.array(self._scales)
+
+    def _scores(
+        self, queries: np.ndarray, metric: str, rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Returns a (queries x rows) matrix where higher scores mean more similar.
+        Scores all rows, or only `rows` if given.
+        """
+        count = len(self._vectors) if rows is None else len(rows)
+        dots = np.empty((len(queries), count), dtype=np.float32)
+        for start in range(0, count, _SEARCH_BLOCK_ROWS):
+            if rows is None:
+                selection = slice(start, start + _SEARCH_BLOCK_ROWS)
+            else:
+                selection = rows[start : start + _SEARCH_BLOCK_ROWS]
+            block = self._vectors[selection]
+            if block.dtype != np.float32:
+                block = block.astype(np.float32)
+            block_dots = queries @ block.T
+            if self._scales is not None:
+                block_dots *= self._scales[selection]
+            dots[:, start : start + len(block)] = block_dots
+        norms = self._norms if rows is None else self._norms[rows]
+
+        if metric == "inner_product":
+            return dots
+        query_norms = np.linalg.norm(queries, axis=1)[:, np.newaxis]
+        if metric == "cosine":
+            denominator = query_norms * norms[np.newaxis, :]
+            denominator[denominator == 0] = 1.0
+            return dots / denominator
+        # Negative squared L2 distance keeps "higher is better" for top-k selection
+        return -(query_norms**2 - 2 * dots + norms[np.newaxis, :] ** 2)
+
+    @staticmethod
+    def _score_to_distance(score: float, metric: str) -> float:
+        if metric == "cosine":
+            return 1 - score
+        if metric == "l2":
+            return float(np.sqrt(max(-score, 0.0)))
+        return -score
+
+    def _filter_mask(self, metadata_filter: Dict) -> np.ndarray:
+        """Returns a boolean row mask for rows whose metadata matches all filter values."""
+        mask = np.ones(len(self._ids), dtype=bool)
+        for key, value in metadata_filter.items():
+            mask &= self._metadata_column(key) == value
+        return mask
+
+    def _metadata_column(self, key: str) -> np.ndarray:
+        """Returns the values of one metadata key as a column, building it on first use."""
+        column = self._metadata_columns.get(key)
+        if column is None:
+            column = np.empty(len(self._ids), dtype=object)
+            for row in range(len(self._ids)):
+                column[row] = json.loads(self._metadatas[row]).get(key)
+            self._metadata_columns[key] = column
+        return column
+
+    def _row_to_dict(self, row: int, with_embedding: bool = False) -> Dict:
+        item = {
+            "id": str(self._ids[row]),
+            "document": self._documents[row],
+            "metadata": json.loads(self._metadatas[row]),
+        }
+        if with_embedding:
+            vector = self._vectors[row].astype(np.float32)
+            if self._scales is not None:
+                vector *= self._scales[row]
+            item["embedding"] = vector.tolist()
+        return item
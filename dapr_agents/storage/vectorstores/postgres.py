@@ -1,10 +1,14 @@
 from dapr_agents.storage.vectorstores import VectorStoreBase
 from dapr_agents.document.embedder import SentenceTransformerEmbedder
 from dapr_agents.document.embedder.base import EmbedderBase
-from typing import List, Dict, Optional, Iterable, Any, Literal, Union
-from pydantic import Field, ConfigDict
+from typing import List, Dict, Optional, Iterable, Iterator, Any, Literal, Union, Tuple
+from pydantic import Field, ConfigDict, PrivateAttr
+from itertools import islice
+import numpy as np
 import uuid
 import logging
+import time
+import weakref
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +50,14 @@ class PostgresVectorStore(VectorStoreBase):
         init=False,
         description="Set of tracked vector dimensions for partial indexing.",
     )
+    metadata_index: bool = Field(
+        True,
+        description="Whether to create a GIN index on the metadata column to speed up metadata filters.",
+    )
+
+    _vector_connections: "weakref.WeakSet" = PrivateAttr(
+        default_factory=weakref.WeakSet
+    )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -96,19 +108,20 @@ class PostgresVectorStore(VectorStoreBase):
                     )
                     logger.info(f"Table '{self.table_name}' ensured.")
 
-                # Create global index for fixed-dimension embeddings
-                if self.embedding_dim:
+                # Index metadata for containment (@>) filters
+                if self.metadata_index:
                     with conn.cursor() as cursor:
                         cursor.execute(
                             f"""
-                            CREATE INDEX IF NOT EXISTS {self.table_name}_embedding_idx
-                            ON {self.table_name} USING {self.index_type} (embedding vector_cosine_ops)
-                            WITH ({", ".join(f"{k}={v}" for k, v in self.index_params.items())});
+                            CREATE INDEX IF NOT EXISTS {self.table_name}_metadata_idx
+                            ON {self.table_name} USING gin (metadata jsonb_path_ops);
                             """
                         )
-                        logger.info(
-                            "Global index created for fixed-dimension embeddings."
-                        )
+
+                # Create global index for fixed-dimension embeddings
+                if self.embedding_dim:
+                    with conn.cursor() as cursor:
+                        self._create_global_index(cursor)
                 else:
                     logger.info(
                         "No fixed dimension specified; relying on dynamic partial indexing."
@@ -117,6 +130,30 @@ class PostgresVectorStore(VectorStoreBase):
             logger.error(f"Failed to initialize PostgresVectorStore: {e}")
             raise
 
+    def _create_global_index(self, cursor: Any) -> None:
+        """
+        Creates the vector index used for fixed-dimension embeddings if it doesn't already exist.
+        """
+        cursor.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS {self.table_name}_embedding_idx
+            ON {self.table_name} USING {self.index_type} (embedding vector_cosine_ops)
+            WITH ({", ".join(f"{k}={v}" for k, v in self.index_params.items())});
+            """
+        )
+        logger.info("Global index created for fixed-dimension embeddings.")
+
+    def _register_vector(self, conn: Any) -> None:
+        """
+        Registers the pgvector types on a pooled connection, once per connection.
+        """
+        if conn in self._vector_connections:
+            return
+        from pgvector.psycopg import register_vector
+
+        register_vector(conn)
+        self._vector_connections.add(conn)
+
     def _ensure_partial_index(self, dimension: int):
         """
         Creates a partial index for embeddings with the specified dimension if it doesn't already exist.
@@ -171,8 +208,9 @@ class PostgresVectorStore(VectorStoreBase):
             raise ImportError("Required library 'psycopg' is missing.") from e
 
         try:
+            documents = list(documents)
             if embeddings is None:
-                embeddings = self.embedding_function(list(documents))
+                embeddings = self.embedding_function(documents)
                 logger.info(
                     "Generated embeddings using the provided embedding function."
                 )
@@ -180,31 +218,29 @@ class PostgresVectorStore(VectorStoreBase):
             if ids is None:
                 ids = [str(uuid.uuid4()) for _ in documents]
 
-            on_conflict_action = (
-                """
-                DO UPDATE SET
-                    document = EXCLUDED.document,
-                    metadata = EXCLUDED.metadata,
-                    embedding = EXCLUDED.embedding
-                """
-                if upsert
-                else "DO NOTHING"
-            )
+            if not self.embedding_dim:
+                for dimension in {len(embedding) for embedding in embeddings}:
+                    self._ensure_partial_index(dimension)
 
+            rows = [
+                (
+                    ids[i],
+                    doc,
+                    Jsonb(metadatas[i]) if metadatas else Jsonb({}),
+                    embeddings[i],
+                )
+                for i, doc in enumerate(documents)
+            ]
             with self.pool.connection() as conn:
                 with conn.cursor() as cursor:
-                    for i, doc in enumerate(documents):
-                        dimension = len(embeddings[i])
-                        if not self.embedding_dim:
-                            self._ensure_partial_index(dimension)
-
-                        metadata = Jsonb(metadatas[i]) if metadatas else Jsonb({})
-                        query = f"""
+                    cursor.executemany(
+                        f"""
                         INSERT INTO {self.table_name} (id, document, metadata, embedding)
                         VALUES (%s, %s, %s, %s)
-                        ON CONFLICT (id) {on_conflict_action};
-                        """
-                        cursor.execute(query, (ids[i], doc, metadata, embeddings[i]))
+                        ON CONFLICT (id) {self._on_conflict_action(upsert)};
+                        """,
+                        rows,
+                    )
             logger.info(
                 f"{'Upserted' if upsert else 'Added'} {len(documents)} documents."
             )
@@ -238,49 +274,261 @@ class PostgresVectorStore(VectorStoreBase):
             raise ImportError("Required library 'psycopg' is missing.") from e
 
         try:
-            if not any([embeddings, metadatas, documents]):
+            if embeddings is None and metadatas is None and documents is None:
                 raise ValueError(
                     "At least one of embeddings, metadatas, or documents must be provided for update."
                 )
 
-            with self.pool.connection() as conn:
-                with conn.cursor() as cursor:
-                    for i, doc_id in enumerate(ids):
-                        update_fields = []
-                        params = []
-
-                        if embeddings and embeddings[i]:
-                            dimension = len(embeddings[i])
-                            if not self.embedding_dim:
-                                self._ensure_partial_index(dimension)
-                            update_fields.append("embedding = %s")
-                            params.append(embeddings[i])
-
-                        if documents and documents[i]:
-                            update_fields.append("document = %s")
-                            params.append(documents[i])
-
-                        if metadatas and metadatas[i]:
-                            update_fields.append("metadata = %s")
-                            params.append(Jsonb(metadatas[i]))
-
-                        if not update_fields:
-                            continue
-
-                        params.append(doc_id)  # Add the ID for the WHERE clause
-
-                        query = f"""
-                        UPDATE {self.table_name}
-                        SET {", ".join(update_fields)}
-                        WHERE id = %s;
-                        """
-                        cursor.execute(query, params)
+            # Missing values are sent as NULL and keep the current column value
+            rows = []
+            for i, doc_id in enumerate(ids):
+                # `is not None` rather than truthiness, so NumPy arrays are accepted as embeddings
+                embedding = embeddings[i] if embeddings is not None else None
+                document = documents[i] if documents is not None else None
+                metadata = metadatas[i] if metadatas is not None else None
+                if metadata is not None:
+                    metadata = Jsonb(metadata)
+                if embedding is None and document is None and metadata is None:
+                    continue
+                if embedding is not None and not self.embedding_dim:
+                    self._ensure_partial_index(len(embedding))
+                rows.append((embedding, document, metadata, doc_id))
+
+            if rows:
+                with self.pool.connection() as conn:
+                    with conn.cursor() as cursor:
+                        cursor.executemany(
+                            f"""
+                            UPDATE {self.table_name}
+                            SET embedding = COALESCE(%s::vector, embedding),
+                                document = COALESCE(%s, document),
+                                metadata = COALESCE(%s, metadata)
+                            WHERE id = %s;
+                            """,
+                            rows,
+                        )
 
             logger.info(f"Updated {len(ids)} documents in {self.table_name}.")
         except Exception as e:
             logger.error(f"Failed to update documents: {e}")
             raise
 
+    def bulk_add(
+        self,
+        documents: Iterable[str],
+        embeddings: Optional[Iterable[List[float]]] = None,
+        metadatas: Optional[Iterable[Dict]] = None,
+        ids: Optional[Iterable[str]] = None,
+        upsert: bool = False,
+        batch_size: int = 5000,
+        method: Literal["copy", "executemany"] = "copy",
+        defer_index: bool = False,
+    ) -> Dict[str, float]:
+        """
+        Loads a large number of documents, streaming the input in batches so the whole corpus never
+        has to be held in memory.
+
+        With `method="copy"`, each batch is written with a binary `COPY` into a temporary staging
+        table and merged into the store with a single `INSERT ... SELECT`. `method="executemany"`
+        sends pipelined `INSERT` statements instead, for servers or proxies that do not support `COPY`.
+
+        Args:
+            documents (Iterable[str]): The documents to load. May be a generator.
+            embeddings (Optional[Iterable[List[float]]]): Precomputed embeddings, in the same order as `documents`.
+                Generated batch by batch with the embedding function if omitted.
+            metadatas (Optional[Iterable[Dict]]): Metadata for each document.
+            ids (Optional[Iterable[str]]): Unique IDs for the documents. Random UUIDs are used if omitted.
+            upsert (bool): Whether to update existing records on conflict. Defaults to False.
+            batch_size (int): Number of documents per batch. Defaults to 5000.
+            method (Literal["copy", "executemany"]): How rows are sent to the database. Defaults to "copy".
+            defer_index (bool): Drop the vector index before loading and build it once afterwards,
+                which is much faster than maintaining it row by row. Defaults to False.
+
+        Returns:
+            Dict[str, float]: Load statistics with the keys "rows", "seconds" and "rows_per_second".
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        try:
+            from psycopg.types.json import Jsonb
+        except ImportError as e:
+            raise ImportError("Required library 'psycopg' is missing.") from e
+
+        rows_loaded = 0
+        dimensions = set()
+        started = time.perf_counter()
+        try:
+            with self.pool.connection() as conn:
+                self._register_vector(conn)
+                if defer_index:
+                    self._drop_vector_indexes(conn)
+
+                for doc_batch, emb_batch, meta_batch, id_batch in self._iter_batches(
+                    documents, embeddings, metadatas, ids, batch_size
+                ):
+                    if emb_batch is None:
+                        emb_batch = self.embedding_function(doc_batch)
+                    if id_batch is None:
+                        id_batch = [str(uuid.uuid4()) for _ in doc_batch]
+
+                    batch_dimensions = {len(embedding) for embedding in emb_batch}
+                    if not self.embedding_dim and not defer_index:
+                        for dimension in batch_dimensions - dimensions:
+                            self._ensure_partial_index(dimension)
+                    dimensions |= batch_dimensions
+
+                    rows = [
+                        (
+                            id_batch[i],
+                            doc,
+                            Jsonb(meta_batch[i] if meta_batch else {}),
+                            np.asarray(emb_batch[i], dtype=np.float32),
+                        )
+                        for i, doc in enumerate(doc_batch)
+                    ]
+                    with conn.transaction():
+                        with conn.cursor() as cursor:
+                            if method == "copy":
+                                self._copy_merge(cursor, rows, upsert)
+                            else:
+                                cursor.executemany(
+                                    f"""
+                                    INSERT INTO {self.table_name} (id, document, metadata, embedding)
+                                    VALUES (%s, %s, %s, %s)
+                                    ON CONFLICT (id) {self._on_conflict_action(upsert)};
+                                    """,
+                                    rows,
+                                )
+                    rows_loaded += len(rows)
+                    elapsed = time.perf_counter() - started
+                    logger.info(
+                        f"Loaded {rows_loaded} documents ({rows_loaded / elapsed:.0f} rows/s)."
+                    )
+
+                if defer_index:
+                    logger.info("Building vector indexes after bulk load.")
+                    if self.embedding_dim:
+                        with conn.cursor() as cursor:
+                            self._create_global_index(cursor)
+                        conn.commit()
+            if defer_index and not self.embedding_dim:
+                # Partial indexes of dimensions loaded earlier were dropped as well
+                with self.pool.connection() as conn:
+                    with conn.cursor() as cursor:
+                        cursor.execute(
+                            f"SELECT DISTINCT vector_dims(embedding) FROM {self.table_name}"
+                        )
+                        stored = {row[0] for row in cursor.fetchall()}
+                self.tracked_dimensions.clear()
+                for dimension in stored | dimensions:
+                    self._ensure_partial_index(dimension)
+        except Exception as e:
+            logger.error(f"Bulk load failed after {rows_loaded} documents: {e}")
+            raise
+
+        elapsed = time.perf_counter() - started
+        stats = {
+            "rows": rows_loaded,
+            "seconds": elapsed,
+            "rows_per_second": rows_loaded / elapsed if elapsed > 0 else 0.0,
+        }
+        logger.info(
+            f"Bulk load finished: {rows_loaded} documents in {elapsed:.1f}s "
+            f"({stats['rows_per_second']:.0f} rows/s)."
+        )
+        return stats
+
+    @staticmethod
+    def _on_conflict_action(upsert: bool) -> str:
+        """Returns the ON CONFLICT action for inserts."""
+        if upsert:
+            return """
+                DO UPDATE SET
+                    document = EXCLUDED.document,
+                    metadata = EXCLUDED.metadata,
+                    embedding = EXCLUDED.embedding
+                """
+        return "DO NOTHING"
+
+    @staticmethod
+    def _iter_batches(
+        documents: Iterable[str],
+        embeddings: Optional[Iterable[List[float]]],
+        metadatas: Optional[Iterable[Dict]],
+        ids: Optional[Iterable[str]],
+        batch_size: int,
+    ) -> Iterator[Tuple[List, Optional[List], Optional[List], Optional[List]]]:
+        """Yields aligned batches of documents, embeddings, metadata and IDs from (possibly lazy) iterables."""
+        documents = iter(documents)
+        embeddings = iter(embeddings) if embeddings is not None else None
+        metadatas = iter(metadatas) if metadatas is not None else None
+        ids = iter(ids) if ids is not None else None
+
+        def take(source: Optional[Iterator], size: int) -> Optional[List]:
+            if source is None:
+                return None
+            batch = list(islice(source, size))
+            if len(batch) != size:
+                raise ValueError(
+                    "documents, embeddings, metadatas and ids must have the same length."
+                )
+            return batch
+
+        while True:
+            doc_batch = list(islice(documents, batch_size))
+            if not doc_batch:
+                return
+            size = len(doc_batch)
+            yield (
+                doc_batch,
+                take(embeddings, size),
+                take(metadatas, size),
+                take(ids, size),
+            )
+
+    def _copy_merge(self, cursor: Any, rows: List[Tuple], upsert: bool) -> None:
+        """
+        Writes rows into a temporary staging table with binary COPY, then merges them into the store.
+        Must run inside a transaction; the staging rows are discarded on commit.
+        """
+        staging = f"{self.table_name}_staging"
+        cursor.execute(
+            f"""
+            CREATE TEMP TABLE IF NOT EXISTS {staging}
+            (LIKE {self.table_name} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS;
+            """
+        )
+        with cursor.copy(
+            f"COPY {staging} (id, document, metadata, embedding) FROM STDIN WITH (FORMAT BINARY)"
+        ) as copy:
+            copy.set_types(["uuid", "text", "jsonb", "vector"])
+            for row_id, *values in rows:
+                # The binary uuid dumper expects uuid.UUID objects, not their string form
+                copy.write_row((uuid.UUID(str(row_id)), *values))
+        cursor.execute(
+            f"""
+            INSERT INTO {self.table_name} (id, document, metadata, embedding)
+            SELECT id, document, metadata, embedding FROM {staging}
+            ON CONFLICT (id) {self._on_conflict_action(upsert)};
+            """
+        )
+
+    def _drop_vector_indexes(self, conn: Any) -> None:
+        """Drops the global and partial vector indexes so they can be rebuilt after a bulk load."""
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT indexname FROM pg_indexes
+                WHERE tablename = %s AND indexname LIKE %s;
+                """,
+                (self.table_name, f"{self.table_name}_embedding_%idx"),
+            )
+            for (index_name,) in cursor.fetchall():
+                cursor.execute(f"DROP INDEX IF EXISTS {index_name};")
+        conn.commit()
+        logger.info("Dropped vector indexes for bulk load.")
+
     def delete(self, ids: List[str]) -> bool:
         """
         Deletes documents from the vector store by their IDs.
@@ -348,6 +596,8 @@ class PostgresVectorStore(VectorStoreBase):
         k: int = 4,
         distance_metric: str = "cosine",
         metadata_filter: Optional[Dict] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
     ) -> List[Dict]:
         """
         Perform a similarity search in the vector store with optional metadata filtering.
@@ -366,6 +616,8 @@ class PostgresVectorStore(VectorStoreBase):
                 Defaults to "cosine".
             metadata_filter (Optional[Dict]): Metadata conditions for filtering results.
                 Keys are metadata fields, and values are the required values for those fields.
+            ef_search (Optional[int]): `hnsw.ef_search` for this query. Higher values improve recall.
+            probes (Optional[int]): `ivfflat.probes` for this query. Higher values improve recall.
 
         Returns:
             List[Dict]: A list of dictionaries, each representing a search result. Each dictionary contains:
@@ -373,11 +625,63 @@ class PostgresVectorStore(VectorStoreBase):
                 - "document" (str): The document content of the matched item.
                 - "metadata" (Dict): Metadata associated with the matched item.
                 - "similarity" (float): The similarity score of the matched item.
+                Results of several queries are concatenated in query order.
+
+        Raises:
+            ValueError: If neither `query_texts` nor `query_embeddings` is provided, or if both are provided.
+            Exception: For any issues during the database query execution.
+        """
+        grouped = self.search_similar_batch(
+            query_texts=query_texts,
+            query_embeddings=query_embeddings,
+            k=k,
+            distance_metric=distance_metric,
+            metadata_filter=metadata_filter,
+            ef_search=ef_search,
+            probes=probes,
+        )
+        return [result for results in grouped for result in results]
+
+    def search_similar_batch(
+        self,
+        query_texts: Optional[Union[str, List[str]]] = None,
+        query_embeddings: Optional[Union[List[float], List[List[float]]]] = None,
+        k: int = 4,
+        distance_metric: str = "cosine",
+        metadata_filter: Optional[Dict] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+    ) -> List[List[Dict]]:
+        """
+        Runs several similarity searches in a single round trip and returns the top-k results of each query.
+
+        All query vectors are sent as one bound `vector[]` parameter and searched with a `LATERAL`
+        join, so the server plans the statement once and every query can use the vector index.
+        Metadata filters use JSONB containment (`@>`), which is served by the metadata GIN index.
+
+        Args:
+            query_texts (Optional[Union[str, List[str]]]): Text queries to embed and search.
+            query_embeddings (Optional[Union[List[float], List[List[float]]]]): Precomputed query embeddings.
+                Provide either `query_texts` or `query_embeddings`, not both.
+            k (int): Number of top results to return per query. Defaults to 4.
+            distance_metric (str): "cosine", "l2" or "inner_product". Defaults to "cosine".
+            metadata_filter (Optional[Dict]): Metadata key/value pairs that results must contain.
+            ef_search (Optional[int]): `hnsw.ef_search` for this search. Higher values improve recall.
+            probes (Optional[int]): `ivfflat.probes` for this search. Higher values improve recall.
+
+        Returns:
+            List[List[Dict]]: One list of results per query, in query order. Each result contains
+                "id", "document", "metadata" and "similarity".
 
         Raises:
             ValueError: If neither `query_texts` nor `query_embeddings` is provided, or if both are provided.
             Exception: For any issues during the database query execution.
         """
+        try:
+            from psycopg.types.json import Jsonb
+        except ImportError as e:
+            raise ImportError("Required library 'psycopg' is missing.") from e
+
         try:
             # Validate inputs
             if not query_texts and not query_embeddings:
@@ -407,52 +711,61 @@ class PostgresVectorStore(VectorStoreBase):
             }
             operator = operator_map.get(distance_metric, "<=>")
 
-            results = []
+            params: List[Any] = [
+                [
+                    np.asarray(embedding, dtype=np.float32)
+                    for embedding in query_embeddings
+                ]
+            ]
+            where_clause = ""
+            if metadata_filter:
+                where_clause = "WHERE t.metadata @> %s"
+                params.append(Jsonb(metadata_filter))
+            params.append(k)
+
+            # Order by the raw distance so the vector index can serve each lateral subquery
+            query = f"""
+            SELECT q.idx, r.id, r.document, r.metadata, r.similarity
+            FROM unnest(%s::vector[]) WITH ORDINALITY AS q(embedding, idx)
+            CROSS JOIN LATERAL (
+                SELECT t.id, t.document, t.metadata,
+                       1 - (t.embedding {operator} q.embedding) AS similarity
+                FROM {self.table_name} t
+                {where_clause}
+                ORDER BY t.embedding {operator} q.embedding
+                LIMIT %s
+            ) r
+            ORDER BY q.idx, r.similarity DESC
+            """
+
+            results: List[List[Dict]] = [[] for _ in query_embeddings]
             with self.pool.connection() as conn:
-                # Use a compatible row factory or default cursor
+                self._register_vector(conn)
                 with conn.cursor() as cursor:
-                    for embedding in query_embeddings:
-                        # Convert the embedding to a PostgreSQL-compatible vector format
-                        embedding_vector = f"ARRAY{embedding}::vector"
-
-                        # Base query
-                        query = f"""
-                        SELECT id, document, metadata, 1 - (embedding {operator} {embedding_vector}) AS similarity
-                        FROM {self.table_name}
-                        """
-
-                        # Add metadata filtering conditions if provided
-                        params = []
-                        if metadata_filter:
-                            filter_conditions = " AND ".join(
-                                ["metadata ->> %s = %s" for _ in metadata_filter]
-                            )
-                            query += f" WHERE {filter_conditions}"
-                            params.extend(
-                                sum(([k, v] for k, v in metadata_filter.items()), [])
-                            )
-
-                        # Add ordering and limit
-                        query += " ORDER BY similarity DESC LIMIT %s"
-                        params.append(k)
-
-                        # Execute the query
-                        cursor.execute(query, tuple(params))
-                        for row in cursor.fetchall():
-                            results.append(row)
-
-            # Format results for consistency
-            formatted_results = [
-                {
-                    "id": row[0],
-                    "document": row[1],
-                    "metadata": row[2],
-                    "similarity": row[3],
-                }
-                for row in results
-            ]
+                    # Local settings only apply to this transaction
+                    if ef_search is not None:
+                        cursor.execute(
+                            "SELECT set_config('hnsw.ef_search', %s, true)",
+                            (str(ef_search),),
+                        )
+                    if probes is not None:
+                        cursor.execute(
+                            "SELECT set_config('ivfflat.probes', %s, true)",
+                            (str(probes),),
+                        )
+                    cursor.execute(query, tuple(params))
+                    rows = cursor.fetchall()
 
-            return formatted_results
+            for idx, doc_id, document, metadata, similarity in rows:
+                results[idx - 1].append(
+                    {
+                        "id": doc_id,
+                        "document": document,
+                        "metadata": metadata,
+                        "similarity": similarity,
+                    }
+                )
+            return results
         except Exception as e:
             logger.error(f"Failed to perform similarity search: {e}")
             raise
@@ -1,6 +1,6 @@
 import inspect
 import logging
-from typing import Callable, Type, Optional, Any, Dict
+from typing import Callable, Type, Optional, Any, Dict, Literal, Tuple
 from inspect import signature, Parameter
 from pydantic import BaseModel, Field, ValidationError, model_validator, PrivateAttr
 
@@ -10,6 +10,9 @@ from dapr_agents.types import ToolError
 
 logger = logging.getLogger(__name__)
 
+# Fields that a tool's function call definition is generated from
+_SCHEMA_FIELDS = frozenset({"name", "description", "args_model"})
+
 
 class AgentTool(BaseModel):
     """
@@ -20,6 +23,9 @@ class AgentTool(BaseModel):
         description (str): A brief description of the tool's purpose.
         args_model (Optional[Type[BaseModel]]): Model for validating tool arguments.
         func (Optional[Callable]): Function defining tool behavior.
+        timeout (Optional[float]): Maximum seconds a single call may take when run by an executor.
+        max_concurrency (Optional[int]): Maximum number of concurrent calls when run by an executor.
+        execution_mode (Literal["thread", "process"]): Where an executor runs a synchronous tool.
     """
 
     name: str = Field(
@@ -35,8 +41,26 @@ class AgentTool(BaseModel):
     func: Optional[Callable] = Field(
         None, description="Optional function implementing the tool's behavior."
     )
+    timeout: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Maximum number of seconds a single call may take when run by an executor. None uses the executor default.",
+    )
+    max_concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Maximum number of concurrent calls of this tool when run by an executor. None means unbounded.",
+    )
+    execution_mode: Literal["thread", "process"] = Field(
+        "thread",
+        description="Where an executor runs this tool if it is synchronous: a worker thread, or a worker process for CPU-bound functions. Process mode requires a picklable, module-level `func`.",
+    )
 
     _is_async: bool = PrivateAttr(default=False)
+    _function_call_cache: Dict[Tuple[str, bool], Dict] = PrivateAttr(
+        default_factory=dict
+    )
+    _schema_version: int = PrivateAttr(default=0)
 
     @model_validator(mode="before")
     @classmethod
@@ -78,6 +102,24 @@ class AgentTool(BaseModel):
             self._initialize_from_run()
         return super().model_post_init(__context)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _SCHEMA_FIELDS:
+            self.invalidate_schema_cache()
+
+    def invalidate_schema_cache(self) -> None:
+        """Discards cached function call definitions. Called automatically when the tool's name, description or args model changes."""
+        private = getattr(self, "__pydantic_private__", None)
+        cache = private.get("_function_call_cache") if private else None
+        if cache is not None:
+            cache.clear()
+            self._schema_version += 1
+
+    @property
+    def schema_version(self) -> int:
+        """Counter incremented whenever the tool's function call definition changes."""
+        return self._schema_version
+
     def _initialize_from_func(self, func: Callable) -> None:
         """Initialize Tool fields from a provided function."""
         if self.args_model is None:
@@ -181,6 +223,9 @@ class AgentTool(BaseModel):
         """
         Converts the tool to a specified function call format.
 
+        Definitions are cached per format, so the JSON schema is only generated once. The returned
+        dictionary is shared between calls and must not be modified.
+
         Args:
             format_type (str): The format type (e.g., 'openai').
             use_deprecated (bool): Whether to use deprecated format.
@@ -188,9 +233,18 @@ class AgentTool(BaseModel):
         Returns:
             Dict: The function call representation.
         """
-        return to_function_call_definition(
-            self.name, self.description, self.args_model, format_type, use_deprecated
-        )
+        key = (format_type.lower(), use_deprecated)
+        definition = self._function_call_cache.get(key)
+        if definition is None:
+            definition = to_function_call_definition(
+                self.name,
+                self.description,
+                self.args_model,
+                format_type,
+                use_deprecated,
+            )
+            self._function_call_cache[key] = definition
+        return definition
 
     def __repr__(self) -> str:
         """Returns a string representation of the AgentTool."""
@@ -220,7 +274,12 @@ class AgentTool(BaseModel):
 
 
 def tool(
-    func: Optional[Callable] = None, *, args_model: Optional[Type[BaseModel]] = None
+    func: Optional[Callable] = None,
+    *,
+    args_model: Optional[Type[BaseModel]] = None,
+    timeout: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    execution_mode: Literal["thread", "process"] = "thread",
 ) -> AgentTool:
     """
     A decorator to wrap a function with an `AgentTool` for validation and metadata.
@@ -228,6 +287,9 @@ def tool(
     Args:
         func (Optional[Callable]): The function to wrap.
         args_model (Optional[Type[BaseModel]]): Optional Pydantic model for argument validation.
+        timeout (Optional[float]): Maximum seconds a single call may take when run by an executor.
+        max_concurrency (Optional[int]): Maximum number of concurrent calls when run by an executor.
+        execution_mode (Literal["thread", "process"]): Where an executor runs the tool if it is synchronous.
 
     Returns:
         AgentTool: The wrapped function as an `AgentTool`.
@@ -235,6 +297,12 @@ def tool(
 
     def decorator(f: Callable) -> AgentTool:
         ToolHelper.check_docstring(f)
-        return AgentTool(func=f, args_model=args_model)
+        return AgentTool(
+            func=f,
+            args_model=args_model,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+            execution_mode=execution_mode,
+        )
 
     return decorator(func) if func else decorator
@@ -1,27 +1,79 @@
+import asyncio
+import contextlib
+import functools
+import importlib
 import logging
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field, PrivateAttr
 from rich.table import Table
 from rich.console import Console
 
 from dapr_agents.tool import AgentTool
+from dapr_agents.tool.utils.tool import FormattedTools
 from dapr_agents.types import AgentToolExecutorError, ToolError
 
 logger = logging.getLogger(__name__)
 
 
+def _call_by_reference(module: str, qualname: str, kwargs: Dict[str, Any]) -> Any:
+    """
+    Runs a module-level function in a worker process, looked up by its import path.
+
+    The `@tool` decorator rebinds the function's module name to the `AgentTool`, so the function
+    itself cannot be pickled by reference. Looking it up here resolves that name again and unwraps
+    the tool.
+    """
+    target: Any = importlib.import_module(module)
+    for attr in qualname.split("."):
+        target = getattr(target, attr)
+    if isinstance(target, AgentTool):
+        target = target.func
+    return target(**kwargs)
+
+
 class AgentToolExecutor(BaseModel):
     """
     Manages the registration and execution of tools, providing both sync and async interfaces.
 
+    Synchronous tools are offloaded to a thread pool (or a process pool for tools with
+    `execution_mode="process"`) so they never block the event loop. Per-tool timeouts and
+    concurrency limits are taken from each tool, falling back to the executor defaults.
+
     Attributes:
         tools (List[AgentTool]): List of tools to register and manage.
+        max_workers (Optional[int]): Size of the thread pool used for synchronous tools.
+        max_process_workers (Optional[int]): Size of the process pool used for process-mode tools.
+        default_timeout (Optional[float]): Timeout for tools that do not define their own.
     """
 
     tools: List[AgentTool] = Field(
         default_factory=list, description="List of tools to register and manage."
     )
+    max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Size of the thread pool used for synchronous tools. None uses the ThreadPoolExecutor default.",
+    )
+    max_process_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Size of the process pool used for tools with execution_mode='process'. None uses the CPU count.",
+    )
+    default_timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Timeout in seconds for tools that do not define their own. None disables the timeout.",
+    )
     _tools_map: Dict[str, AgentTool] = PrivateAttr(default_factory=dict)
+    _thread_pool: Optional[ThreadPoolExecutor] = PrivateAttr(default=None)
+    _process_pool: Optional[ProcessPoolExecutor] = PrivateAttr(default=None)
+    _semaphores: Dict[
+        Tuple[str, asyncio.AbstractEventLoop], asyncio.Semaphore
+    ] = PrivateAttr(default_factory=dict)
+    _formatted_tools: Dict[
+        Tuple[str, bool], Tuple[Tuple[int, ...], FormattedTools]
+    ] = PrivateAttr(default_factory=dict)
 
     def model_post_init(self, __context: Any) -> None:
         """Initializes the internal tools map after model creation."""
@@ -44,6 +96,7 @@ class AgentToolExecutor(BaseModel):
             logger.error(f"Attempted to register duplicate tool: {tool.name}")
             raise AgentToolExecutorError(f"Tool '{tool.name}' is already registered.")
         self._tools_map[tool.name] = tool
+        self._formatted_tools.clear()
         logger.info(f"Tool registered: {tool.name}")
 
     def get_tool(self, tool_name: str) -> Optional[AgentTool]:
@@ -67,6 +120,40 @@ class AgentToolExecutor(BaseModel):
         """
         return list(self._tools_map.keys())
 
+    def get_formatted_tools(
+        self, tool_format: str = "openai", use_deprecated: bool = False
+    ) -> FormattedTools:
+        """
+        Returns the function call definitions of all registered tools for a provider format.
+
+        The payload is built once per format and reused until a tool is registered or changed, so
+        agents can pass it to every chat completion request without re-formatting the tools.
+
+        Args:
+            tool_format (str): The provider format (e.g., 'openai').
+            use_deprecated (bool): Whether to use the deprecated function format.
+
+        Returns:
+            FormattedTools: The formatted tool definitions.
+        """
+        key = (tool_format.lower(), use_deprecated)
+        versions = tuple(tool.schema_version for tool in self._tools_map.values())
+        cached = self._formatted_tools.get(key)
+        if cached is None or cached[0] != versions:
+            payload = FormattedTools(
+                (
+                    tool.to_function_call(
+                        format_type=tool_format, use_deprecated=use_deprecated
+                    )
+                    for tool in self._tools_map.values()
+                ),
+                tool_format=tool_format,
+                use_deprecated=use_deprecated,
+            )
+            cached = (versions, payload)
+            self._formatted_tools[key] = cached
+        return cached[1]
+
     def get_tool_signatures(self) -> str:
         """
         Retrieves the signatures of all registered tools.
@@ -92,6 +179,9 @@ class AgentToolExecutor(BaseModel):
         """
         Executes a tool by name, automatically handling both sync and async tools.
 
+        Synchronous tools run in the executor's thread or process pool. The tool's timeout and
+        concurrency limit are enforced.
+
         Args:
             tool_name (str): Tool name to execute.
             *args: Positional arguments.
@@ -101,17 +191,26 @@ class AgentToolExecutor(BaseModel):
             Any: Result of tool execution.
 
         Raises:
-            AgentToolExecutorError: If the tool is not found or execution fails.
+            AgentToolExecutorError: If the tool is not found, times out or execution fails.
         """
         tool = self.get_tool(tool_name)
         if not tool:
             logger.error(f"Tool not found: {tool_name}")
             raise AgentToolExecutorError(f"Tool '{tool_name}' not found.")
+
+        timeout = tool.timeout or self.default_timeout
         try:
             logger.info(f"Running tool (auto): {tool_name}")
-            if tool._is_async:
-                return await tool.arun(*args, **kwargs)
-            return tool(*args, **kwargs)
+            async with self._get_semaphore(tool):
+                return await asyncio.wait_for(
+                    self._execute(tool, *args, **kwargs), timeout
+                )
+        except asyncio.TimeoutError as e:
+            # A thread or process cannot be interrupted; its result is discarded
+            logger.error(f"Tool '{tool_name}' timed out after {timeout}s")
+            raise AgentToolExecutorError(
+                f"Tool '{tool_name}' timed out after {timeout} seconds."
+            ) from e
         except ToolError as e:
             logger.error(f"Tool execution error in '{tool_name}': {e}")
             raise AgentToolExecutorError(str(e)) from e
@@ -121,6 +220,94 @@ class AgentToolExecutor(BaseModel):
                 f"Unexpected error in tool '{tool_name}': {e}"
             ) from e
 
+    async def run_tools(
+        self,
+        tool_calls: List[Tuple[str, Dict[str, Any]]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Executes several tool calls concurrently.
+
+        Args:
+            tool_calls (List[Tuple[str, Dict[str, Any]]]): `(tool_name, kwargs)` pairs to execute.
+            return_exceptions (bool): If True, failures are returned in place of their result
+                instead of raising the first error.
+
+        Returns:
+            List[Any]: Results in the same order as `tool_calls`.
+
+        Raises:
+            AgentToolExecutorError: If a call fails and `return_exceptions` is False.
+        """
+        return await asyncio.gather(
+            *(self.run_tool(name, **arguments) for name, arguments in tool_calls),
+            return_exceptions=return_exceptions,
+        )
+
+    async def _execute(self, tool: AgentTool, *args, **kwargs) -> Any:
+        """Runs async tools on the event loop and sync tools in the matching worker pool."""
+        if tool._is_async:
+            return await tool.arun(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        if tool.execution_mode == "process":
+            func = tool.func or tool._run
+            # Validate in this process; only the function and its arguments are sent to the worker
+            prepared = tool._validate_and_prepare_args(func, *args, **kwargs)
+            call = functools.partial(func, **prepared)
+            qualname = getattr(func, "__qualname__", "")
+            if tool.func is not None and "<locals>" not in qualname:
+                call = functools.partial(
+                    _call_by_reference, func.__module__, qualname, prepared
+                )
+            return await loop.run_in_executor(self._get_pool("process"), call)
+        return await loop.run_in_executor(
+            self._get_pool("thread"), functools.partial(tool.run, *args, **kwargs)
+        )
+
+    def _get_pool(self, mode: str) -> Executor:
+        """Lazily creates the thread or process pool."""
+        if mode == "process":
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.max_process_workers
+                )
+            return self._process_pool
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="agent-tool"
+            )
+        return self._thread_pool
+
+    def _get_semaphore(self, tool: AgentTool) -> Any:
+        """
+        Returns the concurrency limiter for a tool on the running event loop,
+        or a no-op context manager if the tool is unbounded.
+        """
+        if not tool.max_concurrency:
+            return contextlib.nullcontext()
+        loop = asyncio.get_running_loop()
+        # Forget limiters of loops that have been closed in the meantime
+        for key in [k for k in self._semaphores if k[1].is_closed()]:
+            del self._semaphores[key]
+        key = (tool.name, loop)
+        if key not in self._semaphores:
+            self._semaphores[key] = asyncio.Semaphore(tool.max_concurrency)
+        return self._semaphores[key]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the worker pools. They are recreated if tools are run again.
+
+        Args:
+            wait (bool): Whether to wait for running tool calls to finish.
+        """
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait)
+        self._thread_pool = None
+        self._process_pool = None
+
     @property
     def help(self) -> None:
         """Displays a rich-formatted table of registered tools."""
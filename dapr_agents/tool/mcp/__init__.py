@@ -2,3 +2,4 @@ from .client import MCPClient, create_sync_mcp_client
 from .transport import connect_stdio, connect_sse
 from .schema import create_pydantic_model_from_schema
 from .prompt import convert_prompt_message
+from .pool import MCPSessionPool
@@ -1,5 +1,5 @@
 from contextlib import AsyncExitStack, asynccontextmanager
-from typing import Dict, List, Optional, Set, Any, Type, AsyncGenerator
+from typing import Dict, List, Optional, Set, Any, Type, AsyncGenerator, Tuple
 from types import TracebackType
 import asyncio
 import logging
@@ -9,6 +9,7 @@ from mcp import ClientSession
 from mcp.types import Tool as MCPTool, Prompt
 
 from dapr_agents.tool import AgentTool
+from dapr_agents.tool.mcp.pool import MCPSessionPool
 from dapr_agents.types import ToolError
 
 
@@ -26,6 +27,10 @@ class MCPClient(BaseModel):
         allowed_tools: Optional set of tool names to include (when None, all tools are included)
         server_timeout: Timeout in seconds for server connections
         sse_read_timeout: Read timeout for SSE connections in seconds
+        session_pool_size: Number of idle sessions kept open per server for tool calls
+        max_concurrent_calls: Maximum number of concurrent tool calls per server
+        session_idle_timeout: Seconds after which an unused pooled session is closed
+        session_health_check_interval: Seconds after which an idle session is pinged before reuse
     """
 
     allowed_tools: Optional[Set[str]] = Field(
@@ -38,6 +43,24 @@ class MCPClient(BaseModel):
     sse_read_timeout: float = Field(
         default=300.0, description="Read timeout for SSE connections in seconds"
     )
+    session_pool_size: int = Field(
+        default=2,
+        ge=0,
+        description="Number of idle sessions kept open per server and reused across tool calls",
+    )
+    max_concurrent_calls: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of tool calls executed concurrently against a single server",
+    )
+    session_idle_timeout: Optional[float] = Field(
+        default=300.0,
+        description="Seconds after which an unused pooled session is closed. None keeps sessions open",
+    )
+    session_health_check_interval: Optional[float] = Field(
+        default=60.0,
+        description="Seconds after which an idle pooled session is pinged before being reused. None disables health checks",
+    )
 
     # Private attributes not exposed in model schema
     _exit_stack: AsyncExitStack = PrivateAttr(default_factory=AsyncExitStack)
@@ -46,6 +69,9 @@ class MCPClient(BaseModel):
     _server_prompts: Dict[str, Dict[str, Prompt]] = PrivateAttr(default_factory=dict)
     _task_locals: Dict[str, Any] = PrivateAttr(default_factory=dict)
     _server_configs: Dict[str, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+    _session_pools: Dict[
+        Tuple[str, asyncio.AbstractEventLoop], MCPSessionPool
+    ] = PrivateAttr(default_factory=dict)
 
     def model_post_init(self, __context: Any) -> None:
         """Initialize the client after the model is created."""
@@ -57,22 +83,54 @@ class MCPClient(BaseModel):
         self, server_name: str
     ) -> AsyncGenerator[ClientSession, None]:
         """
-        Create an ephemeral session for the given server and yield it.
-        Used during tool execution to avoid reuse issues.
+        Borrow an initialized session for the given server from its session pool.
+
+        Sessions are reused across tool calls instead of starting a new server process or
+        HTTP stream per call. A session that fails while borrowed is discarded and replaced
+        on the next call.
 
         Args:
-            server_name: The server to create a session for.
+            server_name: The server to borrow a session for.
 
         Yields:
-            A short-lived, initialized MCP session.
+            An initialized MCP session.
         """
-        logger.debug(f"[MCP] Creating ephemeral session for server '{server_name}'")
-        session = await self._create_ephemeral_session(server_name)
-        try:
+        async with self._get_session_pool(server_name).acquire() as session:
             yield session
-        finally:
-            # Session cleanup is managed by AsyncExitStack (via transport module)
-            pass
+
+    def _get_session_pool(self, server_name: str) -> MCPSessionPool:
+        """
+        Get or create the session pool for a server on the running event loop.
+
+        Pools are kept per event loop because MCP transports are bound to the loop that opened them.
+
+        Args:
+            server_name: The MCP server to get a pool for.
+
+        Returns:
+            The session pool for the server.
+        """
+        if server_name not in self._server_configs:
+            raise ToolError(f"No stored config found for server '{server_name}'")
+
+        loop = asyncio.get_running_loop()
+        # Forget pools of loops that have been closed in the meantime
+        for key in [k for k in self._session_pools if k[1].is_closed()]:
+            del self._session_pools[key]
+
+        key = (server_name, loop)
+        if key not in self._session_pools:
+            logger.debug(f"[MCP] Creating session pool for server '{server_name}'")
+            self._session_pools[key] = MCPSessionPool(
+                server_name=server_name,
+                connector=lambda stack: self._open_session(server_name, stack),
+                max_size=self.session_pool_size,
+                max_concurrency=self.max_concurrent_calls,
+                idle_timeout=self.session_idle_timeout,
+                health_check_interval=self.session_health_check_interval,
+                connect_timeout=max(self.server_timeout, 30.0),
+            )
+        return self._session_pools[key]
 
     async def connect_stdio(
         self,
@@ -273,43 +331,36 @@ class MCPClient(BaseModel):
             )
             self._server_prompts[server_name] = []
 
-    async def _create_ephemeral_session(self, server_name: str) -> ClientSession:
+    async def _open_session(
+        self, server_name: str, stack: AsyncExitStack
+    ) -> ClientSession:
         """
-        Create a fresh session for a single tool call.
+        Open a new, uninitialized session using the stored server configuration.
 
         Args:
             server_name: The MCP server to connect to.
+            stack: Exit stack that owns the transport and session contexts.
 
         Returns:
-            A fully initialized ephemeral ClientSession.
+            A ClientSession bound to `stack`.
         """
         config = self._server_configs.get(server_name)
         if not config:
             raise ToolError(f"No stored config found for server '{server_name}'")
 
-        try:
-            if config["type"] == "stdio":
-                from dapr_agents.tool.mcp.transport import connect_stdio
-
-                session = await connect_stdio(
-                    **config["params"], stack=self._exit_stack
-                )
-            elif config["type"] == "sse":
-                from dapr_agents.tool.mcp.transport import connect_sse
+        if config["type"] == "stdio":
+            from dapr_agents.tool.mcp.transport import connect_stdio
 
-                session = await connect_sse(**config["params"], stack=self._exit_stack)
-            else:
-                raise ToolError(f"Unknown transport type: {config['type']}")
+            return await connect_stdio(**config["params"], stack=stack)
+        elif config["type"] == "sse":
+            from dapr_agents.tool.mcp.transport import connect_sse
 
-            await session.initialize()
-            return session
-        except Exception as e:
-            logger.error(f"Failed to create ephemeral session: {e}")
-            raise ToolError(f"Could not create session for '{server_name}': {e}") from e
+            return await connect_sse(**config["params"], stack=stack)
+        raise ToolError(f"Unknown transport type: {config['type']}")
 
     async def wrap_mcp_tool(self, server_name: str, mcp_tool: MCPTool) -> AgentTool:
         """
-        Wrap an MCPTool as an AgentTool with dynamic session creation at runtime,
+        Wrap an MCPTool as an AgentTool that borrows a pooled session at runtime,
         based on stored server configuration.
 
         Args:
@@ -330,7 +381,7 @@ class MCPClient(BaseModel):
         def build_executor(client: MCPClient, server_name: str, tool_name: str):
             async def executor(**kwargs: Any) -> Any:
                 """
-                Execute the tool using a dynamically created session context.
+                Execute the tool using a session borrowed from the server's session pool.
 
                 Args:
                     kwargs: Input arguments to the tool.
@@ -346,7 +397,9 @@ class MCPClient(BaseModel):
                     async with client.create_session(server_name) as session:
                         result = await session.call_tool(tool_name, kwargs)
                         logger.debug(f"[MCP] Received result from tool '{tool_name}'")
-                        return client._process_tool_result(result)
+                    # Tool errors are reported after the session is returned, so they don't
+                    # mark a healthy session as broken
+                    return client._process_tool_result(result)
                 except Exception as e:
                     logger.exception(f"Execution failed for '{tool_name}'")
                     raise ToolError(
@@ -355,7 +408,7 @@ class MCPClient(BaseModel):
 
             return executor
 
-        # Build executor using dynamic context-managed session resolution
+        # Build executor using pooled session resolution
         tool_func = build_executor(self, server_name, mcp_tool.name)
 
         # Optionally generate args model from input schema
@@ -568,6 +621,8 @@ class MCPClient(BaseModel):
                     f"than it was created in. This may cause errors."
                 )
 
+        await self._close_session_pools()
+
         # Close all connections
         try:
             await self._exit_stack.aclose()
@@ -579,6 +634,27 @@ class MCPClient(BaseModel):
             logger.error(f"Error closing MCP client: {str(e)}")
             raise
 
+    async def _close_session_pools(self) -> None:
+        """
+        Drain the session pools of all servers.
+
+        Pools of the running loop are closed directly; pools bound to other running loops are
+        closed on their own loop. Pools of loops that are already closed are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        pools, self._session_pools = self._session_pools, {}
+        for (server_name, pool_loop), pool in pools.items():
+            try:
+                if pool_loop is loop:
+                    await pool.close()
+                elif pool_loop.is_running():
+                    future = asyncio.run_coroutine_threadsafe(pool.close(), pool_loop)
+                    await asyncio.wrap_future(future)
+            except Exception as e:
+                logger.warning(
+                    f"Error closing session pool for server '{server_name}': {e}"
+                )
+
     async def __aenter__(self) -> "MCPClient":
         """Context manager entry point."""
         return self
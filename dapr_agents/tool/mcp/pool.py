@@ -0,0 +1,200 @@
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncGenerator, Awaitable, Callable, List, Optional
+import asyncio
+import logging
+import time
+
+from mcp import ClientSession
+
+from dapr_agents.types import ToolError
+
+logger = logging.getLogger(__name__)
+
+SessionConnector = Callable[[AsyncExitStack], Awaitable[ClientSession]]
+
+
+class PooledSession:
+    """
+    An initialized MCP session owned by a dedicated background task.
+
+    MCP transports are built on anyio task groups, which must be exited by the same task that
+    entered them. Each pooled session therefore lives inside its own task, which opens the transport,
+    initializes the session and keeps it open until `close()` is called.
+    """
+
+    def __init__(self, connector: SessionConnector):
+        self._connector = connector
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+        self.session: Optional[ClientSession] = None
+        self.last_used = time.monotonic()
+        self.last_checked = self.last_used
+
+    async def start(self, timeout: float) -> None:
+        """
+        Starts the owner task and waits until the session is initialized.
+
+        Raises:
+            ToolError: If the session cannot be established within `timeout` seconds.
+        """
+        self._task = asyncio.create_task(self._run())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            await self.close()
+            raise ToolError(f"Timed out after {timeout}s establishing MCP session")
+        if self._error is not None:
+            raise ToolError(f"Could not establish MCP session: {self._error}")
+
+    async def _run(self) -> None:
+        try:
+            async with AsyncExitStack() as stack:
+                session = await self._connector(stack)
+                await session.initialize()
+                self.session = session
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as e:
+            self._error = e
+            logger.debug(f"[MCP] Pooled session ended with error: {e}")
+        finally:
+            self.session = None
+            self._ready.set()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the session is initialized and its owner task is still running."""
+        return (
+            self.session is not None
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    async def ping(self, timeout: float) -> bool:
+        """Sends an MCP ping and reports whether the server answered in time."""
+        if not self.alive:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout)
+            self.last_checked = time.monotonic()
+            return True
+        except Exception as e:
+            logger.debug(f"[MCP] Health check failed: {e}")
+            return False
+
+    async def close(self) -> None:
+        """Signals the owner task to exit the transport and waits for it to finish."""
+        self._closing.set()
+        if self._task is not None and not self._task.done():
+            try:
+                await self._task
+            except BaseException as e:
+                logger.debug(f"[MCP] Error while closing pooled session: {e}")
+
+
+class MCPSessionPool:
+    """
+    Pool of reusable, initialized MCP sessions for a single server and event loop.
+
+    Attributes:
+        max_size: Number of idle sessions kept open for reuse.
+        max_concurrency: Maximum number of sessions borrowed at the same time.
+        idle_timeout: Seconds after which an idle session is closed.
+        health_check_interval: Idle sessions unused for longer than this are pinged before reuse.
+        connect_timeout: Seconds allowed for establishing a new session.
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        connector: SessionConnector,
+        max_size: int = 2,
+        max_concurrency: int = 8,
+        idle_timeout: Optional[float] = 300.0,
+        health_check_interval: Optional[float] = 60.0,
+        connect_timeout: float = 30.0,
+    ):
+        self.server_name = server_name
+        self.max_size = max_size
+        self.max_concurrency = max_concurrency
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.connect_timeout = connect_timeout
+        self._connector = connector
+        self._idle: List[PooledSession] = []
+        self._in_use: List[PooledSession] = []
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._closed = False
+
+    async def _evict_idle(self) -> None:
+        if self.idle_timeout is None:
+            return
+        deadline = time.monotonic() - self.idle_timeout
+        expired = [s for s in self._idle if s.last_used < deadline]
+        self._idle = [s for s in self._idle if s.last_used >= deadline]
+        for pooled in expired:
+            logger.debug(f"[MCP] Closing idle session for '{self.server_name}'")
+            await pooled.close()
+
+    async def _checkout(self) -> PooledSession:
+        await self._evict_idle()
+        while self._idle:
+            pooled = self._idle.pop()
+            needs_check = (
+                self.health_check_interval is not None
+                and time.monotonic() - pooled.last_checked > self.health_check_interval
+            )
+            if pooled.alive and (
+                not needs_check or await pooled.ping(self.connect_timeout)
+            ):
+                return pooled
+            logger.info(f"[MCP] Replacing unhealthy session for '{self.server_name}'")
+            await pooled.close()
+
+        logger.debug(f"[MCP] Opening new pooled session for '{self.server_name}'")
+        pooled = PooledSession(self._connector)
+        await pooled.start(self.connect_timeout)
+        return pooled
+
+    async def _checkin(self, pooled: PooledSession, healthy: bool) -> None:
+        if self._closed or not healthy or not pooled.alive:
+            await pooled.close()
+            return
+        pooled.last_used = time.monotonic()
+        self._idle.append(pooled)
+        # Only keep `max_size` idle sessions around; close the oldest ones
+        while len(self._idle) > self.max_size:
+            await self._idle.pop(0).close()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[ClientSession, None]:
+        """
+        Borrows an initialized session, waiting while `max_concurrency` sessions are in use.
+
+        Sessions that raise while borrowed are closed instead of being returned, so the next
+        borrower transparently reconnects.
+
+        Yields:
+            ClientSession: An initialized MCP session.
+        """
+        if self._closed:
+            raise ToolError(f"Session pool for '{self.server_name}' is closed")
+
+        async with self._semaphore:
+            pooled = await self._checkout()
+            self._in_use.append(pooled)
+            healthy = False
+            try:
+                yield pooled.session
+                healthy = True
+            finally:
+                self._in_use.remove(pooled)
+                await self._checkin(pooled, healthy)
+
+    async def close(self) -> None:
+        """Closes all idle sessions. Borrowed sessions are closed when they are returned."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(pooled.close() for pooled in idle))
@@ -1,2 +1,2 @@
 from .openapi import OpenAPISpecParser
-from .tool import ToolHelper
+from .tool import ToolHelper, FormattedTools
@@ -1,12 +1,36 @@
 from dapr_agents.tool.utils.function_calling import validate_and_format_tool
-from typing import Any, Union, Dict, Callable, Optional, Type
+from typing import Any, Union, Dict, Callable, Optional, Type, List, Iterable
 from inspect import signature, Parameter
 from pydantic import BaseModel, create_model, Field
 from dapr_agents.types import ToolError
 import logging
+import types
 
 logger = logging.getLogger(__name__)
 
+# Attribute a function's AgentTool wrapper is cached under, so its schema is inferred only once.
+# Keeping it on the function ties the wrapper's lifetime to the function's.
+_WRAPPER_ATTR = "__dapr_agents_tool__"
+
+
+class FormattedTools(list):
+    """
+    A list of tool definitions already formatted for one provider.
+
+    Request preparation passes it through without validating or formatting the tools again,
+    so agents can build it once and reuse it across iterations.
+    """
+
+    def __init__(
+        self,
+        tools: Iterable[Dict[str, Any]] = (),
+        tool_format: str = "openai",
+        use_deprecated: bool = False,
+    ):
+        super().__init__(tools)
+        self.tool_format = tool_format
+        self.use_deprecated = use_deprecated
+
 
 class ToolHelper:
     """
@@ -50,7 +74,7 @@ class ToolHelper:
         from dapr_agents.tool.base import AgentTool
 
         if callable(tool) and not isinstance(tool, AgentTool):
-            tool = AgentTool.from_func(tool)
+            tool = ToolHelper.wrap_func(tool)
         elif isinstance(tool, dict):
             return validate_and_format_tool(tool, tool_format, use_deprecated)
         if not isinstance(tool, AgentTool):
@@ -59,6 +83,61 @@ class ToolHelper:
             format_type=tool_format, use_deprecated=use_deprecated
         )
 
+    @staticmethod
+    def format_tools(
+        tools: Iterable[Union[Dict[str, Any], Callable]],
+        tool_format: str = "openai",
+        use_deprecated: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Formats several tools for a specific API format.
+
+        Tools that are already a `FormattedTools` payload for the same format are returned as is.
+
+        Args:
+            tools (Iterable[Union[Dict[str, Any], Callable]]): The tools to format.
+            tool_format (str): Format type, e.g., 'openai'.
+            use_deprecated (bool): Set to use a deprecated format.
+
+        Returns:
+            List[Dict[str, Any]]: The formatted tools.
+        """
+        if (
+            isinstance(tools, FormattedTools)
+            and tools.tool_format == tool_format
+            and tools.use_deprecated == use_deprecated
+        ):
+            return list(tools)
+        return [
+            ToolHelper.format_tool(
+                tool, tool_format=tool_format, use_deprecated=use_deprecated
+            )
+            for tool in tools
+        ]
+
+    @staticmethod
+    def wrap_func(func: Callable) -> Any:
+        """
+        Wraps a raw function in an `AgentTool`, reusing the wrapper created for the same function before.
+
+        Args:
+            func (Callable): The function to wrap.
+
+        Returns:
+            AgentTool: The tool wrapping `func`.
+        """
+        from dapr_agents.tool.base import AgentTool
+
+        if not isinstance(func, types.FunctionType):
+            # Bound methods, builtins and callable objects are wrapped without caching
+            return AgentTool.from_func(func)
+        wrapped = func.__dict__.get(_WRAPPER_ATTR)
+        # functools.wraps copies __dict__, so a decorator's wrapper may carry the inner function's tool
+        if wrapped is None or wrapped.func is not func:
+            wrapped = AgentTool.from_func(func)
+            func.__dict__[_WRAPPER_ATTR] = wrapped
+        return wrapped
+
     @staticmethod
     def infer_func_schema(
         func: Callable, name: Optional[str] = None
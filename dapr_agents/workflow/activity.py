@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Coroutine, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityMetrics(BaseModel):
+    """Counters describing the async activities run on an `ActivityLoop`."""
+
+    submitted: int = Field(default=0, description="Activities submitted to the loop.")
+    completed: int = Field(default=0, description="Activities that returned a result.")
+    failed: int = Field(default=0, description="Activities that raised.")
+    running: int = Field(default=0, description="Activities running right now.")
+    queued: int = Field(
+        default=0,
+        description="Activities waiting for a concurrency slot right now.",
+    )
+    max_queued: int = Field(
+        default=0, description="Highest number of activities waiting at once."
+    )
+    total_wait_seconds: float = Field(
+        default=0.0,
+        description="Time activities spent waiting for a concurrency slot, summed.",
+    )
+    max_wait_seconds: float = Field(
+        default=0.0, description="Longest time an activity waited for a slot."
+    )
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Average time an activity waited for a slot (0.0 before any activity started)."""
+        started = self.completed + self.failed + self.running
+        return self.total_wait_seconds / started if started else 0.0
+
+
+class ActivityLoop(BaseModel):
+    """
+    A long-lived asyncio event loop, running on its own thread, that executes the coroutines of async
+    workflow activities.
+
+    Dapr invokes activities on its worker threads. Submitting their coroutines to one shared loop,
+    instead of creating a loop per activity, keeps async clients (httpx, grpc.aio, ...) and their
+    connections alive across activities. The loop thread starts on first use and can be restarted
+    after `close`.
+    """
+
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of activities running at once. Others wait in FIFO order. None disables the limit.",
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _loop: Optional[asyncio.AbstractEventLoop] = PrivateAttr(default=None)
+    _thread: Optional[threading.Thread] = PrivateAttr(default=None)
+    _semaphore: Optional[asyncio.Semaphore] = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _metrics: ActivityMetrics = PrivateAttr(default_factory=ActivityMetrics)
+
+    @property
+    def metrics(self) -> ActivityMetrics:
+        """A snapshot of the activity counters, including the current queue depth."""
+        with self._lock:
+            return self._metrics.model_copy()
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Runs a coroutine on the shared loop and blocks the calling thread until it finishes.
+
+        Args:
+            coro (Coroutine[Any, Any, Any]): The activity coroutine.
+
+        Returns:
+            Any: The result of the coroutine.
+
+        Raises:
+            RuntimeError: If called from the loop's own thread, which would deadlock.
+        """
+        loop = self._ensure_started()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "ActivityLoop.run cannot be called from the activity loop thread."
+            )
+        with self._lock:
+            self._metrics.submitted += 1
+            self._metrics.queued += 1
+            self._metrics.max_queued = max(
+                self._metrics.max_queued, self._metrics.queued
+            )
+        future = asyncio.run_coroutine_threadsafe(
+            self._run(coro, time.perf_counter()), loop
+        )
+        return future.result()
+
+    def close(self) -> None:
+        """Cancels pending activities, stops the loop and joins its thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = self._semaphore = None
+        if loop is None:
+            return
+
+        async def cancel_pending() -> None:
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        try:
+            asyncio.run_coroutine_threadsafe(cancel_pending(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+        logger.debug("Activity event loop stopped.")
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Starts the loop thread if it is not running and returns the loop."""
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def serve() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            thread = threading.Thread(
+                target=serve, name="workflow-activity-loop", daemon=True
+            )
+            thread.start()
+            ready.wait()
+            if self.max_concurrency is not None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop, self._thread = loop, thread
+            logger.debug("Activity event loop started.")
+            return loop
+
+    async def _run(self, coro: Coroutine[Any, Any, Any], submitted_at: float) -> Any:
+        """Waits for a concurrency slot, then runs the coroutine, keeping the metrics up to date."""
+        semaphore = self._semaphore
+        started = False
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+            started = True
+            waited = time.perf_counter() - submitted_at
+            with self._lock:
+                self._metrics.queued -= 1
+                self._metrics.running += 1
+                self._metrics.total_wait_seconds += waited
+                self._metrics.max_wait_seconds = max(
+                    self._metrics.max_wait_seconds, waited
+                )
+            result = await coro
+        except BaseException:
+            with self._lock:
+                self._metrics.failed += 1
+                if started:
+                    self._metrics.running -= 1
+                else:
+                    self._metrics.queued -= 1
+            if not started:
+                coro.close()
+            raise
+        finally:
+            if started and semaphore is not None:
+                semaphore.release()
+        with self._lock:
+            self._metrics.completed += 1
+            self._metrics.running -= 1
+        return result
@@ -17,12 +17,14 @@ from typing import (
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
     Type,
     Union,
 )
 from pydantic import BaseModel, Field, ValidationError, PrivateAttr
 from dapr.clients import DaprClient
+from dapr.clients.grpc._request import TransactionalStateOperation
 from dapr_agents.agent.utils.text_printer import ColorTextFormatter
 from dapr_agents.memory import (
     ConversationListMemory,
@@ -32,6 +34,7 @@ from dapr_agents.memory import (
 from dapr_agents.workflow.messaging import DaprPubSub
 from dapr_agents.workflow.messaging.routing import MessageRoutingMixin
 from dapr_agents.storage.daprstores.statestore import DaprStateStore
+from dapr_agents.storage.daprstores.pool import close_dapr_client_pools
 from dapr_agents.workflow import WorkflowApp
 
 if TYPE_CHECKING:
@@ -81,12 +84,29 @@ class AgenticWorkflow(WorkflowApp, DaprPubSub, MessageRoutingMixin):
         default_factory=ConversationListMemory,
         description="Handles conversation history storage.",
     )
+    max_concurrent_messages: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of pub/sub messages handled concurrently per subscribed topic.",
+    )
+    message_ordering_key: Optional[str] = Field(
+        default="workflow_instance_id",
+        description="Message payload field used to keep related messages in order. Messages without it are handled concurrently.",
+    )
     save_state_locally: bool = Field(
         default=True, description="Whether to save workflow state locally."
     )
     local_state_path: Optional[str] = Field(
         default=None, description="Path for saving local state."
     )
+    shard_instance_state: bool = Field(
+        default=False,
+        description="Whether to persist each workflow instance under its own key, writing only instances that changed.",
+    )
+    evict_completed_instances: bool = Field(
+        default=False,
+        description="Whether to drop completed workflow instances from memory once they are persisted.",
+    )
 
     # Private internal attributes (not schema/validated)
     _state_store_client: Optional[DaprStateStore] = PrivateAttr(default=None)
@@ -101,6 +121,10 @@ class AgenticWorkflow(WorkflowApp, DaprPubSub, MessageRoutingMixin):
     _topic_handlers: Dict[
         Tuple[str, str], Dict[Type[BaseModel], Callable]
     ] = PrivateAttr(default_factory=dict)
+    _dirty_instances: Set[str] = PrivateAttr(default_factory=set)
+    _completed_instances: Set[str] = PrivateAttr(default_factory=set)
+    _saved_top_level_state: Optional[str] = PrivateAttr(default=None)
+    _state_save_lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
 
     def model_post_init(self, __context: Any) -> None:
         """Initializes the workflow service, messaging, and metadata storage."""
@@ -230,7 +254,8 @@ class AgenticWorkflow(WorkflowApp, DaprPubSub, MessageRoutingMixin):
 
     async def stop(self):
         """
-        Gracefully stops the agent service by unsubscribing and stopping the HTTP server if present.
+        Gracefully stops the agent service by unsubscribing, stopping the HTTP server if present,
+        and closing the shared Dapr client pools.
         """
         if not self._is_running:
             logger.warning("Service is not running. Ignoring stop request.")
@@ -261,6 +286,9 @@ class AgenticWorkflow(WorkflowApp, DaprPubSub, MessageRoutingMixin):
             self.stop_runtime()
             self.wf_runtime_is_running = False
 
+        # Release pooled Dapr clients shared by state stores, pub/sub and LLM clients
+        await close_dapr_client_pools()
+
         self._is_running = False
         logger.info("Agent Workflow Service stopped successfully.")
 
@@ -411,6 +439,11 @@ class AgenticWorkflow(WorkflowApp, DaprPubSub, MessageRoutingMixin):
                         f"Invalid state type retrieved: {type(state_data)}. Expected dict."
                     )
 
+                # State saved before sharding keeps every instance under the main key;
+                # mark them dirty so the next save migrates them to their own keys.
+                if self.shard_instance_state and state_data.get("instances"):
+                    self._dirty_instances.update(state_data["instances"].keys())
+
                 return (
                     self.validate_state(state_data) if self.state_format else state_data
                 )
@@ -424,6 +457,86 @@ class AgenticWorkflow(WorkflowApp, DaprPubSub, MessageRoutingMixin):
             logger.error(f"Failed to load state for key '{self.state_key}': {e}")
             raise RuntimeError(f"Error loading workflow state: {e}") from e
 
+    def _get_instance_state_key(self, instance_id: str) -> str:
+        """Returns the state store key holding a single workflow instance."""
+        return f"{self.state_key}:instance:{instance_id}"
+
+    def get_instance_state(
+        self, instance_id: str, default: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Returns the state entry of a workflow instance, loading it from its shard if it is not in memory.
+
+        Workflow replays can run after a restart or after a completed instance was evicted, so the
+        entry is read back from the state store when needed. Completed instances (those with an
+        `end_time`) read this way stay cached only until the next save, so changes made to them in
+        the meantime are persisted.
+
+        The read blocks on the Dapr sidecar: call it from activities, and from async code through
+        `asyncio.to_thread`, never from workflow code, which runs again on every replay.
+
+        Args:
+            instance_id (str): The workflow instance ID.
+            default (Optional[Dict[str, Any]]): Entry to register if the instance does not exist yet.
+
+        Returns:
+            Optional[Dict[str, Any]]: The instance entry, or None if it does not exist and no default was given.
+        """
+        with self._state_save_lock:
+            entry = self.state.setdefault("instances", {}).get(instance_id)
+            if entry is not None:
+                return entry
+
+        # Read the shard without holding the save lock, so saves are not blocked by the sidecar
+        has_entry, stored = False, None
+        if self.shard_instance_state:
+            has_entry, stored = self._state_store_client.try_get_state(
+                self._get_instance_state_key(instance_id)
+            )
+
+        with self._state_save_lock:
+            instances = self.state.setdefault("instances", {})
+            # Another thread may have loaded or registered the instance in the meantime
+            entry = instances.get(instance_id)
+            if entry is not None:
+                return entry
+
+            if has_entry and stored is not None:
+                instances[instance_id] = stored
+                if self.evict_completed_instances and stored.get("end_time"):
+                    self._completed_instances.add(instance_id)
+                return stored
+
+            if default is not None:
+                instances[instance_id] = default
+                self._dirty_instances.add(instance_id)
+                return default
+
+            return None
+
+    def mark_instance_dirty(self, instance_id: str) -> None:
+        """
+        Flags a workflow instance as modified so the next `save_state` call persists it.
+
+        Args:
+            instance_id (str): The workflow instance ID.
+        """
+        with self._state_save_lock:
+            self._dirty_instances.add(instance_id)
+
+    def mark_instance_completed(self, instance_id: str) -> None:
+        """
+        Flags a workflow instance as completed. Once persisted, completed instances are evicted from
+        memory when `evict_completed_instances` is enabled.
+
+        Args:
+            instance_id (str): The workflow instance ID.
+        """
+        with self._state_save_lock:
+            if self.evict_completed_instances:
+                self._completed_instances.add(instance_id)
+            self._dirty_instances.add(instance_id)
+
     def get_local_state_file_path(self) -> str:
         """
         Returns the file path for saving the local state.
@@ -435,19 +548,20 @@ class AgenticWorkflow(WorkflowApp, DaprPubSub, MessageRoutingMixin):
         return os.path.join(directory, f"{self.state_key}.json")
 
     def save_state_to_disk(
-        self, state_data: str, filename: Optional[str] = None
+        self, state_data: str, filename: Optional[str] = None, merge: bool = True
     ) -> None:
         """
         Safely saves the workflow state to a local JSON file using a uniquely named temp file.
         - Writes to a temp file in parallel.
         - Locks only the final atomic replacement step to avoid overwriting.
+        - Merges into the existing file unless `merge` is False.
         """
         try:
             # Determine save location
-            save_directory = self.local_state_path or os.getcwd()
-            os.makedirs(save_directory, exist_ok=True)  # Ensure directory exists
             filename = filename or f"{self.name}_state.json"
-            file_path = os.path.join(save_directory, filename)
+            file_path = os.path.join(self.local_state_path or os.getcwd(), filename)
+            save_directory = os.path.dirname(file_path)
+            os.makedirs(save_directory, exist_ok=True)  # Ensure directory exists
 
             # Write to a uniquely named temp file
             with tempfile.NamedTemporaryFile(
@@ -460,7 +574,7 @@ class AgenticWorkflow(WorkflowApp, DaprPubSub, MessageRoutingMixin):
             with state_lock:
                 # Load the existing state (merge changes)
                 existing_state = {}
-                if os.path.exists(file_path):
+                if merge and os.path.exists(file_path):
                     with open(file_path, "r", encoding="utf-8") as file:
                         try:
                             existing_state = json.load(file)
@@ -499,6 +613,8 @@ class AgenticWorkflow(WorkflowApp, DaprPubSub, MessageRoutingMixin):
         Saves the current workflow state to the Dapr state store and optionally as a local backup.
 
         This method updates the internal `self.state`, serializes it, and persists it to Dapr's state store.
+        With `shard_instance_state` enabled, only the top-level state (when changed) and the instances
+        flagged via `mark_instance_dirty` are written, each instance under its own key.
         If `save_state_locally` is `True`, it calls `save_state_to_disk` to write the state to a local file.
 
         Args:
@@ -526,11 +642,22 @@ class AgenticWorkflow(WorkflowApp, DaprPubSub, MessageRoutingMixin):
                 )
 
             # Update self.state with the new state if provided
+            if state and self.shard_instance_state:
+                # A full replacement state invalidates what we know about persisted instances
+                new_instances = self._normalize_state(state).get("instances") or {}
+                with self._state_save_lock:
+                    self._dirty_instances.update(new_instances.keys())
             self.state = state or self.state
             if not self.state:
                 logger.warning("Skipping state save: Empty state.")
                 return
 
+            if self.shard_instance_state:
+                self._save_sharded_state()
+                if force_reload:
+                    self.state = self.load_state()
+                return
+
             # Convert state to a JSON-compatible format
             if isinstance(self.state, BaseModel):
                 state_to_save = self.state.model_dump_json()
@@ -564,6 +691,113 @@ class AgenticWorkflow(WorkflowApp, DaprPubSub, MessageRoutingMixin):
             logger.error(f"Failed to save state for key '{self.state_key}': {e}")
             raise
 
+    @staticmethod
+    def _normalize_state(state: Union[dict, BaseModel, str]) -> dict:
+        """
+        Converts a state given as a Pydantic model, dict or JSON string into a dict.
+
+        Raises:
+            TypeError: If the state is not a supported type.
+            ValueError: If the state is a string but not valid JSON.
+        """
+        if isinstance(state, BaseModel):
+            return state.model_dump(mode="json")
+        if isinstance(state, dict):
+            return state
+        if isinstance(state, str):
+            try:
+                return json.loads(state)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON string provided as state: {e}")
+        raise TypeError(
+            f"Invalid state type: {type(state)}. Expected dict, BaseModel, or JSON string."
+        )
+
+    def _save_sharded_state(self) -> None:
+        """
+        Persists the workflow state incrementally.
+
+        Top-level state (everything except `instances`) is stored under `state_key` and only rewritten
+        when it changes. Each modified instance is stored under its own key; there is no shared index
+        to rewrite, so a save only writes what changed. All writes of one save go out in a single
+        state transaction. Completed instances are evicted from memory afterwards if
+        `evict_completed_instances` is set.
+        """
+        with self._state_save_lock:
+            self.state = self._normalize_state(self.state)
+            instances = self.state.get("instances") or {}
+            top_level = {k: v for k, v in self.state.items() if k != "instances"}
+
+            operations: List[TransactionalStateOperation] = []
+            local_writes: List[Tuple[str, str]] = []
+
+            top_level_data = json.dumps(top_level)
+            if top_level_data != self._saved_top_level_state:
+                operations.append(
+                    TransactionalStateOperation(key=self.state_key, data=top_level_data)
+                )
+                local_writes.append((f"{self.name}_state.json", top_level_data))
+
+            dirty = [i for i in self._dirty_instances if i in instances]
+            missing = self._dirty_instances.difference(dirty)
+            if missing:
+                # Entries of these instances are no longer held in memory, so there is nothing to write
+                logger.warning(
+                    f"Dropping dirty marks of {len(missing)} workflow instance(s) not in memory: {sorted(missing)}"
+                )
+                self._dirty_instances.difference_update(missing)
+            for instance_id in dirty:
+                instance_data = json.dumps(instances[instance_id])
+                operations.append(
+                    TransactionalStateOperation(
+                        key=self._get_instance_state_key(instance_id),
+                        data=instance_data,
+                    )
+                )
+                local_writes.append(
+                    (
+                        os.path.join(f"{self.name}_state", f"{instance_id}.json"),
+                        instance_data,
+                    )
+                )
+
+            if not operations:
+                logger.debug("Workflow state unchanged; nothing to save.")
+                self._evict_completed_instances(instances)
+                return
+
+            self._state_store_client.execute_state_transaction(
+                operations, transactional_metadata={"contentType": "application/json"}
+            )
+            self._saved_top_level_state = top_level_data
+            self._dirty_instances.difference_update(dirty)
+            logger.debug(
+                f"Saved {len(dirty)} workflow instance(s) for key '{self.state_key}'."
+            )
+
+            if self.save_state_locally:
+                for filename, data in local_writes:
+                    self.save_state_to_disk(
+                        state_data=data, filename=filename, merge=False
+                    )
+
+            self._evict_completed_instances(instances)
+
+    def _evict_completed_instances(self, instances: Dict[str, Any]) -> None:
+        """
+        Drops persisted completed instances from memory if `evict_completed_instances` is set,
+        including completed instances that were only read back from their shard. Evicted instances
+        are forgotten entirely and read back from their shard if a replay needs them. Callers hold
+        `_state_save_lock`.
+        """
+        if not self.evict_completed_instances:
+            return
+        for instance_id in [
+            i for i in self._completed_instances if i not in self._dirty_instances
+        ]:
+            instances.pop(instance_id, None)
+            self._completed_instances.discard(instance_id)
+
     def get_agents_metadata(
         self, exclude_self: bool = True, exclude_orchestrator: bool = False
     ) -> dict:
@@ -1,9 +1,13 @@
+import asyncio
 import json
 import logging
+import threading
+import warnings
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from dapr.ext.workflow import DaprWorkflowContext
 
@@ -41,13 +45,24 @@ class AssistantAgent(AgentWorkflowBase):
     and refining outputs through iterative feedback loops.
     """
 
-    tool_history: List[ToolMessage] = Field(
-        default_factory=list, description="Executed tool calls during the conversation."
-    )
     tool_choice: Optional[str] = Field(
         default=None,
         description="Strategy for selecting tools ('auto', 'required', 'none'). Defaults to 'auto' if tools are provided.",
     )
+    inline_tools: List[str] = Field(
+        default_factory=list,
+        description="Names of cheap tools executed inside the response activity instead of one activity per call. Their calls run again if that activity is retried, so they should be idempotent.",
+    )
+    max_cached_contexts: int = Field(
+        default=256,
+        ge=1,
+        description="Maximum number of workflow instances whose conversation and tool-call context is kept in memory. Evicted contexts are rebuilt from the workflow state.",
+    )
+
+    _contexts: "OrderedDict[str, Dict[str, List[Dict[str, Any]]]]" = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _contexts_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     def model_post_init(self, __context: Any) -> None:
         """Initializes the workflow with agentic execution capabilities."""
@@ -63,6 +78,27 @@ class AssistantAgent(AgentWorkflowBase):
 
         super().model_post_init(__context)
 
+    @property
+    def tool_history(self) -> List[Dict[str, Any]]:
+        """
+        Deprecated: tool calls and results of the turns in progress, across the workflow instances
+        whose context is held in memory. Kept for backward compatibility; use each instance's
+        `tool_history` in the workflow state instead.
+
+        Returns a copy, so changing it does not affect any instance.
+        """
+        warnings.warn(
+            "AssistantAgent.tool_history is deprecated; read each instance's `tool_history` from the workflow state instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        with self._contexts_lock:
+            return [
+                dict(message)
+                for context in self._contexts.values()
+                for message in context["tool_context"]
+            ]
+
     @message_router
     @workflow(name="ToolCallingWorkflow")
     def tool_calling_workflow(self, ctx: DaprWorkflowContext, message: TriggerAction):
@@ -79,84 +115,63 @@ class AssistantAgent(AgentWorkflowBase):
                 f"Workflow iteration {iteration + 1} started (Instance ID: {instance_id})."
             )
 
-        # Step 1: Initialize instance entry on first iteration
+        # Step 1: Describe the instance entry to create on the first iteration
+        default_entry = None
         if iteration == 0:
             metadata = message.get("_message_metadata", {})
 
-            # Ensure "instances" key exists
-            self.state.setdefault("instances", {})
-
             # Extract workflow metadata with proper defaults
             source = metadata.get("source") or None
             source_workflow_instance_id = message.get("workflow_instance_id") or None
 
             # Create a new workflow entry
-            workflow_entry = AssistantWorkflowEntry(
+            default_entry = AssistantWorkflowEntry(
                 input=task or "Triggered without input.",
                 source=source,
                 source_workflow_instance_id=source_workflow_instance_id,
-            )
-
-            # Store in state, converting to JSON only if necessary
-            self.state["instances"].setdefault(
-                instance_id, workflow_entry.model_dump(mode="json")
-            )
-
-            if not ctx.is_replaying:
-                logger.info(
-                    f"Initial message from {self.state['instances'][instance_id]['source']} -> {self.name}"
-                )
+                source_correlation_id=message.get("correlation_id"),
+            ).model_dump(mode="json")
 
-        # Step 2: Retrieve workflow entry for this instance
-        workflow_entry = self.state["instances"][instance_id]
+        # Step 2: Retrieve (or store) the workflow entry for this instance. State is read in an
+        # activity, as workflow code runs again on every replay
+        workflow_entry = yield ctx.call_activity(
+            self.load_workflow_entry,
+            input={"instance_id": instance_id, "default": default_entry},
+        )
         source = workflow_entry["source"]
         source_workflow_instance_id = workflow_entry["source_workflow_instance_id"]
 
-        # Step 3: Generate Response
-        response = yield ctx.call_activity(
-            self.generate_response, input={"instance_id": instance_id, "task": task}
-        )
-        response_message = yield ctx.call_activity(
-            self.get_response_message, input={"response": response}
-        )
+        if iteration == 0 and not ctx.is_replaying:
+            logger.info(f"Initial message from {source} -> {self.name}")
 
-        # Step 4: Extract Finish Reason
-        finish_reason = yield ctx.call_activity(
-            self.get_finish_reason, input={"response": response}
+        # Step 3: Generate Response (inline tools are executed within the same activity)
+        result = yield ctx.call_activity(
+            self.generate_response, input={"instance_id": instance_id, "task": task}
         )
+        response_message = result["message"]
+        finish_reason = result["finish_reason"]
 
-        # Step 5: Choose execution path based on LLM response
+        # Step 4: Choose execution path based on LLM response
         if finish_reason == "tool_calls":
-            if not ctx.is_replaying:
-                logger.info(
-                    "Tool calls detected in LLM response, extracting and preparing for execution.."
-                )
-
-            # Retrieve the list of tool calls extracted from the LLM response
-            tool_calls = yield ctx.call_activity(
-                self.get_tool_calls, input={"response": response}
-            )
+            tool_calls = result["tool_calls"] or []
 
-            # Execute tool calls in parallel
-            if not ctx.is_replaying:
-                logger.info(f"Executing {len(tool_calls)} tool call(s)..")
-
-            parallel_tasks = [
-                ctx.call_activity(
-                    self.execute_tool,
-                    input={"instance_id": instance_id, "tool_call": tool_call},
-                )
-                for tool_call in tool_calls
-            ]
-            yield self.when_all(parallel_tasks)
-        else:
-            if not ctx.is_replaying:
-                logger.info("Agent generating response without tool execution..")
+            # Execute the remaining tool calls in parallel
+            if tool_calls:
+                if not ctx.is_replaying:
+                    logger.info(f"Executing {len(tool_calls)} tool call(s)..")
 
-            # No Tool Calls → Clear tools
-            self.tool_history.clear()
+                parallel_tasks = [
+                    ctx.call_activity(
+                        self.execute_tool,
+                        input={"instance_id": instance_id, "tool_call": tool_call},
+                    )
+                    for tool_call in tool_calls
+                ]
+                yield self.when_all(parallel_tasks)
+        elif not ctx.is_replaying:
+            logger.info("Agent generating response without tool execution..")
 
-        # Step 6: Determine if Workflow Should Continue
+        # Step 5: Determine if Workflow Should Continue
         next_iteration_count = iteration + 1
         max_iterations_reached = next_iteration_count > self.max_iterations
 
@@ -169,30 +184,33 @@ class AssistantAgent(AgentWorkflowBase):
                         f"Workflow {instance_id} reached the max iteration limit ({self.max_iterations}) before finishing naturally."
                     )
 
-                # Modify the response message to indicate forced stop
-                response_message[
-                    "content"
-                ] += "\n\nThe workflow was terminated because it reached the maximum iteration limit. The task may not be fully complete."
+                # Modify the response message to indicate forced stop. Its content is None
+                # when the last response only requested tool calls
+                response_message["content"] = (
+                    (response_message.get("content") or "")
+                    + "\n\nThe workflow was terminated because it reached the maximum iteration limit. The task may not be fully complete."
+                )
 
             else:
                 verdict = "model hit a natural stop point."
 
-            # Step 8: Broadcasting Response to all agents if available
+            # Step 7: Broadcasting Response to all agents if available
             yield ctx.call_activity(
                 self.broadcast_message_to_agents, input={"message": response_message}
             )
 
-            # Step 9: Respond to source agent if available
+            # Step 8: Respond to source agent if available
             yield ctx.call_activity(
                 self.send_response_back,
                 input={
                     "response": response_message,
                     "target_agent": source,
                     "target_instance_id": source_workflow_instance_id,
+                    "correlation_id": workflow_entry.get("source_correlation_id"),
                 },
             )
 
-            # Step 10: Share Final Message
+            # Step 9: Share Final Message
             yield ctx.call_activity(
                 self.finish_workflow,
                 input={"instance_id": instance_id, "message": response_message},
@@ -205,16 +223,47 @@ class AssistantAgent(AgentWorkflowBase):
 
             return response_message
 
-        # Step 7: Continue Workflow Execution
+        # Step 6: Continue Workflow Execution
         message.update({"task": None, "iteration": next_iteration_count})
         ctx.continue_as_new(message)
 
+    @task
+    def load_workflow_entry(
+        self, instance_id: str, default: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Loads where the task of a workflow instance came from, registering the instance first if
+        it does not exist yet.
+
+        Args:
+            instance_id (str): The workflow instance ID.
+            default (Optional[Dict[str, Any]]): The entry to store if the instance is new.
+
+        Returns:
+            Dict[str, Any]: The instance's `source`, `source_workflow_instance_id` and
+                `source_correlation_id`.
+        """
+        workflow_entry = self.get_instance_state(instance_id, default=default)
+        if not workflow_entry:
+            raise ValueError(f"No workflow entry found for instance_id: {instance_id}")
+        return {
+            "source": workflow_entry.get("source"),
+            "source_workflow_instance_id": workflow_entry.get(
+                "source_workflow_instance_id"
+            ),
+            "source_correlation_id": workflow_entry.get("source_correlation_id"),
+        }
+
     @task
     async def generate_response(
         self, instance_id: str, task: Union[str, Dict[str, Any]] = None
-    ) -> ChatCompletion:
+    ) -> Dict[str, Any]:
         """
-        Generates a response using a language model based on the provided task input.
+        Generates a response using a language model based on the provided task input, and runs
+        the requested calls of tools listed in `inline_tools` right away.
+
+        Only the parts of the response the workflow needs are returned, which keeps the workflow
+        history small and saves one activity per lookup.
 
         Args:
             instance_id (str): The unique identifier of the workflow instance.
@@ -222,111 +271,168 @@ class AssistantAgent(AgentWorkflowBase):
                 used to generate the response. Defaults to None.
 
         Returns:
-            ChatCompletion: The generated AI response encapsulated in a ChatCompletion object.
+            Dict[str, Any]: A dictionary with:
+                - "message": The response message, without its tool calls.
+                - "finish_reason": The reason the model stopped generating tokens (e.g. "stop",
+                  "length", "tool_calls"), or None if the response has no choices.
+                - "tool_calls": The tool calls left for the workflow to execute, or None.
         """
-        # Contruct prompt messages
-        messages = self.construct_messages(task or {})
-
-        # Store message in workflow state and local memory
-        if task:
+        # Store message in workflow state and instance context
+        if isinstance(task, str) and task:
             task_message = {"role": "user", "content": task}
             await self.update_workflow_state(
                 instance_id=instance_id, message=task_message
             )
+        # Instance state and memory may be read from the Dapr sidecar, so keep them off the loop
+        context = await asyncio.to_thread(self.get_instance_context, instance_id)
+        chat_history = await asyncio.to_thread(self.get_chat_history)
+
+        # Contruct prompt messages from shared memory (broadcasts and finished conversations)
+        # followed by the messages of this instance
+        messages = self.construct_messages(
+            task if isinstance(task, dict) else {},
+            chat_history=chat_history + context["messages"],
+        )
 
         # Process conversation iterations
-        messages += self.tool_history
+        messages += context["tool_context"]
 
         # Generate Tool Calls
-        response: ChatCompletion = self.llm.generate(
-            messages=messages, tools=self.tools, tool_choice=self.tool_choice
+        response: ChatCompletion = await self.llm.agenerate(
+            messages=messages,
+            tools=self.tool_executor.get_formatted_tools(self.llm.provider),
+            tool_choice=self.tool_choice,
         )
 
-        # Return chat completion as a dictionary
-        return response.model_dump()
+        if not response.choices:
+            logger.warning("No choices found in LLM response.")
+            return {"message": {}, "finish_reason": None, "tool_calls": None}
 
-    @task
-    def get_response_message(self, response: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Extracts the response message from the first choice in the LLM response.
+        response_message = response.get_message()
+        finish_reason = response.get_reason()
+        tool_calls = response_message.get("tool_calls") or []
 
-        Args:
-            response (Dict[str, Any]): The response dictionary from the LLM, expected to contain a "choices" key.
+        if tool_calls:
+            # Save Tool Call Response Message
+            await self.update_workflow_state(
+                instance_id=instance_id, tool_call_message=response_message
+            )
 
-        Returns:
-            Dict[str, Any]: The extracted response message with the agent's name added.
-        """
-        choices = response.get("choices", [])
-        response_message = choices[0].get("message", {})
+            inline_calls = [
+                tool_call
+                for tool_call in tool_calls
+                if tool_call["function"]["name"] in self.inline_tools
+            ]
+            if inline_calls:
+                logger.info(f"Executing {len(inline_calls)} inline tool call(s)..")
+                await asyncio.gather(
+                    *(
+                        self._run_tool_call(instance_id, tool_call)
+                        for tool_call in inline_calls
+                    )
+                )
+                tool_calls = [
+                    tool_call
+                    for tool_call in tool_calls
+                    if tool_call not in inline_calls
+                ]
+        elif context["tool_context"]:
+            # No Tool Calls → Clear tools
+            await self.update_workflow_state(
+                instance_id=instance_id, clear_tool_context=True
+            )
 
-        return response_message
+        message = {
+            key: value
+            for key, value in response_message.items()
+            if key not in ("tool_calls", "function_call")
+        }
+        return {
+            "message": message,
+            "finish_reason": finish_reason,
+            "tool_calls": tool_calls or None,
+        }
 
     @task
-    def get_finish_reason(self, response: Dict[str, Any]) -> str:
+    async def execute_tool(self, instance_id: str, tool_call: Dict[str, Any]):
         """
-        Extracts the finish reason from the LLM response, indicating why generation stopped.
+        Executes a tool call by invoking the specified function with the provided arguments.
 
         Args:
-            response (Dict[str, Any]): The response dictionary from the LLM, expected to contain a "choices" key.
+            instance_id (str): The unique identifier of the workflow instance.
+            tool_call (Dict[str, Any]): A dictionary containing tool execution details, including the function name and arguments.
 
-        Returns:
-            str: The reason the model stopped generating tokens. Possible values include:
-                - "stop": Natural stop point or stop sequence encountered.
-                - "length": Maximum token limit reached.
-                - "content_filter": Content flagged by filters.
-                - "tool_calls": The model called a tool.
-                - "function_call" (deprecated): The model called a function.
-                - None: If no valid choice exists in the response.
+        Raises:
+            AgentError: If the tool call is malformed or execution fails.
         """
-        choices = response.get("choices", [])
+        await self._run_tool_call(instance_id, tool_call)
 
-        # Ensure there is at least one choice available
-        if not choices:
-            logger.warning("No choices found in LLM response.")
-            return None  # Explicit return to avoid returning 'None' implicitly
+    @task
+    async def broadcast_message_to_agents(self, message: Dict[str, Any]):
+        """
+        Broadcasts it to all registered agents.
 
-        # Extract finish reason safely
-        choice = choices[0].get("finish_reason", None)
+        Args:
+            message (Dict[str, Any]): A message to append to the workflow state and broadcast to all agents.
+        """
+        # Format message for broadcasting
+        message["role"] = "user"
+        message["name"] = self.name
+        response_message = BroadcastMessage(**message)
 
-        return choice
+        # Broadcast message to all agents
+        await self.broadcast_message(message=response_message)
 
     @task
-    def get_tool_calls(
-        self, response: Dict[str, Any]
-    ) -> Optional[List[Dict[str, Any]]]:
+    async def send_response_back(
+        self,
+        response: Dict[str, Any],
+        target_agent: str,
+        target_instance_id: str,
+        correlation_id: Optional[str] = None,
+    ):
         """
-        Extracts tool calls from the first choice in the LLM response, if available.
+        Sends a task response back to a target agent within a workflow.
 
         Args:
-            response (Dict[str, Any]): The response dictionary from the LLM, expected to contain "choices"
-                                    and potentially tool call information.
+            response (Dict[str, Any]): The response payload to be sent.
+            target_agent (str): The name of the agent that should receive the response.
+            target_instance_id (str): The workflow instance ID associated with the response.
+            correlation_id (Optional[str]): Correlation id of the trigger being answered, if any.
 
-        Returns:
-            Optional[List[Dict[str, Any]]]: A list of tool calls if present, otherwise None.
+        Raises:
+            ValidationError: If the response does not match the expected structure for `AgentTaskResponse`.
         """
-        choices = response.get("choices", [])
-
-        if not choices:
-            logger.warning("No choices found in LLM response.")
-            return None
+        # Format Response
+        response["role"] = "user"
+        response["name"] = self.name
+        response["workflow_instance_id"] = target_instance_id
+        response["correlation_id"] = correlation_id
+        agent_response = AgentTaskResponse(**response)
 
-        # Save Tool Call Response Message
-        response_message = choices[0].get("message", {})
-        self.tool_history.append(response_message)
+        # Send the message to the target agent
+        await self.send_message_to_agent(name=target_agent, message=agent_response)
 
-        # Extract tool calls safely
-        tool_calls = choices[0].get("message", {}).get("tool_calls")
+    @task
+    async def finish_workflow(self, instance_id: str, message: Dict[str, Any]):
+        """
+        Finalizes the workflow by storing the provided message as the final output.
 
-        if not tool_calls:
-            logger.info("No tool calls found in LLM response.")
-            return None
+        Args:
+            instance_id (str): The unique identifier of the workflow instance.
+            summary (Dict[str, Any]): The final summary to be stored in the workflow state.
+        """
+        # Store message in workflow state
+        await self.update_workflow_state(instance_id=instance_id, message=message)
 
-        return tool_calls
+        # Store final output
+        await self.update_workflow_state(
+            instance_id=instance_id, final_output=message["content"]
+        )
 
-    @task
-    async def execute_tool(self, instance_id: str, tool_call: Dict[str, Any]):
+    async def _run_tool_call(self, instance_id: str, tool_call: Dict[str, Any]):
         """
-        Executes a tool call by invoking the specified function with the provided arguments.
+        Runs one tool call and records its result in the workflow state and instance context.
 
         Args:
             instance_id (str): The unique identifier of the workflow instance.
@@ -374,122 +480,155 @@ class AssistantAgent(AgentWorkflowBase):
             logger.error(f"Error executing tool '{function_name}': {e}", exc_info=True)
             raise AgentError(f"Error executing tool '{function_name}': {e}") from e
 
-    @task
-    async def broadcast_message_to_agents(self, message: Dict[str, Any]):
+    def get_instance_context(self, instance_id: str) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Broadcasts it to all registered agents.
+        Returns the conversation and tool-call context of a workflow instance.
 
-        Args:
-            message (Dict[str, Any]): A message to append to the workflow state and broadcast to all agents.
-        """
-        # Format message for broadcasting
-        message["role"] = "user"
-        message["name"] = self.name
-        response_message = BroadcastMessage(**message)
-
-        # Broadcast message to all agents
-        await self.broadcast_message(message=response_message)
-
-    @task
-    async def send_response_back(
-        self, response: Dict[str, Any], target_agent: str, target_instance_id: str
-    ):
-        """
-        Sends a task response back to a target agent within a workflow.
-
-        Args:
-            response (Dict[str, Any]): The response payload to be sent.
-            target_agent (str): The name of the agent that should receive the response.
-            target_instance_id (str): The workflow instance ID associated with the response.
-
-        Raises:
-            ValidationError: If the response does not match the expected structure for `AgentTaskResponse`.
-        """
-        # Format Response
-        response["role"] = "user"
-        response["name"] = self.name
-        response["workflow_instance_id"] = target_instance_id
-        agent_response = AgentTaskResponse(**response)
-
-        # Send the message to the target agent
-        await self.send_message_to_agent(name=target_agent, message=agent_response)
-
-    @task
-    async def finish_workflow(self, instance_id: str, message: Dict[str, Any]):
-        """
-        Finalizes the workflow by storing the provided message as the final output.
+        Each instance keeps its own context, so concurrent workflow instances never see each
+        other's messages or tool calls. Contexts are held in an LRU of `max_cached_contexts`
+        entries; a context that is not cached is rebuilt from the instance's workflow state.
 
         Args:
             instance_id (str): The unique identifier of the workflow instance.
-            summary (Dict[str, Any]): The final summary to be stored in the workflow state.
-        """
-        # Store message in workflow state
-        await self.update_workflow_state(instance_id=instance_id, message=message)
 
-        # Store final output
-        await self.update_workflow_state(
-            instance_id=instance_id, final_output=message["content"]
-        )
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: A dictionary with:
+                - "messages": The user and assistant messages of the instance.
+                - "tool_context": The assistant tool-call messages and tool results of the turn in
+                  progress, sent to the LLM until it answers without calling tools.
+        """
+        with self._contexts_lock:
+            context = self._contexts.get(instance_id)
+            if context is not None:
+                self._contexts.move_to_end(instance_id)
+                return context
+
+        workflow_entry = self.get_instance_state(instance_id) or {}
+        context = {
+            "messages": [
+                {
+                    key: message[key]
+                    for key in ("role", "content", "name")
+                    if message.get(key) is not None
+                }
+                for message in workflow_entry.get("messages", [])
+            ],
+            "tool_context": list(workflow_entry.get("tool_context", [])),
+        }
+
+        with self._contexts_lock:
+            context = self._contexts.setdefault(instance_id, context)
+            self._contexts.move_to_end(instance_id)
+            while len(self._contexts) > self.max_cached_contexts:
+                self._contexts.popitem(last=False)
+        return context
 
     async def update_workflow_state(
         self,
         instance_id: str,
         message: Optional[Dict[str, Any]] = None,
+        tool_call_message: Optional[Dict[str, Any]] = None,
         tool_message: Optional[Dict[str, Any]] = None,
+        clear_tool_context: bool = False,
         final_output: Optional[str] = None,
     ):
         """
-        Updates the workflow state by appending a new message or setting the final output.
+        Updates the workflow state and the instance context by appending a new message or setting the final output.
+
+        Reading and persisting state and memory block on the Dapr sidecar, so the update runs in a
+        worker thread and leaves the activity loop free for other activities.
 
         Args:
             instance_id (str): The unique identifier of the workflow instance.
             message (Optional[Dict[str, Any]]): A dictionary representing a user/assistant message.
+            tool_call_message (Optional[Dict[str, Any]]): An assistant message requesting tool calls.
             tool_message (Optional[Dict[str, Any]]): A dictionary representing a tool execution message.
+            clear_tool_context (bool): Whether to drop the tool calls of the finished turn from the context.
             final_output (Optional[str]): The final output of the workflow, marking its completion.
 
         Raises:
             ValueError: If no workflow entry is found for the given instance_id.
         """
-        workflow_entry: AssistantWorkflowEntry = self.state["instances"].get(
-            instance_id
+        await asyncio.to_thread(
+            self._update_workflow_state,
+            instance_id,
+            message,
+            tool_call_message,
+            tool_message,
+            clear_tool_context,
+            final_output,
         )
+
+    def _update_workflow_state(
+        self,
+        instance_id: str,
+        message: Optional[Dict[str, Any]],
+        tool_call_message: Optional[Dict[str, Any]],
+        tool_message: Optional[Dict[str, Any]],
+        clear_tool_context: bool,
+        final_output: Optional[str],
+    ) -> None:
+        """Synchronous body of `update_workflow_state`."""
+        workflow_entry: AssistantWorkflowEntry = self.get_instance_state(instance_id)
         if not workflow_entry:
             raise ValueError(
                 f"No workflow entry found for instance_id {instance_id} in local state."
             )
+        context = self.get_instance_context(instance_id)
 
-        # Store user/assistant messages separately
-        if message is not None:
-            serialized_message = AssistantWorkflowMessage(**message).model_dump(
-                mode="json"
-            )
-            workflow_entry["messages"].append(serialized_message)
-            workflow_entry["last_message"] = serialized_message
-
-            # Add to memory only if it's a user/assistant message
-            self.memory.add_message(message)
+        # Entries are updated under the save lock, so a concurrent save never serializes them halfway
+        with self._state_save_lock:
+            tool_context = workflow_entry.setdefault("tool_context", [])
 
-        # Store tool execution messages separately in tool_history
-        if tool_message is not None:
-            serialized_tool_message = AssistantWorkflowToolMessage(
-                **tool_message
-            ).model_dump(mode="json")
-            workflow_entry["tool_history"].append(serialized_tool_message)
-
-            # Also update agent-level tool history (execution tracking)
-            agent_tool_message = ToolMessage(
-                tool_call_id=tool_message["tool_call_id"],
-                name=tool_message["function_name"],
-                content=tool_message["content"],
-            )
-            self.tool_history.append(agent_tool_message)
+            # Store user/assistant messages separately
+            if message is not None:
+                serialized_message = AssistantWorkflowMessage(**message).model_dump(
+                    mode="json"
+                )
+                workflow_entry["messages"].append(serialized_message)
+                workflow_entry["last_message"] = serialized_message
+                context["messages"].append(message)
+
+            # Store the tool calls requested by the LLM for the following iterations
+            if tool_call_message is not None:
+                tool_context.append(tool_call_message)
+                context["tool_context"].append(tool_call_message)
+
+            # Store tool execution messages separately in tool_history
+            if tool_message is not None:
+                serialized_tool_message = AssistantWorkflowToolMessage(
+                    **tool_message
+                ).model_dump(mode="json")
+                workflow_entry["tool_history"].append(serialized_tool_message)
+
+                # Also update the instance tool context sent back to the LLM
+                context_tool_message = ToolMessage(
+                    tool_call_id=tool_message["tool_call_id"],
+                    name=tool_message["function_name"],
+                    content=tool_message["content"],
+                ).model_dump()
+                tool_context.append(context_tool_message)
+                context["tool_context"].append(context_tool_message)
+
+            if clear_tool_context:
+                tool_context.clear()
+                context["tool_context"].clear()
+
+            # Store final output
+            if final_output is not None:
+                workflow_entry["output"] = final_output
+                workflow_entry["end_time"] = datetime.now().isoformat()
+                self.mark_instance_completed(instance_id)
 
-        # Store final output
         if final_output is not None:
-            workflow_entry["output"] = final_output
-            workflow_entry["end_time"] = datetime.now().isoformat()
+            # Share the finished conversation with later instances through memory
+            for context_message in context["messages"]:
+                self.memory.add_message(context_message)
+            with self._contexts_lock:
+                self._contexts.pop(instance_id, None)
 
         # Persist updated state
+        self.mark_instance_dirty(instance_id)
         self.save_state()
 
     @message_router(broadcast=True)
@@ -17,6 +17,10 @@ class AgentTaskResponse(BaseMessage):
     workflow_instance_id: Optional[str] = Field(
         default=None, description="Dapr workflow instance id from source if available"
     )
+    correlation_id: Optional[str] = Field(
+        default=None,
+        description="Correlation id of the TriggerAction this response answers, if it carried one.",
+    )
 
 
 class TriggerAction(BaseModel):
@@ -32,3 +36,7 @@ class TriggerAction(BaseModel):
     workflow_instance_id: Optional[str] = Field(
         default=None, description="Dapr workflow instance id from source if available"
     )
+    correlation_id: Optional[str] = Field(
+        default=None,
+        description="Identifies the orchestrator step this trigger starts. Echoed back in the agent's AgentTaskResponse.",
+    )
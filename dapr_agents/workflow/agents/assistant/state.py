@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
 from dapr_agents.types import ToolMessage
 from datetime import datetime
 import uuid
@@ -72,11 +72,19 @@ class AssistantWorkflowEntry(BaseModel):
     tool_history: List[AssistantWorkflowToolMessage] = Field(
         default_factory=list, description="Tool message exchanged during the workflow"
     )
+    tool_context: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="Assistant tool-call messages and tool results of the turn in progress, sent back to the LLM",
+    )
     source: Optional[str] = Field(None, description="Entity that initiated the task.")
     source_workflow_instance_id: Optional[str] = Field(
         None,
         description="The workflow instance ID associated with the original request.",
     )
+    source_correlation_id: Optional[str] = Field(
+        None,
+        description="Correlation id of the triggering request, echoed back in the response.",
+    )
 
 
 class AssistantWorkflowState(BaseModel):
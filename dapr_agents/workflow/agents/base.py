@@ -233,31 +233,41 @@ class AgentWorkflowBase(AgenticWorkflow):
         )
 
     def construct_messages(
-        self, input_data: Union[str, Dict[str, Any]]
+        self,
+        input_data: Union[str, Dict[str, Any]],
+        chat_history: Optional[List[Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Constructs and formats initial messages based on input type, pre-filling chat history as needed.
 
         Args:
             input_data (Union[str, Dict[str, Any]]): User input, either as a string or dictionary.
+            chat_history (Optional[List[Dict[str, Any]]]): Chat history to render for this call only.
+                If not provided, the agent's memory is pre-filled into the agent's prompt template.
 
         Returns:
             List[Dict[str, Any]]: List of formatted messages, including the user message if input_data is a string.
         """
-        # Pre-fill chat history in the prompt template
-        chat_history = self.get_chat_history()
-        self.pre_fill_prompt_template(**{"chat_history": chat_history})
+        if chat_history is None:
+            # Pre-fill chat history in the prompt template
+            self.pre_fill_prompt_template(**{"chat_history": self.get_chat_history()})
+            prompt_template = self.prompt_template
+        else:
+            # Leave the shared template untouched so concurrent calls do not see each other's history
+            prompt_template = self.prompt_template.pre_fill_variables(
+                chat_history=chat_history
+            )
 
         # Handle string input by adding a user message
         if isinstance(input_data, str):
-            formatted_messages = self.prompt_template.format_prompt()
+            formatted_messages = prompt_template.format_prompt()
             user_message = {"role": "user", "content": input_data}
             return formatted_messages + [user_message]
 
         # Handle dictionary input as dynamic variables for the template
         elif isinstance(input_data, dict):
             # Pass the dictionary directly, assuming it contains keys expected by the prompt template
-            formatted_messages = self.prompt_template.format_prompt(**input_data)
+            formatted_messages = prompt_template.format_prompt(**input_data)
             return formatted_messages
 
         else:
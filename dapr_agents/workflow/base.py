@@ -6,7 +6,7 @@ import logging
 import sys
 import time
 import uuid
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, TypeVar, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -28,7 +28,9 @@ from dapr.ext.workflow.workflow_state import WorkflowState
 
 from dapr_agents.llm.chat import ChatClientBase
 from dapr_agents.types.workflow import DaprWorkflowStatus
+from dapr_agents.workflow.activity import ActivityLoop, ActivityMetrics
 from dapr_agents.workflow.task import WorkflowTask
+from dapr_agents.workflow.tracker import CompletionMetrics, WorkflowCompletionTracker
 from dapr_agents.workflow.utils import get_decorated_methods
 
 logger = logging.getLogger(__name__)
@@ -48,6 +50,11 @@ class WorkflowApp(BaseModel):
         default=300,
         description="Default timeout duration in seconds for workflow tasks.",
     )
+    max_concurrent_activities: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of async activities running at once on the activity event loop. None disables the limit.",
+    )
 
     # Initialized in model_post_init
     wf_runtime: Optional[WorkflowRuntime] = Field(
@@ -62,6 +69,16 @@ class WorkflowApp(BaseModel):
     client: Optional[DaprClient] = Field(
         default=None, init=False, description="Dapr client instance."
     )
+    activity_loop: Optional[ActivityLoop] = Field(
+        default=None,
+        init=False,
+        description="Shared event loop that runs the coroutines of async activities.",
+    )
+    completion_tracker: Optional[WorkflowCompletionTracker] = Field(
+        default=None,
+        init=False,
+        description="Tracks workflow instances until they reach a terminal status.",
+    )
     tasks: Dict[str, Callable] = Field(
         default_factory=dict, init=False, description="Dictionary of registered tasks."
     )
@@ -82,6 +99,14 @@ class WorkflowApp(BaseModel):
         self.wf_runtime_is_running = False
         self.wf_client = DaprWorkflowClient()
         self.client = DaprClient()
+        self.activity_loop = ActivityLoop(
+            max_concurrency=self.max_concurrent_activities
+        )
+        self.completion_tracker = WorkflowCompletionTracker(
+            fetch_state=functools.partial(
+                self.wf_client.get_workflow_state, fetch_payloads=True
+            )
+        )
         logger.info("WorkflowApp initialized; discovering tasks and workflows.")
 
         # Discover and register tasks and workflows
@@ -156,24 +181,18 @@ class WorkflowApp(BaseModel):
     ) -> Callable:
         """Produce the function that Dapr will invoke for each activity."""
 
-        def run_sync(coro):
-            # Try to get the running event loop and run until complete
-            try:
-                loop = asyncio.get_running_loop()
-                return loop.run_until_complete(coro)
-            except RuntimeError:
-                # If no running loop, create one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                return loop.run_until_complete(coro)
-
         @functools.wraps(method)
         def wrapper(ctx: WorkflowActivityContext, *args, **kwargs):
             wf_ctx = WorkflowActivityContext(ctx)
             try:
+                if task_instance.is_sync:
+                    # Plain functions run on the Dapr worker thread, so they run in parallel
+                    # instead of taking turns on the shared loop
+                    return task_instance.run_sync(wf_ctx, *args, **kwargs)
                 call = task_instance(wf_ctx, *args, **kwargs)
                 if asyncio.iscoroutine(call):
-                    return run_sync(call)
+                    # Async activities share one long-lived loop, so clients bound to it are reused
+                    return self.activity_loop.run(call)
                 return call
             except Exception:
                 logger.exception(f"Task '{task_name}' failed")
@@ -200,13 +219,31 @@ class WorkflowApp(BaseModel):
             def make_wrapped(meth: Callable) -> Callable:
                 @functools.wraps(meth)
                 def wrapped(*args, **kwargs):
-                    return meth(*args, **kwargs)
+                    result = meth(*args, **kwargs)
+                    if inspect.isgenerator(result) and args:
+                        return self._notify_on_finish(args[0], result)
+                    return result
 
                 return wrapped
 
             decorator = self.wf_runtime.workflow(name=wf_name)
             self.workflows[wf_name] = decorator(make_wrapped(method))
 
+    def _notify_on_finish(self, ctx: Any, steps: Generator) -> Generator:
+        """
+        Runs a workflow generator and, once it returns or raises outside of a replay, asks the
+        completion tracker to check the instance right away.
+        """
+        try:
+            output = yield from steps
+        except Exception:
+            if not getattr(ctx, "is_replaying", True):
+                self.completion_tracker.notify(ctx.instance_id)
+            raise
+        if not getattr(ctx, "is_replaying", True):
+            self.completion_tracker.notify(ctx.instance_id)
+        return output
+
     def start_runtime(self):
         """Idempotently start the Dapr workflow runtime."""
         if not self.wf_runtime_is_running:
@@ -222,9 +259,21 @@ class WorkflowApp(BaseModel):
             logger.info("Stopping workflow runtime.")
             self.wf_runtime.shutdown()
             self.wf_runtime_is_running = False
+            self.activity_loop.close()
+            self.completion_tracker.close()
         else:
             logger.debug("Workflow runtime already stopped; skipping.")
 
+    @property
+    def activity_metrics(self) -> ActivityMetrics:
+        """Queue depth, wait time and outcome counters of the async activities run so far."""
+        return self.activity_loop.metrics
+
+    @property
+    def completion_metrics(self) -> CompletionMetrics:
+        """In-flight count, outcome counters and latency histogram of tracked workflow instances."""
+        return self.completion_tracker.metrics
+
     def register_agent(
         self, store_name: str, store_key: str, agent_name: str, agent_metadata: dict
     ) -> None:
@@ -413,11 +462,9 @@ class WorkflowApp(BaseModel):
             Optional[WorkflowState]: The final state of the workflow or None if not found.
         """
         try:
-            state: WorkflowState = await asyncio.to_thread(
-                self.wait_for_workflow_completion,
-                instance_id,
-                fetch_payloads=True,
-                timeout_in_seconds=self.timeout,
+            # One shared tracker follows all pending instances instead of a thread per instance
+            state: WorkflowState = await self.completion_tracker.wait(
+                instance_id, timeout=self.timeout
             )
 
             if not state:
@@ -3,7 +3,7 @@ import json
 from dataclasses import is_dataclass, asdict
 from typing import Optional, Any, Dict, Union
 from pydantic import BaseModel, Field
-from dapr.aio.clients import DaprClient
+from dapr_agents.storage.daprstores.pool import get_async_dapr_client_pool
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +60,7 @@ class DaprPubSub(BaseModel):
         try:
             json_message = await self.serialize_message(message)
 
-            async with DaprClient() as client:
+            async with get_async_dapr_client_pool().acquire() as client:
                 await client.publish_event(
                     pubsub_name=pubsub_name or self.message_bus_name,
                     topic_name=topic_name,
@@ -3,7 +3,8 @@ import inspect
 import logging
 import threading
 import functools
-from typing import Callable
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
 
 from dapr.aio.clients.grpc.subscription import Subscription
 from dapr.clients.grpc._response import TopicEventResponse
@@ -37,6 +38,8 @@ class MessageRoutingMixin:
     - `self.broadcast_topic_name`: Optional default topic name for broadcasts.
     - `self._topic_handlers`: Dict storing routing info by (pubsub, topic).
     - `self._subscriptions`: Dict storing unsubscribe functions for active subscriptions.
+    - `self.max_concurrent_messages`: Maximum number of messages handled at once per topic.
+    - `self.message_ordering_key`: Optional payload field; messages sharing its value are handled in order.
     """
 
     def register_message_routes(self) -> None:
@@ -135,27 +138,50 @@ class MessageRoutingMixin:
         return wrapped_method
 
     def _subscribe_with_router(self, pubsub_name: str, topic_name: str):
+        """
+        Subscribes to a topic and dispatches its messages concurrently on the service's event loop.
+
+        Up to `max_concurrent_messages` messages are in flight at once. When the limit is reached the
+        stream thread stops reading until a handler completes, applying backpressure to the sidecar.
+        Each message is acknowledged as soon as its own handler finishes.
+        """
         subscription: Subscription = self._dapr_client.subscribe(
             pubsub_name, topic_name
         )
         loop = asyncio.get_running_loop()
+        in_flight = threading.BoundedSemaphore(self.max_concurrent_messages)
+        ordering_locks: Dict[Any, List] = {}
+
+        def respond(sub: Subscription, message: SubscriptionMessage, future: Future):
+            try:
+                response = future.result()
+                if isinstance(response, tuple):
+                    response = response[0]
+                sub.respond(message, response.status)
+            except Exception as e:
+                logger.error(f"Error handling message: {e}")
+            finally:
+                in_flight.release()
 
         def stream_messages(sub: Subscription):
             while True:
                 try:
                     for message in sub:
                         if message:
+                            in_flight.acquire()
                             try:
                                 future = asyncio.run_coroutine_threadsafe(
-                                    self._route_message(
-                                        pubsub_name, topic_name, message
+                                    self._dispatch_message(
+                                        pubsub_name, topic_name, message, ordering_locks
                                     ),
                                     loop,
                                 )
-                                response = future.result()
-                                sub.respond(message, response.status)
+                                future.add_done_callback(
+                                    functools.partial(respond, sub, message)
+                                )
                             except Exception as e:
-                                print(f"Error handling message: {e}")
+                                in_flight.release()
+                                logger.error(f"Error dispatching message: {e}")
                         else:
                             continue
                 except (StreamInactiveError, StreamCancelledError):
@@ -169,6 +195,54 @@ class MessageRoutingMixin:
             target=stream_messages, args=(subscription,), daemon=True
         ).start()
 
+    def _get_ordering_key(self, message: SubscriptionMessage) -> Optional[Any]:
+        """
+        Returns the value of `message_ordering_key` in the message payload, if configured and present.
+        """
+        if not self.message_ordering_key:
+            return None
+        try:
+            data = message.data()
+        except Exception:
+            return None
+        if isinstance(data, dict):
+            return data.get(self.message_ordering_key)
+        return None
+
+    async def _dispatch_message(
+        self,
+        pubsub_name: str,
+        topic_name: str,
+        message: SubscriptionMessage,
+        ordering_locks: Dict[Any, List],
+    ) -> TopicEventResponse:
+        """
+        Routes a message, serializing it behind earlier messages that share the same ordering key.
+
+        Args:
+            pubsub_name (str): The name of the pubsub component.
+            topic_name (str): The topic from which the message was received.
+            message (SubscriptionMessage): The incoming Dapr message.
+            ordering_locks (Dict[Any, List]): Per-key `[lock, waiters]` entries for the topic.
+
+        Returns:
+            TopicEventResponse: The response status for the message (success, drop, retry).
+        """
+        key = self._get_ordering_key(message)
+        if key is None:
+            return await self._route_message(pubsub_name, topic_name, message)
+
+        # asyncio.Lock wakes waiters in FIFO order, preserving arrival order per key
+        entry = ordering_locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                return await self._route_message(pubsub_name, topic_name, message)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                ordering_locks.pop(key, None)
+
     async def _route_message(
         self, pubsub_name: str, topic_name: str, message: SubscriptionMessage
     ) -> TopicEventResponse:
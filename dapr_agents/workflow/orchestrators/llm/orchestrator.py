@@ -1,8 +1,10 @@
 import logging
+import asyncio
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 from dapr.ext.workflow import DaprWorkflowContext
+from pydantic import Field
 from dapr_agents.workflow.decorators import task, workflow
 from dapr_agents.workflow.messaging.decorator import message_router
 from dapr_agents.workflow.orchestrators.base import OrchestratorWorkflowBase
@@ -10,15 +12,20 @@ from dapr_agents.workflow.orchestrators.llm.schemas import (
     BroadcastMessage,
     TriggerAction,
     NextStep,
+    NextSteps,
     AgentTaskResponse,
     ProgressCheckOutput,
+    ProgressAndNextStep,
     schemas,
 )
 from dapr_agents.workflow.orchestrators.llm.prompts import (
     TASK_INITIAL_PROMPT,
     TASK_PLANNING_PROMPT,
     NEXT_STEP_PROMPT,
+    NEXT_STEPS_PROMPT,
     PROGRESS_CHECK_PROMPT,
+    BATCH_PROGRESS_CHECK_PROMPT,
+    PROGRESS_AND_NEXT_STEP_PROMPT,
     SUMMARY_GENERATION_PROMPT,
 )
 from dapr_agents.workflow.orchestrators.llm.state import (
@@ -43,8 +50,26 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
     The workflow iterates through conversations, updating its state and persisting messages.
 
     Uses the `continue_as_new` pattern to restart the workflow with updated input at each iteration.
+
+    With `max_parallel_steps` greater than 1, each iteration asks the LLM for a set of independent
+    steps, triggers their agents concurrently, collects their responses and checks progress once
+    for the whole batch.
+
+    With `fused_planning`, each iteration makes a single structured LLM call that checks the
+    progress of the previous step and selects the next one, instead of separate progress check and
+    next step calls.
     """
 
+    max_parallel_steps: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of independent plan steps run concurrently per iteration, each by a different agent. 1 runs one step at a time.",
+    )
+    fused_planning: bool = Field(
+        default=False,
+        description="Check progress and select the next step with one LLM call per iteration. Applies when max_parallel_steps is 1.",
+    )
+
     def model_post_init(self, __context: Any) -> None:
         """
         Initializes and configures the LLM-based workflow service.
@@ -81,13 +106,14 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
         iteration = message.get("iteration")
 
         # Step 1:
-        # Ensure 'instances' and the instance_id entry exist
+        # Ensure 'instances' and the instance_id entry exist. State is read in an activity, as
+        # workflow code runs again on every replay
         instance_id = ctx.instance_id
-        self.state.setdefault("instances", {}).setdefault(
-            instance_id, LLMWorkflowEntry(input=task).model_dump(mode="json")
+        workflow_entry = yield ctx.call_activity(
+            self.load_workflow_entry, input={"instance_id": instance_id, "task": task}
         )
         # Retrieve the plan (will always exist after initialization)
-        plan = self.state["instances"][instance_id].get("plan", [])
+        plan = workflow_entry["plan"]
 
         if not ctx.is_replaying:
             logger.info(
@@ -125,120 +151,90 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
                 input={"instance_id": instance_id, "task": initial_message},
             )
 
-        # Step 4: Identify agent and instruction for the next step
-        next_step = yield ctx.call_activity(
-            self.generate_next_step,
-            input={
-                "task": task,
-                "agents": agents,
-                "plan": plan,
-                "next_step_schema": schemas.next_step,
-            },
-        )
-
-        # Extract Additional Properties from NextStep
-        next_agent = next_step["next_agent"]
-        instruction = next_step["instruction"]
-        step_id = next_step.get("step", None)
-        substep_id = next_step.get("substep", None)
-
-        # Step 5: Validate Step Before Proceeding
-        valid_step = yield ctx.call_activity(
-            self.validate_next_step,
-            input={
-                "instance_id": instance_id,
-                "plan": plan,
-                "step": step_id,
-                "substep": substep_id,
-            },
-        )
-
-        if valid_step:
-            # Step 6: Broadcast Task to all Agents
-            yield ctx.call_activity(
-                self.broadcast_message_to_agents,
-                input={"instance_id": instance_id, "task": instruction},
+        if self.max_parallel_steps > 1:
+            # Steps 4-10, fanned out: run independent steps on several agents at once
+            (
+                plan,
+                next_agent,
+                steps,
+                task_results,
+                verdict,
+                status_updates,
+                plan_updates,
+            ) = yield from self._run_parallel_steps(
+                ctx, instance_id, task, agents, plan, iteration
             )
-
-            # Step 7: Trigger next agent
-            plan = yield ctx.call_activity(
-                self.trigger_agent,
-                input={
-                    "instance_id": instance_id,
-                    "name": next_agent,
-                    "step": step_id,
-                    "substep": substep_id,
-                },
+        elif self.fused_planning:
+            # Steps 4-10 with one LLM call that checks progress and picks the next step
+            (
+                plan,
+                next_agent,
+                steps,
+                task_results,
+                verdict,
+                status_updates,
+                plan_updates,
+            ) = yield from self._run_fused_iteration(
+                ctx,
+                instance_id,
+                workflow_entry.get("input") or task,
+                task,
+                agents,
+                plan,
+                iteration,
+                message.get("last_step"),
             )
-
-            # Step 8: Wait for agent response or timeout
-            if not ctx.is_replaying:
-                logger.info(f"Waiting for {next_agent}'s response...")
-
-            event_data = ctx.wait_for_external_event("AgentTaskResponse")
-            timeout_task = ctx.create_timer(timedelta(seconds=self.timeout))
-            any_results = yield self.when_any([event_data, timeout_task])
-
-            if any_results == timeout_task:
-                logger.warning(
-                    f"Agent response timed out (Iteration: {iteration + 1}, Instance ID: {instance_id})."
-                )
-                task_results = {
-                    "name": self.name,
-                    "role": "user",
-                    "content": f"Timeout occurred. {next_agent} did not respond on time. We need to try again...",
-                }
-            else:
-                task_results = yield event_data
-                if not ctx.is_replaying:
-                    logger.info(f"{task_results['name']} sent a response.")
-
-            # Step 9: Save the task execution results to chat and task history
-            yield ctx.call_activity(
-                self.update_task_history,
-                input={
-                    "instance_id": instance_id,
-                    "agent": next_agent,
-                    "step": step_id,
-                    "substep": substep_id,
-                    "results": task_results,
-                },
-            )
-
-            # Step 10: Check progress
-            progress = yield ctx.call_activity(
-                self.check_progress,
+        else:
+            # Step 4: Identify agent and instruction for the next step
+            next_step = yield ctx.call_activity(
+                self.generate_next_step,
                 input={
                     "task": task,
+                    "agents": agents,
                     "plan": plan,
-                    "step": step_id,
-                    "substep": substep_id,
-                    "results": task_results["content"],
-                    "progress_check_schema": schemas.progress_check,
+                    "next_step_schema": schemas.next_step,
                 },
             )
 
-            if not ctx.is_replaying:
-                logger.info(f"Tracking Progress: {progress}")
+            # Extract Additional Properties from NextStep
+            next_agent = next_step["next_agent"]
+            step_id = next_step.get("step", None)
+            substep_id = next_step.get("substep", None)
+            steps = []
 
-            verdict = progress["verdict"]
-            status_updates = progress.get("plan_status_update", [])
-            plan_updates = progress.get("plan_restructure", [])
-
-        else:
-            logger.warning(
-                f"Step {step_id}, Substep {substep_id} not found in plan for instance {instance_id}. Recovering..."
+            # Steps 5-9: Validate, trigger the agent and record its response
+            plan, task_results, valid_step = yield from self._run_step(
+                ctx, instance_id, plan, next_step, iteration
             )
 
-            # Recovery Task: No updates, just iterate again
-            verdict = "continue"
-            status_updates = []
-            plan_updates = []
-            task_results = {
-                "name": "orchestrator",
-                "role": "user",
-                "content": f"Step {step_id}, Substep {substep_id} does not exist in the plan. Adjusting workflow...",
-            }
+            if valid_step:
+                steps = [{"step": step_id, "substep": substep_id}]
+
+                # Step 10: Check progress
+                progress = yield ctx.call_activity(
+                    self.check_progress,
+                    input={
+                        "task": task,
+                        "plan": plan,
+                        "step": step_id,
+                        "substep": substep_id,
+                        "results": task_results["content"],
+                        "progress_check_schema": schemas.progress_check,
+                    },
+                )
+
+                if not ctx.is_replaying:
+                    logger.info(f"Tracking Progress: {progress}")
+
+                verdict = progress["verdict"]
+                status_updates = progress.get("plan_status_update", [])
+                plan_updates = progress.get("plan_restructure", [])
+
+            else:
+                # Recovery Task: No updates, just iterate again
+                verdict = "continue"
+                status_updates = []
+                plan_updates = []
 
         # Step 11: Process progress suggestions and next iteration count
         next_iteration_count = iteration + 1
@@ -256,8 +252,7 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
                     "task": task,
                     "verdict": verdict,
                     "plan": plan,
-                    "step": step_id,
-                    "substep": substep_id,
+                    "steps": steps,
                     "agent": next_agent,
                     "result": task_results["content"],
                 },
@@ -269,8 +264,7 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
                 input={
                     "instance_id": instance_id,
                     "plan": plan,
-                    "step": step_id,
-                    "substep": substep_id,
+                    "steps": steps,
                     "verdict": verdict,
                     "summary": summary,
                 },
@@ -297,10 +291,408 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
         # Step 12: Update TriggerAction state and continue workflow
         message["task"] = task_results["content"]
         message["iteration"] = next_iteration_count
+        if self.fused_planning:
+            # The next iteration assesses this step's result in its single LLM call. After a
+            # recovery no step ran, so the next iteration plans again from scratch
+            message["last_step"] = {"agent": next_agent, **steps[0]} if steps else None
 
         # Restart workflow with updated TriggerAction state
         ctx.continue_as_new(message)
 
+    def _run_step(
+        self,
+        ctx: DaprWorkflowContext,
+        instance_id: str,
+        plan: List[Dict[str, Any]],
+        next_step: Dict[str, Any],
+        iteration: int,
+    ) -> Generator[Any, Any, Tuple]:
+        """
+        Validates a step, triggers its agent, waits for the response (or the timeout) and records it.
+
+        Returns:
+            Tuple: The updated plan, the task results, and whether the step exists in the plan.
+        """
+        next_agent = next_step["next_agent"]
+        instruction = next_step["instruction"]
+        step_id = next_step.get("step", None)
+        substep_id = next_step.get("substep", None)
+
+        # Step 5: Validate Step Before Proceeding
+        valid_step = yield ctx.call_activity(
+            self.validate_next_step,
+            input={
+                "instance_id": instance_id,
+                "plan": plan,
+                "step": step_id,
+                "substep": substep_id,
+            },
+        )
+
+        if not valid_step:
+            logger.warning(
+                f"Step {step_id}, Substep {substep_id} not found in plan for instance {instance_id}. Recovering..."
+            )
+            task_results = {
+                "name": "orchestrator",
+                "role": "user",
+                "content": f"Step {step_id}, Substep {substep_id} does not exist in the plan. Adjusting workflow...",
+            }
+            return plan, task_results, False
+
+        # Step 6: Broadcast Task to all Agents
+        yield ctx.call_activity(
+            self.broadcast_message_to_agents,
+            input={"instance_id": instance_id, "task": instruction},
+        )
+
+        # Step 7: Trigger next agent
+        plan = yield ctx.call_activity(
+            self.trigger_agent,
+            input={
+                "instance_id": instance_id,
+                "name": next_agent,
+                "step": step_id,
+                "substep": substep_id,
+            },
+        )
+
+        # Step 8: Wait for agent response or timeout
+        if not ctx.is_replaying:
+            logger.info(f"Waiting for {next_agent}'s response...")
+
+        event_data = ctx.wait_for_external_event("AgentTaskResponse")
+        timeout_task = ctx.create_timer(timedelta(seconds=self.timeout))
+        any_results = yield self.when_any([event_data, timeout_task])
+
+        if any_results == timeout_task:
+            logger.warning(
+                f"Agent response timed out (Iteration: {iteration + 1}, Instance ID: {instance_id})."
+            )
+            task_results = {
+                "name": self.name,
+                "role": "user",
+                "content": f"Timeout occurred. {next_agent} did not respond on time. We need to try again...",
+            }
+        else:
+            task_results = yield event_data
+            if not ctx.is_replaying:
+                logger.info(f"{task_results['name']} sent a response.")
+
+        # Step 9: Save the task execution results to chat and task history
+        yield ctx.call_activity(
+            self.update_task_history,
+            input={
+                "instance_id": instance_id,
+                "agent": next_agent,
+                "step": step_id,
+                "substep": substep_id,
+                "results": task_results,
+            },
+        )
+
+        return plan, task_results, True
+
+    def _run_fused_iteration(
+        self,
+        ctx: DaprWorkflowContext,
+        instance_id: str,
+        task: str,
+        last_results: str,
+        agents: str,
+        plan: List[Dict[str, Any]],
+        iteration: int,
+        last_step: Optional[Dict[str, Any]],
+    ) -> Generator[Any, Any, Tuple]:
+        """
+        Runs one iteration in fused planning mode. A single LLM call assesses the previous step's
+        results and chooses the next step; the next step's own results are assessed by the
+        following iteration.
+
+        Returns:
+            Tuple: The same values as `_run_parallel_steps`.
+        """
+        if last_step is None:
+            # Step 4: Nothing to assess yet, only pick the first step
+            next_step = yield ctx.call_activity(
+                self.generate_next_step,
+                input={
+                    "task": task,
+                    "agents": agents,
+                    "plan": plan,
+                    "next_step_schema": schemas.next_step,
+                },
+            )
+        else:
+            # Step 4: Check progress of the last step and pick the next one in one call
+            decision = yield ctx.call_activity(
+                self.check_progress_and_next_step,
+                input={
+                    "task": task,
+                    "agents": agents,
+                    "plan": plan,
+                    "step": last_step["step"],
+                    "substep": last_step["substep"],
+                    "results": last_results,
+                    "progress_and_next_step_schema": schemas.progress_and_next_step,
+                },
+            )
+
+            if not ctx.is_replaying:
+                logger.info(f"Tracking Progress: {decision}")
+
+            verdict = decision["verdict"]
+            status_updates = decision.get("plan_status_update") or []
+            plan_updates = decision.get("plan_restructure") or []
+            last_results = {"name": self.name, "role": "user", "content": last_results}
+
+            if verdict != "continue":
+                return (
+                    plan,
+                    last_step["agent"],
+                    [{"step": last_step["step"], "substep": last_step["substep"]}],
+                    last_results,
+                    verdict,
+                    status_updates,
+                    plan_updates,
+                )
+
+            if status_updates or plan_updates:
+                plan = yield ctx.call_activity(
+                    self.update_plan,
+                    input={
+                        "instance_id": instance_id,
+                        "plan": plan,
+                        "status_updates": status_updates,
+                        "plan_updates": plan_updates,
+                    },
+                )
+
+            next_step = decision.get("next_step")
+            if not next_step:
+                logger.warning(
+                    f"No next step provided for instance {instance_id}. Recovering..."
+                )
+                task_results = {
+                    "name": "orchestrator",
+                    "role": "user",
+                    "content": "The verdict was 'continue' but no next step was selected. Adjusting workflow...",
+                }
+                return plan, None, [], task_results, "continue", [], []
+
+        # Steps 5-9: Validate, trigger the agent and record its response
+        plan, task_results, valid_step = yield from self._run_step(
+            ctx, instance_id, plan, next_step, iteration
+        )
+        steps = (
+            [{"step": next_step.get("step"), "substep": next_step.get("substep")}]
+            if valid_step
+            else []
+        )
+        return (
+            plan,
+            next_step["next_agent"],
+            steps,
+            task_results,
+            "continue",
+            [],
+            [],
+        )
+
+    def _run_parallel_steps(
+        self,
+        ctx: DaprWorkflowContext,
+        instance_id: str,
+        task: str,
+        agents: str,
+        plan: List[Dict[str, Any]],
+        iteration: int,
+    ) -> Generator[Any, Any, Tuple]:
+        """
+        Runs one fan-out iteration: selects independent steps, triggers their agents concurrently,
+        waits for each step's response (or its timeout) and checks progress once for the batch.
+
+        Returns:
+            Tuple: The updated plan, the agents, the steps (each a dict with `step` and `substep`)
+                that ran, the combined task results, the verdict, and the status and plan updates.
+                No steps are returned when the iteration only recovers from an invalid selection.
+        """
+        # Step 4: Identify a set of independent steps and their agents
+        next_steps = yield ctx.call_activity(
+            self.generate_next_steps,
+            input={
+                "task": task,
+                "agents": agents,
+                "plan": plan,
+                "max_steps": self.max_parallel_steps,
+                "next_steps_schema": schemas.next_steps,
+            },
+        )
+
+        # Step 5: Keep the steps that exist in the plan, one per agent
+        steps = yield ctx.call_activity(
+            self.select_parallel_steps,
+            input={
+                "instance_id": instance_id,
+                "plan": plan,
+                "steps": next_steps.get("steps", []),
+            },
+        )
+
+        if not steps:
+            logger.warning(
+                f"No valid steps selected for instance {instance_id}. Recovering..."
+            )
+            task_results = {
+                "name": "orchestrator",
+                "role": "user",
+                "content": "None of the selected steps exist in the plan. Adjusting workflow...",
+            }
+            return plan, None, [], task_results, "continue", [], []
+
+        # Step 6: Broadcast every instruction to all agents
+        yield self.when_all(
+            [
+                ctx.call_activity(
+                    self.broadcast_message_to_agents,
+                    input={"instance_id": instance_id, "task": step["instruction"]},
+                )
+                for step in steps
+            ]
+        )
+
+        # Step 7: Trigger all selected agents at once. Each step gets a deterministic correlation
+        # id that its agent echoes back, so late responses of earlier iterations are told apart
+        for step in steps:
+            step[
+                "correlation_id"
+            ] = f"{instance_id}:{iteration}:{step['step']}:{step.get('substep')}"
+        plan = yield ctx.call_activity(
+            self.trigger_agents, input={"instance_id": instance_id, "steps": steps}
+        )
+
+        # Step 8: Collect one response per step; every agent has its own timeout
+        pending = {step["correlation_id"]: step for step in steps}
+        if not ctx.is_replaying:
+            logger.info(
+                f"Waiting for responses from {[step['next_agent'] for step in steps]}..."
+            )
+        responses: Dict[str, Dict[str, Any]] = {}
+        timers = {
+            correlation_id: ctx.create_timer(timedelta(seconds=self.timeout))
+            for correlation_id in pending
+        }
+        event_data = ctx.wait_for_external_event("AgentTaskResponse")
+        while pending:
+            any_results = yield self.when_any(
+                [event_data, *(timers[correlation_id] for correlation_id in pending)]
+            )
+            if any_results != event_data:
+                correlation_id = next(
+                    cid for cid in pending if timers[cid] == any_results
+                )
+                step = pending.pop(correlation_id)
+                if not ctx.is_replaying:
+                    logger.warning(
+                        f"Agent {step['next_agent']} did not respond in time to step {step['step']}, substep {step.get('substep')} (Iteration: {iteration + 1}, Instance ID: {instance_id})."
+                    )
+                continue
+            response = yield event_data
+            event_data = ctx.wait_for_external_event("AgentTaskResponse")
+
+            name = response.get("name")
+            correlation_id = response.get("correlation_id")
+            if correlation_id is None:
+                # Agents that do not echo correlation ids are matched by name
+                correlation_id = next(
+                    (
+                        cid
+                        for cid, step in pending.items()
+                        if step["next_agent"] == name
+                    ),
+                    None,
+                )
+            if correlation_id not in pending:
+                if not ctx.is_replaying:
+                    logger.warning(
+                        f"Ignoring unexpected or late response from {name} ({correlation_id})."
+                    )
+                continue
+            del pending[correlation_id]
+            responses[correlation_id] = response
+            if not ctx.is_replaying:
+                logger.info(f"{name} sent a response.")
+
+        # Step 9: Save every result (or timeout) to chat and task history
+        batch_results = []
+        for step in steps:
+            agent = step["next_agent"]
+            results = responses.get(step["correlation_id"]) or {
+                "name": self.name,
+                "role": "user",
+                "content": f"Timeout occurred. {agent} did not respond on time. We need to try again...",
+            }
+            yield ctx.call_activity(
+                self.update_task_history,
+                input={
+                    "instance_id": instance_id,
+                    "agent": agent,
+                    "step": step["step"],
+                    "substep": step.get("substep"),
+                    "results": results,
+                },
+            )
+            batch_results.append(
+                f"- Step {step['step']}, Substep {step.get('substep')} ({agent}): {results['content']}"
+            )
+
+        # Step 10: Check progress once for the whole batch
+        combined = "\n".join(batch_results)
+        progress = yield ctx.call_activity(
+            self.check_batch_progress,
+            input={
+                "task": task,
+                "plan": plan,
+                "results": combined,
+                "progress_check_schema": schemas.progress_check,
+            },
+        )
+
+        if not ctx.is_replaying:
+            logger.info(f"Tracking Progress: {progress}")
+
+        task_results = {"name": self.name, "role": "user", "content": combined}
+        return (
+            plan,
+            ", ".join(step["next_agent"] for step in steps),
+            [{"step": step["step"], "substep": step.get("substep")} for step in steps],
+            task_results,
+            progress["verdict"],
+            progress.get("plan_status_update", []),
+            progress.get("plan_restructure", []),
+        )
+
+    @task
+    def load_workflow_entry(self, instance_id: str, task: str) -> Dict[str, Any]:
+        """
+        Loads the original input and the plan of a workflow instance, registering the instance
+        with `task` as its input if it does not exist yet.
+
+        Args:
+            instance_id (str): The workflow instance ID.
+            task (str): The task of the current iteration.
+
+        Returns:
+            Dict[str, Any]: The instance's `input` and `plan`.
+        """
+        workflow_entry = self.get_instance_state(
+            instance_id, default=LLMWorkflowEntry(input=task).model_dump(mode="json")
+        )
+        return {
+            "input": workflow_entry.get("input"),
+            "plan": workflow_entry.get("plan", []),
+        }
+
     @task
     def get_agents_metadata_as_string(self) -> str:
         """
@@ -407,6 +799,25 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
         """
         pass
 
+    @task(description=NEXT_STEPS_PROMPT, include_chat_history=True)
+    async def generate_next_steps(
+        self, task: str, agents: str, plan: str, max_steps: int, next_steps_schema: str
+    ) -> NextSteps:
+        """
+        Determines a set of independent steps that different agents can work on concurrently.
+
+        Args:
+            task (str): The current task description.
+            agents (str): A list of available agents.
+            plan (str): The structured execution plan.
+            max_steps (int): The maximum number of steps to select.
+            next_steps_schema (str): The next steps schema.
+
+        Returns:
+            Dict: A structured response with the selected steps, each with an agent, an instruction and step ids.
+        """
+        pass
+
     @task
     async def validate_next_step(
         self,
@@ -435,6 +846,46 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
             return False
         return True
 
+    @task
+    async def select_parallel_steps(
+        self,
+        instance_id: str,
+        plan: List[Dict[str, Any]],
+        steps: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Filters a set of proposed steps down to those that can run concurrently: each must exist in
+        the plan and not be completed, and each agent and step may appear only once.
+
+        Args:
+            instance_id (str): The workflow instance ID.
+            plan (List[Dict[str, Any]]): The current execution plan.
+            steps (List[Dict[str, Any]]): The proposed steps.
+
+        Returns:
+            List[Dict[str, Any]]: At most `max_parallel_steps` valid steps.
+        """
+        selected, agents, step_ids = [], set(), set()
+        for step in steps:
+            step_id, substep_id = step.get("step"), step.get("substep")
+            step_entry = find_step_in_plan(plan, step_id, substep_id)
+            if not step_entry or step_entry.get("status") == "completed":
+                logger.warning(
+                    f"Skipping step {step_id}, substep {substep_id}: not found or already completed (instance {instance_id})."
+                )
+                continue
+            if step["next_agent"] in agents or (step_id, substep_id) in step_ids:
+                logger.warning(
+                    f"Skipping step {step_id}, substep {substep_id}: agent or step already selected (instance {instance_id})."
+                )
+                continue
+            agents.add(step["next_agent"])
+            step_ids.add((step_id, substep_id))
+            selected.append(step)
+            if len(selected) == self.max_parallel_steps:
+                break
+        return selected
+
     @task
     async def trigger_agent(
         self, instance_id: str, name: str, step: int, substep: Optional[float]
@@ -456,7 +907,7 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
         )
 
         # Get the workflow entry from self.state
-        workflow_entry = self.state["instances"].get(instance_id)
+        workflow_entry = await asyncio.to_thread(self.get_instance_state, instance_id)
         if not workflow_entry:
             raise ValueError(f"No workflow entry found for instance_id: {instance_id}")
 
@@ -488,6 +939,55 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
 
         return updated_plan
 
+    @task
+    async def trigger_agents(
+        self, instance_id: str, steps: List[Dict[str, Any]]
+    ) -> List[dict[str, Any]]:
+        """
+        Marks several steps as in progress with a single plan update and triggers their agents concurrently.
+
+        Args:
+            instance_id (str): Workflow instance ID for context.
+            steps (List[Dict[str, Any]]): The steps to start, each with `next_agent`, `step`, `substep`
+                and the `correlation_id` its agent echoes back.
+
+        Returns:
+            List[Dict[str, Any]]: The updated execution plan.
+        """
+        workflow_entry = await asyncio.to_thread(self.get_instance_state, instance_id)
+        if not workflow_entry:
+            raise ValueError(f"No workflow entry found for instance_id: {instance_id}")
+
+        plan = workflow_entry["plan"]
+        for step in steps:
+            step_entry = find_step_in_plan(plan, step["step"], step.get("substep"))
+            if not step_entry:
+                raise ValueError(
+                    f"Step {step['step']}, Substep {step.get('substep')} not found in the current plan."
+                )
+            step_entry["status"] = "in_progress"
+
+        updated_plan = update_step_statuses(plan)
+        await self.update_workflow_state(instance_id=instance_id, plan=updated_plan)
+
+        logger.info(
+            f"Triggering agents {[step['next_agent'] for step in steps]} (Instance ID: {instance_id})"
+        )
+        await asyncio.gather(
+            *(
+                self.send_message_to_agent(
+                    name=step["next_agent"],
+                    message=TriggerAction(
+                        workflow_instance_id=instance_id,
+                        correlation_id=step.get("correlation_id"),
+                    ),
+                )
+                for step in steps
+            )
+        )
+
+        return updated_plan
+
     @task
     async def update_task_history(
         self,
@@ -519,7 +1019,7 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
         await self.update_workflow_state(instance_id=instance_id, message=results)
 
         # Retrieve Workflow state
-        workflow_entry = self.state["instances"].get(instance_id)
+        workflow_entry = await asyncio.to_thread(self.get_instance_state, instance_id)
         if not workflow_entry:
             raise ValueError(f"No workflow entry found for instance_id: {instance_id}")
 
@@ -562,6 +1062,56 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
         """
         pass
 
+    @task(description=BATCH_PROGRESS_CHECK_PROMPT, include_chat_history=True)
+    async def check_batch_progress(
+        self,
+        task: str,
+        plan: str,
+        results: str,
+        progress_check_schema: str,
+    ) -> ProgressCheckOutput:
+        """
+        Evaluates the plan's progress after several steps ran concurrently.
+
+        Args:
+            task (str): The current task description.
+            plan (str): The structured execution plan.
+            results (str): The results of each step, one per line with its step, substep and agent.
+            progress_check_schema (str): The schema of the progress check
+
+        Returns:
+            ProgressCheckOutput: The plan update details, including status changes and restructuring if needed.
+        """
+        pass
+
+    @task(description=PROGRESS_AND_NEXT_STEP_PROMPT, include_chat_history=True)
+    async def check_progress_and_next_step(
+        self,
+        task: str,
+        agents: str,
+        plan: str,
+        step: int,
+        substep: Optional[float],
+        results: str,
+        progress_and_next_step_schema: str,
+    ) -> ProgressAndNextStep:
+        """
+        Evaluates the results of the last step and selects the next step in a single call.
+
+        Args:
+            task (str): The original task description.
+            agents (str): A list of available agents.
+            plan (str): The structured execution plan.
+            step (int): The step number of the last task.
+            substep (Optional[float]): The substep number of the last task, if applicable.
+            results (str): The result or response generated by the agent.
+            progress_and_next_step_schema (str): The schema of the combined output.
+
+        Returns:
+            ProgressAndNextStep: The verdict, plan updates and, if the task continues, the next step.
+        """
+        pass
+
     @task
     async def update_plan(
         self,
@@ -579,6 +1129,9 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
             status_updates (Optional[List[Dict[str, Any]]]): List of updates for step statuses.
             plan_updates (Optional[List[Dict[str, Any]]]): List of full step modifications.
 
+        Returns:
+            List[Dict[str, Any]]: The updated execution plan.
+
         Raises:
             ValueError: If a specified step or substep is not found.
         """
@@ -616,14 +1169,15 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
 
         logger.info(f"Plan successfully updated for instance {instance_id}")
 
+        return plan
+
     @task(description=SUMMARY_GENERATION_PROMPT, include_chat_history=True)
     async def generate_summary(
         self,
         task: str,
         verdict: str,
         plan: str,
-        step: int,
-        substep: Optional[float],
+        steps: List[Dict[str, Any]],
         agent: str,
         result: str,
     ) -> str:
@@ -634,9 +1188,8 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
             task (str): The original task description.
             verdict (str): The overall task status (e.g., "continue", "completed", or "failed").
             plan (str): The structured execution plan detailing task progress.
-            step (int): The step number associated with the most recent action.
-            substep (Optional[float]): The substep number, if applicable.
-            agent (str): The name of the agent who executed the last action.
+            steps (List[Dict[str, Any]]): The steps (`step` and `substep`) of the most recent action.
+            agent (str): The name of the agent (or agents) who executed the last action.
             result (str): The response or outcome generated by the agent.
 
         Returns:
@@ -649,20 +1202,19 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
         self,
         instance_id: str,
         plan: List[Dict[str, Any]],
-        step: int,
-        substep: Optional[float],
+        steps: List[Dict[str, Any]],
         verdict: str,
         summary: str,
     ):
         """
-        Finalizes the workflow by updating the plan, marking the provided step/substep as completed if applicable,
+        Finalizes the workflow by updating the plan, marking the provided steps/substeps as completed if applicable,
         and storing the summary and verdict.
 
         Args:
             instance_id (str): The workflow instance ID.
             plan (List[Dict[str, Any]]): The current execution plan.
-            step (int): The step that was last worked on.
-            substep (Optional[float]): The substep that was last worked on (if applicable).
+            steps (List[Dict[str, Any]]): The steps (`step` and `substep`) that were last worked on.
+                Several steps run at once when `max_parallel_steps` is greater than 1.
             verdict (str): The final workflow verdict (`completed`, `failed`, or `max_iterations_reached`).
             summary (str): The generated summary of the workflow execution.
 
@@ -672,34 +1224,38 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
         status_updates = []
 
         if verdict == "completed":
-            # Find and validate the step or substep
-            step_entry = find_step_in_plan(plan, step, substep)
-            if not step_entry:
-                raise ValueError(
-                    f"Step {step}, Substep {substep} not found in the current plan. Cannot mark as completed."
-                )
+            for entry in steps:
+                step, substep = entry["step"], entry.get("substep")
 
-            # Mark the step or substep as completed
-            step_entry["status"] = "completed"
-            status_updates.append(
-                {"step": step, "substep": substep, "status": "completed"}
-            )
-
-            # If it's a substep, check if all sibling substeps are completed
-            parent_step = find_step_in_plan(
-                plan, step
-            )  # Retrieve parent without `substep`
-            if parent_step:
-                # Ensure "substeps" is a valid list before iteration
-                if not isinstance(parent_step.get("substeps"), list):
-                    parent_step["substeps"] = []
-
-                all_substeps_completed = all(
-                    ss.get("status") == "completed" for ss in parent_step["substeps"]
+                # Find and validate the step or substep
+                step_entry = find_step_in_plan(plan, step, substep)
+                if not step_entry:
+                    raise ValueError(
+                        f"Step {step}, Substep {substep} not found in the current plan. Cannot mark as completed."
+                    )
+
+                # Mark the step or substep as completed
+                step_entry["status"] = "completed"
+                status_updates.append(
+                    {"step": step, "substep": substep, "status": "completed"}
                 )
-                if all_substeps_completed:
-                    parent_step["status"] = "completed"
-                    status_updates.append({"step": step, "status": "completed"})
+
+                # If it's a substep, check if all sibling substeps are completed
+                parent_step = find_step_in_plan(
+                    plan, step
+                )  # Retrieve parent without `substep`
+                if parent_step:
+                    # Ensure "substeps" is a valid list before iteration
+                    if not isinstance(parent_step.get("substeps"), list):
+                        parent_step["substeps"] = []
+
+                    all_substeps_completed = all(
+                        ss.get("status") == "completed"
+                        for ss in parent_step["substeps"]
+                    )
+                    if all_substeps_completed:
+                        parent_step["status"] = "completed"
+                        status_updates.append({"step": step, "status": "completed"})
 
         # Apply updates in one call
         if status_updates:
@@ -720,6 +1276,9 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
         """
         Updates the workflow state with a new message, execution plan, or final output.
 
+        Reading and persisting state and memory block on the Dapr sidecar, so the update runs in a
+        worker thread and leaves the activity loop free for other activities.
+
         Args:
             instance_id (str): The unique identifier of the workflow instance.
             message (Optional[Dict[str, Any]]): A structured message to be added to the workflow state.
@@ -729,30 +1288,49 @@ class LLMOrchestrator(OrchestratorWorkflowBase):
         Raises:
             ValueError: If the workflow instance ID is not found in the local state.
         """
-        workflow_entry = self.state["instances"].get(instance_id)
+        await asyncio.to_thread(
+            self._update_workflow_state, instance_id, message, final_output, plan
+        )
+
+    def _update_workflow_state(
+        self,
+        instance_id: str,
+        message: Optional[Dict[str, Any]],
+        final_output: Optional[str],
+        plan: Optional[List[Dict[str, Any]]],
+    ) -> None:
+        """Synchronous body of `update_workflow_state`."""
+        workflow_entry = self.get_instance_state(instance_id)
         if not workflow_entry:
             raise ValueError(
                 f"No workflow entry found for instance_id {instance_id} in local state."
             )
 
-        # Only update the provided fields
-        if plan is not None:
-            workflow_entry["plan"] = plan
-        if message is not None:
-            serialized_message = LLMWorkflowMessage(**message).model_dump(mode="json")
+        # Entries are updated under the save lock, so a concurrent save never serializes them halfway
+        with self._state_save_lock:
+            # Only update the provided fields
+            if plan is not None:
+                workflow_entry["plan"] = plan
+            if message is not None:
+                serialized_message = LLMWorkflowMessage(**message).model_dump(
+                    mode="json"
+                )
 
-            # Update workflow state messages
-            workflow_entry["messages"].append(serialized_message)
-            workflow_entry["last_message"] = serialized_message
+                # Update workflow state messages
+                workflow_entry["messages"].append(serialized_message)
+                workflow_entry["last_message"] = serialized_message
 
-            # Update the local chat history
-            self.memory.add_message(message)
+            if final_output is not None:
+                workflow_entry["output"] = final_output
+                workflow_entry["end_time"] = datetime.now().isoformat()
+                self.mark_instance_completed(instance_id)
 
-        if final_output is not None:
-            workflow_entry["output"] = final_output
-            workflow_entry["end_time"] = datetime.now().isoformat()
+        # Update the local chat history
+        if message is not None:
+            self.memory.add_message(message)
 
         # Persist updated state
+        self.mark_instance_dirty(instance_id)
         self.save_state()
 
     @message_router
@@ -68,6 +68,36 @@ The team is working on the following task:
 {next_step_schema}
 """
 
+NEXT_STEPS_PROMPT = """## Task Context
+
+The team is working on the following task:
+
+{task}
+
+### Team of Agents (ONLY these agents are available):
+{agents}
+
+### Current Execution Plan:
+{plan}
+
+### Next Steps:
+- **Select up to {max_steps} steps or substeps that can be worked on at the same time**, based on the execution plan above.
+  - **Only select steps that are independent of each other**: no selected step may need the results of another selected step.
+  - **Assign each selected step to a different agent.**
+  - **If the next steps depend on each other, select only ONE step.**
+- **DO NOT select an agent that is not explicitly listed in `{agents}`**.
+- **You must always provide a valid agent name** from the team**. DO NOT return `null` or an empty agent name**.
+- Provide a **clear, actionable instruction** for each selected agent.
+- **You must ONLY select step and substep IDs that EXIST in the plan.**
+  - **DO NOT select a `"completed"` step or substep.**
+  - **If the main step is `"not_started"` but has `"completed"` substeps, you must correctly identify the next `"not_started"` substeps.**
+  - **DO NOT create or assume non-existent step/substep IDs.**
+  - **DO NOT reference any invalid step/substep identifiers. Always check the plan.**
+
+### Expected Output Format (JSON Schema):
+{next_steps_schema}
+"""
+
 PROGRESS_CHECK_PROMPT = """## Progress Check
 
 ### Task Context
@@ -117,6 +147,101 @@ Assess the task progress based on **conversation history**, execution results, a
 {progress_check_schema}
 """
 
+BATCH_PROGRESS_CHECK_PROMPT = """## Progress Check
+
+### Task Context
+The team is working on the following task:
+
+{task}
+
+### Current Execution Plan:
+
+{plan}
+
+### Latest Execution Context:
+Several agents worked on independent steps at the same time. Their results were:
+
+{results}
+
+### Task Evaluation:
+Assess the task progress based on **conversation history**, the execution results of **every** step above, and the structured plan.
+
+1. **Determine Overall Task Verdict**
+   - `"continue"` → **Use this if there are `"not_started"` or `"in_progress"` steps that still require execution.**
+   - `"completed"` → The task is **done** (i.e., **all required steps and substeps have been completed**).
+   - `"failed"` → The task cannot be completed due to an unresolved issue.
+
+2. **Update Step & Sub-Step Status**
+   - **Update the status of each step listed above based on its own results**, regardless of whether the verdict is `"continue"` or `"completed"`.
+   - If an **agent explicitly marks a step as `"completed"`**, then it **remains completed**, regardless of substeps.
+   - If a **substep is completed**, check if **all** substeps are `"completed"` **before marking the parent step as "completed"**.
+   - **If a step is "completed" but has "not_started" substeps, DO NOT modify those substeps.** They remain unchanged unless explicitly acted upon.
+   - A step whose agent **timed out** is not completed.
+
+3. **Plan Adjustments (Only If Necessary)**
+   - If the step descriptions are **unclear or incomplete**, update `"plan_restructure"` with a **single modified step**.
+   - Do **not** introduce unnecessary modifications.
+
+### Important:
+- **Do NOT mark a step as `"completed"` unless explicitly confirmed based on execution results.**
+- **Do NOT mark substeps as `"completed"` unless explicitly confirmed or all are already completed.**
+- **Always apply step/substep status updates, even if the task is `"completed"`**.
+- **Do not introduce unnecessary modifications to the plan.**
+
+### Expected Output Format (JSON Schema):
+{progress_check_schema}
+"""
+
+PROGRESS_AND_NEXT_STEP_PROMPT = """## Progress Check and Next Step
+
+### Task Context
+The team is working on the following task:
+
+{task}
+
+### Team of Agents (ONLY these agents are available):
+{agents}
+
+### Current Execution Plan:
+
+{plan}
+
+### Latest Execution Context:
+- **Step ID:** {step}
+- **Substep ID (if applicable):** {substep}
+- **Step Execution Results:** "{results}"
+
+### Part 1: Task Evaluation
+Assess the task progress based on **conversation history**, execution results, and the structured plan.
+
+1. **Determine Overall Task Verdict**
+   - `"continue"` → **Use this if there are `"not_started"` or `"in_progress"` steps that still require execution.**
+   - `"completed"` → The task is **done** (i.e., **all required steps and substeps have been completed**).
+   - `"failed"` → The task cannot be completed due to an unresolved issue.
+
+2. **Update Step & Sub-Step Status**
+   - **Always update statuses based on the latest results**, regardless of whether the verdict is `"continue"` or `"completed"`.
+   - If an **agent explicitly marks a step as `"completed"`**, then it **remains completed**, regardless of substeps.
+   - If a **substep is completed**, check if **all** substeps are `"completed"` **before marking the parent step as "completed"**.
+   - **If a step is "completed" but has "not_started" substeps, DO NOT modify those substeps.** They remain unchanged unless explicitly acted upon.
+
+3. **Plan Adjustments (Only If Necessary)**
+   - If the step descriptions are **unclear or incomplete**, update `"plan_restructure"` with a **single modified step**.
+   - Do **not** introduce unnecessary modifications.
+
+### Part 2: Next Step (only if the verdict is `"continue"`, otherwise set `next_step` to null)
+- **Select the next best-suited agent** from the team of agents list, **based on the execution plan after applying your status updates**.
+- **DO NOT select an agent that is not explicitly listed in the team of agents.**
+- Provide a **clear, actionable instruction** for the next agent.
+- **You must ONLY select step and substep IDs that EXIST in the plan.**
+  - **DO NOT select a `"completed"` step or substep.**
+  - **If the main step is `"not_started"` but has `"completed"` substeps, you must correctly identify the next `"not_started"` substep.**
+  - **DO NOT create or assume non-existent step/substep IDs.**
+
+### Expected Output Format (JSON Schema):
+{progress_and_next_step_schema}
+"""
+
 SUMMARY_GENERATION_PROMPT = """# Summary Generator
 
 ## Initial Task:
@@ -128,7 +253,7 @@ SUMMARY_GENERATION_PROMPT = """# Summary Generator
 - **Execution Plan Status:**
   {plan}
 - **Last Action Taken:**
-  - **Step:** `{step}` (Sub-step `{substep}` if applicable)
+  - **Steps:** `{steps}` (each with its sub-step if applicable)
   - **Executing Agent:** `{agent}`
   - **Execution Result:** {result}
 
@@ -22,6 +22,10 @@ class AgentTaskResponse(BaseMessage):
     workflow_instance_id: Optional[str] = Field(
         default=None, description="Dapr workflow instance id from source if available"
     )
+    correlation_id: Optional[str] = Field(
+        default=None,
+        description="Correlation id of the TriggerAction this response answers, if it carried one.",
+    )
 
 
 class TriggerAction(BaseModel):
@@ -39,6 +43,10 @@ class TriggerAction(BaseModel):
     workflow_instance_id: Optional[str] = Field(
         default=None, description="Dapr workflow instance id from source if available"
     )
+    correlation_id: Optional[str] = Field(
+        default=None,
+        description="Identifies the orchestrator step this trigger starts. Echoed back in the agent's AgentTaskResponse.",
+    )
 
 
 class NextStep(BaseModel):
@@ -60,6 +68,18 @@ class NextStep(BaseModel):
     )
 
 
+class NextSteps(BaseModel):
+    """
+    Represents a set of independent steps that can be worked on at the same time,
+    each assigned to a different agent.
+    """
+
+    steps: List[NextStep] = Field(
+        ...,
+        description="Independent steps to run concurrently, each with a different agent.",
+    )
+
+
 class TaskPlan(BaseModel):
     """Encapsulates the structured execution plan."""
 
@@ -95,6 +115,18 @@ class ProgressCheckOutput(BaseModel):
     )
 
 
+class ProgressAndNextStep(ProgressCheckOutput):
+    """
+    Progress check of the last step combined with the selection of the next step, so both are
+    produced by a single LLM call.
+    """
+
+    next_step: Optional[NextStep] = Field(
+        None,
+        description="The next step to execute. Required when the verdict is 'continue', otherwise null.",
+    )
+
+
 # Schemas used in Prompts
 class Schemas:
     """Lazily evaluated JSON schemas used in prompt calls."""
@@ -115,9 +147,21 @@ class Schemas:
             )
         )
 
+    @cached_property
+    def progress_and_next_step(self) -> str:
+        return json.dumps(
+            StructureHandler.enforce_strict_json_schema(
+                ProgressAndNextStep.model_json_schema()
+            )
+        )
+
     @cached_property
     def next_step(self) -> str:
         return json.dumps(NextStep.model_json_schema())
 
+    @cached_property
+    def next_steps(self) -> str:
+        return json.dumps(NextSteps.model_json_schema())
+
 
 schemas = Schemas()
@@ -120,6 +120,35 @@ class WorkflowTask(BaseModel):
             logger.exception(f"Error in task '{self.func.__name__}'")
             raise
 
+    @property
+    def is_sync(self) -> bool:
+        """Whether the task runs a plain synchronous Python function, with no agent or LLM."""
+        if self._choose_executor() != "python":
+            return False
+        return not asyncio.iscoroutinefunction(self.func)
+
+    def run_sync(self, ctx: WorkflowActivityContext, payload: Any = None) -> Any:
+        """
+        Executes a synchronous Python task on the calling thread, without an event loop.
+
+        Args:
+            ctx (WorkflowActivityContext): The workflow execution context.
+            payload (Any): The task input.
+
+        Returns:
+            Any: The result of the task.
+        """
+        data = self._normalize_input(payload) if payload is not None else {}
+        logger.info(f"Executing task '{self.func.__name__}'")
+        logger.debug(f"Executing task '{self.func.__name__}' with input {data!r}")
+
+        try:
+            logger.info("Invoking regular Python function")
+            return self._check_output(self.func(**data))
+        except Exception:
+            logger.exception(f"Error in task '{self.func.__name__}'")
+            raise
+
     def _choose_executor(self) -> Literal["agent", "llm", "python"]:
         """
         Pick execution path.
@@ -205,7 +234,7 @@ class WorkflowTask(BaseModel):
                 params["structured_mode"] = self.structured_mode
 
         logger.debug(f"LLM call params: {params}")
-        return self.llm.generate(**params)
+        return await self.llm.agenerate(**params)
 
     def _normalize_input(self, raw_input: Any) -> dict:
         """
@@ -244,7 +273,10 @@ class WorkflowTask(BaseModel):
         """
         if asyncio.iscoroutine(result):
             result = await result
+        return self._check_output(result)
 
+    def _check_output(self, result: Any) -> Any:
+        """Validates a result against the return-type model, if the function declares one."""
         if (
             not self.signature
             or self.signature.return_annotation is inspect.Signature.empty
@@ -0,0 +1,324 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+# Runtime statuses after which a workflow instance no longer changes
+TERMINAL_STATUSES = ("COMPLETED", "FAILED", "TERMINATED")
+
+# Upper bounds in seconds of the completion latency histogram buckets
+_LATENCY_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, float("inf"))
+
+
+class LatencyHistogram(BaseModel):
+    """Histogram of workflow completion latencies; each observation falls in one bucket."""
+
+    bounds: List[float] = Field(
+        default_factory=lambda: list(_LATENCY_BUCKETS),
+        description="Upper bound in seconds of each bucket.",
+    )
+    counts: List[int] = Field(
+        default_factory=lambda: [0] * len(_LATENCY_BUCKETS),
+        description="Number of observations in each bucket.",
+    )
+    count: int = Field(default=0, description="Number of observations.")
+    total_seconds: float = Field(default=0.0, description="Sum of all observations.")
+
+    def observe(self, seconds: float) -> None:
+        """Adds one observation."""
+        for index, bound in enumerate(self.bounds):
+            if seconds <= bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.total_seconds += seconds
+
+    @property
+    def mean_seconds(self) -> float:
+        """Average latency (0.0 without observations)."""
+        return self.total_seconds / self.count if self.count else 0.0
+
+
+class CompletionMetrics(BaseModel):
+    """Counters describing the workflow instances followed by a `WorkflowCompletionTracker`."""
+
+    in_flight: int = Field(default=0, description="Instances still being tracked.")
+    tracked: int = Field(default=0, description="Instances tracked so far.")
+    completed: int = Field(
+        default=0, description="Instances that reached a terminal status."
+    )
+    not_found: int = Field(default=0, description="Instances unknown to the runtime.")
+    timed_out: int = Field(
+        default=0, description="Instances still running when their timeout expired."
+    )
+    query_errors: int = Field(
+        default=0, description="Failed status queries, which are retried."
+    )
+    queries: int = Field(default=0, description="Status queries sent.")
+    latency: LatencyHistogram = Field(
+        default_factory=LatencyHistogram,
+        description="Time from tracking an instance to observing its terminal status.",
+    )
+
+
+class _Pending:
+    """An instance awaiting its terminal status."""
+
+    __slots__ = ("future", "started", "deadline", "next_check", "interval")
+
+    def __init__(
+        self,
+        future: asyncio.Future,
+        started: float,
+        deadline: Optional[float],
+        interval: float,
+    ):
+        self.future = future
+        self.started = started
+        self.deadline = deadline
+        self.next_check = started + interval
+        self.interval = interval
+
+
+class _LoopState:
+    """The instances tracked from one event loop, with the poller task that checks them."""
+
+    __slots__ = ("loop", "pending", "wakeup", "poller")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.pending: Dict[str, _Pending] = {}
+        self.wakeup = asyncio.Event()
+        self.poller: Optional[asyncio.Task] = None
+
+
+class WorkflowCompletionTracker(BaseModel):
+    """
+    Follows many workflow instances to completion from a single task on the event loop.
+
+    Instead of blocking one thread per instance in `wait_for_workflow_completion`, the tracker
+    keeps one future per instance and a single poller that queries the status of the instances that
+    are due, on a small thread pool. Each instance is checked after `poll_interval` seconds, backing
+    off to `max_poll_interval` while it keeps running. `notify` re-checks an instance right away,
+    which the workflow runtime wrapper calls when a workflow function finishes.
+
+    Futures belong to the event loop they were created on, so each loop that tracks instances gets
+    its own pending instances and poller; loops that have been closed are forgotten.
+    """
+
+    fetch_state: Callable[[str], Any] = Field(
+        ...,
+        description="Returns the current state of a workflow instance (with payloads), or None if it does not exist.",
+    )
+    poll_interval: float = Field(
+        default=0.5, gt=0, description="Delay in seconds before the first check."
+    )
+    max_poll_interval: float = Field(
+        default=5.0,
+        gt=0,
+        description="Longest delay in seconds between two checks of a running instance.",
+    )
+    backoff: float = Field(
+        default=1.5, ge=1, description="Growth factor of the delay between checks."
+    )
+    max_concurrent_queries: int = Field(
+        default=4, ge=1, description="Status queries sent at once."
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _loops: Dict[asyncio.AbstractEventLoop, _LoopState] = PrivateAttr(
+        default_factory=dict
+    )
+    _loops_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _executor: Optional[ThreadPoolExecutor] = PrivateAttr(default=None)
+    _metrics: CompletionMetrics = PrivateAttr(default_factory=CompletionMetrics)
+
+    @property
+    def metrics(self) -> CompletionMetrics:
+        """A snapshot of the tracker counters and latency histogram."""
+        metrics = self._metrics.model_copy(deep=True)
+        with self._loops_lock:
+            states = list(self._loops.values())
+        metrics.in_flight = sum(len(state.pending) for state in states)
+        return metrics
+
+    def track(
+        self, instance_id: str, timeout: Optional[float] = None
+    ) -> "asyncio.Future":
+        """
+        Starts tracking a workflow instance. Must be called from the event loop that awaits it;
+        instances tracked from other loops keep being followed on their own loop.
+
+        Args:
+            instance_id (str): The workflow instance ID.
+            timeout (Optional[float]): Seconds after which the future fails with TimeoutError.
+                None waits indefinitely.
+
+        Returns:
+            asyncio.Future: Resolves to the final WorkflowState, or None if the instance does not
+                exist. Tracking the same instance twice returns the same future.
+        """
+        loop = asyncio.get_running_loop()
+        state = self._loop_state(loop)
+        pending = state.pending.get(instance_id)
+        if pending is not None:
+            return pending.future
+
+        now = loop.time()
+        future = loop.create_future()
+        state.pending[instance_id] = _Pending(
+            future,
+            now,
+            now + timeout if timeout is not None else None,
+            self.poll_interval,
+        )
+        self._metrics.tracked += 1
+        if state.poller is None or state.poller.done():
+            state.poller = loop.create_task(self._poll(state))
+        state.wakeup.set()
+        return future
+
+    async def wait(self, instance_id: str, timeout: Optional[float] = None) -> Any:
+        """
+        Waits for a workflow instance to reach a terminal status.
+
+        Args:
+            instance_id (str): The workflow instance ID.
+            timeout (Optional[float]): Maximum wait in seconds. None waits indefinitely.
+
+        Returns:
+            Any: The final WorkflowState, or None if the instance does not exist.
+
+        Raises:
+            TimeoutError: If the instance is still running after `timeout` seconds.
+        """
+        return await asyncio.shield(self.track(instance_id, timeout))
+
+    def notify(self, instance_id: str) -> None:
+        """
+        Asks for an immediate status check of an instance, e.g. because its workflow function
+        returned. Safe to call from any thread; unknown instances are ignored.
+        """
+        with self._loops_lock:
+            states = list(self._loops.values())
+        for state in states:
+            if state.loop.is_closed():
+                continue
+            try:
+                state.loop.call_soon_threadsafe(self._check_soon, state, instance_id)
+            except RuntimeError:
+                pass
+
+    def close(self) -> None:
+        """Shuts down the query thread pool. Pending futures are left as they are."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _loop_state(self, loop: asyncio.AbstractEventLoop) -> _LoopState:
+        """Returns the state of a loop, creating it and forgetting closed loops on first use."""
+        with self._loops_lock:
+            state = self._loops.get(loop)
+            if state is None:
+                for closed in [other for other in self._loops if other.is_closed()]:
+                    del self._loops[closed]
+                state = self._loops[loop] = _LoopState(loop)
+            return state
+
+    def _check_soon(self, state: _LoopState, instance_id: str) -> None:
+        pending = state.pending.get(instance_id)
+        if pending is None:
+            return
+        pending.interval = self.poll_interval
+        pending.next_check = state.loop.time()
+        state.wakeup.set()
+
+    async def _poll(self, state: _LoopState) -> None:
+        """Checks the due instances of a loop until none is left, sleeping until the next one is due."""
+        loop = state.loop
+        pending_instances = state.pending
+        while pending_instances:
+            state.wakeup.clear()
+            now = loop.time()
+            for instance_id, pending in list(pending_instances.items()):
+                if pending.future.done():
+                    del pending_instances[instance_id]
+                elif pending.deadline is not None and now >= pending.deadline:
+                    del pending_instances[instance_id]
+                    self._metrics.timed_out += 1
+                    pending.future.set_exception(
+                        TimeoutError(
+                            f"Workflow '{instance_id}' did not complete in time."
+                        )
+                    )
+
+            due = [
+                instance_id
+                for instance_id, pending in pending_instances.items()
+                if pending.next_check <= now
+            ]
+            if due:
+                await asyncio.gather(
+                    *(self._check(state, instance_id) for instance_id in due)
+                )
+                continue
+            if not pending_instances:
+                break
+
+            next_event = min(
+                min(
+                    p.next_check, p.deadline if p.deadline is not None else p.next_check
+                )
+                for p in pending_instances.values()
+            )
+            try:
+                await asyncio.wait_for(
+                    state.wakeup.wait(), timeout=max(0.0, next_event - now)
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _check(self, state: _LoopState, instance_id: str) -> None:
+        """Queries one instance and resolves its future if it has finished."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_queries,
+                thread_name_prefix="workflow-status",
+            )
+        loop = state.loop
+        self._metrics.queries += 1
+        result, failed = None, False
+        try:
+            result = await loop.run_in_executor(
+                self._executor, self.fetch_state, instance_id
+            )
+        except Exception as e:
+            self._metrics.query_errors += 1
+            failed = True
+            logger.warning(f"Status query for workflow '{instance_id}' failed: {e}")
+
+        pending = state.pending.get(instance_id)
+        if pending is None or pending.future.done():
+            state.pending.pop(instance_id, None)
+            return
+
+        if not failed and result is None:
+            self._metrics.not_found += 1
+            del state.pending[instance_id]
+            pending.future.set_result(None)
+        elif not failed and result.runtime_status.name in TERMINAL_STATUSES:
+            self._metrics.completed += 1
+            self._metrics.latency.observe(loop.time() - pending.started)
+            del state.pending[instance_id]
+            pending.future.set_result(result)
+        else:
+            pending.interval = min(
+                pending.interval * self.backoff, self.max_poll_interval
+            )
+            pending.next_check = loop.time() + pending.interval
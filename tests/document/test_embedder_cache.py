@@ -0,0 +1,71 @@
+import pytest
+
+from dapr_agents.document.embedder.base import EmbedderBase
+from dapr_agents.document.embedder.cache import CachedEmbedder
+from dapr_agents.document.embedder.sentence import SentenceTransformerEmbedder
+
+
+class CountingEmbedder(EmbedderBase):
+    model: str = "counting"
+    calls: list = []
+
+    def embed(self, input, **kwargs):
+        texts = [input] if isinstance(input, str) else input
+        self.calls.append(list(texts))
+        vectors = [[float(len(text)), 1.0] for text in texts]
+        return vectors[0] if isinstance(input, str) else vectors
+
+
+@pytest.fixture
+def sentence_embedder(monkeypatch):
+    # Skips loading the model, which needs sentence-transformers and a download
+    monkeypatch.setattr(
+        SentenceTransformerEmbedder, "model_post_init", lambda self, _: None
+    )
+    return lambda **kwargs: SentenceTransformerEmbedder.model_construct(
+        **{"model": "all-MiniLM-L6-v2", **kwargs}
+    )
+
+
+def test_repeated_texts_are_embedded_once():
+    embedder = CountingEmbedder(calls=[])
+    cache = CachedEmbedder(embedder=embedder)
+
+    assert cache.embed(["a", "bb", "a"]) == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+    assert cache.embed(" bb ") == [2.0, 1.0]
+    assert embedder.calls == [["a", "bb"]]
+    assert (cache.stats.hits, cache.stats.misses) == (2, 2)
+
+
+def test_vectors_survive_in_the_database(tmp_path):
+    path = str(tmp_path / "cache.db")
+    CachedEmbedder(embedder=CountingEmbedder(calls=[]), path=path).embed(["text"])
+
+    embedder = CountingEmbedder(calls=[])
+    cache = CachedEmbedder(embedder=embedder, path=path, max_memory_entries=0)
+    assert cache.embed(["text"]) == [[4.0, 1.0]]
+    assert embedder.calls == []
+
+
+def test_precision_does_not_change_the_key(sentence_embedder):
+    full = CachedEmbedder(embedder=sentence_embedder(precision="float32"))
+    quantized = CachedEmbedder(embedder=sentence_embedder(precision="int8"))
+
+    # `embed` returns full-precision vectors whatever `precision` is
+    assert full.embedder_id == quantized.embedder_id
+    assert full._make_key("text", "passage") == quantized._make_key("text", "passage")
+
+
+def test_settings_that_change_vectors_change_the_key(sentence_embedder):
+    base = CachedEmbedder(embedder=sentence_embedder(normalize_embeddings=True))
+    keys = {
+        base.embedder_id,
+        CachedEmbedder(
+            embedder=sentence_embedder(normalize_embeddings=False)
+        ).embedder_id,
+        CachedEmbedder(
+            embedder=sentence_embedder(model="other", normalize_embeddings=True)
+        ).embedder_id,
+    }
+    assert len(keys) == 3
+    assert base._make_key("text", "passage") != base._make_key("text", "query")
@@ -0,0 +1,94 @@
+import threading
+
+from dapr_agents.document.ingestion import IngestionCheckpoint, IngestionPipeline
+from dapr_agents.document.reader.text import TextLoader
+from dapr_agents.document.splitter import TextSplitter
+from dapr_agents.storage.vectorstores import LocalVectorStore
+
+
+def embed(texts):
+    return [[float(len(text)), 1.0] for text in texts]
+
+
+def make_pipeline(tmp_path, **kwargs) -> IngestionPipeline:
+    return IngestionPipeline(
+        reader=TextLoader(),
+        splitter=TextSplitter(chunk_size=40, chunk_overlap=0),
+        vector_store=LocalVectorStore(embedding_function=None),
+        embedder=embed,
+        checkpoint_path=str(tmp_path / "checkpoint.db"),
+        executor="thread",
+        max_workers=2,
+        embed_batch_size=2,
+        write_batch_size=2,
+        queue_size=1,
+        **kwargs,
+    )
+
+
+def write_files(tmp_path, count: int) -> list:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for i in range(count):
+        text = " ".join(f"Sentence {j} of file {i}." for j in range(8))
+        (docs / f"file{i}.txt").write_text(text)
+    return sorted(docs.iterdir())
+
+
+def run_with_timeout(pipeline: IngestionPipeline, sources, timeout: float = 20.0):
+    """Runs the pipeline in a thread, failing the test instead of hanging if it never returns."""
+    outcome = {}
+
+    def target():
+        try:
+            outcome["report"] = pipeline.run(sources)
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "ingestion run did not finish"
+    return outcome
+
+
+def test_run_ingests_files_and_skips_them_on_rerun(tmp_path):
+    files = write_files(tmp_path, 3)
+    pipeline = make_pipeline(tmp_path)
+
+    report = run_with_timeout(pipeline, files)["report"]
+    assert report.files_ingested == 3
+    assert not report.failed
+    assert pipeline.vector_store.count() == report.chunks > 3
+
+    rerun = run_with_timeout(pipeline, files)["report"]
+    assert rerun.files_skipped == 3
+    assert pipeline.vector_store.count() == report.chunks
+
+
+def test_checkpoint_write_failure_fails_the_files(tmp_path, monkeypatch):
+    files = write_files(tmp_path, 6)
+
+    def add_chunks(self, path, ids):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(IngestionCheckpoint, "add_chunks", add_chunks)
+    report = run_with_timeout(make_pipeline(tmp_path), files)["report"]
+
+    assert report.files_ingested == 0
+    assert sorted(report.failed) == [str(path) for path in files]
+    assert set(report.failed.values()) == {"disk full"}
+    assert report.chunks == 0
+
+
+def test_dead_writer_fails_the_run_instead_of_hanging(tmp_path, monkeypatch):
+    files = write_files(tmp_path, 20)
+
+    def complete(self, path):
+        raise RuntimeError("checkpoint closed")
+
+    monkeypatch.setattr(IngestionCheckpoint, "complete", complete)
+    outcome = run_with_timeout(make_pipeline(tmp_path), files)
+
+    assert "report" not in outcome
+    assert str(outcome["error"]) == "checkpoint closed"
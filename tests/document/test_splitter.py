@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from dapr_agents.document.splitter import TextSplitter, TokenTextSplitter
+from dapr_agents.document.splitter import token as token_module
+
+PARAGRAPHS = (
+    "Intro paragraph one. It has two sentences.\n\n"
+    "Second paragraph here, with more words in it.\n\n"
+    "A third paragraph follows; it is a little longer than the others.\n\n"
+    "The last one has no punctuation at the end"
+)
+
+
+def random_text(rng: random.Random) -> str:
+    words = ["word", " ", "\n", "\n\n", ".", ",", "x" * 30, "Title"]
+    return "".join(rng.choice(words) for _ in range(rng.randint(0, 80)))
+
+
+def random_pages(rng: random.Random, text: str) -> list:
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, 4)))
+    return [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+
+
+def assert_covers(chunks, text: str) -> None:
+    covered = set()
+    for chunk in chunks:
+        assert chunk.text == text[chunk.start_index : chunk.end_index]
+        covered.update(range(chunk.start_index, chunk.end_index))
+    assert covered == set(range(len(text)))
+
+
+@pytest.fixture
+def token_splitter(monkeypatch):
+    tiktoken = pytest.importorskip("tiktoken")
+    # One token per byte, so token counts are exact without downloading an encoding
+    encoding = tiktoken.Encoding(
+        "bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+    monkeypatch.setattr(token_module, "_load_tiktoken", lambda *args: encoding)
+    return TokenTextSplitter(chunk_size=24, chunk_overlap=4)
+
+
+@pytest.mark.parametrize(
+    "text", ["", "Title page\n", "no punctuation at all", PARAGRAPHS, "a" * 500]
+)
+def test_stream_of_one_text_matches_split_with_offsets(text):
+    splitter = TextSplitter(chunk_size=40, chunk_overlap=5)
+    assert list(splitter.split_stream([text])) == splitter.split_with_offsets(text)
+
+
+def test_stream_split_at_paragraphs_matches_split_with_offsets():
+    splitter = TextSplitter(chunk_size=60, chunk_overlap=10)
+    pages = [page + "\n\n" for page in PARAGRAPHS.split("\n\n")]
+    pages[-1] = pages[-1][:-2]
+    assert list(splitter.split_stream(pages)) == splitter.split_with_offsets(
+        "".join(pages)
+    )
+
+
+def test_small_stream_is_a_single_chunk():
+    splitter = TextSplitter()
+    chunks = list(splitter.split_stream(["Title ", "page\n"]))
+    assert chunks == splitter.split_with_offsets("Title page\n")
+    assert len(chunks) == 1
+
+
+def test_chunks_cover_the_text():
+    rng = random.Random(0)
+    for _ in range(500):
+        text = random_text(rng)
+        splitter = TextSplitter(
+            chunk_size=rng.randint(10, 80), chunk_overlap=rng.randint(0, 10)
+        )
+        assert list(splitter.split_stream([text])) == splitter.split_with_offsets(text)
+        assert_covers(splitter.split_with_offsets(text), text)
+        assert_covers(splitter.split_stream(random_pages(rng, text)), text)
+
+
+def test_token_stream_matches_split_with_offsets(token_splitter):
+    for text in ["Title page\n", "no punctuation at all", PARAGRAPHS]:
+        assert list(
+            token_splitter.split_stream([text])
+        ) == token_splitter.split_with_offsets(text)
+
+
+def test_token_stream_covers_the_text(token_splitter):
+    rng = random.Random(1)
+    for _ in range(200):
+        text = random_text(rng)
+        chunks = list(token_splitter.split_stream(random_pages(rng, text)))
+        assert_covers(chunks, text)
+        assert all(chunk.size <= token_splitter.chunk_size for chunk in chunks)
@@ -0,0 +1,47 @@
+import inspect
+
+import pytest
+
+from dapr_agents.llm import LLMClientBase
+from dapr_agents.llm.elevenlabs.speech import ElevenLabsSpeechClient
+
+
+def concrete_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        if not subclass.__name__.endswith("Base"):
+            yield subclass
+        yield from concrete_subclasses(subclass)
+
+
+def test_every_client_provides_an_async_client():
+    clients = set(concrete_subclasses(LLMClientBase))
+
+    assert len(clients) >= 8
+    abstract = {
+        cls.__name__: sorted(cls.__abstractmethods__)
+        for cls in clients
+        if inspect.isabstract(cls)
+    }
+    assert abstract == {}
+
+
+def test_client_without_async_factory_cannot_be_created():
+    class SyncOnlyClient(LLMClientBase):
+        def get_client(self):
+            return object()
+
+        def get_config(self):
+            return None
+
+    with pytest.raises(TypeError, match="get_async_client"):
+        SyncOnlyClient()
+
+
+def test_elevenlabs_async_client(monkeypatch):
+    pytest.importorskip("elevenlabs")
+    monkeypatch.setenv("ELEVENLABS_API_KEY", "test-key")
+    client = ElevenLabsSpeechClient()
+
+    from elevenlabs import AsyncElevenLabs
+
+    assert isinstance(client.get_async_client(), AsyncElevenLabs)
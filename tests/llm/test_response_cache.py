@@ -0,0 +1,117 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from pydantic import BaseModel
+
+from dapr_agents.llm.cache import LLMResponseCache
+from dapr_agents.llm.cache.daprstate import DaprStateCacheBackend
+
+
+class Answer(BaseModel):
+    text: str
+
+
+PARAMS = {
+    "model": "gpt-4o",
+    "temperature": 0,
+    "messages": [{"role": "user", "content": "Hi"}],
+    "stop": {"END", "STOP", "DONE"},
+    "response_format": Answer,
+}
+
+KEY_SCRIPT = """
+from pydantic import BaseModel
+from dapr_agents.llm.cache import LLMResponseCache
+
+class Answer(BaseModel):
+    text: str
+
+print(LLMResponseCache().make_key("openai", {
+    "response_format": Answer,
+    "stop": {"DONE", "STOP", "END"},
+    "messages": [{"role": "user", "content": "Hi"}],
+    "temperature": 0,
+    "model": "gpt-4o",
+}))
+"""
+
+
+def test_key_ignores_parameter_order():
+    cache = LLMResponseCache()
+    reordered = dict(reversed(list(PARAMS.items())))
+    assert cache.make_key("openai", PARAMS) == cache.make_key("openai", reordered)
+
+
+def test_key_is_stable_across_processes():
+    # Another interpreter has a different hash seed, so set order and object ids differ
+    result = subprocess.run(
+        [sys.executable, "-c", KEY_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONHASHSEED": "123"},
+    )
+    assert result.stdout.strip() == LLMResponseCache().make_key("openai", PARAMS)
+
+
+def test_key_depends_on_provider_namespace_and_params():
+    cache = LLMResponseCache()
+    key = cache.make_key("openai", PARAMS)
+    assert key != cache.make_key("nvidia", PARAMS)
+    assert key != LLMResponseCache(namespace="v2").make_key("openai", PARAMS)
+    assert key != cache.make_key("openai", {**PARAMS, "temperature": 0.1})
+
+
+def test_key_rejects_values_without_a_stable_form():
+    with pytest.raises(TypeError):
+        LLMResponseCache().make_key("openai", {**PARAMS, "callback": object()})
+
+
+class FakeStateStore:
+    def __init__(self):
+        self.data = {}
+
+    def try_get_state(self, key):
+        if key in self.data:
+            return True, json.loads(self.data[key])
+        return False, None
+
+    def save_state(self, key, value, state_metadata=None):
+        self.data[key] = value
+
+    def delete_state(self, key):
+        self.data.pop(key, None)
+
+
+def dapr_backend(store, **settings):
+    backend = DaprStateCacheBackend(store_name="cache", **settings)
+    backend.state_store = store
+    return backend
+
+
+def test_dapr_backend_stores_entries_under_the_prefix():
+    store = FakeStateStore()
+    backend = dapr_backend(store)
+
+    backend.set("key", {"answer": 42}, ttl=60)
+
+    assert backend.get("key") == {"answer": 42}
+    assert list(store.data) == ["llm_cache:0:key"]
+
+
+def test_dapr_backend_clear_is_seen_by_other_replicas():
+    store = FakeStateStore()
+    backend = dapr_backend(store)
+    replica = dapr_backend(store, generation_refresh=0)
+    backend.set("key", "value")
+    assert replica.get("key") == "value"
+
+    backend.clear()
+
+    assert backend.get("key") is None
+    assert replica.get("key") is None
+    backend.set("key", "new value")
+    assert replica.get("key") == "new value"
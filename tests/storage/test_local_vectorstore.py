@@ -0,0 +1,170 @@
+import numpy as np
+import pytest
+
+from dapr_agents.storage.vectorstores import LocalVectorStore
+
+
+def make_store(**kwargs) -> LocalVectorStore:
+    return LocalVectorStore(embedding_function=None, **kwargs)
+
+
+def clustered_vectors(rng: np.random.Generator, rows: int, dim: int = 16) -> np.ndarray:
+    centers = rng.normal(size=(8, dim))
+    labels = rng.integers(0, len(centers), size=rows)
+    return (centers[labels] + 0.1 * rng.normal(size=(rows, dim))).astype(np.float32)
+
+
+def add_rows(store: LocalVectorStore, vectors: np.ndarray) -> list:
+    ids = [f"doc-{i}" for i in range(len(vectors))]
+    store.add(
+        documents=[f"document {i}" for i in range(len(vectors))],
+        embeddings=vectors,
+        metadatas=[{"group": i % 3} for i in range(len(vectors))],
+        ids=ids,
+    )
+    return ids
+
+
+def test_add_get_and_search():
+    store = make_store()
+    vectors = np.eye(4, dtype=np.float32)
+    ids = add_rows(store, vectors)
+
+    assert store.count() == 4
+    assert store.dimension == 4
+    item = store.get(["doc-2"])[0]
+    assert (item["id"], item["document"], item["metadata"]) == (
+        "doc-2",
+        "document 2",
+        {"group": 2},
+    )
+    result = store.search_similar(query_embeddings=[0.1, 0.0, 1.0, 0.0], k=1)[0]
+    assert result["id"] == ids[2]
+    filtered = store.search_similar(
+        query_embeddings=[0.0, 0.0, 1.0, 0.0], k=4, metadata_filter={"group": 0}
+    )
+    assert {r["id"] for r in filtered} == {"doc-0", "doc-3"}
+
+
+def test_add_skips_existing_ids_unless_upsert():
+    store = make_store()
+    add_rows(store, np.eye(3, dtype=np.float32))
+
+    store.add(documents=["new"], embeddings=[[0.0, 1.0, 0.0]], ids=["doc-0"])
+    assert store.get(["doc-0"])[0]["document"] == "document 0"
+
+    store.add(
+        documents=["new"], embeddings=[[0.0, 1.0, 0.0]], ids=["doc-0"], upsert=True
+    )
+    assert store.get(["doc-0"])[0]["document"] == "new"
+    assert store.count() == 3
+
+
+def test_update_accepts_numpy_embeddings():
+    store = make_store()
+    add_rows(store, np.eye(3, dtype=np.float32))
+
+    store.update(
+        ids=["doc-0", "missing"],
+        embeddings=np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 0.0]], dtype=np.float32),
+        documents=["moved", "ignored"],
+    )
+    assert store.get(["doc-0"])[0]["document"] == "moved"
+    results = store.search_similar(query_embeddings=np.array([0.0, 0.0, 1.0]), k=2)
+    assert {r["id"] for r in results} == {"doc-0", "doc-2"}
+    with pytest.raises(ValueError):
+        store.update(ids=["doc-0"])
+
+
+def test_delete_hides_rows_and_compacts():
+    store = make_store(compaction_threshold=0.5)
+    add_rows(store, np.eye(4, dtype=np.float32))
+
+    assert store.delete(["doc-1"])
+    assert not store.delete(["doc-1", "missing"])
+    assert store.count() == 3
+    assert store.get(["doc-1"]) == []
+    assert "doc-1" not in {
+        r["id"]
+        for r in store.search_similar(query_embeddings=[0.0, 1.0, 0.0, 0.0], k=4)
+    }
+
+    # Crossing the threshold drops the deleted rows from the matrix
+    store.delete(["doc-0", "doc-2"])
+    assert store.count() == 1
+    assert store.get()[0]["id"] == "doc-3"
+
+    store.add(documents=["again"], embeddings=[[0.0, 1.0, 0.0, 0.0]], ids=["doc-1"])
+    assert store.get(["doc-1"])[0]["document"] == "again"
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16", "int8"])
+def test_persist_and_reload(tmp_path, dtype):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(50, 8)).astype(np.float32)
+    store = make_store(path=str(tmp_path), dtype=dtype)
+    add_rows(store, vectors)
+    store.delete(["doc-7"])
+    store.persist()
+
+    reloaded = make_store(path=str(tmp_path), dtype=dtype)
+    assert reloaded.count() == 49
+    assert reloaded.get(["doc-7"]) == []
+    assert reloaded.get(["doc-3"])[0]["metadata"] == {"group": 0}
+    assert (
+        reloaded.search_similar(query_embeddings=vectors[11], k=1)[0]["id"] == "doc-11"
+    )
+
+    # Memory-mapped stores stay writable
+    reloaded.add(documents=["extra"], embeddings=[vectors[0]], ids=["extra"])
+    assert reloaded.count() == 50
+
+
+def test_persisting_requires_a_path():
+    with pytest.raises(ValueError):
+        make_store().persist()
+
+
+def test_reload_rejects_another_dtype(tmp_path):
+    store = make_store(path=str(tmp_path))
+    add_rows(store, np.eye(2, dtype=np.float32))
+    store.persist()
+
+    with pytest.raises(ValueError):
+        make_store(path=str(tmp_path), dtype="int8")
+
+
+def test_ivf_recall_against_exact_search():
+    rng = np.random.default_rng(1)
+    vectors = clustered_vectors(rng, 2000)
+    store = make_store(index_type="ivf", ivf_min_rows=500, ivf_lists=16, ivf_probes=4)
+    add_rows(store, vectors)
+    queries = clustered_vectors(rng, 20)
+
+    approximate = store.search_similar_batch(query_embeddings=queries, k=10)
+    exact = store.search_similar_batch(query_embeddings=queries, k=10, exact=True)
+
+    hits = sum(
+        len({r["id"] for r in a} & {r["id"] for r in e})
+        for a, e in zip(approximate, exact)
+    )
+    assert hits / (10 * len(queries)) >= 0.9
+
+
+def test_ivf_index_survives_delete_and_reload(tmp_path):
+    rng = np.random.default_rng(2)
+    vectors = clustered_vectors(rng, 600)
+    store = make_store(
+        path=str(tmp_path), index_type="ivf", ivf_min_rows=500, ivf_lists=8
+    )
+    add_rows(store, vectors)
+    store.delete(["doc-5"])
+    store.persist()
+
+    reloaded = make_store(
+        path=str(tmp_path), index_type="ivf", ivf_min_rows=500, ivf_lists=8
+    )
+    results = reloaded.search_similar(query_embeddings=vectors[5], k=5)
+    assert "doc-5" not in {r["id"] for r in results}
+    top = reloaded.search_similar(query_embeddings=vectors[42], k=1, probes=8)[0]
+    assert top["id"] == "doc-42"
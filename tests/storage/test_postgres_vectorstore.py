@@ -0,0 +1,83 @@
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+
+pytest.importorskip("psycopg")
+
+from dapr_agents.storage.vectorstores.postgres import PostgresVectorStore  # noqa: E402
+
+
+class FakeCursor:
+    def __init__(self, statements):
+        self.statements = statements
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def executemany(self, query, rows):
+        self.statements.append((" ".join(query.split()), list(rows)))
+
+
+class FakePool:
+    """Records the statements sent through pooled connections."""
+
+    def __init__(self):
+        self.statements = []
+
+    @contextmanager
+    def connection(self):
+        yield self
+
+    def cursor(self):
+        return FakeCursor(self.statements)
+
+
+@pytest.fixture
+def make_store(monkeypatch):
+    # model_post_init connects to the database and creates the table
+    monkeypatch.setattr(PostgresVectorStore, "model_post_init", lambda self, _: None)
+    return lambda: PostgresVectorStore.model_construct(
+        connection_string="postgresql://unused",
+        table_name="docs",
+        embedding_dim=3,
+        embedding_function=None,
+        pool=FakePool(),
+        tracked_dimensions=set(),
+    )
+
+
+def test_update_accepts_numpy_embeddings(make_store):
+    store = make_store()
+    embeddings = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], dtype=np.float32)
+
+    store.update(ids=["a", "b"], embeddings=embeddings)
+
+    ((query, rows),) = store.pool.statements
+    assert query.startswith("UPDATE docs SET embedding = COALESCE(%s::vector")
+    assert [row[3] for row in rows] == ["a", "b"]
+    assert np.array_equal(rows[1][0], embeddings[1])
+    assert rows[0][1:3] == (None, None)
+
+
+def test_update_keeps_columns_without_new_values(make_store):
+    store = make_store()
+
+    store.update(
+        ids=["a", "b", "c"],
+        documents=["new text", None, None],
+        metadatas=[None, {"tag": "x"}, None],
+    )
+
+    ((_, rows),) = store.pool.statements
+    assert [row[3] for row in rows] == ["a", "b"]
+    assert rows[0][:3] == (None, "new text", None)
+    assert rows[1][2].obj == {"tag": "x"}
+
+
+def test_update_requires_a_value(make_store):
+    with pytest.raises(ValueError):
+        make_store().update(ids=["a"])
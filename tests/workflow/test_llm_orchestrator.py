@@ -0,0 +1,318 @@
+import asyncio
+import inspect
+from collections import deque
+
+from dapr_agents.workflow.orchestrators.llm.orchestrator import LLMOrchestrator
+
+
+class Activity:
+    def __init__(self, name, input):
+        self.name = name
+        self.input = input
+
+
+class WhenAll:
+    def __init__(self, tasks):
+        self.tasks = tasks
+
+
+class WhenAny:
+    def __init__(self, tasks):
+        self.tasks = tasks
+
+
+class Timer:
+    pass
+
+
+class Event:
+    pass
+
+
+class ActivityRef:
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeOrchestrator:
+    """Runs the orchestrator's workflow code with activities replaced by ActivityRefs."""
+
+    name = "Orchestrator"
+    timeout = 30
+    max_iterations = 10
+    max_parallel_steps = 1
+    fused_planning = False
+
+    main_workflow = inspect.unwrap(LLMOrchestrator.main_workflow)
+    _run_step = LLMOrchestrator._run_step
+    _run_fused_iteration = LLMOrchestrator._run_fused_iteration
+    _run_parallel_steps = LLMOrchestrator._run_parallel_steps
+
+    def __init__(self, **settings):
+        for key, value in settings.items():
+            setattr(self, key, value)
+
+    def __getattr__(self, name):
+        return ActivityRef(name)
+
+    def when_all(self, tasks):
+        return WhenAll(tasks)
+
+    def when_any(self, tasks):
+        return WhenAny(tasks)
+
+
+class FakeContext:
+    """Resolves the tasks a workflow yields; agent responses are queued by the activity handlers."""
+
+    instance_id = "wf-1"
+    is_replaying = False
+
+    def __init__(self, handlers):
+        self.handlers = handlers
+        self.events = deque()
+        self.calls = []
+        self.continued_with = None
+
+    def call_activity(self, activity, input=None):
+        return Activity(activity.name, input)
+
+    def create_timer(self, delay):
+        return Timer()
+
+    def wait_for_external_event(self, name):
+        return Event()
+
+    def continue_as_new(self, message):
+        self.continued_with = message
+
+    def resolve(self, task):
+        if isinstance(task, Activity):
+            self.calls.append((task.name, task.input))
+            handler = self.handlers.get(task.name)
+            return handler(task.input) if handler else None
+        if isinstance(task, WhenAll):
+            return [self.resolve(item) for item in task.tasks]
+        if isinstance(task, WhenAny):
+            # Responses arrive before any timer fires; without responses the first timer fires
+            if self.events:
+                return next(item for item in task.tasks if isinstance(item, Event))
+            return next(item for item in task.tasks if isinstance(item, Timer))
+        if isinstance(task, Event):
+            return self.events.popleft()
+        raise AssertionError(f"Unexpected task {task!r}")
+
+    def run(self, workflow):
+        result = None
+        try:
+            while True:
+                result = self.resolve(workflow.send(result))
+        except StopIteration as stop:
+            return stop.value
+
+    def inputs(self, name):
+        return [input for called, input in self.calls if called == name]
+
+
+PLAN = [
+    {"step": 1, "description": "Research", "status": "not_started", "substeps": []},
+    {"step": 2, "description": "Write", "status": "not_started", "substeps": []},
+]
+
+STEPS = [
+    {"next_agent": "Researcher", "instruction": "Research it", "step": 1},
+    {"next_agent": "Writer", "instruction": "Write it", "step": 2},
+]
+
+
+def parallel_context(verdict, respond=("Writer", "Researcher")):
+    """Responds to the triggered steps in the order of `respond`, echoing correlation ids."""
+
+    def trigger_agents(input):
+        by_agent = {step["next_agent"]: step for step in input["steps"]}
+        for agent in respond:
+            context.events.append(
+                {
+                    "name": agent,
+                    "role": "user",
+                    "content": f"{agent} done",
+                    "correlation_id": by_agent[agent]["correlation_id"],
+                }
+            )
+        return PLAN
+
+    context = FakeContext(
+        {
+            "load_workflow_entry": lambda input: {"input": "task", "plan": PLAN},
+            "get_agents_metadata_as_string": lambda input: "agents",
+            "generate_next_steps": lambda input: {"steps": STEPS},
+            "select_parallel_steps": lambda input: input["steps"],
+            "trigger_agents": trigger_agents,
+            "check_batch_progress": lambda input: {"verdict": verdict},
+            "generate_summary": lambda input: "summary",
+        }
+    )
+    return context
+
+
+def test_parallel_steps_are_all_finished():
+    orchestrator = FakeOrchestrator(max_parallel_steps=2)
+    context = parallel_context("completed")
+
+    summary = context.run(
+        orchestrator.main_workflow(context, {"task": "task", "iteration": 1})
+    )
+
+    assert summary == "summary"
+    expected = [{"step": 1, "substep": None}, {"step": 2, "substep": None}]
+    assert context.inputs("generate_summary")[0]["steps"] == expected
+    assert context.inputs("finish_workflow")[0]["steps"] == expected
+
+
+def test_parallel_responses_are_matched_by_correlation_id():
+    orchestrator = FakeOrchestrator(max_parallel_steps=2)
+    context = parallel_context("continue")
+
+    context.run(orchestrator.main_workflow(context, {"task": "task", "iteration": 1}))
+
+    history = {
+        input["agent"]: input["results"]["content"]
+        for input in context.inputs("update_task_history")
+    }
+    assert history == {"Researcher": "Researcher done", "Writer": "Writer done"}
+    assert context.continued_with["iteration"] == 2
+
+
+def test_parallel_step_without_response_times_out_alone():
+    orchestrator = FakeOrchestrator(max_parallel_steps=2)
+    context = parallel_context("continue", respond=("Writer",))
+
+    context.run(orchestrator.main_workflow(context, {"task": "task", "iteration": 1}))
+
+    history = {
+        input["agent"]: input["results"]["content"]
+        for input in context.inputs("update_task_history")
+    }
+    assert history["Writer"] == "Writer done"
+    assert history["Researcher"].startswith("Timeout occurred.")
+
+
+def test_parallel_recovery_at_the_last_iteration_finishes_no_step():
+    orchestrator = FakeOrchestrator(max_parallel_steps=2, max_iterations=1)
+    context = parallel_context("continue")
+    context.handlers["select_parallel_steps"] = lambda input: []
+
+    context.run(orchestrator.main_workflow(context, {"task": "task", "iteration": 1}))
+
+    assert context.inputs("trigger_agents") == []
+    finish = context.inputs("finish_workflow")[0]
+    assert finish["steps"] == []
+    assert finish["verdict"] == "max_iterations_reached"
+
+
+def test_finish_workflow_marks_every_step_completed():
+    plan = [dict(step) for step in PLAN]
+    updates = []
+
+    class Finisher:
+        async def update_plan(self, instance_id, plan, status_updates):
+            updates.extend(status_updates)
+
+        async def update_workflow_state(self, instance_id, final_output):
+            pass
+
+    finish_workflow = inspect.unwrap(LLMOrchestrator.finish_workflow)
+    asyncio.run(
+        finish_workflow(
+            Finisher(),
+            instance_id="wf-1",
+            plan=plan,
+            steps=[{"step": 1, "substep": None}, {"step": 2, "substep": None}],
+            verdict="completed",
+            summary="summary",
+        )
+    )
+
+    assert [step["status"] for step in plan] == ["completed", "completed"]
+    assert {"step": 2, "substep": None, "status": "completed"} in updates
+
+
+def fused_context(next_step, valid=True, decision=None):
+    def trigger_agent(input):
+        context.events.append(
+            {"name": input["name"], "role": "user", "content": "done"}
+        )
+        return PLAN
+
+    context = FakeContext(
+        {
+            "load_workflow_entry": lambda input: {"input": "task", "plan": PLAN},
+            "get_agents_metadata_as_string": lambda input: "agents",
+            "generate_next_step": lambda input: next_step,
+            "check_progress_and_next_step": lambda input: decision,
+            "validate_next_step": lambda input: valid,
+            "trigger_agent": trigger_agent,
+            "generate_summary": lambda input: "summary",
+        }
+    )
+    return context
+
+
+def test_fused_iteration_hands_its_step_to_the_next_one():
+    orchestrator = FakeOrchestrator(fused_planning=True)
+    context = fused_context(STEPS[0])
+
+    context.run(orchestrator.main_workflow(context, {"task": "task", "iteration": 1}))
+
+    assert context.inputs("check_progress_and_next_step") == []
+    assert context.continued_with["last_step"] == {
+        "agent": "Researcher",
+        "step": 1,
+        "substep": None,
+    }
+
+
+def test_fused_iteration_assesses_the_last_step():
+    orchestrator = FakeOrchestrator(fused_planning=True)
+    context = fused_context(None, decision={"verdict": "completed", "next_step": None})
+    message = {
+        "task": "done",
+        "iteration": 2,
+        "last_step": {"agent": "Researcher", "step": 1, "substep": None},
+    }
+
+    assert context.run(orchestrator.main_workflow(context, message)) == "summary"
+    assert context.inputs("finish_workflow")[0]["steps"] == [
+        {"step": 1, "substep": None}
+    ]
+
+
+def test_fused_recovery_from_an_invalid_step_plans_again():
+    orchestrator = FakeOrchestrator(fused_planning=True)
+    context = fused_context({**STEPS[0], "step": 9}, valid=False)
+
+    context.run(orchestrator.main_workflow(context, {"task": "task", "iteration": 1}))
+
+    assert context.inputs("trigger_agent") == []
+    assert context.continued_with["last_step"] is None
+
+
+def test_fused_recovery_without_next_step_plans_again():
+    orchestrator = FakeOrchestrator(fused_planning=True)
+    context = fused_context(None, decision={"verdict": "continue", "next_step": None})
+    message = {
+        "task": "result",
+        "iteration": 2,
+        "last_step": {"agent": "Researcher", "step": 1, "substep": None},
+    }
+
+    context.run(orchestrator.main_workflow(context, message))
+
+    assert context.continued_with["last_step"] is None
+    assert context.inputs("generate_next_step") == []
+
+    # The next iteration picks a step without assessing a step that never ran
+    context = fused_context(STEPS[1])
+    context.run(orchestrator.main_workflow(context, {**message, "last_step": None}))
+    assert context.inputs("check_progress_and_next_step") == []
+    assert context.continued_with["last_step"]["step"] == 2
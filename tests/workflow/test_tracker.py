@@ -0,0 +1,144 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from dapr_agents.workflow.tracker import WorkflowCompletionTracker
+
+
+class FakeRuntime:
+    """Workflow statuses by instance ID; unknown instances do not exist."""
+
+    def __init__(self):
+        self.statuses = {}
+        self.queries = []
+
+    def fetch_state(self, instance_id):
+        self.queries.append(instance_id)
+        status = self.statuses.get(instance_id)
+        if status is None:
+            return None
+        return SimpleNamespace(
+            instance_id=instance_id, runtime_status=SimpleNamespace(name=status)
+        )
+
+
+def make_tracker(runtime: FakeRuntime, **kwargs) -> WorkflowCompletionTracker:
+    options = {"poll_interval": 0.01, "max_poll_interval": 0.05, **kwargs}
+    return WorkflowCompletionTracker(fetch_state=runtime.fetch_state, **options)
+
+
+def test_wait_returns_final_state():
+    runtime = FakeRuntime()
+    runtime.statuses["wf"] = "RUNNING"
+    tracker = make_tracker(runtime)
+
+    async def main():
+        waiter = asyncio.ensure_future(tracker.wait("wf"))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        runtime.statuses["wf"] = "COMPLETED"
+        return await asyncio.wait_for(waiter, 2)
+
+    state = asyncio.run(main())
+    tracker.close()
+
+    assert state.runtime_status.name == "COMPLETED"
+    metrics = tracker.metrics
+    assert (metrics.tracked, metrics.completed, metrics.in_flight) == (1, 1, 0)
+    assert metrics.latency.count == 1
+
+
+def test_unknown_instance_resolves_to_none():
+    runtime = FakeRuntime()
+    tracker = make_tracker(runtime)
+
+    assert asyncio.run(asyncio.wait_for(tracker.wait("missing"), 2)) is None
+    tracker.close()
+    assert tracker.metrics.not_found == 1
+
+
+def test_timeout_fails_only_the_expired_instance():
+    runtime = FakeRuntime()
+    runtime.statuses.update(slow="RUNNING", fast="RUNNING")
+    tracker = make_tracker(runtime)
+
+    async def main():
+        slow = asyncio.ensure_future(tracker.wait("slow", timeout=0.1))
+        fast = asyncio.ensure_future(tracker.wait("fast", timeout=5))
+        with pytest.raises(TimeoutError, match="slow"):
+            await asyncio.wait_for(slow, 2)
+        assert not fast.done()
+        runtime.statuses["fast"] = "FAILED"
+        return await asyncio.wait_for(fast, 2)
+
+    state = asyncio.run(main())
+    tracker.close()
+
+    assert state.runtime_status.name == "FAILED"
+    metrics = tracker.metrics
+    assert (metrics.timed_out, metrics.completed, metrics.in_flight) == (1, 1, 0)
+
+
+def test_timeout_expires_between_slow_polls():
+    runtime = FakeRuntime()
+    runtime.statuses["wf"] = "RUNNING"
+    tracker = make_tracker(runtime, poll_interval=10, max_poll_interval=10)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(TimeoutError):
+            await tracker.wait("wf", timeout=0.1)
+        return loop.time() - started
+
+    elapsed = asyncio.run(main())
+    tracker.close()
+
+    assert elapsed < 5
+    assert runtime.queries == []
+
+
+def test_notify_checks_the_instance_right_away():
+    runtime = FakeRuntime()
+    runtime.statuses["wf"] = "RUNNING"
+    tracker = make_tracker(runtime, poll_interval=10, max_poll_interval=10)
+
+    async def main():
+        waiter = asyncio.ensure_future(tracker.wait("wf"))
+        await asyncio.sleep(0.01)
+        runtime.statuses["wf"] = "COMPLETED"
+        threading.Thread(target=tracker.notify, args=("wf",)).start()
+        return await asyncio.wait_for(waiter, 2)
+
+    assert asyncio.run(main()).runtime_status.name == "COMPLETED"
+    tracker.close()
+
+
+def test_loops_keep_their_own_pending_instances():
+    runtime = FakeRuntime()
+    runtime.statuses.update(first="RUNNING", second="COMPLETED")
+    tracker = make_tracker(runtime)
+    tracked = threading.Event()
+    result = {}
+
+    async def first_loop():
+        waiter = asyncio.ensure_future(tracker.wait("first"))
+        tracked.set()
+        result["first"] = await asyncio.wait_for(waiter, 5)
+
+    thread = threading.Thread(target=asyncio.run, args=(first_loop(),))
+    thread.start()
+    assert tracked.wait(2)
+
+    # Tracking from another loop must not orphan the future of the first one
+    second = asyncio.run(asyncio.wait_for(tracker.wait("second"), 2))
+    assert second.runtime_status.name == "COMPLETED"
+
+    runtime.statuses["first"] = "COMPLETED"
+    thread.join(5)
+    tracker.close()
+
+    assert result["first"].runtime_status.name == "COMPLETED"
+    assert tracker.metrics.in_flight == 0